@@ -0,0 +1,54 @@
+import logging
+import os
+
+from fastapi.staticfiles import StaticFiles
+from starlette.concurrency import run_in_threadpool
+from starlette.exceptions import HTTPException
+from starlette.responses import Response
+from starlette.types import Scope
+
+from services.session_catalog import get_session_catalog_instance
+from utils.annotation_renderer import find_session_annotation, get_annotation_preview_cache
+
+logger = logging.getLogger(__name__)
+
+
+class AnnotatedStaticFiles(StaticFiles):
+    """
+    Static data files, plus annotated screenshots rendered on demand.
+
+    Capture sessions no longer write annotated copies of their screenshots. A request for
+    <project>/<command>/screenshots/annotated/<file> that is not on disk is answered by
+    drawing the event's recorded overlay onto the raw screenshot.
+
+    Requests for a session's files mark the session as used in the session catalog.
+    """
+
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        parts = os.path.normpath(path).replace("\\", "/").split("/")
+        if len(parts) >= 3 and ".." not in parts:
+            await run_in_threadpool(get_session_catalog_instance().mark_used, parts[0], parts[1])
+        try:
+            return await super().get_response(path, scope)
+        except HTTPException as e:
+            if e.status_code != 404:
+                raise
+            png = await run_in_threadpool(self._render_annotation, path)
+            if png is None:
+                raise
+            return Response(content=png, media_type="image/png")
+
+    def _render_annotation(self, path: str):
+        parts = os.path.normpath(path).replace("\\", "/").split("/")
+        if len(parts) != 5 or parts[2:4] != ["screenshots", "annotated"] or ".." in parts:
+            return None
+        project_uuid, command_uuid, _, _, filename = parts
+        try:
+            annotation = find_session_annotation(project_uuid, command_uuid, filename, str(self.directory))
+            if annotation is None:
+                return None
+            screenshot_path, overlay = annotation
+            return get_annotation_preview_cache().get_png(screenshot_path, overlay)
+        except Exception as e:
+            logger.error(f"Failed to render annotation {path}: {str(e)}")
+            return None
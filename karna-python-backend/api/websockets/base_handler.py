@@ -1,9 +1,10 @@
 from abc import ABC, abstractmethod
 from fastapi import WebSocket, WebSocketDisconnect
-from typing import Dict, List, TypeVar, Generic
+from typing import Collection, Dict, Optional, TypeVar, Generic
 import logging
 
 from api.websockets.base_models import Connection, RateLimit
+from api.websockets.fanout import FanoutHub
 from google.protobuf.message import Message
 
 from base.base_observer import AsyncCapableObserver
@@ -13,11 +14,24 @@ T = TypeVar("T")
 
 
 class BaseWebSocketHandler(Generic[T], ABC):
+    # Maximum number of broadcast messages waiting to be sent to a single client
+    send_queue_size: int = 16
+
     def __init__(self, service: BaseService[T]):
         self.service = service
         self.active_connections: Dict[str, Connection[T]] = {}
         self.logger = logging.getLogger(self.__class__.__name__)
         self.rate_limiter = RateLimit()
+        # Broadcasts are serialized once and queued per client by the hub
+        self.fanout = FanoutHub(
+            self.__class__.__name__,
+            max_queue_size=self.send_queue_size,
+            on_client_error=self._on_send_error,
+            get_resync_message=self._get_resync_message
+        )
+        # One default observer shared by every connection without a custom observer,
+        # so a service update is converted and broadcast once rather than once per client
+        self._shared_observer: Optional[AsyncCapableObserver[T]] = None
         
     @abstractmethod
     async def _default_observer_callable(self, data: T) -> None:
@@ -53,11 +67,14 @@ class BaseWebSocketHandler(Generic[T], ABC):
     # @abstractmethod
     async def _post_connect(self, connection: Connection[T]) -> None:
         """Post-connection setup - to be overridden by subclasses"""
-        observer = connection.observer
-        if observer is None:
-            observer = self.get_default_observer()
-            connection.observer = observer
-            self.service.add_observer(observer)
+        self.fanout.add_client(connection.client_id, connection.websocket)
+        if connection.observer is None:
+            if self._shared_observer is None:
+                self._shared_observer = self.get_default_observer()
+                self.service.add_observer(self._shared_observer)
+            connection.observer = self._shared_observer
+        else:
+            self.service.add_observer(connection.observer)
 
     def disconnect(self, websocket: WebSocket) -> None:
         """Handle WebSocket disconnection"""
@@ -75,31 +92,46 @@ class BaseWebSocketHandler(Generic[T], ABC):
     # @abstractmethod
     def _pre_disconnect(self, connection: Connection[T]) -> None:
         """Pre-disconnection cleanup - to be overridden by subclasses"""
-        self.service.remove_observer(connection.observer)
-
-    async def broadcast(self, message: Message) -> None:  #
-        """Broadcast protobuf message to all connected clients"""
+        self.fanout.remove_client(connection.client_id)
+        if connection.observer is None:
+            return
+        if connection.observer is not self._shared_observer:
+            self.service.remove_observer(connection.observer)
+            return
+        still_shared = any(
+            other.observer is self._shared_observer
+            for client_id, other in self.active_connections.items()
+            if client_id != connection.client_id
+        )
+        if not still_shared:
+            self.service.remove_observer(self._shared_observer)
+            self._shared_observer = None
+
+    def _on_send_error(self, client_id: str) -> None:
+        """Drop a client whose send failed"""
+        connection = self.active_connections.get(client_id)
+        if connection is not None:
+            self.disconnect(connection.websocket)
+
+    def _get_resync_message(self, client_id: str) -> Optional[bytes]:
+        """The message replacing a slow client's pending broadcasts, None drops the oldest one.
+
+        Broadcasts are full state updates by default, so dropping the oldest loses nothing.
+        Handlers that broadcast incremental changes return a full snapshot instead.
+        """
+        return None
+
+    async def broadcast(self, message: Message, client_ids: Optional[Collection[str]] = None) -> None:
+        """Broadcast protobuf message to all connected clients, or only to client_ids if given.
+
+        The message is serialized once and queued for every client; each client's
+        queue is drained concurrently, so a slow client does not delay the others.
+        """
         if not isinstance(message, Message):
             self.logger.error("Invalid message type for broadcast")
             return
 
-        data = message.SerializeToString()
-        disconnected: List[str] = []
-        # log current active connections
-        # self.report_active_clients()
-        for client_id, connection in self.active_connections.items():
-            try:
-                await connection.websocket.send_bytes(data)
-            except WebSocketDisconnect:
-                disconnected.append(client_id)
-            except Exception as e:
-                self.logger.error(f"Error broadcasting to {client_id}: {e}")
-                disconnected.append(client_id)
-
-        # Clean up disconnected clients
-        for client_id in disconnected:
-            if client_id in self.active_connections:
-                self.disconnect(self.active_connections[client_id].websocket)
+        await self.fanout.broadcast(message.SerializeToString(), client_ids)
 
     def report_active_clients(self) -> None:
         self.logger.info(f"======{self.__class__.__name__} Connection Status ======")
@@ -0,0 +1,204 @@
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from typing import Callable, Collection, Dict, List, Optional, Tuple
+
+from fastapi import WebSocket
+
+
+@dataclass
+class FanoutClientStats:
+    """Delivery counters of a single fan-out client."""
+    sent: int = 0
+    dropped: int = 0
+    # Times the pending messages were replaced by a resync message
+    resyncs: int = 0
+
+
+# Serialized message and the future resolved once it was sent (True) or dropped (False)
+_QueuedMessage = Tuple[bytes, "asyncio.Future[bool]"]
+
+
+@dataclass
+class _FanoutClient:
+    websocket: WebSocket
+    queue: "asyncio.Queue[_QueuedMessage]"
+    stats: FanoutClientStats = field(default_factory=FanoutClientStats)
+    sender: Optional["asyncio.Task[None]"] = None
+
+
+class FanoutHub:
+    """
+    Sends already-serialized messages to every client of a websocket handler.
+
+    Each client has a bounded send queue drained by its own sender task, so all clients
+    are written to concurrently and a slow client never stalls the others.
+
+    When a client's queue is full, get_resync_message is asked for a message that replaces
+    everything pending for the client, e.g. a full snapshot for a client receiving
+    incremental deltas, which must never silently lose one. Without a resync message the
+    oldest pending message is dropped, which is only safe when messages are full state
+    updates that supersede each other.
+    """
+
+    def __init__(self, name: str, max_queue_size: int = 16, send_timeout: float = 1.0,
+                 on_client_error: Optional[Callable[[str], None]] = None,
+                 get_resync_message: Optional[Callable[[str], Optional[bytes]]] = None):
+        """
+        Initialize the hub.
+
+        Args:
+            name: Name used in log messages.
+            max_queue_size: Maximum number of messages waiting per client.
+            send_timeout: Maximum seconds broadcast() waits for the clients that are keeping up.
+            on_client_error: Called with the client id when sending to that client fails.
+            get_resync_message: Called with the client id when its queue is full. Returns the
+                serialized message replacing its pending messages, or None to drop the oldest one.
+        """
+        if max_queue_size < 1:
+            raise ValueError("max_queue_size must be at least 1")
+        self.name = name
+        self.max_queue_size = max_queue_size
+        self.send_timeout = send_timeout
+        self.on_client_error = on_client_error
+        self.get_resync_message = get_resync_message
+        self.logger = logging.getLogger(f"FanoutHub[{name}]")
+        self._clients: Dict[str, _FanoutClient] = {}
+
+    def add_client(self, client_id: str, websocket: WebSocket) -> None:
+        """Register a client and start its sender task. Must be called from the event loop."""
+        self.remove_client(client_id)
+        client = _FanoutClient(websocket=websocket, queue=asyncio.Queue(maxsize=self.max_queue_size))
+        client.sender = asyncio.get_running_loop().create_task(self._send_loop(client_id, client))
+        self._clients[client_id] = client
+
+    def remove_client(self, client_id: str) -> None:
+        """Unregister a client and stop its sender task. Pending messages are discarded."""
+        client = self._clients.pop(client_id, None)
+        if client is None:
+            return
+        self._discard_pending(client)
+        if client.sender is not None and client.sender is not _current_task():
+            client.sender.cancel()
+
+    def publish(self, data: bytes, client_ids: Optional[Collection[str]] = None) -> List["asyncio.Future[bool]"]:
+        """
+        Queue serialized bytes for every client without waiting for delivery.
+
+        Args:
+            data: The serialized message, shared by all clients.
+            client_ids: Only queue the message for these clients. None means every client.
+
+        Returns:
+            The delivery futures of the clients that had nothing pending, i.e. that are keeping up.
+        """
+        loop = asyncio.get_running_loop()
+        idle_deliveries = []
+        for client_id, client in self._clients.items():
+            if client_ids is not None and client_id not in client_ids:
+                continue
+            delivered: "asyncio.Future[bool]" = loop.create_future()
+            if client.queue.empty():
+                idle_deliveries.append(delivered)
+            elif client.queue.full() and self._resync(client_id, client):
+                # The resync message supersedes the pending messages, queue this one after it if there is room
+                if client.queue.full():
+                    _resolve(delivered, False)
+                    client.stats.dropped += 1
+                    continue
+            elif client.queue.full():
+                # Backpressure: the client is behind, drop its oldest pending message
+                _, dropped = client.queue.get_nowait()
+                client.queue.task_done()
+                _resolve(dropped, False)
+                client.stats.dropped += 1
+                self.logger.warning(f"Client {client_id} is slow, dropped a pending message ({client.stats.dropped} total)")
+            client.queue.put_nowait((data, delivered))
+        return idle_deliveries
+
+    def _resync(self, client_id: str, client: _FanoutClient) -> bool:
+        """Replace the pending messages of a client by its resync message, if it has one"""
+        if self.get_resync_message is None:
+            return False
+        resync_message = self.get_resync_message(client_id)
+        if resync_message is None:
+            return False
+        client.stats.dropped += client.queue.qsize()
+        self._discard_pending(client)
+        client.queue.put_nowait((resync_message, asyncio.get_running_loop().create_future()))
+        client.stats.resyncs += 1
+        self.logger.warning(f"Client {client_id} is slow, replaced its pending messages with a resync message "
+                            f"({client.stats.resyncs} total)")
+        return True
+
+    async def broadcast(self, data: bytes, client_ids: Optional[Collection[str]] = None) -> None:
+        """
+        Queue serialized bytes for every client and wait for the clients that are keeping up.
+
+        Clients that already have pending messages are not waited for, and the wait is bounded
+        by send_timeout, so one slow client never holds up the broadcaster.
+
+        Args:
+            data: The serialized message, shared by all clients.
+            client_ids: Only send the message to these clients. None means every client.
+        """
+        idle_deliveries = self.publish(data, client_ids)
+        if idle_deliveries:
+            await asyncio.wait(idle_deliveries, timeout=self.send_timeout)
+
+    async def drain(self) -> None:
+        """Wait until every queued message has been sent (or dropped) for all current clients."""
+        await asyncio.gather(*(client.queue.join() for client in list(self._clients.values())))
+
+    async def _send_loop(self, client_id: str, client: _FanoutClient) -> None:
+        while True:
+            data, delivered = await client.queue.get()
+            try:
+                await client.websocket.send_bytes(data)
+                client.stats.sent += 1
+            except asyncio.CancelledError:
+                _resolve(delivered, False)
+                raise
+            except Exception as e:
+                self.logger.error(f"Error sending to {client_id}: {e}")
+                _resolve(delivered, False)
+                client.queue.task_done()
+                self._fail_client(client_id)
+                return
+            _resolve(delivered, True)
+            client.queue.task_done()
+
+    def _fail_client(self, client_id: str) -> None:
+        client = self._clients.pop(client_id, None)
+        if client is not None:
+            self._discard_pending(client)
+        if self.on_client_error is not None:
+            self.on_client_error(client_id)
+
+    @staticmethod
+    def _discard_pending(client: _FanoutClient) -> None:
+        # Unblock broadcast() and drain() callers waiting on messages that will never be sent
+        while not client.queue.empty():
+            _, delivered = client.queue.get_nowait()
+            _resolve(delivered, False)
+            client.queue.task_done()
+
+    def get_stats(self) -> Dict[str, FanoutClientStats]:
+        """Get the delivery counters of every connected client."""
+        return {client_id: client.stats for client_id, client in self._clients.items()}
+
+    @property
+    def client_count(self) -> int:
+        return len(self._clients)
+
+
+def _resolve(future: "asyncio.Future[bool]", delivered: bool) -> None:
+    if not future.done():
+        future.set_result(delivered)
+
+
+def _current_task() -> Optional["asyncio.Task"]:
+    try:
+        return asyncio.current_task()
+    except RuntimeError:
+        return None
@@ -7,12 +7,28 @@ from generated.screen_capture_pb2 import (
     CaptureResult,
     RpcScreenshotEvent,
     CaptureCacheRequest,
+    CaptureDeltaSubscribeRequest,
+    CaptureResyncRequest,
+    CaptureStatsRequest,
+    CAPTURE_DELTA_APPEND,
+    CAPTURE_DELTA_UPDATE,
+    CAPTURE_DELTA_DELETE,
+    CAPTURE_DELTA_RESET,
 )
-from services.screen_capture_service import ScreenCaptureService, ScreenshotEvent
+from services.screen_capture_service import ScreenCaptureService, ScreenshotEvent, CaptureDelta, CaptureDeltaType
 from api.websockets.base_handler import BaseWebSocketHandler
-from typing import List
+from api.websockets.base_models import Connection
+from base.base_observer import AsyncCapableObserver
+from typing import Collection, List, Optional, Set
 from utils.screen_capture_utils import load_screenshot_events_from_cache, ScreenCaptureUtilError
 
+_DELTA_TYPES = {
+    CaptureDeltaType.APPEND: CAPTURE_DELTA_APPEND,
+    CaptureDeltaType.UPDATE: CAPTURE_DELTA_UPDATE,
+    CaptureDeltaType.DELETE: CAPTURE_DELTA_DELETE,
+    CaptureDeltaType.RESET: CAPTURE_DELTA_RESET,
+}
+
 class ScreenCaptureWebSocketHandler(BaseWebSocketHandler[List[ScreenshotEvent]]):
     service: ScreenCaptureService  # Add type annotation to help type checker
     
@@ -20,13 +36,89 @@ class ScreenCaptureWebSocketHandler(BaseWebSocketHandler[List[ScreenshotEvent]])
         super().__init__(service=ScreenCaptureService())
         self.rate_limiter.max_requests = 10  # Moderate rate limit for screen capture
         self.rate_limiter.time_window = 60  # 10 requests per minute
+        # Clients that opted in to CaptureDelta updates instead of the full event list
+        self._delta_clients: Set[str] = set()
+        self._delta_observer = AsyncCapableObserver[CaptureDelta](self._delta_observer_callable)
+        self.service.add_delta_observer(self._delta_observer)
 
     async def _default_observer_callable(self, data: List[ScreenshotEvent]) -> None:
         """Default implementation for handling screenshot event updates"""
-        await self.broadcast_capture_events(data)
+        legacy_clients = self._legacy_client_ids()
+        if legacy_clients:
+            await self.broadcast_capture_events(data, legacy_clients)
+
+    async def _delta_observer_callable(self, delta: CaptureDelta) -> None:
+        """Send a change to the screenshot event list to the clients that opted in to deltas"""
+        if self._delta_clients:
+            await self.broadcast_capture_delta(delta, set(self._delta_clients))
+
+    def _legacy_client_ids(self) -> Set[str]:
+        return {client_id for client_id in self.active_connections if client_id not in self._delta_clients}
+
+    def _get_resync_message(self, client_id: str) -> Optional[bytes]:
+        """A slow delta client must not lose a delta, so its pending messages are replaced by a RESET"""
+        if client_id not in self._delta_clients:
+            return None
+        snapshot = self.service.get_capture_snapshot()
+        if snapshot is None:
+            return None
+        return self._to_capture_delta_response(snapshot).SerializeToString()
+
+    def _pre_disconnect(self, connection: Connection) -> None:
+        self._delta_clients.discard(connection.client_id)
+        super()._pre_disconnect(connection)
 
-    async def broadcast_capture_events(self, events: List[ScreenshotEvent]) -> None:
-        """Broadcast screen capture events to all connected clients"""
+    @staticmethod
+    def _convert_to_proto_event(event: ScreenshotEvent, proto_event: RpcScreenshotEvent) -> None:
+        """Fill a proto screenshot event from a domain event"""
+        proto_event.event_id = event.event_id
+        proto_event.project_uuid = event.project_uuid
+        proto_event.command_uuid = event.command_uuid
+        proto_event.timestamp = event.timestamp.isoformat()
+        proto_event.description = event.description
+        proto_event.screenshot_path = event.screenshot_path
+        if event.annotation_path:
+            proto_event.annotation_path = event.annotation_path
+        if event.mouse_x is not None:
+            proto_event.mouse_x = event.mouse_x
+        if event.mouse_y is not None:
+            proto_event.mouse_y = event.mouse_y
+        if event.key_char:
+            proto_event.key_char = event.key_char
+        if event.key_code:
+            proto_event.key_code = event.key_code
+        proto_event.is_special_key = event.is_special_key
+        if event.mouse_event_tool_tip:
+            proto_event.mouse_event_tool_tip = event.mouse_event_tool_tip
+        if event.similarity_score is not None:
+            proto_event.similarity_score = event.similarity_score
+        if event.duplicate_of_event_id:
+            proto_event.duplicate_of_event_id = event.duplicate_of_event_id
+        if event.thumbnail_paths:
+            proto_event.thumbnail_paths.update(event.thumbnail_paths)
+        if event.capture_origin:
+            proto_event.capture_origin_x, proto_event.capture_origin_y = event.capture_origin
+
+    async def broadcast_capture_delta(self, delta: CaptureDelta, client_ids: Optional[Collection[str]] = None) -> None:
+        """Broadcast a change to the screenshot event list to all (or the given) clients"""
+        await self.broadcast(self._to_capture_delta_response(delta), client_ids)
+
+    def _to_capture_delta_response(self, delta: CaptureDelta) -> ScreenCaptureRPCResponse:
+        """Convert a change to the screenshot event list to its RPC response"""
+        response = ScreenCaptureRPCResponse()
+        proto_delta = response.capture_delta
+        proto_delta.project_uuid = delta.project_uuid
+        proto_delta.command_uuid = delta.command_uuid
+        proto_delta.sequence = delta.sequence
+        proto_delta.type = _DELTA_TYPES[delta.type]
+        proto_delta.is_active = delta.is_active
+        for event in delta.events:
+            self._convert_to_proto_event(event, proto_delta.screenshot_events.add())
+        proto_delta.deleted_event_ids.extend(delta.deleted_event_ids)
+        return response
+
+    async def broadcast_capture_events(self, events: List[ScreenshotEvent], client_ids: Optional[Collection[str]] = None) -> None:
+        """Broadcast screen capture events to all (or the given) connected clients"""
         response = ScreenCaptureRPCResponse()
         result = CaptureResult()
         
@@ -39,29 +131,10 @@ class ScreenCaptureWebSocketHandler(BaseWebSocketHandler[List[ScreenshotEvent]])
             
             # Convert domain events to proto events
             for event in events:
-                proto_event : RpcScreenshotEvent = result.screenshot_events.add()
-                proto_event.event_id = event.event_id
-                proto_event.project_uuid = event.project_uuid
-                proto_event.command_uuid = event.command_uuid
-                proto_event.timestamp = event.timestamp.isoformat()
-                proto_event.description = event.description
-                proto_event.screenshot_path = event.screenshot_path
-                if event.annotation_path:
-                    proto_event.annotation_path = event.annotation_path
-                if event.mouse_x is not None:
-                    proto_event.mouse_x = event.mouse_x
-                if event.mouse_y is not None:
-                    proto_event.mouse_y = event.mouse_y
-                if event.key_char:
-                    proto_event.key_char = event.key_char
-                if event.key_code:
-                    proto_event.key_code = event.key_code
-                proto_event.is_special_key = event.is_special_key
-                if event.mouse_event_tool_tip:
-                    proto_event.mouse_event_tool_tip = event.mouse_event_tool_tip
+                self._convert_to_proto_event(event, result.screenshot_events.add())
                 
         response.capture_response.CopyFrom(result)
-        await self.broadcast(response)
+        await self.broadcast(response, client_ids)
 
     async def handle_message(self, websocket: WebSocket, data: bytes) -> None:
         """Handle incoming WebSocket messages"""
@@ -107,6 +180,15 @@ class ScreenCaptureWebSocketHandler(BaseWebSocketHandler[List[ScreenshotEvent]])
                 self.logger.info(f"Project UUID: {message_content.project_uuid}")
                 self.logger.info(f"Command UUID: {message_content.command_uuid}")
                 await self.handle_get_cache(websocket, request.get_cache)
+            elif method == "subscribe_deltas":
+                self.logger.info(f"Received subscribe deltas request from client {client_id}: {request.subscribe_deltas.enabled}")
+                await self.handle_subscribe_deltas(websocket, request.subscribe_deltas)
+            elif method == "resync":
+                message_content = getattr(request, method)
+                self.logger.info(f"Received resync request from client {client_id} after sequence {message_content.last_sequence}")
+                await self.handle_resync(websocket, request.resync)
+            elif method == "get_stats":
+                await self.handle_get_stats(websocket, request.get_stats)
             else:
                 response = ScreenCaptureRPCResponse()
                 response.error = f"Unknown screen capture method: {method}"
@@ -167,7 +249,12 @@ class ScreenCaptureWebSocketHandler(BaseWebSocketHandler[List[ScreenshotEvent]])
                         key_char=proto_event.key_char if proto_event.HasField('key_char') else None,
                         key_code=proto_event.key_code if proto_event.HasField('key_code') else None,
                         is_special_key=proto_event.is_special_key,
-                        mouse_event_tool_tip=proto_event.mouse_event_tool_tip if proto_event.HasField('mouse_event_tool_tip') else None
+                        mouse_event_tool_tip=proto_event.mouse_event_tool_tip if proto_event.HasField('mouse_event_tool_tip') else None,
+                        similarity_score=proto_event.similarity_score if proto_event.HasField('similarity_score') else None,
+                        duplicate_of_event_id=proto_event.duplicate_of_event_id if proto_event.HasField('duplicate_of_event_id') else None,
+                        thumbnail_paths=dict(proto_event.thumbnail_paths) or None,
+                        capture_origin=(proto_event.capture_origin_x, proto_event.capture_origin_y)
+                            if proto_event.HasField('capture_origin_x') else None
                     )
                     updated_events.append(domain_event)
                 
@@ -181,8 +268,10 @@ class ScreenCaptureWebSocketHandler(BaseWebSocketHandler[List[ScreenshotEvent]])
                 self.logger.warning("Update capture request contains no events")
                 result_events = []
             
-            if result_events and len(result_events) > 0 and self.service.current_session:
-                await self.broadcast_capture_events(result_events)
+            # Delta clients receive the changes from the service's delta notifications
+            legacy_clients = self._legacy_client_ids()
+            if result_events and len(result_events) > 0 and self.service.current_session and legacy_clients:
+                await self.broadcast_capture_events(result_events, legacy_clients)
                 self.logger.info(f"Updated screenshot events for {update_capture_request.project_uuid}/{update_capture_request.command_uuid}")
             else:
                 self.logger.info(f"No events to broadcast after update for {update_capture_request.project_uuid}/{update_capture_request.command_uuid}")
@@ -221,3 +310,70 @@ class ScreenCaptureWebSocketHandler(BaseWebSocketHandler[List[ScreenshotEvent]])
             response = ScreenCaptureRPCResponse()
             response.error = str(e)
             await websocket.send_bytes(response.SerializeToString())
+
+    async def handle_subscribe_deltas(self, websocket: WebSocket, subscribe_request: CaptureDeltaSubscribeRequest) -> None:
+        """
+        Switch a client between CaptureDelta updates and the full CaptureResult list.
+        
+        A client that opts in first receives the current session as a RESET delta.
+        
+        Args:
+            websocket: The WebSocket connection
+            subscribe_request: Whether the client wants deltas
+        """
+        client_id = str(id(websocket))
+        if not subscribe_request.enabled:
+            self._delta_clients.discard(client_id)
+            return
+        self._delta_clients.add(client_id)
+        snapshot = self.service.get_capture_snapshot()
+        if snapshot is not None:
+            await self.broadcast_capture_delta(snapshot, [client_id])
+
+    async def handle_resync(self, websocket: WebSocket, resync_request: CaptureResyncRequest) -> None:
+        """
+        Send the full event list of the current session to a client that missed deltas.
+        
+        The snapshot goes through the client's send queue, so it is ordered with the deltas
+        already queued for it; the client drops deltas whose sequence is not above the snapshot's.
+        
+        Args:
+            websocket: The WebSocket connection
+            resync_request: The session and the last sequence number the client applied
+        """
+        snapshot = self.service.get_capture_snapshot()
+        if snapshot is None or (snapshot.project_uuid, snapshot.command_uuid) != (resync_request.project_uuid, resync_request.command_uuid):
+            response = ScreenCaptureRPCResponse()
+            response.error = f"No capture session to resync for project {resync_request.project_uuid}, command {resync_request.command_uuid}"
+            await websocket.send_bytes(response.SerializeToString())
+            return
+        await self.broadcast_capture_delta(snapshot, [str(id(websocket))])
+
+    async def handle_get_stats(self, websocket: WebSocket, stats_request: CaptureStatsRequest) -> None:
+        """
+        Send the running statistics of the current session.
+        
+        Args:
+            websocket: The WebSocket connection
+            stats_request: The (empty) statistics request
+        """
+        response = ScreenCaptureRPCResponse()
+        session = self.service.current_session
+        stats = self.service.get_current_session_stats()
+        if session is None or stats is None:
+            response.error = "No capture session to report statistics for"
+            await websocket.send_bytes(response.SerializeToString())
+            return
+        proto_stats = response.capture_stats
+        proto_stats.project_uuid = stats.project_uuid
+        proto_stats.command_uuid = stats.command_uuid
+        proto_stats.is_active = session.is_active
+        proto_stats.total_screenshots = stats.total_screenshots
+        proto_stats.total_annotations = stats.total_annotations
+        proto_stats.total_key_events = stats.total_key_events
+        proto_stats.total_mouse_events = stats.total_mouse_events
+        proto_stats.duration_seconds = stats.duration_seconds
+        proto_stats.raw_directory_size = stats.raw_directory_size
+        proto_stats.annotated_directory_size = stats.annotated_directory_size
+        proto_stats.missing_files = stats.missing_files
+        await websocket.send_bytes(response.SerializeToString())
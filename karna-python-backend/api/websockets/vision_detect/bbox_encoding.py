@@ -0,0 +1,100 @@
+"""
+Packed protobuf encoding of bounding boxes.
+
+The vision detect channel sends each box as a nested BoundingBox message,
+built field by field in Python. PackedBoundingBoxes carries the boxes of a
+frame as packed numeric columns plus a class name table instead, so encoding
+fills each column from a numpy array in one call and decoding reads the
+columns straight into a BoundingBoxArray.
+
+Positions and sizes are truncated to ints as in BoundingBox, and confidences
+are sent as float32 like the nested encoding.
+"""
+
+from typing import Sequence
+
+import numpy as np
+
+from generated.vision_detect_pb2 import BoundingBox as ProtoBoundingBox, PackedBoundingBoxes
+from inference import BoundingBox, BoundingBoxArray
+
+
+def encode_packed_bounding_boxes(boxes: Sequence[BoundingBox]) -> PackedBoundingBoxes:
+    """
+    Encode the boxes of a frame as packed columns.
+
+    Args:
+        boxes: A list of BoundingBox or a BoundingBoxArray.
+
+    Returns:
+        PackedBoundingBoxes: The encoded boxes.
+    """
+    array = BoundingBoxArray.from_boxes(boxes)
+    packed = PackedBoundingBoxes()
+    packed.x.extend(array.x1.astype(np.int32).tolist())
+    packed.y.extend(array.y1.astype(np.int32).tolist())
+    packed.width.extend(array.widths.astype(np.int32).tolist())
+    packed.height.extend(array.heights.astype(np.int32).tolist())
+    packed.confidence.extend(array.confidences.tolist())
+    packed.class_index.extend(array.class_indices.tolist())
+    packed.class_names.extend(array.class_table)
+    packed.ids.extend(array.ids.tolist())
+    return packed
+
+
+def decode_packed_bounding_boxes(packed: PackedBoundingBoxes) -> BoundingBoxArray:
+    """
+    Decode packed columns into a BoundingBoxArray.
+
+    Args:
+        packed: The encoded boxes.
+
+    Returns:
+        BoundingBoxArray: The boxes, built into BoundingBox objects only when used.
+
+    Raises:
+        ValueError: If the columns have different lengths or a class index is out of range.
+    """
+    count = len(packed.x)
+    columns = (packed.y, packed.width, packed.height, packed.confidence, packed.class_index)
+    if any(len(column) != count for column in columns) or (len(packed.ids) not in (0, count)):
+        raise ValueError("Packed bounding box columns have different lengths")
+
+    x = np.array(packed.x, dtype=np.float64)
+    y = np.array(packed.y, dtype=np.float64)
+    xyxy = np.stack([x, y, x + np.array(packed.width), y + np.array(packed.height)], axis=1).reshape(-1, 4)
+    class_indices = np.array(packed.class_index, dtype=np.int32)
+    if count and (class_indices.min() < 0 or class_indices.max() >= len(packed.class_names)):
+        raise ValueError("Packed bounding box class index out of range")
+    return BoundingBoxArray(xyxy, np.array(packed.confidence, dtype=np.float64), class_indices,
+                            list(packed.class_names), list(packed.ids) if packed.ids else None)
+
+
+def encode_nested_bounding_box(bbox: BoundingBox) -> ProtoBoundingBox:
+    """
+    Encode one box as a nested BoundingBox message, the default encoding.
+    """
+    proto_bbox = ProtoBoundingBox()
+    proto_bbox.id = bbox.id
+    proto_bbox.x = bbox.x
+    proto_bbox.y = bbox.y
+    proto_bbox.width = bbox.width
+    proto_bbox.height = bbox.height
+    proto_bbox.class_name = bbox.class_name
+    proto_bbox.confidence = bbox.confidence
+    return proto_bbox
+
+
+def decode_nested_bounding_box(proto_bbox: ProtoBoundingBox) -> BoundingBox:
+    """
+    Decode one nested BoundingBox message.
+    """
+    return BoundingBox(
+        x=proto_bbox.x,
+        y=proto_bbox.y,
+        width=proto_bbox.width,
+        height=proto_bbox.height,
+        class_name=proto_bbox.class_name,
+        confidence=proto_bbox.confidence,
+        id=proto_bbox.id
+    )
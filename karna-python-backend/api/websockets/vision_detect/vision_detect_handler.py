@@ -5,7 +5,8 @@ import logging
 from datetime import datetime
 
 from api.websockets.base_handler import BaseWebSocketHandler
-from services.vision_detect_service import VisionDetectService, get_vision_detect_service_instance
+from base.base_observer import AsyncCapableObserver
+from services.vision_detect_service import VisionDetectResultDelta, VisionDetectService, get_vision_detect_service_instance
 from inference import VisionDetectResultModelList, VisionDetectResultModel
 from services.screen_capture_service import ScreenshotEvent
 
@@ -18,9 +19,15 @@ from generated.vision_detect_pb2 import (
     UpdateResultsRequest,
     VisionDetectResultsList,
     VisionDetectResultModel as ProtoVisionDetectResultModel,
-    BoundingBox as ProtoBoundingBox,
+    VisionDetectResultDelta as ProtoVisionDetectResultDelta,
     VisionDetectStatus
 )
+from api.websockets.vision_detect.bbox_encoding import (
+    encode_packed_bounding_boxes,
+    decode_packed_bounding_boxes,
+    encode_nested_bounding_box,
+    decode_nested_bounding_box
+)
 
 logger = logging.getLogger(__name__)
 
@@ -28,12 +35,18 @@ class VisionDetectWebSocketHandler(BaseWebSocketHandler[VisionDetectResultModelL
     """WebSocket handler for vision detection service."""
     
     service: VisionDetectService  # Type annotation to help type checker
+    # Send boxes as packed_bboxes columns instead of nested merged_ui_icon_bboxes messages.
+    # Only enable once every client decodes packed_bboxes.
+    PACKED_BBOXES: bool = False
     
     def __init__(self):
         """Initialize the WebSocket handler with the VisionDetectService."""
         super().__init__(service=get_vision_detect_service_instance())
         self.rate_limiter.max_requests = 10  # Moderate rate limit
         self.rate_limiter.time_window = 60   # 10 requests per minute
+        # One observer for live per-frame results, broadcast to every connected client
+        self._delta_observer = AsyncCapableObserver[VisionDetectResultDelta](self._delta_observer_callable)
+        self.service.add_delta_observer(self._delta_observer)
         logger.info("VisionDetectWebSocketHandler initialized")
     
     async def _default_observer_callable(self, data: VisionDetectResultModelList) -> None:
@@ -45,6 +58,16 @@ class VisionDetectWebSocketHandler(BaseWebSocketHandler[VisionDetectResultModelL
         logger.info("Observer received vision detection results update")
         await self.broadcast_results(data)
     
+    async def _delta_observer_callable(self, delta: VisionDetectResultDelta) -> None:
+        """Broadcast the result of a frame detected live during a capture session.
+        
+        Args:
+            delta: The live detection result of one frame.
+        """
+        if not self.active_connections:
+            return
+        await self.broadcast_result_delta(delta)
+    
     async def handle_message(self, websocket: WebSocket, data: bytes) -> None:
         """Handle incoming WebSocket messages.
         
@@ -175,46 +198,52 @@ class VisionDetectWebSocketHandler(BaseWebSocketHandler[VisionDetectResultModelL
         proto_results.command_uuid = results.command_uuid
         
         for result in results.vision_detect_result_models:
-            proto_result = ProtoVisionDetectResultModel()
-            proto_result.event_id = result.event_id
-            proto_result.project_uuid = result.project_uuid
-            proto_result.command_uuid = result.command_uuid
-            proto_result.timestamp = result.timestamp.isoformat()
-            proto_result.description = result.description
-            proto_result.original_image_path = result.original_image_path
-            proto_result.original_width = result.original_width
-            proto_result.original_height = result.original_height
-            proto_result.is_cropped = result.is_cropped
+            proto_results.results.append(self._convert_to_proto_result(result))
+        
+        return proto_results
+    
+    def _convert_to_proto_result(self, result: VisionDetectResultModel) -> ProtoVisionDetectResultModel:
+        """Convert a VisionDetectResultModel to a protobuf VisionDetectResultModel.
+        
+        Args:
+            result: The vision detection result of one frame.
             
-            # Convert bounding boxes
-            for bbox in result.merged_ui_icon_bboxes:
-                proto_bbox = ProtoBoundingBox()
-                proto_bbox.id = bbox.id
-                proto_bbox.x = bbox.x
-                proto_bbox.y = bbox.y
-                proto_bbox.width = bbox.width
-                proto_bbox.height = bbox.height
-                proto_bbox.class_name = bbox.class_name
-                proto_bbox.confidence = bbox.confidence
-                proto_result.merged_ui_icon_bboxes.append(proto_bbox)
+        Returns:
+            ProtoVisionDetectResultModel: The protobuf vision detection result.
+        """
+        proto_result = ProtoVisionDetectResultModel()
+        proto_result.event_id = result.event_id
+        proto_result.project_uuid = result.project_uuid
+        proto_result.command_uuid = result.command_uuid
+        proto_result.timestamp = result.timestamp.isoformat()
+        proto_result.description = result.description
+        proto_result.original_image_path = result.original_image_path
+        proto_result.original_width = result.original_width
+        proto_result.original_height = result.original_height
+        proto_result.is_cropped = result.is_cropped
+        
+        # Convert bounding boxes
+        if self.PACKED_BBOXES:
+            proto_result.packed_bboxes.CopyFrom(encode_packed_bounding_boxes(result.merged_ui_icon_bboxes))
+        else:
+            proto_result.merged_ui_icon_bboxes.extend(
+                encode_nested_bounding_box(bbox) for bbox in result.merged_ui_icon_bboxes)
+        
+        # Add cropped image data if available
+        if result.cropped_image:
+            # Convert PIL Image to bytes
+            import io
+            img_byte_arr = io.BytesIO()
+            result.cropped_image.save(img_byte_arr, format='PNG')
+            proto_result.cropped_image = img_byte_arr.getvalue()
             
-            # Add cropped image data if available
-            if result.cropped_image:
-                # Convert PIL Image to bytes
-                import io
-                img_byte_arr = io.BytesIO()
-                result.cropped_image.save(img_byte_arr, format='PNG')
-                proto_result.cropped_image = img_byte_arr.getvalue()
-                
-            if result.cropped_width is not None:
-                proto_result.cropped_width = result.cropped_width
-                
-            if result.cropped_height is not None:
-                proto_result.cropped_height = result.cropped_height
+        if result.cropped_width is not None:
+            proto_result.cropped_width = result.cropped_width
             
-            proto_results.results.append(proto_result)
+        if result.cropped_height is not None:
+            proto_result.cropped_height = result.cropped_height
         
-        return proto_results
+        return proto_result
     
     def _convert_from_proto_results(self, proto_results: VisionDetectResultsList) -> VisionDetectResultModelList:
         """Convert protobuf VisionDetectResultsList to VisionDetectResultModelList.
@@ -235,20 +264,11 @@ class VisionDetectWebSocketHandler(BaseWebSocketHandler[VisionDetectResultModelL
         )
         
         for proto_result in proto_results.results:
-            # Convert bounding boxes
-            bboxes = []
-            for proto_bbox in proto_result.merged_ui_icon_bboxes:
-                from inference import BoundingBox
-                bbox = BoundingBox(
-                    x=proto_bbox.x,
-                    y=proto_bbox.y,
-                    width=proto_bbox.width,
-                    height=proto_bbox.height,
-                    class_name=proto_bbox.class_name,
-                    confidence=proto_bbox.confidence,
-                    id=proto_bbox.id
-                )
-                bboxes.append(bbox)
+            # Convert bounding boxes, sent either packed or nested
+            if proto_result.HasField("packed_bboxes"):
+                bboxes = list(decode_packed_bounding_boxes(proto_result.packed_bboxes))
+            else:
+                bboxes = [decode_nested_bounding_box(proto_bbox) for proto_bbox in proto_result.merged_ui_icon_bboxes]
             
             # Convert cropped image if available
             cropped_image = None
@@ -287,6 +307,22 @@ class VisionDetectWebSocketHandler(BaseWebSocketHandler[VisionDetectResultModelL
         response.results.CopyFrom(self._convert_to_proto_results(results))
         await self.broadcast(response)
     
+    async def broadcast_result_delta(self, delta: VisionDetectResultDelta) -> None:
+        """Broadcast the live detection result of a single frame to all connected clients.
+        
+        Args:
+            delta: The live detection result of one frame.
+        """
+        response = VisionDetectRPCResponse()
+        proto_delta = ProtoVisionDetectResultDelta()
+        proto_delta.project_uuid = delta.project_uuid
+        proto_delta.command_uuid = delta.command_uuid
+        proto_delta.result.CopyFrom(self._convert_to_proto_result(delta.result))
+        proto_delta.processed_count = delta.processed_count
+        proto_delta.pending_count = delta.pending_count
+        response.result_delta.CopyFrom(proto_delta)
+        await self.broadcast(response)
+    
     async def broadcast_status(self) -> None:
         """Broadcast vision detection service status to all connected clients."""
         response = VisionDetectRPCResponse()
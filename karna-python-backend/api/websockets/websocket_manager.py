@@ -14,6 +14,8 @@ class WebSocketManager(metaclass=SingletonMeta):
             self.status_handler = StatusWebSocketHandler()
             self.screen_capture_handler = ScreenCaptureWebSocketHandler()
             self.vision_detect_handler = VisionDetectWebSocketHandler()
+            # Detect UI elements on each frame as soon as it is captured, if live detection is enabled
+            self.vision_detect_handler.service.attach_to_screen_capture(self.screen_capture_handler.service)
             self.logger = logging.getLogger(__name__)
             self._initialized = True
 
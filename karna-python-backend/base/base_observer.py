@@ -1,8 +1,9 @@
 import asyncio
 from abc import ABC, abstractmethod
-from typing import Awaitable, Dict, TypeVar, Generic, Any, Optional, Callable
+from collections import deque
+from typing import Awaitable, Deque, Dict, TypeVar, Generic, Any, Optional, Callable
 from weakref import WeakSet
-from enum import IntEnum
+from enum import Enum, IntEnum
 from dataclasses import dataclass
 from datetime import datetime
 import copy
@@ -17,6 +18,13 @@ class Priority(IntEnum):
     HIGH = 2
     CRITICAL = 3
 
+class NotificationMode(Enum):
+    """How an observable hands its payload to observers."""
+    # Every observer receives its own deep copy of the payload
+    COPY_PER_OBSERVER = "copy_per_observer"
+    # One snapshot is made per notification and shared by all observers, which must not mutate it
+    SHARED_SNAPSHOT = "shared_snapshot"
+
 @dataclass
 class StateChange:
     """Represents a state change in the observable."""
@@ -78,13 +86,24 @@ class AsyncCapableObserver(Observer[ObserverDataType]):
 class Observable(Generic[ObserverDataType]):
     """Base class for objects that need to be observed."""
     
-    def __init__(self):
-        """Initialize the observable with an empty set of observers."""
+    # Default payload handling, subclasses can override
+    notification_mode: NotificationMode = NotificationMode.COPY_PER_OBSERVER
+    # Number of state changes kept in the history (None keeps all of them)
+    state_history_limit: Optional[int] = 1000
+    
+    def __init__(self, notification_mode: Optional[NotificationMode] = None):
+        """Initialize the observable with an empty set of observers.
+        
+        Args:
+            notification_mode (Optional[NotificationMode]): Overrides the class notification_mode.
+        """
         self._observers: Dict[Priority, WeakSet[Observer[ObserverDataType]]] = {
             priority: WeakSet() for priority in Priority
         }
+        if notification_mode is not None:
+            self.notification_mode = notification_mode
         self._state: Dict[str, Any] = {}
-        self._state_history: list[StateChange] = []
+        self._state_history: Deque[StateChange] = deque(maxlen=self.state_history_limit)
         self._conditions: Dict[int, Callable[[ObserverDataType], bool]] = {}
 
     def add_observer(self, observer: Observer[ObserverDataType], condition: Optional[Callable[[ObserverDataType], bool]] = None) -> None:
@@ -112,15 +131,34 @@ class Observable(Generic[ObserverDataType]):
             self._observers[priority].clear()
         self._conditions.clear()
 
+    def _make_snapshot(self, data: ObserverDataType) -> ObserverDataType:
+        """Create the payload handed to observers, isolated from later changes to data.
+        
+        Subclasses can override this to share parts of the payload that are never
+        mutated (e.g. images) instead of copying them.
+        """
+        return copy.deepcopy(data)
+
     def notify_observers(self, data: ObserverDataType) -> None:
         """Notify all observers with the provided data in priority order."""
+        share_snapshot = self.notification_mode == NotificationMode.SHARED_SNAPSHOT
+        # The shared snapshot is made lazily, so notifications without matching observers cost nothing
+        snapshot: Any = None
+        has_snapshot = False
+        
         # Notify observers in priority order (CRITICAL to LOW)
         for priority in reversed(Priority):
-            for observer in self._observers[priority]:
+            for observer in list(self._observers[priority]):
                 try:
                     condition = self._conditions.get(id(observer))
                     if condition is None or condition(data):
-                        observer.update(copy.deepcopy(data))
+                        if not share_snapshot:
+                            observer.update(self._make_snapshot(data))
+                            continue
+                        if not has_snapshot:
+                            snapshot = self._make_snapshot(data)
+                            has_snapshot = True
+                        observer.update(snapshot)
                 except Exception as e:
                     print(f"Error notifying observer {observer}: {str(e)}")
 
@@ -142,9 +180,9 @@ class Observable(Generic[ObserverDataType]):
         self._state_history.append(change)
 
     def get_state_history(self, key: Optional[str] = None) -> list[StateChange]:
-        """Get state change history, optionally filtered by key."""
+        """Get the most recent state changes (up to state_history_limit), optionally filtered by key."""
         if key is None:
-            return self._state_history
+            return list(self._state_history)
         return [change for change in self._state_history if change.key == key]
 
     @property
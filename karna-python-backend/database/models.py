@@ -1,6 +1,7 @@
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, Float, JSON
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, Float, JSON, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 from datetime import datetime
+from typing import List
 from uuid import uuid4
 from .config import Base
 
@@ -29,4 +30,37 @@ class CachedIntent(Base):
     created_at = Column(DateTime, default=datetime.now)
 
     # Relationship with CachedCommand
-    command = relationship("CachedCommand", back_populates="intents")
\ No newline at end of file
+    command = relationship("CachedCommand", back_populates="intents")
+
+class CaptureSessionRecord(Base):
+    """Catalog entry of a screen capture session stored in data/<project_uuid>/<command_uuid>"""
+    __tablename__ = "capture_sessions"
+    # Command uuids are only unique within a project
+    __table_args__ = (UniqueConstraint("project_uuid", "command_uuid", name="uq_capture_sessions_project_command"),)
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    uuid: Mapped[str] = mapped_column(String, unique=True, index=True, default=lambda: str(uuid4()))
+    project_uuid: Mapped[str] = mapped_column(String, index=True)
+    command_uuid: Mapped[str] = mapped_column(String, index=True)
+    frame_count: Mapped[int] = mapped_column(Integer, default=0)
+    byte_size: Mapped[int] = mapped_column(Integer, default=0)  # Screenshots and annotations, in bytes
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.now)
+    last_accessed_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.now, index=True)
+
+    # Relationship with SessionArtifact
+    artifacts: Mapped[List["SessionArtifact"]] = relationship(back_populates="session", cascade="all, delete-orphan")
+
+class SessionArtifact(Base):
+    """Data derived from a capture session, e.g. thumbnails or cached detections"""
+    __tablename__ = "session_artifacts"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    uuid: Mapped[str] = mapped_column(String, unique=True, index=True, default=lambda: str(uuid4()))
+    session_uuid: Mapped[str] = mapped_column(String, ForeignKey("capture_sessions.uuid"), index=True)
+    kind: Mapped[str] = mapped_column(String, index=True)
+    path: Mapped[str] = mapped_column(String)
+    byte_size: Mapped[int] = mapped_column(Integer, default=0)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.now)
+
+    # Relationship with CaptureSessionRecord
+    session: Mapped[CaptureSessionRecord] = relationship(back_populates="artifacts")
@@ -0,0 +1,96 @@
+from datetime import datetime
+from typing import Optional, List, Callable
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+from .base_repository import BaseRepository
+from ..models import CaptureSessionRecord, SessionArtifact
+
+class CaptureSessionRepository(BaseRepository[CaptureSessionRecord]):
+    def __init__(self, session_factory: Callable[[], Session] | None = None):
+        super().__init__(CaptureSessionRecord, session_factory=session_factory)
+
+    def get_session(self, db: Session, project_uuid: str, command_uuid: str) -> Optional[CaptureSessionRecord]:
+        return (db.query(self.model)
+                .filter(self.model.project_uuid == project_uuid,
+                        self.model.command_uuid == command_uuid)
+                .first())
+
+    def upsert_session(self, db: Session, project_uuid: str, command_uuid: str,
+                       frame_count: Optional[int] = None, byte_size: Optional[int] = None,
+                       created_at: Optional[datetime] = None,
+                       last_accessed_at: Optional[datetime] = None) -> CaptureSessionRecord:
+        """Create the entry of a session or update the given fields of an existing one"""
+        now = datetime.now()
+        record = self.get_session(db, project_uuid, command_uuid)
+        if record is None:
+            record = self.model(project_uuid=project_uuid, command_uuid=command_uuid,
+                                frame_count=frame_count or 0, byte_size=byte_size or 0,
+                                created_at=created_at or now, last_accessed_at=last_accessed_at or now)
+            db.add(record)
+        else:
+            if frame_count is not None:
+                record.frame_count = frame_count
+            if byte_size is not None:
+                record.byte_size = byte_size
+            record.last_accessed_at = last_accessed_at or now
+        db.commit()
+        db.refresh(record)
+        return record
+
+    def touch(self, db: Session, project_uuid: str, command_uuid: str, when: Optional[datetime] = None) -> bool:
+        """Mark a session as used. Returns False if it is not in the catalog"""
+        updated = (db.query(self.model)
+                   .filter(self.model.project_uuid == project_uuid,
+                           self.model.command_uuid == command_uuid)
+                   .update({self.model.last_accessed_at: when or datetime.now()}))
+        db.commit()
+        return updated > 0
+
+    def record_artifact(self, db: Session, project_uuid: str, command_uuid: str, kind: str, path: str,
+                        byte_size: int) -> Optional[SessionArtifact]:
+        """Add or resize an artifact of a session. Returns None if the session is not in the catalog"""
+        record = self.get_session(db, project_uuid, command_uuid)
+        if record is None:
+            return None
+        artifact = (db.query(SessionArtifact)
+                    .filter(SessionArtifact.session_uuid == record.uuid,
+                            SessionArtifact.path == path)
+                    .first())
+        if artifact is None:
+            artifact = SessionArtifact(session_uuid=record.uuid, kind=kind, path=path, byte_size=byte_size)
+            db.add(artifact)
+        else:
+            artifact.kind = kind
+            artifact.byte_size = byte_size
+        db.commit()
+        db.refresh(artifact)
+        return artifact
+
+    def get_session_size(self, db: Session, record: CaptureSessionRecord) -> int:
+        """Bytes of a session's captured files plus its artifacts"""
+        artifact_bytes = (db.query(func.coalesce(func.sum(SessionArtifact.byte_size), 0))
+                          .filter(SessionArtifact.session_uuid == record.uuid)
+                          .scalar())
+        return record.byte_size + artifact_bytes
+
+    def get_total_size(self, db: Session) -> int:
+        """Bytes of all catalogued sessions and artifacts"""
+        session_bytes = db.query(func.coalesce(func.sum(self.model.byte_size), 0)).scalar()
+        artifact_bytes = db.query(func.coalesce(func.sum(SessionArtifact.byte_size), 0)).scalar()
+        return session_bytes + artifact_bytes
+
+    def count(self, db: Session) -> int:
+        return db.query(func.count(self.model.id)).scalar()
+
+    def find_least_recently_used(self, db: Session, limit: Optional[int] = None) -> List[CaptureSessionRecord]:
+        """Sessions ordered from the least to the most recently used"""
+        query = db.query(self.model).order_by(self.model.last_accessed_at, self.model.id)
+        if limit is not None:
+            query = query.limit(limit)
+        return query.all()
+
+    def find_not_accessed_since(self, db: Session, cutoff: datetime) -> List[CaptureSessionRecord]:
+        return (db.query(self.model)
+               .filter(self.model.last_accessed_at < cutoff)
+               .order_by(self.model.last_accessed_at)
+               .all())
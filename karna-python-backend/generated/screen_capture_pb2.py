@@ -24,25 +24,41 @@ _sym_db = _symbol_database.Default()
 
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x14screen_capture.proto\x12\x14karna.screen_capture\"<\n\x0e\x43\x61ptureRequest\x12\x14\n\x0cproject_uuid\x18\x01 \x01(\t\x12\x14\n\x0c\x63ommand_uuid\x18\x02 \x01(\t\"A\n\x13\x43\x61ptureCacheRequest\x12\x14\n\x0cproject_uuid\x18\x01 \x01(\t\x12\x14\n\x0c\x63ommand_uuid\x18\x02 \x01(\t\"\x98\x01\n\x14\x43\x61ptureUpdateRequest\x12\x14\n\x0cproject_uuid\x18\x01 \x01(\t\x12\x14\n\x0c\x63ommand_uuid\x18\x02 \x01(\t\x12\x0f\n\x07message\x18\x03 \x01(\t\x12\x43\n\x11screenshot_events\x18\x04 \x03(\x0b\x32(.karna.screen_capture.RpcScreenshotEvent\"\xa6\x02\n\x17ScreenCaptureRPCRequest\x12=\n\rstart_capture\x18\x01 \x01(\x0b\x32$.karna.screen_capture.CaptureRequestH\x00\x12<\n\x0cstop_capture\x18\x02 \x01(\x0b\x32$.karna.screen_capture.CaptureRequestH\x00\x12\x44\n\x0eupdate_capture\x18\x03 \x01(\x0b\x32*.karna.screen_capture.CaptureUpdateRequestH\x00\x12>\n\tget_cache\x18\x04 \x01(\x0b\x32).karna.screen_capture.CaptureCacheRequestH\x00\x42\x08\n\x06method\"\xa5\x03\n\x12RpcScreenshotEvent\x12\x10\n\x08\x65vent_id\x18\x01 \x01(\t\x12\x14\n\x0cproject_uuid\x18\x02 \x01(\t\x12\x14\n\x0c\x63ommand_uuid\x18\x03 \x01(\t\x12\x11\n\ttimestamp\x18\x04 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x05 \x01(\t\x12\x17\n\x0fscreenshot_path\x18\x06 \x01(\t\x12\x1c\n\x0f\x61nnotation_path\x18\x07 \x01(\tH\x00\x88\x01\x01\x12\x14\n\x07mouse_x\x18\x08 \x01(\x05H\x01\x88\x01\x01\x12\x14\n\x07mouse_y\x18\t \x01(\x05H\x02\x88\x01\x01\x12\x15\n\x08key_char\x18\n \x01(\tH\x03\x88\x01\x01\x12\x15\n\x08key_code\x18\x0b \x01(\tH\x04\x88\x01\x01\x12\x16\n\x0eis_special_key\x18\x0c \x01(\x08\x12!\n\x14mouse_event_tool_tip\x18\r \x01(\tH\x05\x88\x01\x01\x42\x12\n\x10_annotation_pathB\n\n\x08_mouse_xB\n\n\x08_mouse_yB\x0b\n\t_key_charB\x0b\n\t_key_codeB\x17\n\x15_mouse_event_tool_tip\"\xa4\x01\n\rCaptureResult\x12\x14\n\x0cproject_uuid\x18\x01 \x01(\t\x12\x14\n\x0c\x63ommand_uuid\x18\x02 \x01(\t\x12\x11\n\tis_active\x18\x03 \x01(\x08\x12\x0f\n\x07message\x18\x04 \x01(\t\x12\x43\n\x11screenshot_events\x18\x05 \x03(\x0b\x32(.karna.screen_capture.RpcScreenshotEvent\"t\n\x18ScreenCaptureRPCResponse\x12?\n\x10\x63\x61pture_response\x18\x01 \x01(\x0b\x32#.karna.screen_capture.CaptureResultH\x00\x12\x0f\n\x05\x65rror\x18\x02 \x01(\tH\x00\x42\x06\n\x04typeb\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x14screen_capture.proto\x12\x14karna.screen_capture\"<\n\x0e\x43\x61ptureRequest\x12\x14\n\x0cproject_uuid\x18\x01 \x01(\t\x12\x14\n\x0c\x63ommand_uuid\x18\x02 \x01(\t\"A\n\x13\x43\x61ptureCacheRequest\x12\x14\n\x0cproject_uuid\x18\x01 \x01(\t\x12\x14\n\x0c\x63ommand_uuid\x18\x02 \x01(\t\"\x98\x01\n\x14\x43\x61ptureUpdateRequest\x12\x14\n\x0cproject_uuid\x18\x01 \x01(\t\x12\x14\n\x0c\x63ommand_uuid\x18\x02 \x01(\t\x12\x0f\n\x07message\x18\x03 \x01(\t\x12\x43\n\x11screenshot_events\x18\x04 \x03(\x0b\x32(.karna.screen_capture.RpcScreenshotEvent\"/\n\x1c\x43\x61ptureDeltaSubscribeRequest\x12\x0f\n\x07\x65nabled\x18\x01 \x01(\x08\"Y\n\x14\x43\x61ptureResyncRequest\x12\x14\n\x0cproject_uuid\x18\x01 \x01(\t\x12\x14\n\x0c\x63ommand_uuid\x18\x02 \x01(\t\x12\x15\n\rlast_sequence\x18\x03 \x01(\x03\"\x15\n\x13\x43\x61ptureStatsRequest\"\xf4\x03\n\x17ScreenCaptureRPCRequest\x12=\n\rstart_capture\x18\x01 \x01(\x0b\x32$.karna.screen_capture.CaptureRequestH\x00\x12<\n\x0cstop_capture\x18\x02 \x01(\x0b\x32$.karna.screen_capture.CaptureRequestH\x00\x12\x44\n\x0eupdate_capture\x18\x03 \x01(\x0b\x32*.karna.screen_capture.CaptureUpdateRequestH\x00\x12>\n\tget_cache\x18\x04 \x01(\x0b\x32).karna.screen_capture.CaptureCacheRequestH\x00\x12N\n\x10subscribe_deltas\x18\x05 \x01(\x0b\x32\x32.karna.screen_capture.CaptureDeltaSubscribeRequestH\x00\x12<\n\x06resync\x18\x06 \x01(\x0b\x32*.karna.screen_capture.CaptureResyncRequestH\x00\x12>\n\tget_stats\x18\x07 \x01(\x0b\x32).karna.screen_capture.CaptureStatsRequestH\x00\x42\x08\n\x06method\"\x8d\x06\n\x12RpcScreenshotEvent\x12\x10\n\x08\x65vent_id\x18\x01 \x01(\t\x12\x14\n\x0cproject_uuid\x18\x02 \x01(\t\x12\x14\n\x0c\x63ommand_uuid\x18\x03 \x01(\t\x12\x11\n\ttimestamp\x18\x04 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x05 \x01(\t\x12\x17\n\x0fscreenshot_path\x18\x06 \x01(\t\x12\x1c\n\x0f\x61nnotation_path\x18\x07 \x01(\tH\x00\x88\x01\x01\x12\x14\n\x07mouse_x\x18\x08 \x01(\x05H\x01\x88\x01\x01\x12\x14\n\x07mouse_y\x18\t \x01(\x05H\x02\x88\x01\x01\x12\x15\n\x08key_char\x18\n \x01(\tH\x03\x88\x01\x01\x12\x15\n\x08key_code\x18\x0b \x01(\tH\x04\x88\x01\x01\x12\x16\n\x0eis_special_key\x18\x0c \x01(\x08\x12!\n\x14mouse_event_tool_tip\x18\r \x01(\tH\x05\x88\x01\x01\x12\x1d\n\x10similarity_score\x18\x0e \x01(\x01H\x06\x88\x01\x01\x12\"\n\x15\x64uplicate_of_event_id\x18\x0f \x01(\tH\x07\x88\x01\x01\x12U\n\x0fthumbnail_paths\x18\x10 \x03(\x0b\x32<.karna.screen_capture.RpcScreenshotEvent.ThumbnailPathsEntry\x12\x1d\n\x10\x63\x61pture_origin_x\x18\x11 \x01(\x05H\x08\x88\x01\x01\x12\x1d\n\x10\x63\x61pture_origin_y\x18\x12 \x01(\x05H\t\x88\x01\x01\x1a\x35\n\x13ThumbnailPathsEntry\x12\x0b\n\x03key\x18\x01 \x01(\x05\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\x42\x12\n\x10_annotation_pathB\n\n\x08_mouse_xB\n\n\x08_mouse_yB\x0b\n\t_key_charB\x0b\n\t_key_codeB\x17\n\x15_mouse_event_tool_tipB\x13\n\x11_similarity_scoreB\x18\n\x16_duplicate_of_event_idB\x13\n\x11_capture_origin_xB\x13\n\x11_capture_origin_y\"\xa4\x01\n\rCaptureResult\x12\x14\n\x0cproject_uuid\x18\x01 \x01(\t\x12\x14\n\x0c\x63ommand_uuid\x18\x02 \x01(\t\x12\x11\n\tis_active\x18\x03 \x01(\x08\x12\x0f\n\x07message\x18\x04 \x01(\t\x12\x43\n\x11screenshot_events\x18\x05 \x03(\x0b\x32(.karna.screen_capture.RpcScreenshotEvent\"\xf5\x01\n\x0c\x43\x61ptureDelta\x12\x14\n\x0cproject_uuid\x18\x01 \x01(\t\x12\x14\n\x0c\x63ommand_uuid\x18\x02 \x01(\t\x12\x10\n\x08sequence\x18\x03 \x01(\x03\x12\x34\n\x04type\x18\x04 \x01(\x0e\x32&.karna.screen_capture.CaptureDeltaType\x12\x11\n\tis_active\x18\x05 \x01(\x08\x12\x43\n\x11screenshot_events\x18\x06 \x03(\x0b\x32(.karna.screen_capture.RpcScreenshotEvent\x12\x19\n\x11\x64\x65leted_event_ids\x18\x07 \x03(\t\"\xa8\x02\n\x0c\x43\x61ptureStats\x12\x14\n\x0cproject_uuid\x18\x01 \x01(\t\x12\x14\n\x0c\x63ommand_uuid\x18\x02 \x01(\t\x12\x11\n\tis_active\x18\x03 \x01(\x08\x12\x19\n\x11total_screenshots\x18\x04 \x01(\x05\x12\x19\n\x11total_annotations\x18\x05 \x01(\x05\x12\x18\n\x10total_key_events\x18\x06 \x01(\x05\x12\x1a\n\x12total_mouse_events\x18\x07 \x01(\x05\x12\x18\n\x10\x64uration_seconds\x18\x08 \x01(\x01\x12\x1a\n\x12raw_directory_size\x18\t \x01(\x03\x12 \n\x18\x61nnotated_directory_size\x18\n \x01(\x03\x12\x15\n\rmissing_files\x18\x0b \x01(\x05\"\xee\x01\n\x18ScreenCaptureRPCResponse\x12?\n\x10\x63\x61pture_response\x18\x01 \x01(\x0b\x32#.karna.screen_capture.CaptureResultH\x00\x12\x0f\n\x05\x65rror\x18\x02 \x01(\tH\x00\x12;\n\rcapture_delta\x18\x03 \x01(\x0b\x32\".karna.screen_capture.CaptureDeltaH\x00\x12;\n\rcapture_stats\x18\x04 \x01(\x0b\x32\".karna.screen_capture.CaptureStatsH\x00\x42\x06\n\x04type*y\n\x10\x43\x61ptureDeltaType\x12\x18\n\x14\x43\x41PTURE_DELTA_APPEND\x10\x00\x12\x18\n\x14\x43\x41PTURE_DELTA_UPDATE\x10\x01\x12\x18\n\x14\x43\x41PTURE_DELTA_DELETE\x10\x02\x12\x17\n\x13\x43\x41PTURE_DELTA_RESET\x10\x03\x62\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
 _builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'screen_capture_pb2', _globals)
 if not _descriptor._USE_C_DESCRIPTORS:
   DESCRIPTOR._loaded_options = None
+  _globals['_RPCSCREENSHOTEVENT_THUMBNAILPATHSENTRY']._loaded_options = None
+  _globals['_RPCSCREENSHOTEVENT_THUMBNAILPATHSENTRY']._serialized_options = b'8\001'
+  _globals['_CAPTUREDELTATYPE']._serialized_start=2735
+  _globals['_CAPTUREDELTATYPE']._serialized_end=2856
   _globals['_CAPTUREREQUEST']._serialized_start=46
   _globals['_CAPTUREREQUEST']._serialized_end=106
   _globals['_CAPTURECACHEREQUEST']._serialized_start=108
   _globals['_CAPTURECACHEREQUEST']._serialized_end=173
   _globals['_CAPTUREUPDATEREQUEST']._serialized_start=176
   _globals['_CAPTUREUPDATEREQUEST']._serialized_end=328
-  _globals['_SCREENCAPTURERPCREQUEST']._serialized_start=331
-  _globals['_SCREENCAPTURERPCREQUEST']._serialized_end=625
-  _globals['_RPCSCREENSHOTEVENT']._serialized_start=628
-  _globals['_RPCSCREENSHOTEVENT']._serialized_end=1049
-  _globals['_CAPTURERESULT']._serialized_start=1052
-  _globals['_CAPTURERESULT']._serialized_end=1216
-  _globals['_SCREENCAPTURERPCRESPONSE']._serialized_start=1218
-  _globals['_SCREENCAPTURERPCRESPONSE']._serialized_end=1334
+  _globals['_CAPTUREDELTASUBSCRIBEREQUEST']._serialized_start=330
+  _globals['_CAPTUREDELTASUBSCRIBEREQUEST']._serialized_end=377
+  _globals['_CAPTURERESYNCREQUEST']._serialized_start=379
+  _globals['_CAPTURERESYNCREQUEST']._serialized_end=468
+  _globals['_CAPTURESTATSREQUEST']._serialized_start=470
+  _globals['_CAPTURESTATSREQUEST']._serialized_end=491
+  _globals['_SCREENCAPTURERPCREQUEST']._serialized_start=494
+  _globals['_SCREENCAPTURERPCREQUEST']._serialized_end=994
+  _globals['_RPCSCREENSHOTEVENT']._serialized_start=997
+  _globals['_RPCSCREENSHOTEVENT']._serialized_end=1778
+  _globals['_RPCSCREENSHOTEVENT_THUMBNAILPATHSENTRY']._serialized_start=1541
+  _globals['_RPCSCREENSHOTEVENT_THUMBNAILPATHSENTRY']._serialized_end=1594
+  _globals['_CAPTURERESULT']._serialized_start=1781
+  _globals['_CAPTURERESULT']._serialized_end=1945
+  _globals['_CAPTUREDELTA']._serialized_start=1948
+  _globals['_CAPTUREDELTA']._serialized_end=2193
+  _globals['_CAPTURESTATS']._serialized_start=2196
+  _globals['_CAPTURESTATS']._serialized_end=2492
+  _globals['_SCREENCAPTURERPCRESPONSE']._serialized_start=2495
+  _globals['_SCREENCAPTURERPCRESPONSE']._serialized_end=2733
 # @@protoc_insertion_point(module_scope)
@@ -7,11 +7,39 @@ import builtins
 import collections.abc
 import google.protobuf.descriptor
 import google.protobuf.internal.containers
+import google.protobuf.internal.enum_type_wrapper
 import google.protobuf.message
+import sys
 import typing
 
+if sys.version_info >= (3, 10):
+    import typing as typing_extensions
+else:
+    import typing_extensions
+
 DESCRIPTOR: google.protobuf.descriptor.FileDescriptor
 
+class _CaptureDeltaType:
+    ValueType = typing.NewType("ValueType", builtins.int)
+    V: typing_extensions.TypeAlias = ValueType
+
+class _CaptureDeltaTypeEnumTypeWrapper(google.protobuf.internal.enum_type_wrapper._EnumTypeWrapper[_CaptureDeltaType.ValueType], builtins.type):
+    DESCRIPTOR: google.protobuf.descriptor.EnumDescriptor
+    CAPTURE_DELTA_APPEND: _CaptureDeltaType.ValueType  # 0
+    CAPTURE_DELTA_UPDATE: _CaptureDeltaType.ValueType  # 1
+    CAPTURE_DELTA_DELETE: _CaptureDeltaType.ValueType  # 2
+    CAPTURE_DELTA_RESET: _CaptureDeltaType.ValueType  # 3
+    """screenshot_events holds the full list of the session"""
+
+class CaptureDeltaType(_CaptureDeltaType, metaclass=_CaptureDeltaTypeEnumTypeWrapper): ...
+
+CAPTURE_DELTA_APPEND: CaptureDeltaType.ValueType  # 0
+CAPTURE_DELTA_UPDATE: CaptureDeltaType.ValueType  # 1
+CAPTURE_DELTA_DELETE: CaptureDeltaType.ValueType  # 2
+CAPTURE_DELTA_RESET: CaptureDeltaType.ValueType  # 3
+"""screenshot_events holds the full list of the session"""
+global___CaptureDeltaType = CaptureDeltaType
+
 @typing.final
 class CaptureRequest(google.protobuf.message.Message):
     DESCRIPTOR: google.protobuf.descriptor.Descriptor
@@ -73,6 +101,59 @@ class CaptureUpdateRequest(google.protobuf.message.Message):
 
 global___CaptureUpdateRequest = CaptureUpdateRequest
 
+@typing.final
+class CaptureDeltaSubscribeRequest(google.protobuf.message.Message):
+    """Opt in (or out) of CaptureDelta updates instead of the full CaptureResult list"""
+
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    ENABLED_FIELD_NUMBER: builtins.int
+    enabled: builtins.bool
+    def __init__(
+        self,
+        *,
+        enabled: builtins.bool = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing.Literal["enabled", b"enabled"]) -> None: ...
+
+global___CaptureDeltaSubscribeRequest = CaptureDeltaSubscribeRequest
+
+@typing.final
+class CaptureResyncRequest(google.protobuf.message.Message):
+    """Ask for the full event list of the current session, e.g. after a sequence gap"""
+
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    PROJECT_UUID_FIELD_NUMBER: builtins.int
+    COMMAND_UUID_FIELD_NUMBER: builtins.int
+    LAST_SEQUENCE_FIELD_NUMBER: builtins.int
+    project_uuid: builtins.str
+    command_uuid: builtins.str
+    last_sequence: builtins.int
+    """Last sequence number the client applied"""
+    def __init__(
+        self,
+        *,
+        project_uuid: builtins.str = ...,
+        command_uuid: builtins.str = ...,
+        last_sequence: builtins.int = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing.Literal["command_uuid", b"command_uuid", "last_sequence", b"last_sequence", "project_uuid", b"project_uuid"]) -> None: ...
+
+global___CaptureResyncRequest = CaptureResyncRequest
+
+@typing.final
+class CaptureStatsRequest(google.protobuf.message.Message):
+    """Ask for the running statistics of the current session"""
+
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    def __init__(
+        self,
+    ) -> None: ...
+
+global___CaptureStatsRequest = CaptureStatsRequest
+
 @typing.final
 class ScreenCaptureRPCRequest(google.protobuf.message.Message):
     """Request message types"""
@@ -83,6 +164,9 @@ class ScreenCaptureRPCRequest(google.protobuf.message.Message):
     STOP_CAPTURE_FIELD_NUMBER: builtins.int
     UPDATE_CAPTURE_FIELD_NUMBER: builtins.int
     GET_CACHE_FIELD_NUMBER: builtins.int
+    SUBSCRIBE_DELTAS_FIELD_NUMBER: builtins.int
+    RESYNC_FIELD_NUMBER: builtins.int
+    GET_STATS_FIELD_NUMBER: builtins.int
     @property
     def start_capture(self) -> global___CaptureRequest: ...
     @property
@@ -91,6 +175,12 @@ class ScreenCaptureRPCRequest(google.protobuf.message.Message):
     def update_capture(self) -> global___CaptureUpdateRequest: ...
     @property
     def get_cache(self) -> global___CaptureCacheRequest: ...
+    @property
+    def subscribe_deltas(self) -> global___CaptureDeltaSubscribeRequest: ...
+    @property
+    def resync(self) -> global___CaptureResyncRequest: ...
+    @property
+    def get_stats(self) -> global___CaptureStatsRequest: ...
     def __init__(
         self,
         *,
@@ -98,10 +188,13 @@ class ScreenCaptureRPCRequest(google.protobuf.message.Message):
         stop_capture: global___CaptureRequest | None = ...,
         update_capture: global___CaptureUpdateRequest | None = ...,
         get_cache: global___CaptureCacheRequest | None = ...,
+        subscribe_deltas: global___CaptureDeltaSubscribeRequest | None = ...,
+        resync: global___CaptureResyncRequest | None = ...,
+        get_stats: global___CaptureStatsRequest | None = ...,
     ) -> None: ...
-    def HasField(self, field_name: typing.Literal["get_cache", b"get_cache", "method", b"method", "start_capture", b"start_capture", "stop_capture", b"stop_capture", "update_capture", b"update_capture"]) -> builtins.bool: ...
-    def ClearField(self, field_name: typing.Literal["get_cache", b"get_cache", "method", b"method", "start_capture", b"start_capture", "stop_capture", b"stop_capture", "update_capture", b"update_capture"]) -> None: ...
-    def WhichOneof(self, oneof_group: typing.Literal["method", b"method"]) -> typing.Literal["start_capture", "stop_capture", "update_capture", "get_cache"] | None: ...
+    def HasField(self, field_name: typing.Literal["get_cache", b"get_cache", "get_stats", b"get_stats", "method", b"method", "resync", b"resync", "start_capture", b"start_capture", "stop_capture", b"stop_capture", "subscribe_deltas", b"subscribe_deltas", "update_capture", b"update_capture"]) -> builtins.bool: ...
+    def ClearField(self, field_name: typing.Literal["get_cache", b"get_cache", "get_stats", b"get_stats", "method", b"method", "resync", b"resync", "start_capture", b"start_capture", "stop_capture", b"stop_capture", "subscribe_deltas", b"subscribe_deltas", "update_capture", b"update_capture"]) -> None: ...
+    def WhichOneof(self, oneof_group: typing.Literal["method", b"method"]) -> typing.Literal["start_capture", "stop_capture", "update_capture", "get_cache", "subscribe_deltas", "resync", "get_stats"] | None: ...
 
 global___ScreenCaptureRPCRequest = ScreenCaptureRPCRequest
 
@@ -109,6 +202,22 @@ global___ScreenCaptureRPCRequest = ScreenCaptureRPCRequest
 class RpcScreenshotEvent(google.protobuf.message.Message):
     DESCRIPTOR: google.protobuf.descriptor.Descriptor
 
+    @typing.final
+    class ThumbnailPathsEntry(google.protobuf.message.Message):
+        DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+        KEY_FIELD_NUMBER: builtins.int
+        VALUE_FIELD_NUMBER: builtins.int
+        key: builtins.int
+        value: builtins.str
+        def __init__(
+            self,
+            *,
+            key: builtins.int = ...,
+            value: builtins.str = ...,
+        ) -> None: ...
+        def ClearField(self, field_name: typing.Literal["key", b"key", "value", b"value"]) -> None: ...
+
     EVENT_ID_FIELD_NUMBER: builtins.int
     PROJECT_UUID_FIELD_NUMBER: builtins.int
     COMMAND_UUID_FIELD_NUMBER: builtins.int
@@ -122,6 +231,11 @@ class RpcScreenshotEvent(google.protobuf.message.Message):
     KEY_CODE_FIELD_NUMBER: builtins.int
     IS_SPECIAL_KEY_FIELD_NUMBER: builtins.int
     MOUSE_EVENT_TOOL_TIP_FIELD_NUMBER: builtins.int
+    SIMILARITY_SCORE_FIELD_NUMBER: builtins.int
+    DUPLICATE_OF_EVENT_ID_FIELD_NUMBER: builtins.int
+    THUMBNAIL_PATHS_FIELD_NUMBER: builtins.int
+    CAPTURE_ORIGIN_X_FIELD_NUMBER: builtins.int
+    CAPTURE_ORIGIN_Y_FIELD_NUMBER: builtins.int
     event_id: builtins.str
     project_uuid: builtins.str
     command_uuid: builtins.str
@@ -136,6 +250,19 @@ class RpcScreenshotEvent(google.protobuf.message.Message):
     is_special_key: builtins.bool
     mouse_event_tool_tip: builtins.str
     """For mouse button information - defaults to "Left Button" for backward compatibility when mouseX/Y are present"""
+    similarity_score: builtins.float
+    """Similarity to the previous stored frame of the session (1.0 = identical)"""
+    duplicate_of_event_id: builtins.str
+    """Set when the frame was a near-duplicate; screenshot_path is then the referenced event's image"""
+    capture_origin_x: builtins.int
+    """Screen coordinates of the screenshot's top-left pixel when only the website render area was
+    captured; mouse_x and mouse_y stay in screen coordinates
+    """
+    capture_origin_y: builtins.int
+    @property
+    def thumbnail_paths(self) -> google.protobuf.internal.containers.ScalarMap[builtins.int, builtins.str]:
+        """Thumbnail width in pixels -> path of the WebP thumbnail, served under /data like screenshot_path"""
+
     def __init__(
         self,
         *,
@@ -152,12 +279,23 @@ class RpcScreenshotEvent(google.protobuf.message.Message):
         key_code: builtins.str | None = ...,
         is_special_key: builtins.bool = ...,
         mouse_event_tool_tip: builtins.str | None = ...,
+        similarity_score: builtins.float | None = ...,
+        duplicate_of_event_id: builtins.str | None = ...,
+        thumbnail_paths: collections.abc.Mapping[builtins.int, builtins.str] | None = ...,
+        capture_origin_x: builtins.int | None = ...,
+        capture_origin_y: builtins.int | None = ...,
     ) -> None: ...
-    def HasField(self, field_name: typing.Literal["_annotation_path", b"_annotation_path", "_key_char", b"_key_char", "_key_code", b"_key_code", "_mouse_event_tool_tip", b"_mouse_event_tool_tip", "_mouse_x", b"_mouse_x", "_mouse_y", b"_mouse_y", "annotation_path", b"annotation_path", "key_char", b"key_char", "key_code", b"key_code", "mouse_event_tool_tip", b"mouse_event_tool_tip", "mouse_x", b"mouse_x", "mouse_y", b"mouse_y"]) -> builtins.bool: ...
-    def ClearField(self, field_name: typing.Literal["_annotation_path", b"_annotation_path", "_key_char", b"_key_char", "_key_code", b"_key_code", "_mouse_event_tool_tip", b"_mouse_event_tool_tip", "_mouse_x", b"_mouse_x", "_mouse_y", b"_mouse_y", "annotation_path", b"annotation_path", "command_uuid", b"command_uuid", "description", b"description", "event_id", b"event_id", "is_special_key", b"is_special_key", "key_char", b"key_char", "key_code", b"key_code", "mouse_event_tool_tip", b"mouse_event_tool_tip", "mouse_x", b"mouse_x", "mouse_y", b"mouse_y", "project_uuid", b"project_uuid", "screenshot_path", b"screenshot_path", "timestamp", b"timestamp"]) -> None: ...
+    def HasField(self, field_name: typing.Literal["_annotation_path", b"_annotation_path", "_capture_origin_x", b"_capture_origin_x", "_capture_origin_y", b"_capture_origin_y", "_duplicate_of_event_id", b"_duplicate_of_event_id", "_key_char", b"_key_char", "_key_code", b"_key_code", "_mouse_event_tool_tip", b"_mouse_event_tool_tip", "_mouse_x", b"_mouse_x", "_mouse_y", b"_mouse_y", "_similarity_score", b"_similarity_score", "annotation_path", b"annotation_path", "capture_origin_x", b"capture_origin_x", "capture_origin_y", b"capture_origin_y", "duplicate_of_event_id", b"duplicate_of_event_id", "key_char", b"key_char", "key_code", b"key_code", "mouse_event_tool_tip", b"mouse_event_tool_tip", "mouse_x", b"mouse_x", "mouse_y", b"mouse_y", "similarity_score", b"similarity_score"]) -> builtins.bool: ...
+    def ClearField(self, field_name: typing.Literal["_annotation_path", b"_annotation_path", "_capture_origin_x", b"_capture_origin_x", "_capture_origin_y", b"_capture_origin_y", "_duplicate_of_event_id", b"_duplicate_of_event_id", "_key_char", b"_key_char", "_key_code", b"_key_code", "_mouse_event_tool_tip", b"_mouse_event_tool_tip", "_mouse_x", b"_mouse_x", "_mouse_y", b"_mouse_y", "_similarity_score", b"_similarity_score", "annotation_path", b"annotation_path", "capture_origin_x", b"capture_origin_x", "capture_origin_y", b"capture_origin_y", "command_uuid", b"command_uuid", "description", b"description", "duplicate_of_event_id", b"duplicate_of_event_id", "event_id", b"event_id", "is_special_key", b"is_special_key", "key_char", b"key_char", "key_code", b"key_code", "mouse_event_tool_tip", b"mouse_event_tool_tip", "mouse_x", b"mouse_x", "mouse_y", b"mouse_y", "project_uuid", b"project_uuid", "screenshot_path", b"screenshot_path", "similarity_score", b"similarity_score", "thumbnail_paths", b"thumbnail_paths", "timestamp", b"timestamp"]) -> None: ...
     @typing.overload
     def WhichOneof(self, oneof_group: typing.Literal["_annotation_path", b"_annotation_path"]) -> typing.Literal["annotation_path"] | None: ...
     @typing.overload
+    def WhichOneof(self, oneof_group: typing.Literal["_capture_origin_x", b"_capture_origin_x"]) -> typing.Literal["capture_origin_x"] | None: ...
+    @typing.overload
+    def WhichOneof(self, oneof_group: typing.Literal["_capture_origin_y", b"_capture_origin_y"]) -> typing.Literal["capture_origin_y"] | None: ...
+    @typing.overload
+    def WhichOneof(self, oneof_group: typing.Literal["_duplicate_of_event_id", b"_duplicate_of_event_id"]) -> typing.Literal["duplicate_of_event_id"] | None: ...
+    @typing.overload
     def WhichOneof(self, oneof_group: typing.Literal["_key_char", b"_key_char"]) -> typing.Literal["key_char"] | None: ...
     @typing.overload
     def WhichOneof(self, oneof_group: typing.Literal["_key_code", b"_key_code"]) -> typing.Literal["key_code"] | None: ...
@@ -167,6 +305,8 @@ class RpcScreenshotEvent(google.protobuf.message.Message):
     def WhichOneof(self, oneof_group: typing.Literal["_mouse_x", b"_mouse_x"]) -> typing.Literal["mouse_x"] | None: ...
     @typing.overload
     def WhichOneof(self, oneof_group: typing.Literal["_mouse_y", b"_mouse_y"]) -> typing.Literal["mouse_y"] | None: ...
+    @typing.overload
+    def WhichOneof(self, oneof_group: typing.Literal["_similarity_score", b"_similarity_score"]) -> typing.Literal["similarity_score"] | None: ...
 
 global___RpcScreenshotEvent = RpcScreenshotEvent
 
@@ -198,6 +338,96 @@ class CaptureResult(google.protobuf.message.Message):
 
 global___CaptureResult = CaptureResult
 
+@typing.final
+class CaptureDelta(google.protobuf.message.Message):
+    """Change to the screenshot event list of a session"""
+
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    PROJECT_UUID_FIELD_NUMBER: builtins.int
+    COMMAND_UUID_FIELD_NUMBER: builtins.int
+    SEQUENCE_FIELD_NUMBER: builtins.int
+    TYPE_FIELD_NUMBER: builtins.int
+    IS_ACTIVE_FIELD_NUMBER: builtins.int
+    SCREENSHOT_EVENTS_FIELD_NUMBER: builtins.int
+    DELETED_EVENT_IDS_FIELD_NUMBER: builtins.int
+    project_uuid: builtins.str
+    command_uuid: builtins.str
+    sequence: builtins.int
+    """Increases by one per delta within a session"""
+    type: global___CaptureDeltaType.ValueType
+    is_active: builtins.bool
+    @property
+    def screenshot_events(self) -> google.protobuf.internal.containers.RepeatedCompositeFieldContainer[global___RpcScreenshotEvent]:
+        """Appended or updated events"""
+
+    @property
+    def deleted_event_ids(self) -> google.protobuf.internal.containers.RepeatedScalarFieldContainer[builtins.str]: ...
+    def __init__(
+        self,
+        *,
+        project_uuid: builtins.str = ...,
+        command_uuid: builtins.str = ...,
+        sequence: builtins.int = ...,
+        type: global___CaptureDeltaType.ValueType = ...,
+        is_active: builtins.bool = ...,
+        screenshot_events: collections.abc.Iterable[global___RpcScreenshotEvent] | None = ...,
+        deleted_event_ids: collections.abc.Iterable[builtins.str] | None = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing.Literal["command_uuid", b"command_uuid", "deleted_event_ids", b"deleted_event_ids", "is_active", b"is_active", "project_uuid", b"project_uuid", "screenshot_events", b"screenshot_events", "sequence", b"sequence", "type", b"type"]) -> None: ...
+
+global___CaptureDelta = CaptureDelta
+
+@typing.final
+class CaptureStats(google.protobuf.message.Message):
+    """Statistics of the current session, kept up to date as screenshots are written"""
+
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    PROJECT_UUID_FIELD_NUMBER: builtins.int
+    COMMAND_UUID_FIELD_NUMBER: builtins.int
+    IS_ACTIVE_FIELD_NUMBER: builtins.int
+    TOTAL_SCREENSHOTS_FIELD_NUMBER: builtins.int
+    TOTAL_ANNOTATIONS_FIELD_NUMBER: builtins.int
+    TOTAL_KEY_EVENTS_FIELD_NUMBER: builtins.int
+    TOTAL_MOUSE_EVENTS_FIELD_NUMBER: builtins.int
+    DURATION_SECONDS_FIELD_NUMBER: builtins.int
+    RAW_DIRECTORY_SIZE_FIELD_NUMBER: builtins.int
+    ANNOTATED_DIRECTORY_SIZE_FIELD_NUMBER: builtins.int
+    MISSING_FILES_FIELD_NUMBER: builtins.int
+    project_uuid: builtins.str
+    command_uuid: builtins.str
+    is_active: builtins.bool
+    total_screenshots: builtins.int
+    total_annotations: builtins.int
+    total_key_events: builtins.int
+    total_mouse_events: builtins.int
+    duration_seconds: builtins.float
+    raw_directory_size: builtins.int
+    """in bytes"""
+    annotated_directory_size: builtins.int
+    """in bytes"""
+    missing_files: builtins.int
+    """Referenced files found missing by the last reconciliation"""
+    def __init__(
+        self,
+        *,
+        project_uuid: builtins.str = ...,
+        command_uuid: builtins.str = ...,
+        is_active: builtins.bool = ...,
+        total_screenshots: builtins.int = ...,
+        total_annotations: builtins.int = ...,
+        total_key_events: builtins.int = ...,
+        total_mouse_events: builtins.int = ...,
+        duration_seconds: builtins.float = ...,
+        raw_directory_size: builtins.int = ...,
+        annotated_directory_size: builtins.int = ...,
+        missing_files: builtins.int = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing.Literal["annotated_directory_size", b"annotated_directory_size", "command_uuid", b"command_uuid", "duration_seconds", b"duration_seconds", "is_active", b"is_active", "missing_files", b"missing_files", "project_uuid", b"project_uuid", "raw_directory_size", b"raw_directory_size", "total_annotations", b"total_annotations", "total_key_events", b"total_key_events", "total_mouse_events", b"total_mouse_events", "total_screenshots", b"total_screenshots"]) -> None: ...
+
+global___CaptureStats = CaptureStats
+
 @typing.final
 class ScreenCaptureRPCResponse(google.protobuf.message.Message):
     """Response message types"""
@@ -206,17 +436,25 @@ class ScreenCaptureRPCResponse(google.protobuf.message.Message):
 
     CAPTURE_RESPONSE_FIELD_NUMBER: builtins.int
     ERROR_FIELD_NUMBER: builtins.int
+    CAPTURE_DELTA_FIELD_NUMBER: builtins.int
+    CAPTURE_STATS_FIELD_NUMBER: builtins.int
     error: builtins.str
     @property
     def capture_response(self) -> global___CaptureResult: ...
+    @property
+    def capture_delta(self) -> global___CaptureDelta: ...
+    @property
+    def capture_stats(self) -> global___CaptureStats: ...
     def __init__(
         self,
         *,
         capture_response: global___CaptureResult | None = ...,
         error: builtins.str = ...,
+        capture_delta: global___CaptureDelta | None = ...,
+        capture_stats: global___CaptureStats | None = ...,
     ) -> None: ...
-    def HasField(self, field_name: typing.Literal["capture_response", b"capture_response", "error", b"error", "type", b"type"]) -> builtins.bool: ...
-    def ClearField(self, field_name: typing.Literal["capture_response", b"capture_response", "error", b"error", "type", b"type"]) -> None: ...
-    def WhichOneof(self, oneof_group: typing.Literal["type", b"type"]) -> typing.Literal["capture_response", "error"] | None: ...
+    def HasField(self, field_name: typing.Literal["capture_delta", b"capture_delta", "capture_response", b"capture_response", "capture_stats", b"capture_stats", "error", b"error", "type", b"type"]) -> builtins.bool: ...
+    def ClearField(self, field_name: typing.Literal["capture_delta", b"capture_delta", "capture_response", b"capture_response", "capture_stats", b"capture_stats", "error", b"error", "type", b"type"]) -> None: ...
+    def WhichOneof(self, oneof_group: typing.Literal["type", b"type"]) -> typing.Literal["capture_response", "error", "capture_delta", "capture_stats"] | None: ...
 
 global___ScreenCaptureRPCResponse = ScreenCaptureRPCResponse
@@ -91,6 +91,58 @@ class BoundingBox(google.protobuf.message.Message):
 
 global___BoundingBox = BoundingBox
 
+@typing.final
+class PackedBoundingBoxes(google.protobuf.message.Message):
+    """Bounding boxes of one frame as columns: box i is element i of every column.
+    The numeric columns are packed, so a frame needs no nested message per box.
+    """
+
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    X_FIELD_NUMBER: builtins.int
+    Y_FIELD_NUMBER: builtins.int
+    WIDTH_FIELD_NUMBER: builtins.int
+    HEIGHT_FIELD_NUMBER: builtins.int
+    CONFIDENCE_FIELD_NUMBER: builtins.int
+    CLASS_INDEX_FIELD_NUMBER: builtins.int
+    CLASS_NAMES_FIELD_NUMBER: builtins.int
+    IDS_FIELD_NUMBER: builtins.int
+    @property
+    def x(self) -> google.protobuf.internal.containers.RepeatedScalarFieldContainer[builtins.int]: ...
+    @property
+    def y(self) -> google.protobuf.internal.containers.RepeatedScalarFieldContainer[builtins.int]: ...
+    @property
+    def width(self) -> google.protobuf.internal.containers.RepeatedScalarFieldContainer[builtins.int]: ...
+    @property
+    def height(self) -> google.protobuf.internal.containers.RepeatedScalarFieldContainer[builtins.int]: ...
+    @property
+    def confidence(self) -> google.protobuf.internal.containers.RepeatedScalarFieldContainer[builtins.float]: ...
+    @property
+    def class_index(self) -> google.protobuf.internal.containers.RepeatedScalarFieldContainer[builtins.int]:
+        """Index into class_names"""
+
+    @property
+    def class_names(self) -> google.protobuf.internal.containers.RepeatedScalarFieldContainer[builtins.str]:
+        """Class name table of the frame"""
+
+    @property
+    def ids(self) -> google.protobuf.internal.containers.RepeatedScalarFieldContainer[builtins.str]: ...
+    def __init__(
+        self,
+        *,
+        x: collections.abc.Iterable[builtins.int] | None = ...,
+        y: collections.abc.Iterable[builtins.int] | None = ...,
+        width: collections.abc.Iterable[builtins.int] | None = ...,
+        height: collections.abc.Iterable[builtins.int] | None = ...,
+        confidence: collections.abc.Iterable[builtins.float] | None = ...,
+        class_index: collections.abc.Iterable[builtins.int] | None = ...,
+        class_names: collections.abc.Iterable[builtins.str] | None = ...,
+        ids: collections.abc.Iterable[builtins.str] | None = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing.Literal["class_index", b"class_index", "class_names", b"class_names", "confidence", b"confidence", "height", b"height", "ids", b"ids", "width", b"width", "x", b"x", "y", b"y"]) -> None: ...
+
+global___PackedBoundingBoxes = PackedBoundingBoxes
+
 @typing.final
 class VisionDetectResultModel(google.protobuf.message.Message):
     """Vision detection result model"""
@@ -110,6 +162,7 @@ class VisionDetectResultModel(google.protobuf.message.Message):
     CROPPED_IMAGE_FIELD_NUMBER: builtins.int
     CROPPED_WIDTH_FIELD_NUMBER: builtins.int
     CROPPED_HEIGHT_FIELD_NUMBER: builtins.int
+    PACKED_BBOXES_FIELD_NUMBER: builtins.int
     event_id: builtins.str
     project_uuid: builtins.str
     command_uuid: builtins.str
@@ -126,6 +179,10 @@ class VisionDetectResultModel(google.protobuf.message.Message):
     cropped_height: builtins.int
     @property
     def merged_ui_icon_bboxes(self) -> google.protobuf.internal.containers.RepeatedCompositeFieldContainer[global___BoundingBox]: ...
+    @property
+    def packed_bboxes(self) -> global___PackedBoundingBoxes:
+        """Sent instead of merged_ui_icon_bboxes when the server packs boxes"""
+
     def __init__(
         self,
         *,
@@ -142,8 +199,10 @@ class VisionDetectResultModel(google.protobuf.message.Message):
         cropped_image: builtins.bytes = ...,
         cropped_width: builtins.int = ...,
         cropped_height: builtins.int = ...,
+        packed_bboxes: global___PackedBoundingBoxes | None = ...,
     ) -> None: ...
-    def ClearField(self, field_name: typing.Literal["command_uuid", b"command_uuid", "cropped_height", b"cropped_height", "cropped_image", b"cropped_image", "cropped_width", b"cropped_width", "description", b"description", "event_id", b"event_id", "is_cropped", b"is_cropped", "merged_ui_icon_bboxes", b"merged_ui_icon_bboxes", "original_height", b"original_height", "original_image_path", b"original_image_path", "original_width", b"original_width", "project_uuid", b"project_uuid", "timestamp", b"timestamp"]) -> None: ...
+    def HasField(self, field_name: typing.Literal["packed_bboxes", b"packed_bboxes"]) -> builtins.bool: ...
+    def ClearField(self, field_name: typing.Literal["command_uuid", b"command_uuid", "cropped_height", b"cropped_height", "cropped_image", b"cropped_image", "cropped_width", b"cropped_width", "description", b"description", "event_id", b"event_id", "is_cropped", b"is_cropped", "merged_ui_icon_bboxes", b"merged_ui_icon_bboxes", "original_height", b"original_height", "original_image_path", b"original_image_path", "original_width", b"original_width", "packed_bboxes", b"packed_bboxes", "project_uuid", b"project_uuid", "timestamp", b"timestamp"]) -> None: ...
 
 global___VisionDetectResultModel = VisionDetectResultModel
 
@@ -171,6 +230,39 @@ class VisionDetectResultsList(google.protobuf.message.Message):
 
 global___VisionDetectResultsList = VisionDetectResultsList
 
+@typing.final
+class VisionDetectResultDelta(google.protobuf.message.Message):
+    """Result of a single frame, pushed while a capture session is still recording"""
+
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    PROJECT_UUID_FIELD_NUMBER: builtins.int
+    COMMAND_UUID_FIELD_NUMBER: builtins.int
+    RESULT_FIELD_NUMBER: builtins.int
+    PROCESSED_COUNT_FIELD_NUMBER: builtins.int
+    PENDING_COUNT_FIELD_NUMBER: builtins.int
+    project_uuid: builtins.str
+    command_uuid: builtins.str
+    processed_count: builtins.int
+    """Frames of the session processed so far"""
+    pending_count: builtins.int
+    """Frames captured but still waiting for detection"""
+    @property
+    def result(self) -> global___VisionDetectResultModel: ...
+    def __init__(
+        self,
+        *,
+        project_uuid: builtins.str = ...,
+        command_uuid: builtins.str = ...,
+        result: global___VisionDetectResultModel | None = ...,
+        processed_count: builtins.int = ...,
+        pending_count: builtins.int = ...,
+    ) -> None: ...
+    def HasField(self, field_name: typing.Literal["result", b"result"]) -> builtins.bool: ...
+    def ClearField(self, field_name: typing.Literal["command_uuid", b"command_uuid", "pending_count", b"pending_count", "processed_count", b"processed_count", "project_uuid", b"project_uuid", "result", b"result"]) -> None: ...
+
+global___VisionDetectResultDelta = VisionDetectResultDelta
+
 @typing.final
 class VisionDetectStatus(google.protobuf.message.Message):
     """Status of the vision detection service"""
@@ -238,21 +330,25 @@ class VisionDetectRPCResponse(google.protobuf.message.Message):
 
     RESULTS_FIELD_NUMBER: builtins.int
     STATUS_FIELD_NUMBER: builtins.int
+    RESULT_DELTA_FIELD_NUMBER: builtins.int
     ERROR_FIELD_NUMBER: builtins.int
     error: builtins.str
     @property
     def results(self) -> global___VisionDetectResultsList: ...
     @property
     def status(self) -> global___VisionDetectStatus: ...
+    @property
+    def result_delta(self) -> global___VisionDetectResultDelta: ...
     def __init__(
         self,
         *,
         results: global___VisionDetectResultsList | None = ...,
         status: global___VisionDetectStatus | None = ...,
+        result_delta: global___VisionDetectResultDelta | None = ...,
         error: builtins.str = ...,
     ) -> None: ...
-    def HasField(self, field_name: typing.Literal["response", b"response", "results", b"results", "status", b"status"]) -> builtins.bool: ...
-    def ClearField(self, field_name: typing.Literal["error", b"error", "response", b"response", "results", b"results", "status", b"status"]) -> None: ...
-    def WhichOneof(self, oneof_group: typing.Literal["response", b"response"]) -> typing.Literal["results", "status"] | None: ...
+    def HasField(self, field_name: typing.Literal["response", b"response", "result_delta", b"result_delta", "results", b"results", "status", b"status"]) -> builtins.bool: ...
+    def ClearField(self, field_name: typing.Literal["error", b"error", "response", b"response", "result_delta", b"result_delta", "results", b"results", "status", b"status"]) -> None: ...
+    def WhichOneof(self, oneof_group: typing.Literal["response", b"response"]) -> typing.Literal["results", "status", "result_delta"] | None: ...
 
 global___VisionDetectRPCResponse = VisionDetectRPCResponse
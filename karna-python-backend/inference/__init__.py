@@ -3,7 +3,7 @@ from datetime import datetime
 import logging
 from dataclasses import dataclass, field
 import uuid
-from typing import List
+from typing import List, Sequence
 from PIL import Image
 
 @dataclass
@@ -42,7 +42,8 @@ class BoundingBoxResult:
     image_path: str
     original_width: int
     original_height: int
-    bounding_boxes: List[BoundingBox]
+    # A list, or a BoundingBoxArray from the detectors that builds the BoundingBox objects on first use
+    bounding_boxes: Sequence[BoundingBox]
     
 @dataclass
 class VisionDetectResultModel:
@@ -102,4 +103,7 @@ class BaseInference(ABC):
         pass
     
     
-__all__ = ["BoundingBox", "BoundingBoxResult", "VisionDetectResultModel", "VisionDetectResultModelList"]
\ No newline at end of file
+# Imported last, it builds on BoundingBox
+from inference.bounding_box_array import BoundingBoxArray
+
+__all__ = ["BoundingBox", "BoundingBoxArray", "BoundingBoxResult", "VisionDetectResultModel", "VisionDetectResultModelList"]
\ No newline at end of file
@@ -0,0 +1,326 @@
+"""
+Columnar container of bounding boxes.
+
+BoundingBoxArray keeps the boxes of a frame as numpy columns (xyxy corners,
+confidence, class index into a class name table, id) so that filtering,
+sorting, IoU and coordinate transforms run on whole arrays. It is a read-only
+Sequence[BoundingBox]: iterating or indexing it builds the BoundingBox objects
+once, on first use, so code written against List[BoundingBox] keeps working.
+
+Ids are generated on first access, in one batch, instead of one uuid4 call per
+detection. Every operation returns a new array; the arrays are never changed in
+place.
+"""
+
+import os
+from collections.abc import Sequence
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Union, overload
+
+import numpy as np
+
+from inference import BoundingBox
+from inference.yolo.box_ops import box_area, nms, pairwise_intersection, pairwise_iou
+
+
+def generate_ids(count: int) -> np.ndarray:
+    """
+    Generate random (version 4) UUID strings from a single read of the OS random source.
+    """
+    raw = np.frombuffer(os.urandom(16 * count), dtype=np.uint8).reshape(count, 16).copy()
+    raw[:, 6] = (raw[:, 6] & 0x0F) | 0x40
+    raw[:, 8] = (raw[:, 8] & 0x3F) | 0x80
+    hex_digits = raw.tobytes().hex()
+    ids = np.empty(count, dtype=object)
+    for i in range(count):
+        h = hex_digits[32 * i:32 * (i + 1)]
+        ids[i] = f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+    return ids
+
+
+class BoundingBoxArray(Sequence):
+    """
+    Bounding boxes stored as numpy columns.
+    """
+
+    def __init__(self, xyxy: np.ndarray, confidences: np.ndarray, class_indices: np.ndarray,
+                 class_table: Sequence, ids: Optional[np.ndarray] = None):
+        """
+        Parameters:
+            xyxy (np.ndarray): (N, 4) boxes in (x_min, y_min, x_max, y_max).
+            confidences (np.ndarray): (N,) confidence scores.
+            class_indices (np.ndarray): (N,) indices into class_table.
+            class_table (Sequence[str]): Class names.
+            ids (np.ndarray, optional): (N,) box ids, generated on first access when omitted.
+        """
+        self.xyxy = np.asarray(xyxy, dtype=np.float64).reshape(-1, 4)
+        self.confidences = np.asarray(confidences, dtype=np.float64).reshape(-1)
+        self.class_indices = np.asarray(class_indices, dtype=np.int32).reshape(-1)
+        self.class_table = tuple(class_table)
+        if not len(self.xyxy) == len(self.confidences) == len(self.class_indices):
+            raise ValueError("Bounding box columns have different lengths")
+        if ids is not None:
+            ids = np.asarray(ids, dtype=object).reshape(-1)
+            if len(ids) != len(self.xyxy):
+                raise ValueError("Bounding box columns have different lengths")
+        self._ids = ids
+        self._boxes: Optional[List[BoundingBox]] = None
+
+    # Construction
+
+    @classmethod
+    def empty(cls) -> "BoundingBoxArray":
+        return cls(np.zeros((0, 4)), np.zeros(0), np.zeros(0, dtype=np.int32), ())
+
+    @classmethod
+    def from_boxes(cls, boxes: Iterable[BoundingBox]) -> "BoundingBoxArray":
+        """
+        Build an array from BoundingBox objects, keeping their ids. An array is returned as is.
+        """
+        if isinstance(boxes, BoundingBoxArray):
+            return boxes
+        boxes = list(boxes)
+        if not boxes:
+            return cls.empty()
+        class_table, class_indices = np.unique([box.class_name for box in boxes], return_inverse=True)
+        array = cls(
+            xyxy=[(box.x, box.y, box.x + box.width, box.y + box.height) for box in boxes],
+            confidences=[box.confidence for box in boxes],
+            class_indices=class_indices,
+            class_table=class_table.tolist(),
+            ids=[box.id for box in boxes],
+        )
+        # The objects already exist, hand the same ones back on iteration
+        array._boxes = boxes
+        return array
+
+    @classmethod
+    def from_dicts(cls, dicts: Iterable[Dict[str, Any]]) -> "BoundingBoxArray":
+        """
+        Build an array from BoundingBox.to_dict() dictionaries.
+        """
+        dicts = list(dicts)
+        if not dicts:
+            return cls.empty()
+        class_table, class_indices = np.unique([d["class"] for d in dicts], return_inverse=True)
+        return cls(
+            xyxy=[(d["x"], d["y"], d["x"] + d["width"], d["y"] + d["height"]) for d in dicts],
+            confidences=[d["confidence"] for d in dicts],
+            class_indices=class_indices,
+            class_table=class_table.tolist(),
+            ids=[d["id"] for d in dicts],
+        )
+
+    @classmethod
+    def from_detections(cls, names: Any, xyxy: np.ndarray, labels: np.ndarray,
+                        confidences: np.ndarray) -> "BoundingBoxArray":
+        """
+        Build an array from model output arrays.
+
+        Parameters:
+            names (dict | list): Class index to class name mapping (model.names).
+            xyxy (np.ndarray): (N, 4) boxes.
+            labels (np.ndarray): (N,) model class indices.
+            confidences (np.ndarray): (N,) confidences.
+        """
+        labels = np.asarray(labels).astype(np.int64).reshape(-1)
+        present, class_indices = np.unique(labels, return_inverse=True)
+        return cls(xyxy, confidences, class_indices, [names[label] for label in present.tolist()])
+
+    @classmethod
+    def concatenate(cls, arrays: Iterable[Union["BoundingBoxArray", Sequence]]) -> "BoundingBoxArray":
+        """
+        Join arrays (or lists of BoundingBox), merging their class tables.
+        """
+        arrays = [cls.from_boxes(array) for array in arrays]
+        if not arrays:
+            return cls.empty()
+        class_table = sorted(set().union(*(array.class_table for array in arrays)))
+        position = {class_name: index for index, class_name in enumerate(class_table)}
+        class_indices = [
+            np.array([position[name] for name in array.class_table], dtype=np.int32)[array.class_indices]
+            if len(array) else np.zeros(0, dtype=np.int32)
+            for array in arrays
+        ]
+        ids = None
+        if any(array._ids is not None for array in arrays):
+            # Existing ids are kept, so the arrays without them get theirs now
+            ids = np.concatenate([array.ids for array in arrays])
+        result = cls(np.concatenate([array.xyxy for array in arrays]),
+                     np.concatenate([array.confidences for array in arrays]),
+                     np.concatenate(class_indices), class_table, ids)
+        if all(array._boxes is not None or not len(array) for array in arrays):
+            result._boxes = [box for array in arrays for box in array._boxes or []]
+        return result
+
+    # Columns
+
+    @property
+    def x1(self) -> np.ndarray:
+        return self.xyxy[:, 0]
+
+    @property
+    def y1(self) -> np.ndarray:
+        return self.xyxy[:, 1]
+
+    @property
+    def x2(self) -> np.ndarray:
+        return self.xyxy[:, 2]
+
+    @property
+    def y2(self) -> np.ndarray:
+        return self.xyxy[:, 3]
+
+    @property
+    def widths(self) -> np.ndarray:
+        return self.xyxy[:, 2] - self.xyxy[:, 0]
+
+    @property
+    def heights(self) -> np.ndarray:
+        return self.xyxy[:, 3] - self.xyxy[:, 1]
+
+    @property
+    def class_names(self) -> np.ndarray:
+        """(N,) class name of each box"""
+        return np.asarray(self.class_table, dtype=object)[self.class_indices] if len(self) else np.zeros(0, dtype=object)
+
+    @property
+    def ids(self) -> np.ndarray:
+        """(N,) box ids, generated on first access"""
+        if self._ids is None:
+            self._ids = generate_ids(len(self))
+        return self._ids
+
+    # Sequence[BoundingBox]
+
+    def __len__(self) -> int:
+        return len(self.xyxy)
+
+    @overload
+    def __getitem__(self, index: int) -> BoundingBox: ...
+
+    @overload
+    def __getitem__(self, index: Union[slice, np.ndarray, List[int]]) -> "BoundingBoxArray": ...
+
+    def __getitem__(self, index):
+        """
+        An int returns a BoundingBox; a slice, index array or boolean mask returns a BoundingBoxArray.
+        """
+        if isinstance(index, (int, np.integer)):
+            return self.to_boxes()[index]
+        return self._take(index)
+
+    def _take(self, index: Union[slice, np.ndarray, List[int]]) -> "BoundingBoxArray":
+        """The boxes selected by a slice, index array or boolean mask"""
+        if isinstance(index, slice):
+            index = np.arange(len(self))[index]
+        index = np.asarray(index)
+        if index.dtype == bool and len(index) != len(self):
+            raise IndexError("Boolean mask length does not match the number of boxes")
+        selected = BoundingBoxArray(self.xyxy[index], self.confidences[index], self.class_indices[index],
+                                    self.class_table, self._ids[index] if self._ids is not None else None)
+        if self._boxes is not None:
+            selected._boxes = [self._boxes[i] for i in np.arange(len(self))[index].tolist()]
+        return selected
+
+    def __iter__(self) -> Iterator[BoundingBox]:
+        return iter(self.to_boxes())
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (BoundingBoxArray, list, tuple)):
+            return self.to_boxes() == list(other)
+        return NotImplemented
+
+    __hash__ = None  # type: ignore
+
+    def __repr__(self) -> str:
+        return f"BoundingBoxArray({len(self)} boxes, classes={list(self.class_table)})"
+
+    # Conversion
+
+    def to_boxes(self) -> List[BoundingBox]:
+        """
+        The boxes as BoundingBox objects, built once and then reused.
+
+        Positions are truncated like int() of the corner and sizes like int() of the
+        float extent, as the detectors have always reported them.
+        """
+        if self._boxes is None:
+            xs = self.x1.astype(np.int64).tolist()
+            ys = self.y1.astype(np.int64).tolist()
+            widths = self.widths.astype(np.int64).tolist()
+            heights = self.heights.astype(np.int64).tolist()
+            self._boxes = [
+                BoundingBox(x=x, y=y, width=width, height=height, class_name=class_name, confidence=conf, id=box_id)
+                for x, y, width, height, class_name, conf, box_id in zip(
+                    xs, ys, widths, heights, self.class_names.tolist(), self.confidences.tolist(), self.ids.tolist())
+            ]
+        return self._boxes
+
+    def to_dicts(self) -> List[Dict[str, Any]]:
+        """
+        The boxes as BoundingBox.to_dict() dictionaries.
+        """
+        return [box.to_dict() for box in self.to_boxes()]
+
+    # Geometry
+
+    def area(self) -> np.ndarray:
+        """(N,) box areas"""
+        return box_area(self.xyxy)
+
+    def iou(self, other: "BoundingBoxArray") -> np.ndarray:
+        """(N, M) IoU between these boxes and other's"""
+        return pairwise_iou(self.xyxy, BoundingBoxArray.from_boxes(other).xyxy)
+
+    def containment(self, other: "BoundingBoxArray") -> np.ndarray:
+        """(N, M) fraction of each of these boxes that lies inside each of other's boxes"""
+        intersection = pairwise_intersection(self.xyxy, BoundingBoxArray.from_boxes(other).xyxy)
+        areas = self.area()[:, None]
+        return np.divide(intersection, areas, out=np.zeros_like(intersection), where=areas > 0)
+
+    def _with_xyxy(self, xyxy: np.ndarray) -> "BoundingBoxArray":
+        # Geometry changes keep the ids, but the box objects have to be rebuilt
+        return BoundingBoxArray(xyxy, self.confidences, self.class_indices, self.class_table, self._ids)
+
+    def with_new_ids(self) -> "BoundingBoxArray":
+        """The same boxes under freshly generated ids"""
+        return BoundingBoxArray(self.xyxy, self.confidences, self.class_indices, self.class_table)
+
+    def translate(self, dx: float, dy: float) -> "BoundingBoxArray":
+        """The boxes moved by (dx, dy)"""
+        return self._with_xyxy(self.xyxy + np.array([dx, dy, dx, dy], dtype=np.float64))
+
+    def scale(self, sx: float, sy: Optional[float] = None) -> "BoundingBoxArray":
+        """The boxes scaled about the origin, by sx horizontally and sy (default sx) vertically"""
+        sy = sx if sy is None else sy
+        return self._with_xyxy(self.xyxy * np.array([sx, sy, sx, sy], dtype=np.float64))
+
+    def clip(self, width: float, height: float) -> "BoundingBoxArray":
+        """The boxes clipped to a width x height frame"""
+        xyxy = self.xyxy.copy()
+        xyxy[:, [0, 2]] = xyxy[:, [0, 2]].clip(0, width)
+        xyxy[:, [1, 3]] = xyxy[:, [1, 3]].clip(0, height)
+        return self._with_xyxy(xyxy)
+
+    # Selection
+
+    def filter(self, mask: np.ndarray) -> "BoundingBoxArray":
+        """The boxes where mask is True"""
+        return self._take(np.asarray(mask, dtype=bool))
+
+    def filter_confidence(self, min_confidence: float) -> "BoundingBoxArray":
+        return self.filter(self.confidences >= min_confidence)
+
+    def filter_classes(self, class_names: Iterable[str]) -> "BoundingBoxArray":
+        wanted = set(class_names)
+        table_mask = np.array([name in wanted for name in self.class_table] or [False])
+        return self.filter(table_mask[self.class_indices] if len(self) else np.zeros(0, dtype=bool))
+
+    def sort_by_confidence(self, descending: bool = True) -> "BoundingBoxArray":
+        order = np.argsort(-self.confidences if descending else self.confidences, kind="stable")
+        return self._take(order)
+
+    def nms(self, iou_threshold: float, class_aware: bool = True) -> "BoundingBoxArray":
+        """The boxes left by greedy NMS, by descending confidence"""
+        labels = self.class_indices if class_aware else None
+        return self._take(nms(self.xyxy, self.confidences, iou_threshold, labels=labels))
@@ -35,6 +35,9 @@ def run_omniparser_inference(json_file_path: str) -> Tuple[OmniParserResultModel
     except json.JSONDecodeError as e:
         raise ValueError(f"Invalid JSON in file: {str(e)}")
     
+    if isinstance(events_data, dict):
+        # Session snapshot, the events are stored with the journal generation
+        events_data = events_data.get("events")
     if not events_data or not isinstance(events_data, list):
         raise ValueError("JSON file does not contain a list of screenshot events")
     
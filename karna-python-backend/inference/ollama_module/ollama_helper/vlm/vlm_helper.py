@@ -9,6 +9,7 @@ import os
 from inference.ollama_module.llm_client import OllamaLLMClient
 from inference.ollama_module.vlm_client import OllamaVLMClient
 from services.screen_capture_service import ScreenshotEvent
+from utils.annotation_renderer import ensure_annotation_file
 
 async def async_vlm_generate(
     prompt: str, 
@@ -1697,6 +1698,10 @@ async def async_vlm_analyze_screenshot_events(
         # Determine which image path to use (annotated or raw)
         if prefer_annotated and event.annotation_path:
             image_path = event.annotation_path
+            if getattr(event, 'annotation_overlay', None) and event.screenshot_path:
+                # Annotated images are rendered on demand, write this one for the model
+                image_path = ensure_annotation_file(event.annotation_path, event.screenshot_path,
+                                                    event.annotation_overlay)
         elif event.screenshot_path:
             image_path = event.screenshot_path
         else:
@@ -1819,6 +1824,10 @@ async def async_stream_vlm_analyze_screenshot_events(
         # Determine which image path to use (annotated or raw)
         if prefer_annotated and event.annotation_path:
             image_path = event.annotation_path
+            if getattr(event, 'annotation_overlay', None) and event.screenshot_path:
+                # Annotated images are rendered on demand, write this one for the model
+                image_path = ensure_annotation_file(event.annotation_path, event.screenshot_path,
+                                                    event.annotation_overlay)
         elif event.screenshot_path:
             image_path = event.screenshot_path
         else:
@@ -0,0 +1,85 @@
+"""
+Vectorised operations on (N, 4) arrays of xyxy boxes.
+
+Everything works on whole numpy arrays, so matching or suppressing boxes over a
+frame with hundreds of detections does not loop in Python per pair of boxes.
+"""
+
+from typing import Optional
+
+import numpy as np
+
+
+def as_xyxy(boxes) -> np.ndarray:
+    """
+    Get boxes as an (N, 4) float64 array of (x_min, y_min, x_max, y_max).
+    """
+    return np.asarray(boxes, dtype=np.float64).reshape(-1, 4)
+
+
+def box_area(xyxy: np.ndarray) -> np.ndarray:
+    """
+    Get the (N,) areas of xyxy boxes, zero for degenerate boxes.
+    """
+    xyxy = as_xyxy(xyxy)
+    return np.clip(xyxy[:, 2] - xyxy[:, 0], 0, None) * np.clip(xyxy[:, 3] - xyxy[:, 1], 0, None)
+
+
+def pairwise_intersection(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """
+    Get the (N, M) intersection areas between every box of a and every box of b.
+    """
+    a, b = as_xyxy(a), as_xyxy(b)
+    top_left = np.maximum(a[:, None, :2], b[None, :, :2])
+    bottom_right = np.minimum(a[:, None, 2:], b[None, :, 2:])
+    return np.clip(bottom_right - top_left, 0, None).prod(axis=2)
+
+
+def pairwise_iou(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """
+    Get the (N, M) intersection over union between every box of a and every box of b.
+
+    Parameters:
+        a (np.ndarray): (N, 4) xyxy boxes.
+        b (np.ndarray): (M, 4) xyxy boxes.
+
+    Returns:
+        np.ndarray: IoU matrix, zero where the union is empty.
+    """
+    intersection = pairwise_intersection(a, b)
+    union = box_area(a)[:, None] + box_area(b)[None, :] - intersection
+    return np.divide(intersection, union, out=np.zeros_like(intersection), where=union > 0)
+
+
+def nms(xyxy: np.ndarray, scores: np.ndarray, iou_threshold: float,
+        labels: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Greedy non-maximum suppression.
+
+    Parameters:
+        xyxy (np.ndarray): (N, 4) boxes.
+        scores (np.ndarray): (N,) confidences, higher boxes are kept first.
+        iou_threshold (float): Boxes overlapping a kept box by more than this IoU are suppressed.
+        labels (np.ndarray, optional): (N,) class indices; boxes only suppress boxes of their own class.
+
+    Returns:
+        np.ndarray: Indices of the kept boxes, by descending score.
+    """
+    xyxy = as_xyxy(xyxy)
+    if len(xyxy) == 0:
+        return np.zeros(0, dtype=np.int64)
+    if labels is not None:
+        # Shift every class to its own region so boxes of different classes never overlap
+        offsets = np.asarray(labels, dtype=np.float64) * (xyxy.max() - min(xyxy.min(), 0) + 1)
+        xyxy = xyxy + offsets[:, None]
+
+    order = np.argsort(-np.asarray(scores, dtype=np.float64), kind="stable")
+    iou = pairwise_iou(xyxy, xyxy)
+    suppressed = np.zeros(len(xyxy), dtype=bool)
+    keep = []
+    for index in order:
+        if suppressed[index]:
+            continue
+        keep.append(index)
+        suppressed |= iou[index] > iou_threshold
+    return np.asarray(keep, dtype=np.int64)
@@ -0,0 +1,220 @@
+"""
+Concurrent execution of the YOLO UI and icon detectors.
+
+The two detectors are independent and, on CPU-only machines, a single model
+does not keep every core busy. DetectorExecutor runs them over the same frames
+in one of three modes:
+
+- SEQUENTIAL: the UI pass and then the icon pass, in the calling thread.
+- THREADED: one worker thread per detector, with torch intra-op threads split
+  between the workers so the two passes do not oversubscribe the CPU.
+- PROCESS: one worker process per detector. Decoded frames are written once
+  into a shared memory block that both workers map read-only.
+"""
+
+import logging
+import os
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from enum import Enum
+from multiprocessing import get_context, shared_memory
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from inference import BoundingBoxResult
+from inference.yolo.preprocess import PreprocessedFrame
+from inference.yolo.yolo_prediction_base import BaseYOLOPrediction
+from inference.yolo.ui.yolo_prediction import YOLO_UI_Prediction
+from inference.yolo.icon.yolo_prediction import YOLO_ICON_Prediction
+
+logger = logging.getLogger("DetectorExecutor")
+
+UI_DETECTOR = "ui"
+ICON_DETECTOR = "icon"
+
+DETECTOR_CLASSES = {
+    UI_DETECTOR: YOLO_UI_Prediction,
+    ICON_DETECTOR: YOLO_ICON_Prediction,
+}
+
+
+class ExecutionMode(Enum):
+    """
+    How the UI and icon detectors are scheduled.
+    """
+    SEQUENTIAL = "sequential"
+    THREADED = "threaded"
+    PROCESS = "process"
+
+
+@dataclass(frozen=True)
+class SharedFrameSpec:
+    """
+    Location of one frame inside a shared memory block.
+    """
+    offset: int
+    shape: Tuple[int, ...]
+    image_path: str
+
+
+def _set_torch_threads(num_threads: int) -> None:
+    try:
+        import torch
+        torch.set_num_threads(max(1, num_threads))
+    except ImportError:
+        pass
+
+
+def _threads_per_worker(num_workers: int) -> int:
+    return max(1, (os.cpu_count() or 1) // num_workers)
+
+
+# Per-process state of a detector worker process
+_worker_prediction: Optional[BaseYOLOPrediction] = None
+
+
+def _init_process_worker(detector: str, num_threads: int) -> None:
+    global _worker_prediction
+    _set_torch_threads(num_threads)
+    _worker_prediction = DETECTOR_CLASSES[detector]()
+    # Load the weights now so the first request does not pay for it
+    _worker_prediction.model
+
+
+def _read_shared_frame(shm: shared_memory.SharedMemory, spec: SharedFrameSpec) -> PreprocessedFrame:
+    bgr = np.ndarray(spec.shape, dtype=np.uint8, buffer=shm.buf, offset=spec.offset)
+    bgr.setflags(write=False)
+    return PreprocessedFrame(bgr, spec.image_path)
+
+
+def _write_shared_frames(shm: shared_memory.SharedMemory, frames: List[PreprocessedFrame]) -> List[SharedFrameSpec]:
+    specs = []
+    offset = 0
+    for frame in frames:
+        view = np.ndarray(frame.bgr.shape, dtype=np.uint8, buffer=shm.buf, offset=offset)
+        view[...] = frame.bgr
+        specs.append(SharedFrameSpec(offset=offset, shape=frame.bgr.shape, image_path=frame.image_path))
+        offset += frame.bgr.nbytes
+    return specs
+
+
+def _detect_shared_frames(shm_name: str, specs: List[SharedFrameSpec]) -> List[BoundingBoxResult]:
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        frames = [_read_shared_frame(shm, spec) for spec in specs]
+        results = list(_worker_prediction.predict_frames_stream(frames))  # type: ignore
+        # Drop every view into the block before closing it
+        del frames
+        return results
+    finally:
+        shm.close()
+
+
+class DetectorExecutor:
+    """
+    Runs the UI and icon detectors over the same frames, sequentially or concurrently.
+    """
+
+    def __init__(self, mode: ExecutionMode = ExecutionMode.SEQUENTIAL):
+        """
+        Initialize the executor.
+
+        Parameters:
+            mode (ExecutionMode): How the two detectors are scheduled.
+        """
+        self.mode = mode
+        self._lock = threading.Lock()
+        self._thread_pool: Optional[ThreadPoolExecutor] = None
+        self._process_pools: Dict[str, ProcessPoolExecutor] = {}
+
+    def run(self, frames: List[PreprocessedFrame]) -> Tuple[List[BoundingBoxResult], List[BoundingBoxResult]]:
+        """
+        Run both detectors over the frames.
+
+        Parameters:
+            frames (List[PreprocessedFrame]): Frames to run the detectors on.
+
+        Returns:
+            Tuple[List[BoundingBoxResult], List[BoundingBoxResult]]: UI results and icon results,
+                each with one result per frame in input order.
+        """
+        if not frames:
+            return [], []
+        if self.mode == ExecutionMode.THREADED:
+            return self._run_threaded(frames)
+        if self.mode == ExecutionMode.PROCESS:
+            return self._run_in_processes(frames)
+        return self._run_sequential(frames)
+
+    @staticmethod
+    def _detect(detector: str, frames: List[PreprocessedFrame]) -> List[BoundingBoxResult]:
+        return list(DETECTOR_CLASSES[detector]().predict_frames_stream(frames))
+
+    def _run_sequential(self, frames: List[PreprocessedFrame]) -> Tuple[List[BoundingBoxResult], List[BoundingBoxResult]]:
+        return self._detect(UI_DETECTOR, frames), self._detect(ICON_DETECTOR, frames)
+
+    def _get_thread_pool(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._thread_pool is None:
+                # torch.set_num_threads applies to the calling thread's OpenMP team,
+                # so each worker gets its own share of the cores
+                self._thread_pool = ThreadPoolExecutor(
+                    max_workers=2,
+                    thread_name_prefix="yolo-detector",
+                    initializer=_set_torch_threads,
+                    initargs=(_threads_per_worker(2),)
+                )
+            return self._thread_pool
+
+    def _run_threaded(self, frames: List[PreprocessedFrame]) -> Tuple[List[BoundingBoxResult], List[BoundingBoxResult]]:
+        pool = self._get_thread_pool()
+        # Letterbox up front, at the size each detector will ask for, so the workers do not
+        # contend on the per-frame locks. Tiled frames letterbox their tiles, not the frame.
+        for detector in DETECTOR_CLASSES.values():
+            prediction = detector()
+            for frame in frames:
+                plan = prediction.plan_resolution(frame)
+                if not plan.is_tiled:
+                    frame.letterboxed(plan.imgsz)
+        ui_future = pool.submit(self._detect, UI_DETECTOR, frames)
+        icon_future = pool.submit(self._detect, ICON_DETECTOR, frames)
+        return ui_future.result(), icon_future.result()
+
+    def _get_process_pool(self, detector: str) -> Executor:
+        with self._lock:
+            if detector not in self._process_pools:
+                self._process_pools[detector] = ProcessPoolExecutor(
+                    max_workers=1,
+                    mp_context=get_context("spawn"),
+                    initializer=_init_process_worker,
+                    initargs=(detector, _threads_per_worker(len(DETECTOR_CLASSES)))
+                )
+            return self._process_pools[detector]
+
+    def _run_in_processes(self, frames: List[PreprocessedFrame]) -> Tuple[List[BoundingBoxResult], List[BoundingBoxResult]]:
+        total_bytes = sum(frame.bgr.nbytes for frame in frames)
+        shm = shared_memory.SharedMemory(create=True, size=max(1, total_bytes))
+        try:
+            # The views into the block go out of scope with the helper, so it can be closed
+            specs = _write_shared_frames(shm, frames)
+            ui_future = self._get_process_pool(UI_DETECTOR).submit(_detect_shared_frames, shm.name, specs)
+            icon_future = self._get_process_pool(ICON_DETECTOR).submit(_detect_shared_frames, shm.name, specs)
+            return ui_future.result(), icon_future.result()
+        finally:
+            shm.close()
+            shm.unlink()
+
+    def shutdown(self) -> None:
+        """
+        Stop the worker threads and processes.
+        """
+        with self._lock:
+            if self._thread_pool is not None:
+                self._thread_pool.shutdown(wait=True)
+                self._thread_pool = None
+            for pool in self._process_pools.values():
+                pool.shutdown(wait=True)
+            self._process_pools.clear()
+        logger.info(f"DetectorExecutor ({self.mode.value}) shut down")
@@ -0,0 +1,218 @@
+"""
+Content-addressed on-disk cache of merged UI/icon detection results.
+
+Every entry is a small JSON file in ``<session_dir>/detection_cache/`` named
+after a key derived from:
+
+- the screenshot's content hash (so renamed or re-saved identical frames hit),
+- the hashes of the model weights that produced it,
+- the crop area the detectors ran on,
+- the detection thresholds and the cache format version.
+
+Re-opening a session that was processed before therefore only runs YOLO on
+the frames that are new or whose pixels changed.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+from inference import BoundingBoxArray, BoundingBoxResult
+
+logger = logging.getLogger("DetectionCache")
+
+# Bump when the stored result format or the merge logic changes
+CACHE_VERSION = 1
+
+CACHE_DIR_NAME = "detection_cache"
+
+_HASH_CHUNK_SIZE = 1 << 20
+
+# (abspath, mtime_ns, size) -> digest, so the weights are only hashed once per file version
+_weights_digests: Dict[Tuple[str, int, int], str] = {}
+_weights_digests_lock = threading.Lock()
+
+
+def hash_file(path: str) -> str:
+    """
+    Compute the blake2b content hash of a file.
+
+    Parameters:
+        path (str): Path to the file.
+
+    Returns:
+        str: Hex digest of the file contents.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(_HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def get_weights_digest(weights_path: str) -> str:
+    """
+    Get the content hash of a model weights file or export directory, memoized per file version.
+
+    Parameters:
+        weights_path (str): Path to the weights.
+
+    Returns:
+        str: Hex digest of the weights, or "missing:<path>" if the file does not exist.
+    """
+    abs_path = os.path.abspath(weights_path)
+    try:
+        stat = os.stat(abs_path)
+    except OSError:
+        return f"missing:{abs_path}"
+
+    memo_key = (abs_path, stat.st_mtime_ns, stat.st_size)
+    with _weights_digests_lock:
+        if memo_key in _weights_digests:
+            return _weights_digests[memo_key]
+
+    if os.path.isdir(abs_path):
+        # OpenVINO exports are a directory of model files
+        digest = hashlib.blake2b(digest_size=16)
+        for name in sorted(os.listdir(abs_path)):
+            file_path = os.path.join(abs_path, name)
+            if os.path.isfile(file_path):
+                digest.update(f"{name}:{hash_file(file_path)}".encode("utf-8"))
+        digest = digest.hexdigest()
+    else:
+        digest = hash_file(abs_path)
+    with _weights_digests_lock:
+        _weights_digests[memo_key] = digest
+    return digest
+
+
+def get_session_dir(screenshot_path: str) -> str:
+    """
+    Get the session directory of a screenshot.
+
+    Screenshots are stored as ``<session_dir>/screenshots/raw/<file>.png``; screenshots
+    stored anywhere else use their own directory.
+    """
+    raw_dir = os.path.dirname(os.path.abspath(screenshot_path))
+    screenshots_dir = os.path.dirname(raw_dir)
+    if os.path.basename(raw_dir) == "raw" and os.path.basename(screenshots_dir) == "screenshots":
+        return os.path.dirname(screenshots_dir)
+    return raw_dir
+
+
+class DetectionCache:
+    """
+    Persistent cache of BoundingBoxResults stored next to the session data.
+    """
+
+    def __init__(self, cache_dir_name: str = CACHE_DIR_NAME,
+                 on_write: Optional[Callable[[str, int], None]] = None):
+        """
+        Initialize the cache.
+
+        Parameters:
+            cache_dir_name (str): Name of the cache directory created inside each session directory.
+            on_write (Optional[Callable[[str, int], None]]): Called with the path and byte size of every entry written,
+                e.g. to account the entry to its session.
+        """
+        self.cache_dir_name = cache_dir_name
+        self.on_write = on_write
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(image_digest: str, weights_paths: Iterable[str],
+                 crop_area: Optional[Tuple[int, int, int, int]], params: Dict[str, Any]) -> str:
+        """
+        Build the cache key of a frame.
+
+        Parameters:
+            image_digest (str): Content hash of the screenshot.
+            weights_paths (Iterable[str]): Weights of every model that contributes to the result.
+            crop_area (Optional[Tuple[int, int, int, int]]): The crop applied before detection, or None.
+            params (Dict[str, Any]): Detection thresholds and any other parameter affecting the result.
+
+        Returns:
+            str: Hex digest identifying the detection result.
+        """
+        key_data = {
+            "version": CACHE_VERSION,
+            "image": image_digest,
+            "weights": [get_weights_digest(path) for path in weights_paths],
+            "crop_area": list(crop_area) if crop_area is not None else None,
+            "params": params,
+        }
+        encoded = json.dumps(key_data, sort_keys=True).encode("utf-8")
+        return hashlib.blake2b(encoded, digest_size=16).hexdigest()
+
+    def _entry_path(self, screenshot_path: str, key: str) -> str:
+        return os.path.join(get_session_dir(screenshot_path), self.cache_dir_name, f"{key}.json")
+
+    def get(self, screenshot_path: str, key: str) -> Optional[BoundingBoxResult]:
+        """
+        Look up the cached result of a screenshot.
+
+        Parameters:
+            screenshot_path (str): Path to the screenshot; the result is reported for this path.
+            key (str): Key from make_key.
+
+        Returns:
+            Optional[BoundingBoxResult]: The cached result, or None on a miss.
+        """
+        entry_path = self._entry_path(screenshot_path, key)
+        try:
+            with open(entry_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            result = BoundingBoxResult(
+                image_path=screenshot_path,
+                original_width=data["original_width"],
+                original_height=data["original_height"],
+                # Built into BoundingBox objects only if the result is used box by box
+                bounding_boxes=BoundingBoxArray.from_dicts(data["bounding_boxes"])
+            )
+        except FileNotFoundError:
+            result = None
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Ignoring unreadable detection cache entry {entry_path}: {str(e)}")
+            result = None
+
+        with self._lock:
+            if result is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return result
+
+    def put(self, screenshot_path: str, key: str, result: BoundingBoxResult) -> None:
+        """
+        Store the result of a screenshot. Write failures are logged and otherwise ignored.
+
+        Parameters:
+            screenshot_path (str): Path to the screenshot.
+            key (str): Key from make_key.
+            result (BoundingBoxResult): The detection result.
+        """
+        entry_path = self._entry_path(screenshot_path, key)
+        data = {
+            "original_width": result.original_width,
+            "original_height": result.original_height,
+            "bounding_boxes": [bbox.to_dict() for bbox in result.bounding_boxes],
+        }
+        try:
+            os.makedirs(os.path.dirname(entry_path), exist_ok=True)
+            # Write to a temporary file and rename so readers never see a partial entry
+            fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(entry_path), suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+                byte_size = f.tell()
+            os.replace(temp_path, entry_path)
+        except OSError as e:
+            logger.warning(f"Failed to write detection cache entry {entry_path}: {str(e)}")
+            return
+        if self.on_write:
+            self.on_write(entry_path, byte_size)
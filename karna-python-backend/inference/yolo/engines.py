@@ -0,0 +1,188 @@
+"""
+Inference engines of the YOLO UI and icon detectors.
+
+Every detector's PyTorch weights (``model_path``) can be exported next to
+themselves with ``python -m scripts.export_yolo_models``:
+
+- ONNX:          <name>.onnx, run through ONNX Runtime
+- ONNX_INT8:     <name>_int8.onnx, dynamically quantized int8 weights
+- OPENVINO:      <name>_openvino_model/, run through OpenVINO
+- OPENVINO_INT8: <name>_int8_openvino_model/, quantized with NNCF
+
+ultralytics loads all of these behind the same YOLO interface, so the
+prediction classes only pick the weights to load. An engine whose export is
+missing falls back to the PyTorch weights.
+"""
+
+import logging
+import os
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Optional, Sequence
+
+import numpy as np
+
+from inference import BoundingBox, BoundingBoxArray
+
+logger = logging.getLogger("YOLOEngines")
+
+
+class InferenceEngine(Enum):
+    """
+    Runtime that executes a YOLO detector.
+    """
+    PYTORCH = "pytorch"
+    ONNX = "onnx"
+    ONNX_INT8 = "onnx_int8"
+    OPENVINO = "openvino"
+    OPENVINO_INT8 = "openvino_int8"
+
+
+# The engine used when a prediction class does not set one
+DEFAULT_ENGINE = InferenceEngine.PYTORCH
+
+_EXPORT_SUFFIXES = {
+    InferenceEngine.ONNX: ".onnx",
+    InferenceEngine.ONNX_INT8: "_int8.onnx",
+    # ultralytics' own naming of OpenVINO exports
+    InferenceEngine.OPENVINO: "_openvino_model",
+    InferenceEngine.OPENVINO_INT8: "_int8_openvino_model",
+}
+
+
+def get_engine_weights_path(model_path: str, engine: InferenceEngine) -> str:
+    """
+    Get where the weights of a detector are exported for an engine.
+
+    Parameters:
+        model_path (str): Path to the PyTorch weights.
+        engine (InferenceEngine): The engine.
+
+    Returns:
+        str: The exported model file or directory, model_path itself for PYTORCH.
+    """
+    if engine == InferenceEngine.PYTORCH:
+        return model_path
+    return os.path.splitext(model_path)[0] + _EXPORT_SUFFIXES[engine]
+
+
+def resolve_weights_path(model_path: str, engine: InferenceEngine) -> str:
+    """
+    Get the weights to load for an engine, falling back to PyTorch if they are not exported.
+
+    Parameters:
+        model_path (str): Path to the PyTorch weights.
+        engine (InferenceEngine): The requested engine.
+
+    Returns:
+        str: Path of the weights to load.
+    """
+    weights_path = get_engine_weights_path(model_path, engine)
+    if engine != InferenceEngine.PYTORCH and not os.path.exists(weights_path):
+        logger.warning(f"No {engine.value} export of {model_path}, using the PyTorch weights. "
+                       f"Run python -m scripts.export_yolo_models to create it.")
+        return model_path
+    return weights_path
+
+
+def is_exported_model(weights_path: str) -> bool:
+    """
+    Whether weights are an export (ONNX, OpenVINO) rather than PyTorch weights.
+    """
+    return not str(weights_path).endswith(".pt")
+
+
+def get_model_imgsz(model: Any, default: int = 640) -> int:
+    """
+    Get the square input size a loaded YOLO model expects.
+
+    PyTorch models keep it in their training overrides. Exported models store it in
+    their metadata, which ultralytics reads when it sets up the predictor.
+
+    Parameters:
+        model (YOLO): The loaded model.
+        default (int): Size used when the model does not record one.
+
+    Returns:
+        int: The input size in pixels.
+    """
+    imgsz: Optional[Any] = getattr(model, "overrides", {}).get("imgsz")
+    weights_path = getattr(model, "ckpt_path", None)
+    if imgsz is None and weights_path and is_exported_model(weights_path):
+        try:
+            # Reading the class names sets up the predictor and its backend with the export metadata
+            model.names
+            imgsz = getattr(model.predictor.model, "imgsz", None)
+        except Exception as e:
+            logger.warning(f"Failed to read the input size of the exported model: {str(e)}")
+    if imgsz is None:
+        return default
+    if isinstance(imgsz, (list, tuple)):
+        imgsz = max(imgsz)
+    return int(imgsz)
+
+
+@dataclass
+class DetectionParity:
+    """
+    How closely one engine's detections match a reference engine's on the same frames.
+    """
+    reference_boxes: int = 0
+    candidate_boxes: int = 0
+    # Reference boxes matched by a candidate box of the same class
+    matched: int = 0
+    # Summed IoU of the matched pairs
+    iou_sum: float = 0.0
+
+    @property
+    def recall(self) -> float:
+        return self.matched / self.reference_boxes if self.reference_boxes else 1.0
+
+    @property
+    def precision(self) -> float:
+        return self.matched / self.candidate_boxes if self.candidate_boxes else 1.0
+
+    @property
+    def mean_iou(self) -> float:
+        return self.iou_sum / self.matched if self.matched else 0.0
+
+    def add(self, other: "DetectionParity") -> None:
+        """Accumulate the parity of another frame"""
+        self.reference_boxes += other.reference_boxes
+        self.candidate_boxes += other.candidate_boxes
+        self.matched += other.matched
+        self.iou_sum += other.iou_sum
+
+
+def compare_detections(reference: Sequence[BoundingBox], candidate: Sequence[BoundingBox],
+                       iou_threshold: float = 0.5) -> DetectionParity:
+    """
+    Match two engines' detections of one frame.
+
+    Reference boxes are matched greedily, most confident first, to the unmatched candidate
+    box of the same class with the highest IoU, if that IoU reaches iou_threshold.
+
+    Parameters:
+        reference (Sequence[BoundingBox]): Detections of the reference engine, e.g. PyTorch.
+        candidate (Sequence[BoundingBox]): Detections of the engine under test.
+        iou_threshold (float): Minimum IoU of a match.
+
+    Returns:
+        DetectionParity: Match counts and the summed IoU of the matches.
+    """
+    parity = DetectionParity(reference_boxes=len(reference), candidate_boxes=len(candidate))
+    if not reference or not candidate:
+        return parity
+
+    reference, candidate = BoundingBoxArray.from_boxes(reference), BoundingBoxArray.from_boxes(candidate)
+    iou = reference.iou(candidate)
+    iou[reference.class_names[:, None] != candidate.class_names[None, :]] = 0.0
+
+    for i in np.argsort(-reference.confidences, kind="stable"):
+        j = int(np.argmax(iou[i]))
+        if iou[i, j] >= iou_threshold:
+            parity.matched += 1
+            parity.iou_sum += float(iou[i, j])
+            # The candidate box is taken
+            iou[:, j] = 0.0
+    return parity
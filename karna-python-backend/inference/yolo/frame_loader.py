@@ -0,0 +1,187 @@
+"""
+Single-decode screenshot loading for the YOLO detectors.
+
+A FrameLoader decodes and crops each screenshot exactly once into a read-only
+BGR numpy buffer. The UI and icon detectors, the result models and any later
+consumer all share that buffer instead of reopening the PNG. The website render
+area is resolved once per loader rather than once per image, and an optional
+bounded LRU keeps recently loaded frames keyed by (path, mtime, render area)
+so that re-processing the same session does not decode it again.
+"""
+
+import logging
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import List, Optional, Sequence, Tuple
+
+import cv2
+import numpy as np
+from PIL import Image
+
+from inference.yolo.preprocess import PreprocessedFrame
+from utils.image_utils import clamp_render_area, get_capture_origin, get_website_render_area, to_image_render_area
+
+RenderArea = Tuple[int, int, int, int]
+FrameCacheKey = Tuple[str, int, Optional[RenderArea]]
+
+
+@dataclass(frozen=True)
+class LoadedFrame:
+    """
+    A decoded (and optionally cropped) screenshot backed by a read-only BGR buffer.
+    """
+    image_path: str
+    bgr: np.ndarray
+    original_width: int
+    original_height: int
+    # Clamped (left, top, right, bottom) crop applied to the original image, None if not cropped
+    crop_box: Optional[RenderArea] = None
+
+    @property
+    def width(self) -> int:
+        return self.bgr.shape[1]
+
+    @property
+    def height(self) -> int:
+        return self.bgr.shape[0]
+
+    @property
+    def is_cropped(self) -> bool:
+        return self.crop_box is not None
+
+    def to_pil(self) -> Image.Image:
+        """
+        Get the frame as a new RGB PIL image. The caller owns the returned image.
+        """
+        return Image.fromarray(cv2.cvtColor(self.bgr, cv2.COLOR_BGR2RGB))
+
+    def to_preprocessed(self) -> PreprocessedFrame:
+        """
+        Wrap the frame for YOLO inference without copying the pixel buffer.
+        """
+        return PreprocessedFrame(self.bgr, self.image_path)
+
+
+class FrameLoader:
+    """
+    Decodes and crops screenshots once, with an optional bounded LRU of loaded frames.
+    """
+
+    def __init__(self, should_crop: bool = True, render_area: Optional[RenderArea] = None, cache_size: int = 0):
+        """
+        Initialize the frame loader.
+
+        Parameters:
+            should_crop (bool): Whether to crop the frames to the render area.
+            render_area (Optional[RenderArea]): The render area in screen coordinates (left, top, right, bottom).
+                If None and should_crop is True, it is read from BBoxFactory once.
+            cache_size (int): Maximum number of frames kept in the LRU. 0 disables caching.
+        """
+        if cache_size < 0:
+            raise ValueError("cache_size must not be negative")
+        self.logger = logging.getLogger("FrameLoader")
+        self.should_crop = should_crop
+        self.render_area: Optional[RenderArea] = None
+        if should_crop:
+            self.render_area = tuple(render_area) if render_area is not None else get_website_render_area()  # type: ignore
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[FrameCacheKey, LoadedFrame]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _decode(self, image_path: str) -> LoadedFrame:
+        # imdecode over np.fromfile also handles non-ASCII paths on Windows, unlike cv2.imread
+        bgr = cv2.imdecode(np.fromfile(image_path, dtype=np.uint8), cv2.IMREAD_COLOR)
+        if bgr is None:
+            raise ValueError(f"Failed to open image: {image_path}")
+
+        original_height, original_width = bgr.shape[:2]
+        crop_box = None
+        if self.render_area is not None:
+            # Region captures start at their origin rather than the screen's top-left corner
+            render_area = to_image_render_area(self.render_area, get_capture_origin(image_path))
+            crop_box = clamp_render_area(render_area, original_width, original_height)
+            left, top, right, bottom = crop_box
+            # Copy the crop so the full decoded frame is not kept alive by a view
+            bgr = bgr[top:bottom, left:right].copy()
+
+        # Freeze the buffer so every consumer can share it safely
+        bgr.setflags(write=False)
+
+        return LoadedFrame(
+            image_path=image_path,
+            bgr=bgr,
+            original_width=original_width,
+            original_height=original_height,
+            crop_box=crop_box
+        )
+
+    def load(self, image_path: str) -> LoadedFrame:
+        """
+        Load a single screenshot.
+
+        Parameters:
+            image_path (str): Path to the screenshot.
+
+        Returns:
+            LoadedFrame: The decoded, cropped and read-only frame.
+
+        Raises:
+            FileNotFoundError: If the image file does not exist.
+            ValueError: If the image cannot be decoded.
+        """
+        try:
+            mtime_ns = os.stat(image_path).st_mtime_ns
+        except OSError:
+            raise FileNotFoundError(f"Image file not found: {image_path}")
+
+        if self.cache_size == 0:
+            return self._decode(image_path)
+
+        key: FrameCacheKey = (os.path.abspath(image_path), mtime_ns, self.render_area)
+        with self._lock:
+            frame = self._cache.get(key)
+            if frame is not None:
+                self._cache.move_to_end(key)
+                self.hits += 1
+                return frame
+            self.misses += 1
+
+        frame = self._decode(image_path)
+
+        with self._lock:
+            self._cache[key] = frame
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return frame
+
+    def load_many(self, image_paths: Sequence[str]) -> List[LoadedFrame]:
+        """
+        Load several screenshots, skipping (and logging) the ones that cannot be read.
+
+        Parameters:
+            image_paths (Sequence[str]): Paths to the screenshots.
+
+        Returns:
+            List[LoadedFrame]: The loaded frames, in input order. Each frame carries its own
+                image_path, so callers should not zip the result with the input paths.
+        """
+        frames = []
+        for image_path in image_paths:
+            try:
+                frames.append(self.load(image_path))
+            except (FileNotFoundError, ValueError) as e:
+                self.logger.warning(f"Skipping image {image_path}: {str(e)}")
+        self.logger.info(f"Loaded {len(frames)} of {len(image_paths)} frames")
+        return frames
+
+    def clear(self) -> None:
+        """
+        Drop every cached frame.
+        """
+        with self._lock:
+            self._cache.clear()
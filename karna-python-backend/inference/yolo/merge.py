@@ -0,0 +1,201 @@
+"""
+Cross-model de-duplication of the UI and icon detections.
+
+The UI and icon detectors each run NMS over their own boxes, but they often
+both detect the same element, so concatenating their results reports it
+twice. merge_detections finds the boxes of one model that duplicate a box of
+another model and keeps only the more confident of each duplicate group.
+
+Whether two boxes are duplicates is decided per pair of class names by a
+MergeRule: their IoU, and optionally how much of the less confident box lies
+inside the other. Containment is off by default so that genuinely nested
+elements, such as an icon inside a button, are both kept. Boxes of the same
+model never suppress each other.
+"""
+
+import threading
+from dataclasses import dataclass, field
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+from inference import BoundingBox, BoundingBoxArray
+from inference.yolo.box_ops import as_xyxy, box_area, pairwise_intersection
+
+# Class name matching any class in MergeRules keys
+ANY_CLASS = "*"
+
+ClassPair = Tuple[str, str]
+
+
+@dataclass(frozen=True)
+class MergeRule:
+    """
+    When two boxes of different models are the same element.
+    """
+    # Duplicates when their IoU reaches this, None disables the IoU test
+    iou_threshold: Optional[float] = 0.7
+    # Duplicates when this fraction of the less confident box lies inside the other, None disables the test
+    containment_threshold: Optional[float] = None
+
+
+DEFAULT_MERGE_RULES: Dict[ClassPair, MergeRule] = {
+    (ANY_CLASS, ANY_CLASS): MergeRule(),
+}
+
+
+@dataclass
+class MergeReport:
+    """
+    What a merge suppressed, accumulated over frames with add().
+    """
+    input_boxes: int = 0
+    kept_boxes: int = 0
+    # Suppressed boxes per (suppressed class, kept class)
+    suppressed_by_pair: Dict[ClassPair, int] = field(default_factory=dict)
+
+    @property
+    def suppressed(self) -> int:
+        return self.input_boxes - self.kept_boxes
+
+    def add(self, other: "MergeReport") -> None:
+        self.input_boxes += other.input_boxes
+        self.kept_boxes += other.kept_boxes
+        for pair, count in other.suppressed_by_pair.items():
+            self.suppressed_by_pair[pair] = self.suppressed_by_pair.get(pair, 0) + count
+
+
+def get_merge_rule(rules: Mapping[ClassPair, MergeRule], class_a: str, class_b: str) -> MergeRule:
+    """
+    Get the rule of a pair of classes, in either order, falling back to wildcard rules.
+    """
+    for a, b in ((class_a, class_b), (class_a, ANY_CLASS), (ANY_CLASS, class_b), (ANY_CLASS, ANY_CLASS)):
+        rule = rules.get((a, b)) or rules.get((b, a))
+        if rule is not None:
+            return rule
+    return MergeRule(iou_threshold=None)
+
+
+def merge_rules_params(rules: Mapping[ClassPair, MergeRule]) -> Dict[str, List[Optional[float]]]:
+    """
+    The rules as plain data, for cache keys.
+    """
+    return {f"{a}|{b}": [rule.iou_threshold, rule.containment_threshold] for (a, b), rule in sorted(rules.items())}
+
+
+def _threshold_matrices(class_names: Sequence[str], class_index: np.ndarray,
+                        rules: Mapping[ClassPair, MergeRule]) -> Tuple[np.ndarray, np.ndarray]:
+    """(N, N) IoU and containment thresholds of every box pair, inf where the test is disabled"""
+    count = len(class_names)
+    iou_table = np.full((count, count), np.inf)
+    containment_table = np.full((count, count), np.inf)
+    for i, class_a in enumerate(class_names):
+        for j, class_b in enumerate(class_names):
+            rule = get_merge_rule(rules, class_a, class_b)
+            if rule.iou_threshold is not None:
+                iou_table[i, j] = rule.iou_threshold
+            if rule.containment_threshold is not None:
+                containment_table[i, j] = rule.containment_threshold
+    return (iou_table[class_index[:, None], class_index[None, :]],
+            containment_table[class_index[:, None], class_index[None, :]])
+
+
+def merge_detections(xyxy: np.ndarray, confidences: np.ndarray, class_names: Sequence[str],
+                     sources: np.ndarray, rules: Mapping[ClassPair, MergeRule] = DEFAULT_MERGE_RULES
+                     ) -> Tuple[np.ndarray, MergeReport]:
+    """
+    Suppress boxes that duplicate a more confident box of another model.
+
+    The duplicate test runs on (N, N) arrays of all box pairs. Only boxes with a
+    duplicate are then visited, most confident first, so a suppressed box never
+    suppresses others.
+
+    Parameters:
+        xyxy (np.ndarray): (N, 4) boxes of every model.
+        confidences (np.ndarray): (N,) confidences.
+        class_names (Sequence[str]): (N,) class name of each box.
+        sources (np.ndarray): (N,) model of each box, e.g. 0 for icon and 1 for UI boxes.
+        rules (Mapping[ClassPair, MergeRule]): Rules per pair of class names, see get_merge_rule.
+
+    Returns:
+        Tuple[np.ndarray, MergeReport]: (N,) mask of the kept boxes and what was suppressed.
+    """
+    xyxy = as_xyxy(xyxy)
+    count = len(xyxy)
+    keep = np.ones(count, dtype=bool)
+    report = MergeReport(input_boxes=count, kept_boxes=count)
+    if count < 2:
+        return keep, report
+
+    unique_classes, class_index = np.unique(np.asarray(class_names, dtype=object).astype(str), return_inverse=True)
+    iou_thresholds, containment_thresholds = _threshold_matrices(list(unique_classes), class_index, rules)
+
+    intersection = pairwise_intersection(xyxy, xyxy)
+    areas = box_area(xyxy)
+    union = areas[:, None] + areas[None, :] - intersection
+    iou = np.divide(intersection, union, out=np.zeros_like(intersection), where=union > 0)
+    # containment[i, j]: fraction of box j inside box i
+    containment = np.divide(intersection, areas[None, :], out=np.zeros_like(intersection), where=areas[None, :] > 0)
+
+    sources = np.asarray(sources)
+    confidences = np.asarray(confidences, dtype=np.float64)
+    order = np.argsort(-confidences, kind="stable")
+    rank = np.empty(count, dtype=np.int64)
+    rank[order] = np.arange(count)
+    # duplicate[i, j]: box i, of another model and ranked higher, makes box j redundant
+    duplicate = ((iou >= iou_thresholds) | (containment >= containment_thresholds))
+    duplicate &= sources[:, None] != sources[None, :]
+    duplicate &= rank[:, None] < rank[None, :]
+
+    for i in order[duplicate[order].any(axis=1)]:
+        if not keep[i]:
+            continue
+        suppressed = duplicate[i] & keep
+        keep &= ~suppressed
+        for j in np.flatnonzero(suppressed):
+            pair = (str(unique_classes[class_index[j]]), str(unique_classes[class_index[i]]))
+            report.suppressed_by_pair[pair] = report.suppressed_by_pair.get(pair, 0) + 1
+
+    report.kept_boxes = int(keep.sum())
+    return keep, report
+
+
+def merge_bounding_boxes(box_lists: Sequence[Sequence[BoundingBox]],
+                         rules: Mapping[ClassPair, MergeRule] = DEFAULT_MERGE_RULES
+                         ) -> Tuple[BoundingBoxArray, MergeReport]:
+    """
+    Concatenate the boxes of several models, without the cross-model duplicates.
+
+    Parameters:
+        box_lists (Sequence[Sequence[BoundingBox]]): The boxes of each model, as lists or BoundingBoxArrays.
+        rules (Mapping[ClassPair, MergeRule]): Rules per pair of class names.
+
+    Returns:
+        Tuple[BoundingBoxArray, MergeReport]: The kept boxes in input order and what was suppressed.
+    """
+    boxes = BoundingBoxArray.concatenate(box_lists)
+    sources = np.repeat(np.arange(len(box_lists)), [len(box_list) for box_list in box_lists])
+    keep, report = merge_detections(boxes.xyxy, boxes.confidences, boxes.class_names, sources, rules)
+    return boxes.filter(keep), report
+
+
+class MergeStats:
+    """
+    Thread-safe running total of the merge reports of a process.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._total = MergeReport()
+
+    def add(self, report: MergeReport) -> None:
+        with self._lock:
+            self._total.add(report)
+
+    def snapshot(self) -> MergeReport:
+        with self._lock:
+            return MergeReport(self._total.input_boxes, self._total.kept_boxes, dict(self._total.suppressed_by_pair))
+
+    def reset(self) -> None:
+        with self._lock:
+            self._total = MergeReport()
@@ -0,0 +1,344 @@
+"""
+Process-wide registry of loaded YOLO models.
+
+Loading the yolo11x weights is more expensive than running inference on a
+handful of frames, so every YOLO prediction class obtains its model from this
+registry instead of constructing ``YOLO(...)`` itself. Models are keyed by
+(weights path, device), loaded lazily on first use, and can optionally be
+evicted after a period of inactivity to free RAM on small machines.
+
+An ultralytics model keeps the state of the running prediction (its predictor,
+dataset and batch) on the model object, so a shared model must not run two
+predictions at once. Callers hold get_inference_lock() around every call of a
+model; different models still run in parallel.
+"""
+
+import gc
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass, asdict
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from ultralytics import YOLO # type: ignore
+from base import SingletonMeta
+from inference.yolo.engines import is_exported_model
+
+logger = logging.getLogger("YOLOModelRegistry")
+
+# Key used when the caller does not request a specific device and lets ultralytics decide
+AUTO_DEVICE = "auto"
+
+ModelKey = Tuple[str, str]
+
+
+@dataclass
+class ModelRegistryStats:
+    """
+    Load-time and hit metrics for a single registry entry.
+    """
+    weights_path: str
+    device: str
+    loads: int = 0
+    hits: int = 0
+    evictions: int = 0
+    last_load_seconds: float = 0.0
+    total_load_seconds: float = 0.0
+    last_used: Optional[datetime] = None
+    is_loaded: bool = False
+
+    def to_dict(self):
+        """
+        Convert the stats to a dictionary.
+        """
+        result = asdict(self)
+        result["last_used"] = self.last_used.isoformat() if self.last_used else None
+        return result
+
+
+@dataclass
+class _RegistryEntry:
+    model: Any
+    last_used_monotonic: float
+
+
+class YOLOModelRegistry(metaclass=SingletonMeta):
+    """
+    Shared, lazily-initialised cache of YOLO models keyed by weights path and device.
+    """
+
+    def __init__(self, idle_timeout_seconds: Optional[float] = None):
+        """
+        Initialize the registry.
+
+        Args:
+            idle_timeout_seconds: Evict models that have not been used for this many seconds.
+                None disables idle eviction.
+        """
+        if not hasattr(self, '_initialized'):
+            self._entries: Dict[ModelKey, _RegistryEntry] = {}
+            self._stats: Dict[ModelKey, ModelRegistryStats] = {}
+            self._lock = threading.Lock()
+            self._load_locks: Dict[ModelKey, threading.Lock] = {}
+            self._inference_locks: Dict[ModelKey, threading.Lock] = {}
+            self._idle_timeout_seconds: Optional[float] = None
+            self._eviction_thread: Optional[threading.Thread] = None
+            self._stop_eviction = threading.Event()
+            self._initialized = True
+            self.set_idle_timeout(idle_timeout_seconds)
+            logger.info("YOLOModelRegistry instance created")
+
+    @staticmethod
+    def _make_key(weights_path: str, device: Optional[str]) -> ModelKey:
+        return os.path.abspath(str(weights_path)), device or AUTO_DEVICE
+
+    def _get_load_lock(self, key: ModelKey) -> threading.Lock:
+        with self._lock:
+            if key not in self._load_locks:
+                self._load_locks[key] = threading.Lock()
+            return self._load_locks[key]
+
+    def get_inference_lock(self, weights_path: str, device: Optional[str] = None) -> threading.Lock:
+        """
+        Get the lock serialising the predictions of a model.
+
+        Args:
+            weights_path: Path to the model weights.
+            device: Device the model was loaded for.
+
+        Returns:
+            threading.Lock: The lock to hold while calling the model.
+        """
+        key = self._make_key(weights_path, device)
+        with self._lock:
+            if key not in self._inference_locks:
+                self._inference_locks[key] = threading.Lock()
+            return self._inference_locks[key]
+
+    def _get_stats(self, key: ModelKey) -> ModelRegistryStats:
+        # Must be called with self._lock held
+        if key not in self._stats:
+            self._stats[key] = ModelRegistryStats(weights_path=key[0], device=key[1])
+        return self._stats[key]
+
+    def get_model(self, weights_path: str, device: Optional[str] = None) -> Any:
+        """
+        Get a loaded model, loading it on first use.
+
+        Args:
+            weights_path: Path to the model weights, or an ONNX/OpenVINO export of them.
+            device: Torch device string (e.g. "cpu", "cuda:0"). None lets ultralytics decide.
+
+        Returns:
+            YOLO: The shared model instance.
+        """
+        key = self._make_key(weights_path, device)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                entry.last_used_monotonic = time.monotonic()
+                stats = self._get_stats(key)
+                stats.hits += 1
+                stats.last_used = datetime.now()
+                return entry.model
+
+        # Only one thread loads a given key; others wait and then reuse the result
+        with self._get_load_lock(key):
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is not None:
+                    entry.last_used_monotonic = time.monotonic()
+                    stats = self._get_stats(key)
+                    stats.hits += 1
+                    stats.last_used = datetime.now()
+                    return entry.model
+
+            model = self._load_model(key)
+
+            with self._lock:
+                self._entries[key] = _RegistryEntry(model=model, last_used_monotonic=time.monotonic())
+                stats = self._get_stats(key)
+                stats.is_loaded = True
+                stats.last_used = datetime.now()
+            return model
+
+    def _load_model(self, key: ModelKey) -> Any:
+        weights_path, device = key
+        logger.info(f"Loading YOLO model from {weights_path} (device: {device})")
+        start_time = time.perf_counter()
+        if is_exported_model(weights_path):
+            # Exported models carry no task of their own, and run on the device passed at predict time
+            model = YOLO(weights_path, task="detect")
+        else:
+            model = YOLO(weights_path)
+            if device != AUTO_DEVICE:
+                model.to(device)
+        load_seconds = time.perf_counter() - start_time
+
+        with self._lock:
+            stats = self._get_stats(key)
+            stats.loads += 1
+            stats.last_load_seconds = load_seconds
+            stats.total_load_seconds += load_seconds
+
+        logger.info(f"YOLO model loaded from {weights_path} in {load_seconds:.2f}s")
+        return model
+
+    def warm_up(self, models: Iterable[Tuple[str, Optional[str]]], run_inference: bool = True) -> None:
+        """
+        Load models ahead of the first request.
+
+        Args:
+            models: Iterable of (weights_path, device) pairs to load.
+            run_inference: Whether to run one dummy inference per model so that lazily
+                initialised backend state is built before the first real request.
+        """
+        for weights_path, device in models:
+            try:
+                model = self.get_model(weights_path, device)
+                if run_inference:
+                    import numpy as np
+                    dummy_frame = np.zeros((640, 640, 3), dtype=np.uint8)
+                    kwargs = {} if device is None else {"device": device}
+                    with self.get_inference_lock(weights_path, device):
+                        model(dummy_frame, verbose=False, **kwargs)
+                logger.info(f"Warmed up YOLO model {weights_path}")
+            except Exception as e:
+                logger.error(f"Failed to warm up YOLO model {weights_path}: {str(e)}")
+
+    def evict(self, weights_path: str, device: Optional[str] = None) -> bool:
+        """
+        Drop a model from the registry.
+
+        Args:
+            weights_path: Path to the model weights.
+            device: Device the model was loaded for.
+
+        Returns:
+            bool: True if a loaded model was evicted.
+        """
+        key = self._make_key(weights_path, device)
+        with self._lock:
+            evicted = self._evict_locked(key)
+        if evicted:
+            self._release_memory()
+        return evicted
+
+    def _evict_locked(self, key: ModelKey) -> bool:
+        # Must be called with self._lock held
+        if self._entries.pop(key, None) is None:
+            return False
+        stats = self._get_stats(key)
+        stats.evictions += 1
+        stats.is_loaded = False
+        logger.info(f"Evicted YOLO model {key[0]} (device: {key[1]})")
+        return True
+
+    def evict_idle(self) -> List[ModelKey]:
+        """
+        Evict every model that has been idle for longer than the idle timeout.
+
+        Returns:
+            List[Tuple[str, str]]: Keys of the evicted models.
+        """
+        if self._idle_timeout_seconds is None:
+            return []
+
+        now = time.monotonic()
+        with self._lock:
+            idle_keys = [
+                key for key, entry in self._entries.items()
+                if now - entry.last_used_monotonic > self._idle_timeout_seconds
+            ]
+            for key in idle_keys:
+                self._evict_locked(key)
+
+        if idle_keys:
+            self._release_memory()
+        return idle_keys
+
+    def clear(self) -> None:
+        """
+        Evict all loaded models.
+        """
+        with self._lock:
+            for key in list(self._entries.keys()):
+                self._evict_locked(key)
+        self._release_memory()
+
+    @staticmethod
+    def _release_memory() -> None:
+        gc.collect()
+        try:
+            import torch
+            if torch.cuda.is_available():
+                torch.cuda.empty_cache()
+        except ImportError:
+            pass
+
+    def set_idle_timeout(self, idle_timeout_seconds: Optional[float]) -> None:
+        """
+        Enable, change or disable idle eviction.
+
+        Args:
+            idle_timeout_seconds: Idle time after which a model is evicted, or None to disable.
+        """
+        if idle_timeout_seconds is not None and idle_timeout_seconds <= 0:
+            raise ValueError("idle_timeout_seconds must be positive or None")
+
+        self._idle_timeout_seconds = idle_timeout_seconds
+        if idle_timeout_seconds is None:
+            self._stop_eviction.set()
+            return
+
+        if self._eviction_thread is None or not self._eviction_thread.is_alive():
+            self._stop_eviction = threading.Event()
+            self._eviction_thread = threading.Thread(
+                target=self._eviction_loop,
+                name="YOLOModelRegistryEviction",
+                daemon=True
+            )
+            self._eviction_thread.start()
+
+    def _eviction_loop(self) -> None:
+        while self._idle_timeout_seconds is not None:
+            interval = min(max(self._idle_timeout_seconds / 2, 1.0), 30.0)
+            if self._stop_eviction.wait(interval):
+                break
+            try:
+                self.evict_idle()
+            except Exception as e:
+                logger.error(f"Error during idle model eviction: {str(e)}")
+
+    def is_loaded(self, weights_path: str, device: Optional[str] = None) -> bool:
+        """
+        Check whether a model is currently loaded.
+        """
+        with self._lock:
+            return self._make_key(weights_path, device) in self._entries
+
+    def get_stats(self) -> List[ModelRegistryStats]:
+        """
+        Get load-time and hit metrics for every model the registry has seen.
+
+        Returns:
+            List[ModelRegistryStats]: Copies of the per-model statistics.
+        """
+        with self._lock:
+            return [ModelRegistryStats(**asdict(stats)) for stats in self._stats.values()]
+
+
+def get_model_registry_instance(idle_timeout_seconds: Optional[float] = None) -> YOLOModelRegistry:
+    """
+    Get the singleton instance of the YOLOModelRegistry.
+
+    Args:
+        idle_timeout_seconds: Optional idle timeout applied on first initialization.
+
+    Returns:
+        YOLOModelRegistry: The singleton registry.
+    """
+    return YOLOModelRegistry(idle_timeout_seconds)
@@ -0,0 +1,178 @@
+"""
+Frame preprocessing shared by the YOLO UI and icon detectors.
+
+Each frame is converted once to a contiguous BGR array (the layout ultralytics
+works on) and letterboxed once per model input size. When the UI and icon
+models run over the same frames they reuse the same PreprocessedFrame objects,
+so the conversion and resize work is not repeated per model.
+"""
+
+import threading
+import uuid
+from dataclasses import dataclass
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, TypeVar, Union
+
+import cv2
+import numpy as np
+from PIL import Image
+
+# Padding colour used by ultralytics' own LetterBox transform
+LETTERBOX_COLOR = (114, 114, 114)
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class LetterboxedFrame:
+    """
+    A frame resized with unchanged aspect ratio and padded to a square model input.
+    """
+    image: np.ndarray
+    ratio: float
+    pad_left: int
+    pad_top: int
+    original_width: int
+    original_height: int
+
+    def to_original_xyxy(self, xyxy: np.ndarray) -> np.ndarray:
+        """
+        Map (N, 4) xyxy boxes from letterboxed coordinates back to the original frame.
+        """
+        boxes = np.asarray(xyxy, dtype=np.float32).reshape(-1, 4).copy()
+        boxes[:, [0, 2]] = (boxes[:, [0, 2]] - self.pad_left) / self.ratio
+        boxes[:, [1, 3]] = (boxes[:, [1, 3]] - self.pad_top) / self.ratio
+        boxes[:, [0, 2]] = boxes[:, [0, 2]].clip(0, self.original_width)
+        boxes[:, [1, 3]] = boxes[:, [1, 3]].clip(0, self.original_height)
+        return boxes
+
+
+def letterbox(image: np.ndarray, imgsz: int, color: Tuple[int, int, int] = LETTERBOX_COLOR) -> LetterboxedFrame:
+    """
+    Resize and pad an HxWx3 image to an imgsz x imgsz square, keeping the aspect ratio.
+
+    Parameters:
+        image (np.ndarray): Source image.
+        imgsz (int): Target square size.
+        color (Tuple[int, int, int]): Padding colour.
+
+    Returns:
+        LetterboxedFrame: The letterboxed image and the parameters needed to map boxes back.
+    """
+    height, width = image.shape[:2]
+    ratio = min(imgsz / height, imgsz / width)
+    new_width, new_height = int(round(width * ratio)), int(round(height * ratio))
+
+    if (new_width, new_height) != (width, height):
+        resized = cv2.resize(image, (new_width, new_height), interpolation=cv2.INTER_LINEAR)
+    else:
+        resized = image
+
+    pad_w, pad_h = imgsz - new_width, imgsz - new_height
+    pad_left, pad_top = pad_w // 2, pad_h // 2
+    padded = cv2.copyMakeBorder(
+        resized, pad_top, pad_h - pad_top, pad_left, pad_w - pad_left,
+        cv2.BORDER_CONSTANT, value=color
+    )
+    return LetterboxedFrame(
+        image=padded,
+        ratio=ratio,
+        pad_left=pad_left,
+        pad_top=pad_top,
+        original_width=width,
+        original_height=height
+    )
+
+
+class PreprocessedFrame:
+    """
+    A frame prepared once for YOLO inference and shared between detectors.
+    """
+
+    def __init__(self, bgr: np.ndarray, image_path: str):
+        """
+        Parameters:
+            bgr (np.ndarray): HxWx3 uint8 image in BGR channel order.
+            image_path (str): Path (or identifier) reported in the BoundingBoxResult.
+        """
+        self.bgr = np.ascontiguousarray(bgr)
+        self.image_path = image_path
+        self._letterboxed: Dict[int, LetterboxedFrame] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def width(self) -> int:
+        return self.bgr.shape[1]
+
+    @property
+    def height(self) -> int:
+        return self.bgr.shape[0]
+
+    def letterboxed(self, imgsz: int) -> LetterboxedFrame:
+        """
+        Get the frame letterboxed to imgsz, computing it only on first request.
+        """
+        with self._lock:
+            if imgsz not in self._letterboxed:
+                self._letterboxed[imgsz] = letterbox(self.bgr, imgsz)
+            return self._letterboxed[imgsz]
+
+    @classmethod
+    def from_source(cls, image: Union[str, Image.Image, np.ndarray], image_path: Optional[str] = None) -> "PreprocessedFrame":
+        """
+        Build a frame from an image path, a PIL image or an RGB numpy array.
+
+        Raises:
+            FileNotFoundError: If an image path cannot be read.
+        """
+        if isinstance(image, np.ndarray):
+            bgr = cv2.cvtColor(image, cv2.COLOR_RGB2BGR)
+            return cls(bgr, image_path or f"array_image_{uuid.uuid4()}")
+
+        if isinstance(image, Image.Image):
+            rgb = np.asarray(image.convert("RGB"))
+            bgr = cv2.cvtColor(rgb, cv2.COLOR_RGB2BGR)
+            return cls(bgr, image_path or f"pil_image_{uuid.uuid4()}")
+
+        path = str(image)
+        bgr = cv2.imread(path, cv2.IMREAD_COLOR)
+        if bgr is None:
+            raise FileNotFoundError(f"Image file not found or unreadable: {path}")
+        return cls(bgr, image_path or path)
+
+
+def preprocess_frames(images: Sequence[Union[str, Image.Image, np.ndarray, PreprocessedFrame]],
+                      image_paths: Optional[Sequence[str]] = None) -> List[PreprocessedFrame]:
+    """
+    Convert a list of images into PreprocessedFrame objects, passing existing frames through.
+
+    Parameters:
+        images: Image paths, PIL images, RGB arrays or already preprocessed frames.
+        image_paths: Optional paths reported for each image in the results.
+
+    Returns:
+        List[PreprocessedFrame]: One frame per input image.
+    """
+    frames = []
+    for index, image in enumerate(images):
+        if isinstance(image, PreprocessedFrame):
+            frames.append(image)
+            continue
+        image_path = str(image_paths[index]) if image_paths is not None else None
+        frames.append(PreprocessedFrame.from_source(image, image_path))
+    return frames
+
+
+def iter_batches(items: Iterable[T], batch_size: int) -> Iterator[List[T]]:
+    """
+    Yield consecutive lists of at most batch_size items.
+    """
+    if batch_size < 1:
+        raise ValueError("batch_size must be at least 1")
+    batch: List[T] = []
+    for item in items:
+        batch.append(item)
+        if len(batch) == batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
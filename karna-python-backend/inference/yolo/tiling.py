@@ -0,0 +1,294 @@
+"""
+Input resolution planning and tiled inference for the YOLO detectors.
+
+A detector runs every frame at one square input size, so the scale at which a
+frame reaches the model depends on its resolution: small icons on a 4K or
+ultrawide capture shrink below what the model can detect, while a small crop
+is padded up to the full input size. The planner picks the input size of each
+frame from its resolution and the smallest element that should stay
+detectable:
+
+- frames smaller than the trained input size run at their own size
+- larger frames run at the size that keeps that element detectable, at least
+  the trained size and at most max_imgsz
+- frames that would need more than max_imgsz are split into overlapping tiles,
+  each run at max_imgsz, and the tile detections are merged back with NMS
+
+The pixels fed to the models can be capped per second by the process-wide
+PixelRateLimiter, which keeps detection throughput predictable whatever the
+frame sizes.
+"""
+
+import logging
+import math
+import threading
+import time
+from dataclasses import dataclass
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from inference.yolo.box_ops import nms
+
+logger = logging.getLogger("YOLOTiling")
+
+# Input sizes are multiples of the YOLO models' largest stride
+STRIDE = 32
+
+# (x_min, y_min, x_max, y_max) of a tile in frame pixels
+TileWindow = Tuple[int, int, int, int]
+
+
+def round_up_to_stride(value: float, stride: int = STRIDE) -> int:
+    return int(math.ceil(value / stride)) * stride
+
+
+@dataclass(frozen=True)
+class ResolutionPlan:
+    """
+    How one frame is fed to a detector.
+    """
+    # Square model input size
+    imgsz: int
+    # Tiles of the frame, empty when the whole frame is letterboxed at once
+    tiles: Tuple[TileWindow, ...] = ()
+
+    @property
+    def is_tiled(self) -> bool:
+        return len(self.tiles) > 0
+
+    @property
+    def input_pixels(self) -> int:
+        """Pixels fed to the model for the frame"""
+        return self.imgsz * self.imgsz * max(len(self.tiles), 1)
+
+
+def required_imgsz(width: int, height: int, min_element_size: float, min_element_input_size: float,
+                   stride: int = STRIDE) -> int:
+    """
+    Get the input size at which an element of min_element_size frame pixels is min_element_input_size model pixels.
+    """
+    return round_up_to_stride(max(width, height) * min_element_input_size / min_element_size, stride)
+
+
+def plan_tile_starts(length: int, window: int, overlap: int) -> List[int]:
+    """
+    Get the start offsets of windows covering length with at least overlap pixels between neighbours.
+    """
+    if length <= window:
+        return [0]
+    count = int(math.ceil((length - overlap) / (window - overlap)))
+    return [int(round(start)) for start in np.linspace(0, length - window, count)]
+
+
+def plan_tiles(width: int, height: int, window: int, overlap: int) -> Tuple[TileWindow, ...]:
+    """
+    Split a frame into overlapping square windows, clipped to the frame.
+
+    Parameters:
+        width (int): Frame width.
+        height (int): Frame height.
+        window (int): Tile edge in frame pixels.
+        overlap (int): Minimum overlap between neighbouring tiles in pixels.
+
+    Returns:
+        Tuple[TileWindow, ...]: Tiles in row-major order.
+    """
+    if overlap >= window:
+        raise ValueError("Tile overlap must be smaller than the tile")
+    return tuple(
+        (x, y, min(x + window, width), min(y + window, height))
+        for y in plan_tile_starts(height, window, overlap)
+        for x in plan_tile_starts(width, window, overlap)
+    )
+
+
+def plan_resolution(width: int, height: int, trained_imgsz: int, min_element_size: float,
+                    min_element_input_size: float, max_imgsz: int, tile_overlap: float) -> ResolutionPlan:
+    """
+    Plan the input size, and tiles if needed, of a frame.
+
+    Parameters:
+        width (int): Frame width.
+        height (int): Frame height.
+        trained_imgsz (int): The model's own input size.
+        min_element_size (float): Smallest element, in frame pixels, that should stay detectable.
+        min_element_input_size (float): Size such an element needs in the model input.
+        max_imgsz (int): Largest input size; frames that need more are tiled.
+        tile_overlap (float): Overlap between tiles as a fraction of the tile.
+
+    Returns:
+        ResolutionPlan: The plan of the frame.
+    """
+    max_imgsz = max(max_imgsz, trained_imgsz)
+    needed = required_imgsz(width, height, min_element_size, min_element_input_size)
+    # Small crops are not padded up to the trained size, larger frames never run below it
+    imgsz = max(needed, min(trained_imgsz, round_up_to_stride(max(width, height))))
+    if imgsz <= max_imgsz:
+        return ResolutionPlan(imgsz=imgsz)
+
+    # The tile that keeps the smallest element detectable at max_imgsz
+    window = int(max_imgsz * min_element_size / min_element_input_size)
+    overlap = int(window * tile_overlap)
+    return ResolutionPlan(imgsz=max_imgsz, tiles=plan_tiles(width, height, window, overlap))
+
+
+def drop_truncated_boxes(xyxy: np.ndarray, tile: TileWindow, frame_size: Tuple[int, int], overlap: int,
+                         edge_margin: float = 2.0) -> np.ndarray:
+    """
+    Find the boxes of a tile that are not cut off by its edges inside the frame.
+
+    A box touching an inner tile edge is the visible part of an element that
+    continues in the neighbouring tile. If it is narrower than the overlap,
+    the neighbour sees the whole element, so the cut-off box is dropped.
+
+    Parameters:
+        xyxy (np.ndarray): (N, 4) boxes of the tile, in frame coordinates.
+        tile (TileWindow): The tile.
+        frame_size (Tuple[int, int]): (width, height) of the frame.
+        overlap (int): Minimum overlap between neighbouring tiles in pixels.
+        edge_margin (float): Distance to an edge at which a box counts as cut off.
+
+    Returns:
+        np.ndarray: (N,) mask of the boxes to keep.
+    """
+    x_min, y_min, x_max, y_max = tile
+    width, height = frame_size
+    widths, heights = xyxy[:, 2] - xyxy[:, 0], xyxy[:, 3] - xyxy[:, 1]
+    truncated = np.zeros(len(xyxy), dtype=bool)
+    if x_min > 0:
+        truncated |= (xyxy[:, 0] <= x_min + edge_margin) & (widths < overlap)
+    if y_min > 0:
+        truncated |= (xyxy[:, 1] <= y_min + edge_margin) & (heights < overlap)
+    if x_max < width:
+        truncated |= (xyxy[:, 2] >= x_max - edge_margin) & (widths < overlap)
+    if y_max < height:
+        truncated |= (xyxy[:, 3] >= y_max - edge_margin) & (heights < overlap)
+    return ~truncated
+
+
+def merge_tile_detections(tiles: Sequence[TileWindow], tile_boxes: Sequence[np.ndarray],
+                          tile_labels: Sequence[np.ndarray], tile_confidences: Sequence[np.ndarray],
+                          frame_size: Tuple[int, int], iou_threshold: float = 0.5
+                          ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Merge the detections of a frame's tiles into detections of the frame.
+
+    Parameters:
+        tiles (Sequence[TileWindow]): The tiles, as planned by plan_tiles.
+        tile_boxes (Sequence[np.ndarray]): (N_i, 4) xyxy boxes of each tile, in frame coordinates.
+        tile_labels (Sequence[np.ndarray]): (N_i,) class indices of each tile.
+        tile_confidences (Sequence[np.ndarray]): (N_i,) confidences of each tile.
+        frame_size (Tuple[int, int]): (width, height) of the frame.
+        iou_threshold (float): IoU above which same-class boxes from overlapping tiles are duplicates.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray, np.ndarray]: Boxes, labels and confidences of the frame.
+    """
+    overlap = _min_tile_overlap(tiles)
+    boxes, labels, confidences = [], [], []
+    for tile, xyxy, tile_label, tile_conf in zip(tiles, tile_boxes, tile_labels, tile_confidences):
+        xyxy = np.asarray(xyxy, dtype=np.float32).reshape(-1, 4)
+        keep = drop_truncated_boxes(xyxy, tile, frame_size, overlap)
+        boxes.append(xyxy[keep])
+        labels.append(np.asarray(tile_label).reshape(-1)[keep])
+        confidences.append(np.asarray(tile_conf).reshape(-1)[keep])
+
+    if not boxes:
+        return np.zeros((0, 4), dtype=np.float32), np.zeros(0), np.zeros(0)
+    boxes, labels, confidences = np.concatenate(boxes), np.concatenate(labels), np.concatenate(confidences)
+    keep = nms(boxes, confidences, iou_threshold, labels=labels)
+    return boxes[keep], labels[keep], confidences[keep]
+
+
+def _min_tile_overlap(tiles: Sequence[TileWindow]) -> int:
+    """The smallest overlap between horizontally or vertically neighbouring tiles"""
+    overlaps = []
+    for axis in (0, 1):
+        starts = sorted({tile[axis] for tile in tiles})
+        ends = sorted({tile[axis + 2] for tile in tiles})
+        overlaps.extend(end - start for end, start in zip(ends[:-1], starts[1:]))
+    return min(overlaps) if overlaps else 0
+
+
+class PixelRateLimiter:
+    """
+    Token bucket capping the pixels fed to the detectors per second.
+
+    The bucket holds at most one second of pixels. A request larger than what
+    is available waits until the bucket has refilled by the missing amount, so
+    one oversized frame delays the frames after it instead of being refused.
+    """
+
+    def __init__(self, pixels_per_second: Optional[float] = None):
+        """
+        Args:
+            pixels_per_second: Pixel budget per second, None for no limit.
+        """
+        self._lock = threading.Lock()
+        self._pixels_per_second: Optional[float] = None
+        self._tokens = 0.0
+        self._last_refill = time.monotonic()
+        # Total time callers were held back, for diagnostics
+        self.waited_seconds = 0.0
+        self.set_rate(pixels_per_second)
+
+    @property
+    def pixels_per_second(self) -> Optional[float]:
+        return self._pixels_per_second
+
+    def set_rate(self, pixels_per_second: Optional[float]) -> None:
+        """
+        Change or remove the limit.
+
+        Args:
+            pixels_per_second: Pixel budget per second, None for no limit.
+        """
+        if pixels_per_second is not None and pixels_per_second <= 0:
+            raise ValueError("pixels_per_second must be positive or None")
+        with self._lock:
+            self._pixels_per_second = pixels_per_second
+            self._tokens = float(pixels_per_second or 0)
+            self._last_refill = time.monotonic()
+
+    def acquire(self, pixels: int) -> float:
+        """
+        Take pixels from the budget, waiting until they are available.
+
+        Args:
+            pixels: Pixels about to be fed to a model.
+
+        Returns:
+            float: Seconds waited.
+        """
+        with self._lock:
+            rate = self._pixels_per_second
+            if rate is None:
+                return 0.0
+            now = time.monotonic()
+            self._tokens = min(rate, self._tokens + (now - self._last_refill) * rate)
+            self._last_refill = now
+            # Reserve the pixels now so concurrent callers queue up behind this one
+            self._tokens -= pixels
+            wait_seconds = max(-self._tokens / rate, 0.0)
+            self.waited_seconds += wait_seconds
+
+        if wait_seconds > 0:
+            logger.debug(f"Waiting {wait_seconds:.3f}s for the detection pixel budget")
+            time.sleep(wait_seconds)
+        return wait_seconds
+
+
+_default_rate_limiter: Optional[PixelRateLimiter] = None
+_default_rate_limiter_lock = threading.Lock()
+
+
+def get_pixel_rate_limiter_instance() -> PixelRateLimiter:
+    """
+    Get the process-wide PixelRateLimiter shared by every detector, unlimited until set_rate is called.
+    """
+    global _default_rate_limiter
+    with _default_rate_limiter_lock:
+        if _default_rate_limiter is None:
+            _default_rate_limiter = PixelRateLimiter()
+        return _default_rate_limiter
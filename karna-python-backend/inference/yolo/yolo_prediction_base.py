@@ -0,0 +1,298 @@
+from inference.yolo.yolo_utils import (export_bounding_boxes, export_letterboxed_bounding_boxes,
+                                       export_tiled_bounding_boxes)
+from inference.yolo.model_registry import get_model_registry_instance
+from inference.yolo.engines import DEFAULT_ENGINE, InferenceEngine, get_model_imgsz, resolve_weights_path
+from inference.yolo.preprocess import LetterboxedFrame, PreprocessedFrame, iter_batches, letterbox, preprocess_frames
+from inference.yolo.tiling import ResolutionPlan, TileWindow, get_pixel_rate_limiter_instance, plan_resolution
+from inference import BaseInference, BoundingBoxResult
+from PIL import Image
+import numpy as np
+import threading
+from typing import Dict, Iterable, Iterator, Sequence, Tuple, Union, List, Any, Optional
+import uuid
+
+ImageInput = Union[str, Image.Image, np.ndarray, PreprocessedFrame]
+
+class BaseYOLOPrediction(BaseInference):
+    """
+    Base class for YOLO prediction classes.
+
+    Subclasses only set ``model_path``. The model itself is owned by the process-wide
+    YOLOModelRegistry, so constructing a prediction object is cheap and the weights
+    are loaded once per (weights, device). Calls of the shared model are serialised
+    with inference_lock.
+    """
+    model_path: str = ""
+    # Runtime of the detector; exported engines load the ONNX/OpenVINO model next to model_path
+    engine: InferenceEngine = DEFAULT_ENGINE
+    # Number of frames fed to the model per forward pass
+    default_batch_size: int = 8
+    # Detection thresholds passed to the model, None keeps the ultralytics defaults
+    conf_threshold: Optional[float] = None
+    iou_threshold: Optional[float] = None
+    # Pick the input size of each frame from its resolution instead of always using the trained size
+    adaptive_imgsz: bool = True
+    # Smallest element (frame pixels) that should stay detectable, and the size it needs in the model input
+    min_element_size: float = 16
+    min_element_input_size: float = 8
+    # Largest input size; frames that need more are split into tiles overlapping by tile_overlap
+    max_imgsz: int = 1280
+    tile_overlap: float = 0.2
+
+    def __init__(self, device: Optional[str] = None, batch_size: Optional[int] = None,
+                 engine: Optional[InferenceEngine] = None):
+        """
+        Initialize the YOLO prediction class.
+        Args:
+            device: Optional torch device string (e.g. "cpu", "cuda:0"). None lets ultralytics decide.
+            batch_size: Frames per forward pass for the batched APIs. Defaults to default_batch_size.
+            engine: Inference engine. Defaults to the class's engine.
+        """
+        super().__init__()
+        if not self.model_path:
+            raise ValueError(f"{self.__class__.__name__} does not define a model_path")
+        self.device = device
+        self.batch_size = batch_size or self.default_batch_size
+        self.engine = engine or self.engine
+        self.weights_path = self.get_weights_path(self.engine)
+        self.registry = get_model_registry_instance()
+
+    @classmethod
+    def get_weights_path(cls, engine: Optional[InferenceEngine] = None) -> str:
+        """
+        The weights loaded for an engine, the PyTorch weights if it has no export.
+        Args:
+            engine: Inference engine. Defaults to the class's engine.
+        """
+        return resolve_weights_path(cls.model_path, engine or cls.engine)
+
+    @property
+    def model(self) -> Any:
+        """
+        The shared YOLO model, loaded lazily through the registry.
+        """
+        return self.registry.get_model(self.weights_path, self.device)
+
+    @property
+    def inference_lock(self) -> threading.Lock:
+        """
+        The lock held around every call of the shared model, see YOLOModelRegistry.get_inference_lock.
+        """
+        return self.registry.get_inference_lock(self.weights_path, self.device)
+
+    @classmethod
+    def warm_up(cls, device: Optional[str] = None, run_inference: bool = True) -> None:
+        """
+        Load the model (and optionally run a dummy inference) before the first request.
+        Args:
+            device: Optional torch device string.
+            run_inference: Whether to run one dummy inference after loading.
+        """
+        get_model_registry_instance().warm_up([(cls.get_weights_path(), device)], run_inference=run_inference)
+
+    @property
+    def imgsz(self) -> int:
+        """
+        The square input size the model was trained or exported with.
+        """
+        return get_model_imgsz(self.model)
+
+    def _predict_kwargs(self) -> dict:
+        kwargs = self.detection_params()
+        if self.device is not None:
+            kwargs["device"] = self.device
+        return kwargs
+
+    @classmethod
+    def detection_params(cls) -> dict:
+        """
+        The thresholds that affect the detections, as passed to the model.
+        """
+        params = {}
+        if cls.conf_threshold is not None:
+            params["conf"] = cls.conf_threshold
+        if cls.iou_threshold is not None:
+            params["iou"] = cls.iou_threshold
+        return params
+
+    @classmethod
+    def resolution_params(cls) -> dict:
+        """
+        The input resolution settings that affect the detections.
+        """
+        if not cls.adaptive_imgsz:
+            return {"adaptive_imgsz": False}
+        return {
+            "adaptive_imgsz": True,
+            "min_element_size": cls.min_element_size,
+            "min_element_input_size": cls.min_element_input_size,
+            "max_imgsz": cls.max_imgsz,
+            "tile_overlap": cls.tile_overlap,
+        }
+
+    def plan_resolution(self, frame: PreprocessedFrame) -> ResolutionPlan:
+        """
+        The input size, and the tiles if the frame is too large, at which a frame is fed to the model.
+        """
+        if not self.adaptive_imgsz:
+            return ResolutionPlan(imgsz=self.imgsz)
+        return plan_resolution(frame.width, frame.height, self.imgsz, self.min_element_size,
+                               self.min_element_input_size, self.max_imgsz, self.tile_overlap)
+
+    def predict(self, image: Union[str, Image.Image]):
+        """
+        Predict the bounding boxes of the image.
+        Args:
+            image: Either a path to an image (str) or a PIL Image object.
+        Returns:
+            results (Any): The results of the prediction.
+        """
+        model = self.model
+        with self.inference_lock:
+            results = model(image, **self._predict_kwargs())
+        self.logger.info(f"YOLO single image prediction results: {results}")
+        return results
+
+    def predict_batch(self, images: List[Union[str, Image.Image]], batch_size: Optional[int] = None):
+        """
+        Predict the bounding boxes of the images, feeding batch_size frames per forward pass.
+        Args:
+            images: List of either image paths (str) or PIL Image objects.
+            batch_size: Frames per forward pass. Defaults to self.batch_size.
+        Returns:
+            results (list[Any]): The results of the prediction, one list of results per image.
+        """
+        model = self.model
+        results = []
+        for batch in iter_batches(images, batch_size or self.batch_size):
+            with self.inference_lock:
+                batch_results = model([str(image) if not isinstance(image, Image.Image) else image for image in batch],
+                                      verbose=False, **self._predict_kwargs())
+            results.extend([result] for result in batch_results)
+        self.logger.info(f"YOLO batch prediction finished for {len(results)} images")
+        return results
+
+    def predict_and_export_bboxes(self, image: Union[str, Image.Image]):
+        """
+        Predict the bounding boxes of the image and export the results.
+        Args:
+            image: Either a path to an image (str) or a PIL Image object.
+        Returns:
+            BoundingBoxResult: Object containing image information and bounding boxes with fields:
+                    image_path: Path to the image (or a generated ID for PIL images)
+                    original_width: Original width of the image
+                    original_height: Original height of the image
+                    bounding_boxes: List of BoundingBox objects
+        """
+        model = self.model
+        with self.inference_lock:
+            results = model(image, **self._predict_kwargs())
+        self.logger.info(f"YOLO single image prediction results: {results}")
+
+        # PIL images are exported in memory; dimensions come from the image itself
+        if isinstance(image, Image.Image):
+            return export_bounding_boxes(model, image_path=f"pil_image_{uuid.uuid4()}", results=results,
+                                         image_size=image.size)
+        return export_bounding_boxes(model, image_path=image, results=results)
+
+    def predict_frames_stream(self, frames: Iterable[PreprocessedFrame], batch_size: Optional[int] = None) -> Iterator[BoundingBoxResult]:
+        """
+        Run batched inference over preprocessed frames, yielding results as each batch finishes.
+
+        Each frame runs at the input size planned by plan_resolution; frames too large for
+        max_imgsz are run tile by tile and their detections merged. The model inputs count
+        against the process-wide pixel rate limit.
+        Args:
+            frames: Preprocessed frames. The same frames can be passed to several detectors;
+                the letterboxed input is computed once per input size and reused.
+            batch_size: Model inputs (frames or tiles) per forward pass. Defaults to self.batch_size.
+        Yields:
+            BoundingBoxResult: One result per frame, in input order, in original frame coordinates.
+        """
+        model = self.model
+        batch_size = batch_size or self.batch_size
+        rate_limiter = get_pixel_rate_limiter_instance()
+        for batch in iter_batches(frames, batch_size):
+            plans = [self.plan_resolution(frame) for frame in batch]
+            # Model inputs of the batch (frame index, tile, letterboxed input), grouped by input size
+            inputs: Dict[int, List[Tuple[int, Optional[TileWindow], LetterboxedFrame]]] = {}
+            for index, (frame, plan) in enumerate(zip(batch, plans)):
+                if not plan.is_tiled:
+                    inputs.setdefault(plan.imgsz, []).append((index, None, frame.letterboxed(plan.imgsz)))
+                    continue
+                for tile in plan.tiles:
+                    x_min, y_min, x_max, y_max = tile
+                    tile_image = np.ascontiguousarray(frame.bgr[y_min:y_max, x_min:x_max])
+                    inputs.setdefault(plan.imgsz, []).append((index, tile, letterbox(tile_image, plan.imgsz)))
+
+            outputs: List[List[Tuple[Optional[TileWindow], LetterboxedFrame, Any]]] = [[] for _ in batch]
+            for imgsz, items in inputs.items():
+                for chunk in iter_batches(items, batch_size):
+                    rate_limiter.acquire(len(chunk) * imgsz * imgsz)
+                    with self.inference_lock:
+                        chunk_results = model([lb.image for _, _, lb in chunk], imgsz=imgsz, verbose=False,
+                                              **self._predict_kwargs())
+                    for (index, tile, lb), result in zip(chunk, chunk_results):
+                        outputs[index].append((tile, lb, result))
+            self.logger.info(f"YOLO batch of {len(batch)} frames finished")
+
+            for frame, plan, frame_outputs in zip(batch, plans, outputs):
+                if plan.is_tiled:
+                    yield export_tiled_bounding_boxes(model, frame.image_path, (frame.width, frame.height),
+                                                      frame_outputs)
+                else:
+                    _, lb, result = frame_outputs[0]
+                    yield export_letterboxed_bounding_boxes(model, frame.image_path, lb, result)
+
+    def predict_and_export_bboxes_stream(self, images: Sequence[ImageInput],
+                                         image_paths: Optional[Sequence[str]] = None,
+                                         batch_size: Optional[int] = None) -> Iterator[BoundingBoxResult]:
+        """
+        Predict and export the bounding boxes of the images in batches, yielding results as each batch finishes.
+        Args:
+            images: Image paths, PIL images, RGB arrays or PreprocessedFrame objects.
+            image_paths: Optional paths reported in the results instead of generated identifiers.
+            batch_size: Frames per forward pass. Defaults to self.batch_size.
+        Yields:
+            BoundingBoxResult: One result per image, in input order.
+        """
+        yield from self.predict_frames_stream(preprocess_frames(images, image_paths), batch_size=batch_size)
+
+    def predict_and_export_bboxes_batch(self, images: List[Union[str, Image.Image]], batch_size: Optional[int] = None) -> List[BoundingBoxResult]:
+        """
+        Predict the bounding boxes of the images and export the results.
+        Args:
+            images: List of either image paths (str) or PIL Image objects.
+            batch_size: Frames per forward pass. Defaults to self.batch_size.
+        Returns:
+            list[BoundingBoxResult]: List of objects containing image information and bounding boxes.
+            Each BoundingBoxResult has fields:
+                image_path: Path to the image (or a generated ID for PIL images)
+                original_width: Original width of the image
+                original_height: Original height of the image
+                bounding_boxes: List of BoundingBox objects
+        """
+        self.logger.info(f"YOLO batch prediction started for {len(images)} images")
+        results = list(self.predict_and_export_bboxes_stream(images, batch_size=batch_size))
+        self.logger.info(f"YOLO batch prediction results: {results}")
+        return results
+
+    def predict_pil_image(self, pil_image: Image.Image):
+        """
+        Predict the bounding boxes of a PIL image.
+        Args:
+            pil_image (Image.Image): The PIL Image object.
+        Returns:
+            results (Any): The results of the prediction.
+        """
+        return self.predict(pil_image)
+
+    def predict_and_export_bboxes_pil(self, pil_image: Image.Image):
+        """
+        Predict the bounding boxes of a PIL image and export the results.
+        Args:
+            pil_image (Image.Image): The PIL Image object.
+        Returns:
+            BoundingBoxResult: Object containing image information and bounding boxes.
+        """
+        return self.predict_and_export_bboxes(pil_image)
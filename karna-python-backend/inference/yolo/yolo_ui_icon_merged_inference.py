@@ -1,7 +1,8 @@
 import logging
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
 import json
 import os
+from dataclasses import replace
 from datetime import datetime
 
 import cv2
@@ -9,9 +10,15 @@ import numpy as np
 from PIL import Image
 
 # Replace relative imports with absolute imports
-from inference import BoundingBoxResult, VisionDetectResultModel
+from inference import BoundingBoxArray, BoundingBoxResult, VisionDetectResultModel
 from inference.yolo.ui.yolo_prediction import YOLO_UI_Prediction
 from inference.yolo.icon.yolo_prediction import YOLO_ICON_Prediction
+from inference.yolo.concurrent_detection import DetectorExecutor, ExecutionMode
+from inference.yolo.detection_cache import DetectionCache, hash_file
+from inference.yolo.frame_loader import FrameLoader, LoadedFrame
+from inference.yolo.merge import (DEFAULT_MERGE_RULES, ClassPair, MergeReport, MergeRule, MergeStats,
+                                  merge_bounding_boxes, merge_rules_params)
+from inference.yolo.preprocess import PreprocessedFrame, preprocess_frames
 from services.screen_capture_service import ScreenshotEvent
 from utils.image_utils import crop_to_render_area
 
@@ -22,10 +29,203 @@ class Merged_UI_IconBBoxes:
     # Class-level logger
     logger = logging.getLogger("Merged_UI_IconBBoxes")
     
-    @staticmethod
-    def merge_icon_ui_bboxes(icon_bboxes: BoundingBoxResult, ui_bboxes: BoundingBoxResult) -> BoundingBoxResult:
+    # Shared prediction objects, the weights themselves live in the YOLOModelRegistry
+    _ui_model: Optional[YOLO_UI_Prediction] = None
+    _icon_model: Optional[YOLO_ICON_Prediction] = None
+    
+    # Decoded screenshots kept by the shared frame loaders, 0 disables the LRU
+    frame_cache_size: int = 0
+    _frame_loaders: Dict[bool, FrameLoader] = {}
+    
+    # How the UI and icon detectors are scheduled over the same frames
+    execution_mode: ExecutionMode = ExecutionMode.SEQUENTIAL
+    _detector_executors: Dict[ExecutionMode, DetectorExecutor] = {}
+    
+    # When a UI and an icon box are the same element, per pair of class names (see inference/yolo/merge.py)
+    merge_rules: Dict[ClassPair, MergeRule] = DEFAULT_MERGE_RULES
+    # Boxes suppressed as cross-model duplicates since startup
+    merge_stats: MergeStats = MergeStats()
+    
+    # On-disk cache of merged results, stored next to the session data
+    _detection_cache: Optional[DetectionCache] = None
+    
+    @classmethod
+    def get_ui_model(cls) -> YOLO_UI_Prediction:
         """
-        Merge icon and UI bounding boxes.
+        Get the shared YOLO UI prediction object.
+        """
+        if cls._ui_model is None:
+            cls._ui_model = YOLO_UI_Prediction()
+        return cls._ui_model
+    
+    @classmethod
+    def get_icon_model(cls) -> YOLO_ICON_Prediction:
+        """
+        Get the shared YOLO Icon prediction object.
+        """
+        if cls._icon_model is None:
+            cls._icon_model = YOLO_ICON_Prediction()
+        return cls._icon_model
+    
+    @classmethod
+    def get_frame_loader(cls, should_crop: bool = True) -> FrameLoader:
+        """
+        Get the shared frame loader, which resolves the render area once and decodes each screenshot once.
+        
+        Parameters:
+            should_crop (bool): Whether the loader crops the frames to the website render area.
+        """
+        if should_crop not in cls._frame_loaders:
+            cls._frame_loaders[should_crop] = FrameLoader(should_crop=should_crop, cache_size=cls.frame_cache_size)
+        return cls._frame_loaders[should_crop]
+    
+    @classmethod
+    def get_detector_executor(cls, execution_mode: Optional[ExecutionMode] = None) -> DetectorExecutor:
+        """
+        Get the shared executor that runs the UI and icon detectors.
+        
+        Parameters:
+            execution_mode (Optional[ExecutionMode]): Mode to use. Defaults to cls.execution_mode.
+        """
+        execution_mode = execution_mode or cls.execution_mode
+        if execution_mode not in cls._detector_executors:
+            cls._detector_executors[execution_mode] = DetectorExecutor(execution_mode)
+        return cls._detector_executors[execution_mode]
+    
+    @classmethod
+    def load_event_frames(cls, screenshot_events: List[ScreenshotEvent], should_crop: bool = True) -> List[Tuple[ScreenshotEvent, LoadedFrame]]:
+        """
+        Decode (and crop) the screenshot of every event exactly once.
+        
+        Parameters:
+            screenshot_events (List[ScreenshotEvent]): List of screenshot events.
+            should_crop (bool): Whether to crop the images to the website render area. Default is True.
+            
+        Returns:
+            List[Tuple[ScreenshotEvent, LoadedFrame]]: The events whose screenshot could be loaded, with their frame.
+        """
+        frame_loader = cls.get_frame_loader(should_crop)
+        event_frames = []
+        for event in screenshot_events:
+            try:
+                event_frames.append((event, frame_loader.load(event.screenshot_path)))
+            except (FileNotFoundError, ValueError) as e:
+                cls.logger.warning(f"Skipping image {event.screenshot_path}: {str(e)}")
+        return event_frames
+    
+    @classmethod
+    def get_merged_ui_icon_bboxes_for_frames(cls, frames: List[LoadedFrame],
+                                             execution_mode: Optional[ExecutionMode] = None) -> List[BoundingBoxResult]:
+        """
+        Run the UI and icon detectors over the same decoded frames and merge their results.
+        
+        Parameters:
+            frames (List[LoadedFrame]): Frames from a FrameLoader.
+            execution_mode (Optional[ExecutionMode]): How to schedule the two detectors.
+                Defaults to cls.execution_mode.
+            
+        Returns:
+            List[BoundingBoxResult]: One merged result per frame, in input order.
+        """
+        preprocessed_frames = [frame.to_preprocessed() for frame in frames]
+        executor = cls.get_detector_executor(execution_mode)
+        cls.logger.info(f"Running UI and Icon detection on {len(frames)} frames ({executor.mode.value})")
+        ui_bboxes_results, icon_bboxes_results = executor.run(preprocessed_frames)
+        
+        cls.logger.info("Merging UI and Icon bounding boxes")
+        return [
+            cls.merge_icon_ui_bboxes(icon_result, ui_result)
+            for ui_result, icon_result in zip(ui_bboxes_results, icon_bboxes_results)
+        ]
+    
+    @classmethod
+    def get_detection_cache(cls) -> DetectionCache:
+        """
+        Get the shared on-disk detection result cache.
+        """
+        if cls._detection_cache is None:
+            cls._detection_cache = DetectionCache()
+        return cls._detection_cache
+    
+    @classmethod
+    def detection_cache_key(cls, frame: LoadedFrame) -> str:
+        """
+        Get the detection cache key of a frame: its content, the model weights, the crop area and the thresholds.
+        
+        Parameters:
+            frame (LoadedFrame): Frame from a FrameLoader.
+        """
+        return DetectionCache.make_key(
+            hash_file(frame.image_path),
+            [YOLO_UI_Prediction.get_weights_path(), YOLO_ICON_Prediction.get_weights_path()],
+            frame.crop_box,
+            {"ui": YOLO_UI_Prediction.detection_params(), "icon": YOLO_ICON_Prediction.detection_params(),
+             "resolution": {"ui": YOLO_UI_Prediction.resolution_params(),
+                            "icon": YOLO_ICON_Prediction.resolution_params()},
+             "merge": merge_rules_params(cls.merge_rules)}
+        )
+    
+    @classmethod
+    def get_merged_ui_icon_bboxes_for_frames_cached(cls, frames: List[LoadedFrame]) -> List[BoundingBoxResult]:
+        """
+        Get merged UI and icon bounding boxes, running the detectors only on frames missing from the detection cache.
+        
+        Parameters:
+            frames (List[LoadedFrame]): Frames from a FrameLoader.
+            
+        Returns:
+            List[BoundingBoxResult]: One merged result per frame, in input order.
+        """
+        detection_cache = cls.get_detection_cache()
+        keys = [cls.detection_cache_key(frame) for frame in frames]
+        # Near-duplicate capture events share one image, look up and detect each distinct frame once
+        first_index_by_key: Dict[str, int] = {}
+        for index, key in enumerate(keys):
+            first_index_by_key.setdefault(key, index)
+        unique = list(first_index_by_key.values())
+        results_by_key: Dict[str, BoundingBoxResult] = {}
+        for index in unique:
+            cached_result = detection_cache.get(frames[index].image_path, keys[index])
+            if cached_result is not None:
+                results_by_key[keys[index]] = cached_result
+        
+        missing = [index for index in unique if keys[index] not in results_by_key]
+        cls.logger.info(f"Detection cache: {len(unique) - len(missing)} hits, {len(missing)} misses "
+                        f"({len(frames)} frames)")
+        if missing:
+            detected = cls.get_merged_ui_icon_bboxes_for_frames([frames[index] for index in missing])
+            for index, merged_result in zip(missing, detected):
+                detection_cache.put(frames[index].image_path, keys[index], merged_result)
+                results_by_key[keys[index]] = merged_result
+        
+        merged_bboxes_results: List[BoundingBoxResult] = []
+        for index, key in enumerate(keys):
+            merged_result = results_by_key[key]
+            if first_index_by_key[key] != index:
+                # Every event gets its own result object, and its own box ids
+                bounding_boxes = BoundingBoxArray.from_boxes(merged_result.bounding_boxes).with_new_ids()
+                merged_result = replace(merged_result, image_path=frames[index].image_path,
+                                        bounding_boxes=bounding_boxes)
+            merged_bboxes_results.append(merged_result)
+        
+        return merged_bboxes_results
+    
+    @classmethod
+    def warm_up_models(cls, run_inference: bool = True) -> None:
+        """
+        Load the UI and icon models ahead of the first request.
+        
+        Parameters:
+            run_inference (bool): Whether to run a dummy inference on each model after loading.
+        """
+        cls.logger.info("Warming up YOLO UI and Icon models")
+        YOLO_UI_Prediction.warm_up(run_inference=run_inference)
+        YOLO_ICON_Prediction.warm_up(run_inference=run_inference)
+    
+    @classmethod
+    def merge_icon_ui_bboxes(cls, icon_bboxes: BoundingBoxResult, ui_bboxes: BoundingBoxResult) -> BoundingBoxResult:
+        """
+        Merge icon and UI bounding boxes, dropping the boxes both models detected.
         
         Parameters:
             icon_bboxes (BoundingBoxResult): Icon bounding boxes.
@@ -34,6 +234,22 @@ class Merged_UI_IconBBoxes:
         Returns:
             BoundingBoxResult: Merged bounding boxes.
         """
+        merged_result, _ = cls.merge_icon_ui_bboxes_with_report(icon_bboxes, ui_bboxes)
+        return merged_result
+    
+    @classmethod
+    def merge_icon_ui_bboxes_with_report(cls, icon_bboxes: BoundingBoxResult,
+                                         ui_bboxes: BoundingBoxResult) -> Tuple[BoundingBoxResult, MergeReport]:
+        """
+        Merge icon and UI bounding boxes and report the cross-model duplicates that were suppressed.
+        
+        Parameters:
+            icon_bboxes (BoundingBoxResult): Icon bounding boxes.
+            ui_bboxes (BoundingBoxResult): UI bounding boxes.
+
+        Returns:
+            Tuple[BoundingBoxResult, MergeReport]: Merged bounding boxes and what the merge suppressed.
+        """
         # check if icon_bboxes and ui_bboxes have the same imagePath
         if icon_bboxes.image_path != ui_bboxes.image_path:
             raise ValueError("icon_bboxes and ui_bboxes have different image paths")
@@ -42,15 +258,20 @@ class Merged_UI_IconBBoxes:
         if icon_bboxes.original_width != ui_bboxes.original_width or icon_bboxes.original_height != ui_bboxes.original_height:
             raise ValueError("icon_bboxes and ui_bboxes have different originalWidth or originalHeight")
         
-        # merge the bounding boxes
-        merged_bboxes = icon_bboxes.bounding_boxes + ui_bboxes.bounding_boxes
+        # merge the bounding boxes, keeping the more confident box of each cross-model duplicate
+        merged_bboxes, report = merge_bounding_boxes([icon_bboxes.bounding_boxes, ui_bboxes.bounding_boxes],
+                                                     cls.merge_rules)
+        cls.merge_stats.add(report)
+        if report.suppressed:
+            cls.logger.debug(f"Suppressed {report.suppressed} of {report.input_boxes} boxes "
+                             f"as UI/icon duplicates in {icon_bboxes.image_path}")
         
         return BoundingBoxResult(
             image_path=icon_bboxes.image_path,
             original_width=icon_bboxes.original_width,
             original_height=icon_bboxes.original_height,
             bounding_boxes=merged_bboxes
-        )
+        ), report
     
     @staticmethod
     def path_to_pil_image(image_path: str, should_crop: bool = True) -> Image.Image:
@@ -114,18 +335,8 @@ class Merged_UI_IconBBoxes:
         Returns:
             List[BoundingBoxResult]: List of UI bounding box results.
         """
-        cls.logger.info("Initializing YOLO UI prediction model")
-        ui_model = YOLO_UI_Prediction()
-        
-        # If cropping is enabled, first crop the images and then predict
-        if should_crop:
-            cls.logger.info("Cropping images to website render area before UI prediction")
-            pil_images = cls.paths_to_pil_images(screenshot_paths, should_crop=True)
-            return cls.get_ui_bboxes_pil(pil_images, screenshot_paths)
-        
-        cls.logger.info("Starting UI bounding box prediction without cropping")
-        ui_bboxes_results = ui_model.predict_and_export_bboxes_batch(screenshot_paths)
-        cls.logger.info(f"Completed UI bounding box prediction, found {len(ui_bboxes_results)} results")
+        frames = cls.get_frame_loader(should_crop).load_many(screenshot_paths)
+        ui_bboxes_results = cls.get_ui_bboxes_frames([frame.to_preprocessed() for frame in frames])
         
         return ui_bboxes_results
     
@@ -141,19 +352,25 @@ class Merged_UI_IconBBoxes:
         Returns:
             List[BoundingBoxResult]: List of UI bounding box results.
         """
-        cls.logger.info("Initializing YOLO UI prediction model for PIL images")
-        ui_model = YOLO_UI_Prediction()
-        
-        cls.logger.info("Starting UI bounding box prediction with PIL images")
-        ui_bboxes_results = []
+        return cls.get_ui_bboxes_frames(preprocess_frames(pil_images, original_paths))
+    
+    @classmethod
+    def get_ui_bboxes_frames(cls, frames: List[PreprocessedFrame]) -> List[BoundingBoxResult]:
+        """
+        Get UI bounding boxes from preprocessed frames using batched inference.
         
-        for pil_image, original_path in zip(pil_images, original_paths):
-            result = ui_model.predict_and_export_bboxes_pil(pil_image)
-            # Update the image path to the original path
-            result.image_path = original_path
-            ui_bboxes_results.append(result)
+        Parameters:
+            frames (List[PreprocessedFrame]): Frames to run the UI model on. Each result's
+                image_path is the frame's image_path.
+            
+        Returns:
+            List[BoundingBoxResult]: List of UI bounding box results.
+        """
+        ui_model = cls.get_ui_model()
         
-        cls.logger.info(f"Completed UI bounding box prediction with PIL images, found {len(ui_bboxes_results)} results")
+        cls.logger.info(f"Starting UI bounding box prediction on {len(frames)} frames")
+        ui_bboxes_results = list(ui_model.predict_frames_stream(frames))
+        cls.logger.info(f"Completed UI bounding box prediction, found {len(ui_bboxes_results)} results")
         
         return ui_bboxes_results
     
@@ -169,18 +386,8 @@ class Merged_UI_IconBBoxes:
         Returns:
             List[BoundingBoxResult]: List of icon bounding box results.
         """
-        cls.logger.info("Initializing YOLO Icon prediction model")
-        icon_model = YOLO_ICON_Prediction()
-        
-        # If cropping is enabled, first crop the images and then predict
-        if should_crop:
-            cls.logger.info("Cropping images to website render area before Icon prediction")
-            pil_images = cls.paths_to_pil_images(screenshot_paths, should_crop=True)
-            return cls.get_icon_bboxes_pil(pil_images, screenshot_paths)
-        
-        cls.logger.info("Starting Icon bounding box prediction without cropping")
-        icon_bboxes_results = icon_model.predict_and_export_bboxes_batch(screenshot_paths)
-        cls.logger.info(f"Completed Icon bounding box prediction, found {len(icon_bboxes_results)} results")
+        frames = cls.get_frame_loader(should_crop).load_many(screenshot_paths)
+        icon_bboxes_results = cls.get_icon_bboxes_frames([frame.to_preprocessed() for frame in frames])
         
         return icon_bboxes_results
     
@@ -196,19 +403,25 @@ class Merged_UI_IconBBoxes:
         Returns:
             List[BoundingBoxResult]: List of icon bounding box results.
         """
-        cls.logger.info("Initializing YOLO Icon prediction model for PIL images")
-        icon_model = YOLO_ICON_Prediction()
-        
-        cls.logger.info("Starting Icon bounding box prediction with PIL images")
-        icon_bboxes_results = []
+        return cls.get_icon_bboxes_frames(preprocess_frames(pil_images, original_paths))
+    
+    @classmethod
+    def get_icon_bboxes_frames(cls, frames: List[PreprocessedFrame]) -> List[BoundingBoxResult]:
+        """
+        Get Icon bounding boxes from preprocessed frames using batched inference.
         
-        for pil_image, original_path in zip(pil_images, original_paths):
-            result = icon_model.predict_and_export_bboxes_pil(pil_image)
-            # Update the image path to the original path
-            result.image_path = original_path
-            icon_bboxes_results.append(result)
+        Parameters:
+            frames (List[PreprocessedFrame]): Frames to run the Icon model on. Each result's
+                image_path is the frame's image_path.
+            
+        Returns:
+            List[BoundingBoxResult]: List of Icon bounding box results.
+        """
+        icon_model = cls.get_icon_model()
         
-        cls.logger.info(f"Completed Icon bounding box prediction with PIL images, found {len(icon_bboxes_results)} results")
+        cls.logger.info(f"Starting Icon bounding box prediction on {len(frames)} frames")
+        icon_bboxes_results = list(icon_model.predict_frames_stream(frames))
+        cls.logger.info(f"Completed Icon bounding box prediction, found {len(icon_bboxes_results)} results")
         
         return icon_bboxes_results
     
@@ -221,15 +434,11 @@ class Merged_UI_IconBBoxes:
         # get the ui_bboxes and icon_bboxes from the screenshot paths
         cls.logger.info(f"Found {len(screenshot_paths)} screenshot paths")
         
-        # Get UI and icon bounding boxes
-        ui_bboxes_results = cls.get_ui_bboxes(screenshot_paths, should_crop=should_crop)
-        icon_bboxes_results = cls.get_icon_bboxes(screenshot_paths, should_crop=should_crop)
-        
-        # Merge the UI and icon bounding boxes
-        cls.logger.info("Merging UI and Icon bounding boxes")
+        # Decode each screenshot once and share it between the UI and icon detectors
+        frames = cls.get_frame_loader(should_crop).load_many(screenshot_paths)
         merged_results = {}
-        for ui_result, icon_result in zip(ui_bboxes_results, icon_bboxes_results):
-            merged_results[ui_result.image_path] = cls.merge_icon_ui_bboxes(icon_result, ui_result)
+        for merged_result in cls.get_merged_ui_icon_bboxes_for_frames(frames):
+            merged_results[merged_result.image_path] = merged_result
         
         cls.logger.info(f"Completed merging, returning {len(merged_results)} merged bounding box results")
         # show the merged results as dict in compact format as truncating the bounding boxes
@@ -252,20 +461,14 @@ class Merged_UI_IconBBoxes:
         """
         cls.logger.info(f"Processing {len(screenshot_events)} screenshot events")
         
-        # get the ui_bboxes and icon_bboxes from the screenshot paths
-        screenshot_paths = [event.screenshot_path for event in screenshot_events]
-        event_ids = [event.event_id for event in screenshot_events]
-        cls.logger.info(f"Found {len(screenshot_paths)} screenshot paths")
-        
-        # Get UI and icon bounding boxes
-        ui_bboxes_results = cls.get_ui_bboxes(screenshot_paths, should_crop=should_crop)
-        icon_bboxes_results = cls.get_icon_bboxes(screenshot_paths, should_crop=should_crop)
+        # Decode each screenshot once and share it between the UI and icon detectors
+        event_frames = cls.load_event_frames(screenshot_events, should_crop=should_crop)
+        cls.logger.info(f"Loaded {len(event_frames)} screenshots")
         
-        # Merge the UI and icon bounding boxes
-        cls.logger.info("Merging UI and Icon bounding boxes")
+        merged_bboxes_results = cls.get_merged_ui_icon_bboxes_for_frames([frame for _, frame in event_frames])
         merged_results = {}
-        for event_id, ui_result, icon_result in zip(event_ids, ui_bboxes_results, icon_bboxes_results):
-            merged_results[event_id] = cls.merge_icon_ui_bboxes(icon_result, ui_result)
+        for (event, _), merged_result in zip(event_frames, merged_bboxes_results):
+            merged_results[event.event_id] = merged_result
         
         cls.logger.info(f"Completed merging, returning {len(merged_results)} merged bounding box results")
         # show the merged results as dict in compact format as truncating the bounding boxes
@@ -287,26 +490,14 @@ class Merged_UI_IconBBoxes:
         """
         cls.logger.info(f"Processing {len(screenshot_events)} screenshot events with PIL images")
         
-        # Get the screenshot paths and event IDs
-        screenshot_paths = [event.screenshot_path for event in screenshot_events]
-        event_ids = [event.event_id for event in screenshot_events]
-        cls.logger.info(f"Found {len(screenshot_paths)} screenshot paths")
-        
-        # Convert paths to PIL images
-        pil_images = cls.paths_to_pil_images(screenshot_paths, should_crop=should_crop)
-        
-        # Get UI and icon bounding boxes using PIL images
-        ui_bboxes_results = cls.get_ui_bboxes_pil(pil_images, screenshot_paths)
+        # Decode and crop every screenshot exactly once; both detectors consume the same frames
+        event_frames = cls.load_event_frames(screenshot_events, should_crop=should_crop)
+        cls.logger.info(f"Loaded {len(event_frames)} screenshots")
         
-        # We need to create new PIL images because the previous ones might be modified by the UI prediction
-        pil_images = cls.paths_to_pil_images(screenshot_paths, should_crop=should_crop)
-        icon_bboxes_results = cls.get_icon_bboxes_pil(pil_images, screenshot_paths)
-        
-        # Merge the UI and icon bounding boxes
-        cls.logger.info("Merging UI and Icon bounding boxes from PIL images")
+        merged_bboxes_results = cls.get_merged_ui_icon_bboxes_for_frames([frame for _, frame in event_frames])
         merged_results = {}
-        for event_id, ui_result, icon_result in zip(event_ids, ui_bboxes_results, icon_bboxes_results):
-            merged_results[event_id] = cls.merge_icon_ui_bboxes(icon_result, ui_result)
+        for (event, _), merged_result in zip(event_frames, merged_bboxes_results):
+            merged_results[event.event_id] = merged_result
         
         cls.logger.info(f"Completed merging with PIL images, returning {len(merged_results)} merged bounding box results")
         
@@ -505,51 +696,44 @@ class Merged_UI_IconBBoxes:
         cv2.destroyAllWindows()
 
     @classmethod
-    def get_inference_result_models_pil(cls, screenshot_events: List[ScreenshotEvent], should_crop: bool = True) -> List[VisionDetectResultModel]:
+    def get_inference_result_models_pil(cls, screenshot_events: List[ScreenshotEvent], should_crop: bool = True,
+                                        use_cache: bool = False) -> List[VisionDetectResultModel]:
         """
         Get inference result models from screenshot events.
+        
+        Parameters:
+            screenshot_events (List[ScreenshotEvent]): List of screenshot events.
+            should_crop (bool): Whether to crop the images to the website render area. Default is True.
+            use_cache (bool): Whether to reuse (and store) results from the on-disk detection cache.
         """
-        # get the pil images
-        screenshot_paths = [event.screenshot_path for event in screenshot_events]
-        pil_images = cls.paths_to_pil_images(screenshot_paths, should_crop=should_crop)
-        merged_results = cls.get_merged_ui_icon_bboxes_pil(screenshot_events, should_crop=should_crop)
+        # Decode each screenshot once; the same frame feeds both detectors and the result model
+        event_frames = cls.load_event_frames(screenshot_events, should_crop=should_crop)
+        frames = [frame for _, frame in event_frames]
+        if use_cache:
+            merged_bboxes_results = cls.get_merged_ui_icon_bboxes_for_frames_cached(frames)
+        else:
+            merged_bboxes_results = cls.get_merged_ui_icon_bboxes_for_frames(frames)
         vision_detect_result_models = []
         
         # Create VisionDetectResultModel for each screenshot event
-        for event, pil_image in zip(screenshot_events, pil_images):
-            event_id = event.event_id
-            
-            # Skip if no merged results for this event
-            if event_id not in merged_results:
-                cls.logger.warning(f"No merged results found for event {event_id}, skipping")
-                continue
-                
-            merged_result = merged_results[event_id]
-            
-            # Get original image dimensions from the original image file
-            try:
-                with Image.open(event.screenshot_path) as original_img:
-                    original_width, original_height = original_img.size
-            except (FileNotFoundError, IOError) as e:
-                cls.logger.warning(f"Could not open original image {event.screenshot_path}: {str(e)}")
-                # Fallback to using the cropped image dimensions
-                original_width, original_height = pil_image.size
+        for (event, frame), merged_result in zip(event_frames, merged_bboxes_results):
+            pil_image = frame.to_pil()
             
             # Create VisionDetectResultModel
             vision_detect_result_model = VisionDetectResultModel(
-                event_id=event_id,
+                event_id=event.event_id,
                 project_uuid=event.project_uuid,
                 command_uuid=event.command_uuid,
                 timestamp=event.timestamp,
                 description=event.description,
                 original_image_path=event.screenshot_path,
-                original_width=original_width,
-                original_height=original_height,
+                original_width=frame.original_width,
+                original_height=frame.original_height,
                 is_cropped=should_crop,
                 cropped_image=pil_image,
                 cropped_width=pil_image.width,
                 cropped_height=pil_image.height,
-                merged_ui_icon_bboxes=merged_result.bounding_boxes
+                merged_ui_icon_bboxes=list(merged_result.bounding_boxes)
             )
             
             vision_detect_result_models.append(vision_detect_result_model)
@@ -1,49 +1,122 @@
-from typing import Any, List
-import uuid
+from typing import Any, List, Optional, Tuple
+import numpy as np
 from PIL import Image
-from .. import BoundingBox, BoundingBoxResult
+from .. import BoundingBox, BoundingBoxArray, BoundingBoxResult
+from .tiling import TileWindow, merge_tile_detections
 
-def export_bounding_boxes(model, image_path : str, results : Any):
+def boxes_to_bounding_boxes(names: Any, xyxy: np.ndarray, labels: np.ndarray, confidences: np.ndarray) -> List[BoundingBox]:
+    """
+    Convert detection arrays into BoundingBox objects.
+
+    The coordinate, size, class and confidence columns are converted with numpy in one pass;
+    only the BoundingBox construction itself is per box. The export functions below keep
+    the columns as a BoundingBoxArray instead, which builds the objects only when used.
+
+    Parameters:
+        names (dict | list): Class index to class name mapping (model.names).
+        xyxy (np.ndarray): (N, 4) boxes in (x_min, y_min, x_max, y_max).
+        labels (np.ndarray): (N,) class indices.
+        confidences (np.ndarray): (N,) confidence scores.
+
+    Returns:
+        List[BoundingBox]: One BoundingBox per detection.
+    """
+    return BoundingBoxArray.from_detections(names, xyxy, labels, confidences).to_boxes()
+
+def _result_arrays(result: Any) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    boxes = result.boxes
+    return boxes.xyxy.cpu().numpy(), boxes.cls.cpu().numpy(), boxes.conf.cpu().numpy()
+
+def export_bounding_boxes(model, image_path : str, results : Any, image_size: Optional[Tuple[int, int]] = None):
     """
     Convert YOLO results into a BoundingBoxResult object with automatically extracted image dimensions.
 
+    The dimensions are taken from image_size, or else from the results' original shape. The image
+    file is only opened as a last resort when there are no results to read the shape from.
+
     Parameters:
         model (YOLO): YOLO model.
-        image_path (str): Path to the image.
+        image_path (str): Path (or identifier) of the image.
         results (list): YOLO detection results.
+        image_size (Tuple[int, int], optional): (width, height) of the image, if already known.
 
     Returns:
         BoundingBoxResult: Object containing image information and bounding boxes.
     """
-    # Open the image to get its dimensions
-    with Image.open(image_path) as img:
-        original_width, original_height = img.size
-
-    bounding_boxes: List[BoundingBox] = []
-
-    for result in results:
-        boxes = result.boxes.xyxy.cpu().numpy()  # Bounding boxes in (x_min, y_min, x_max, y_max)
-        labels = result.boxes.cls.cpu().numpy()  # Class labels (index)
-        confidences = result.boxes.conf.cpu().numpy()  # Confidence scores
-
-        for box, label, conf in zip(boxes, labels, confidences):
-            x_min, y_min, x_max, y_max = box
-            width = x_max - x_min
-            height = y_max - y_min
-            bounding_boxes.append(
-                BoundingBox(
-                    x=int(x_min),
-                    y=int(y_min),
-                    width=int(width),
-                    height=int(height),
-                    class_name=model.names[int(label)],  # type: ignore
-                    confidence=float(conf)
-                )
-            )
+    if image_size is not None:
+        original_width, original_height = image_size
+    elif len(results) > 0:
+        original_height, original_width = results[0].orig_shape[:2]
+    else:
+        with Image.open(image_path) as img:
+            original_width, original_height = img.size
+
+    bounding_boxes = BoundingBoxArray.concatenate(
+        BoundingBoxArray.from_detections(model.names, *_result_arrays(result)) for result in results)
 
     return BoundingBoxResult(
         image_path=image_path,
-        original_width=original_width,
-        original_height=original_height,
+        original_width=int(original_width),
+        original_height=int(original_height),
         bounding_boxes=bounding_boxes
-    )
\ No newline at end of file
+    )
+
+def export_letterboxed_bounding_boxes(model, image_path: str, letterboxed: Any, result: Any) -> BoundingBoxResult:
+    """
+    Convert the YOLO result of a letterboxed frame into a BoundingBoxResult in original frame coordinates.
+
+    Parameters:
+        model (YOLO): YOLO model.
+        image_path (str): Path (or identifier) of the source image.
+        letterboxed (LetterboxedFrame): The letterboxed input the model was run on.
+        result (Results): YOLO detection result for that single frame.
+
+    Returns:
+        BoundingBoxResult: Object containing image information and bounding boxes.
+    """
+    xyxy, labels, confidences = _result_arrays(result)
+
+    return BoundingBoxResult(
+        image_path=image_path,
+        original_width=letterboxed.original_width,
+        original_height=letterboxed.original_height,
+        bounding_boxes=BoundingBoxArray.from_detections(model.names, letterboxed.to_original_xyxy(xyxy), labels,
+                                                        confidences)
+    )
+
+def export_tiled_bounding_boxes(model, image_path: str, frame_size: Tuple[int, int],
+                                tile_results: List[Tuple[TileWindow, Any, Any]],
+                                iou_threshold: float = 0.5) -> BoundingBoxResult:
+    """
+    Convert the YOLO results of a frame's tiles into one BoundingBoxResult in original frame coordinates.
+
+    Parameters:
+        model (YOLO): YOLO model.
+        image_path (str): Path (or identifier) of the source image.
+        frame_size (Tuple[int, int]): (width, height) of the frame.
+        tile_results (List[Tuple[TileWindow, LetterboxedFrame, Results]]): Each tile, its letterboxed
+            input and the YOLO result for it.
+        iou_threshold (float): IoU above which same-class boxes from overlapping tiles are duplicates.
+
+    Returns:
+        BoundingBoxResult: Object containing image information and the merged bounding boxes.
+    """
+    tiles, tile_boxes, tile_labels, tile_confidences = [], [], [], []
+    for tile, letterboxed, result in tile_results:
+        xyxy, labels, confidences = _result_arrays(result)
+        xyxy = letterboxed.to_original_xyxy(xyxy)
+        xyxy[:, [0, 2]] += tile[0]
+        xyxy[:, [1, 3]] += tile[1]
+        tiles.append(tile)
+        tile_boxes.append(xyxy)
+        tile_labels.append(labels)
+        tile_confidences.append(confidences)
+
+    xyxy, labels, confidences = merge_tile_detections(tiles, tile_boxes, tile_labels, tile_confidences,
+                                                      frame_size, iou_threshold)
+    return BoundingBoxResult(
+        image_path=image_path,
+        original_width=int(frame_size[0]),
+        original_height=int(frame_size[1]),
+        bounding_boxes=BoundingBoxArray.from_detections(model.names, xyxy, labels, confidences)
+    )
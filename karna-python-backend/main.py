@@ -2,15 +2,16 @@ import logging
 from pathlib import Path
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.staticfiles import StaticFiles
 import uvicorn
 from base import SingletonMeta, ServiceManager
 from api import setup_routes
+from api.annotated_static_files import AnnotatedStaticFiles
 # from modules.vision_agent import get_vision_service_instance
 from modules.action_prediction import get_language_service_instance
 from modules.action_execution import get_action_service_instance
 from modules.command.command_processor import get_command_service_instance
 from services.vision_detect_service import get_vision_detect_service_instance
+from services.session_catalog import get_session_catalog_instance
 import config.db.settings as db_settings
 import asyncio
 from base.base_observer import AsyncCapableObserver
@@ -30,9 +31,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Mount static files directory
+# Mount static files directory, annotated screenshots are rendered on request
 data_dir = Path(__file__).parent.parent / "data"
-app.mount("/data", StaticFiles(directory=str(data_dir), html=True), name="data")
+app.mount("/data", AnnotatedStaticFiles(directory=str(data_dir), html=True), name="data")
 
 # Setup routes
 setup_routes(app)
@@ -159,11 +160,18 @@ async def startup_event():
     assistant = get_orchestrator_instance(model_paths)
     await assistant.start()
 
+    # Warm up the vision detection models in the background so startup is not blocked
+    asyncio.create_task(get_vision_detect_service_instance().initialize())
+
+    # Enforce the capture session size and age limits in the background, if retention is enabled
+    get_session_catalog_instance().start_scheduler()
+
 @app.on_event("shutdown")
 async def shutdown_event():
     try:
         assistant = get_orchestrator_instance()
         await assistant.stop()
+        get_session_catalog_instance().stop_scheduler()
     except Exception as e:
         logging.error(f"Error during shutdown: {e}")
 
@@ -0,0 +1,59 @@
+"""Capture session catalog
+
+Revision ID: 002
+Create Date: 2025-06-10
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '002'
+down_revision = '001'
+branch_labels = None
+depends_on = None
+
+def upgrade() -> None:
+    # Create capture_sessions table
+    op.create_table('capture_sessions',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('uuid', sa.String(), nullable=False),
+        sa.Column('project_uuid', sa.String(), nullable=False),
+        sa.Column('command_uuid', sa.String(), nullable=False),
+        sa.Column('frame_count', sa.Integer(), nullable=False),
+        sa.Column('byte_size', sa.Integer(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('last_accessed_at', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('project_uuid', 'command_uuid', name='uq_capture_sessions_project_command')
+    )
+    op.create_index(op.f('ix_capture_sessions_uuid'), 'capture_sessions', ['uuid'], unique=True)
+    op.create_index(op.f('ix_capture_sessions_project_uuid'), 'capture_sessions', ['project_uuid'], unique=False)
+    op.create_index(op.f('ix_capture_sessions_command_uuid'), 'capture_sessions', ['command_uuid'], unique=False)
+    op.create_index(op.f('ix_capture_sessions_last_accessed_at'), 'capture_sessions', ['last_accessed_at'], unique=False)
+
+    # Create session_artifacts table
+    op.create_table('session_artifacts',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('uuid', sa.String(), nullable=False),
+        sa.Column('session_uuid', sa.String(), nullable=False),
+        sa.Column('kind', sa.String(), nullable=False),
+        sa.Column('path', sa.String(), nullable=False),
+        sa.Column('byte_size', sa.Integer(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(['session_uuid'], ['capture_sessions.uuid'], ),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_session_artifacts_uuid'), 'session_artifacts', ['uuid'], unique=True)
+    op.create_index(op.f('ix_session_artifacts_session_uuid'), 'session_artifacts', ['session_uuid'], unique=False)
+    op.create_index(op.f('ix_session_artifacts_kind'), 'session_artifacts', ['kind'], unique=False)
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_session_artifacts_kind'), table_name='session_artifacts')
+    op.drop_index(op.f('ix_session_artifacts_session_uuid'), table_name='session_artifacts')
+    op.drop_index(op.f('ix_session_artifacts_uuid'), table_name='session_artifacts')
+    op.drop_table('session_artifacts')
+    op.drop_index(op.f('ix_capture_sessions_last_accessed_at'), table_name='capture_sessions')
+    op.drop_index(op.f('ix_capture_sessions_command_uuid'), table_name='capture_sessions')
+    op.drop_index(op.f('ix_capture_sessions_project_uuid'), table_name='capture_sessions')
+    op.drop_index(op.f('ix_capture_sessions_uuid'), table_name='capture_sessions')
+    op.drop_table('capture_sessions')
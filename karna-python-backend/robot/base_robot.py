@@ -12,6 +12,7 @@ from typing import Tuple, List, Optional, Dict, Any, Union
 import platform
 import os
 from dataclasses import dataclass
+from robot.capture_backends import CaptureBackend, get_capture_backend_instance
 
 # Configure PyAutoGUI settings
 pyautogui.FAILSAFE = True  # Move mouse to corner to abort
@@ -428,6 +429,11 @@ class Robot:
     
     # ===== Screen and Image Methods =====
     
+    @property
+    def capture_backend(self) -> CaptureBackend:
+        """Screen grab backend used for screenshots (the process-wide default)."""
+        return get_capture_backend_instance()
+    
     def take_screenshot(self, region: Optional[Region] = None) -> Any:
         """
         Take a screenshot of the entire screen or a region.
@@ -440,12 +446,12 @@ class Robot:
         """
         try:
             if region:
-                screenshot = pyautogui.screenshot(region=(region.x, region.y, region.width, region.height))
+                frame = self.capture_backend.grab((region.x, region.y, region.width, region.height))
                 logger.debug(f"Took screenshot of region: {region}")
             else:
-                screenshot = pyautogui.screenshot()
+                frame = self.capture_backend.grab()
                 logger.debug("Took full screen screenshot")
-            return screenshot
+            return frame.to_pil()
         except Exception as e:
             logger.error(f"Failed to take screenshot: {str(e)}")
             raise
@@ -0,0 +1,330 @@
+"""
+Screen grab backends and an in-memory ring buffer of recent frames.
+
+Every backend returns frames as read-only RGB numpy arrays:
+
+- MSSBackend: grabs through mss, much faster than pyautogui and without a PIL round trip.
+- PyAutoGUIBackend: the previous pyautogui.screenshot() path, kept as a fallback.
+- FileReplayBackend: replays image files in a fixed order, for tests and offline runs.
+
+A FrameSampler can keep grabbing into a FrameRingBuffer in the background so
+a click handler can use the frame from just before the click (the state the
+user actually clicked on) instead of grabbing after the UI already reacted.
+"""
+
+import logging
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Deque, List, Optional, Sequence, Tuple
+
+import numpy as np
+from PIL import Image
+
+logger = logging.getLogger(__name__)
+
+# (left, top, width, height) in screen coordinates, as for pyautogui.screenshot(region=...)
+GrabRegion = Tuple[int, int, int, int]
+
+
+@dataclass(frozen=True)
+class Frame:
+    """A grabbed screen frame backed by a read-only RGB buffer"""
+    rgb: np.ndarray
+    # time.monotonic() at grab time, comparable with FrameRingBuffer look-ups
+    monotonic_time: float
+    captured_at: datetime = field(default_factory=datetime.now)
+    # Screen coordinates of the frame's top-left pixel
+    origin: Tuple[int, int] = (0, 0)
+
+    @property
+    def width(self) -> int:
+        return self.rgb.shape[1]
+
+    @property
+    def height(self) -> int:
+        return self.rgb.shape[0]
+
+    def to_pil(self) -> Image.Image:
+        """Get the frame as a new PIL image. The caller owns the returned image."""
+        return Image.fromarray(self.rgb)
+
+
+class CaptureBackend(ABC):
+    """Grabs the screen, or a region of it, as an RGB numpy array"""
+
+    name: str = "base"
+
+    @abstractmethod
+    def grab_array(self, region: Optional[GrabRegion] = None) -> np.ndarray:
+        """
+        Grab the screen.
+
+        Args:
+            region: Optional (left, top, width, height) to grab instead of the primary screen.
+
+        Returns:
+            np.ndarray: HxWx3 uint8 RGB array.
+        """
+        raise NotImplementedError
+
+    def screen_size(self) -> Tuple[int, int]:
+        """Get the (width, height) of the screen grabbed without a region"""
+        rgb = self.grab_array()
+        return rgb.shape[1], rgb.shape[0]
+
+    def grab(self, region: Optional[GrabRegion] = None) -> Frame:
+        """Grab the screen into a read-only Frame"""
+        monotonic_time = time.monotonic()
+        rgb = self.grab_array(region)
+        rgb.setflags(write=False)
+        origin = (region[0], region[1]) if region is not None else (0, 0)
+        return Frame(rgb=rgb, monotonic_time=monotonic_time, origin=origin)
+
+    def close(self) -> None:
+        """Release the backend's resources"""
+        pass
+
+
+class MSSBackend(CaptureBackend):
+    """Grabs through mss. Each thread gets its own mss instance, as mss requires."""
+
+    name = "mss"
+
+    def __init__(self):
+        import mss  # Imported here so the module loads without mss installed
+        self._mss = mss
+        self._local = threading.local()
+        self._instances: List = []
+        self._lock = threading.Lock()
+
+    def _get_sct(self):
+        sct = getattr(self._local, "sct", None)
+        if sct is None:
+            sct = self._mss.mss()
+            self._local.sct = sct
+            with self._lock:
+                self._instances.append(sct)
+        return sct
+
+    def screen_size(self) -> Tuple[int, int]:
+        monitor = self._get_sct().monitors[1]
+        return monitor["width"], monitor["height"]
+
+    def grab_array(self, region: Optional[GrabRegion] = None) -> np.ndarray:
+        sct = self._get_sct()
+        if region is not None:
+            left, top, width, height = region
+            monitor = {"left": left, "top": top, "width": width, "height": height}
+        else:
+            # monitors[0] spans every screen, monitors[1] is the primary one like pyautogui
+            monitor = sct.monitors[1]
+        bgra = np.asarray(sct.grab(monitor))
+        return np.ascontiguousarray(bgra[:, :, 2::-1])
+
+    def close(self) -> None:
+        with self._lock:
+            for sct in self._instances:
+                try:
+                    sct.close()
+                except Exception as e:
+                    logger.debug(f"Error closing mss instance: {str(e)}")
+            self._instances.clear()
+        self._local = threading.local()
+
+
+class PyAutoGUIBackend(CaptureBackend):
+    """Grabs through pyautogui.screenshot()"""
+
+    name = "pyautogui"
+
+    def screen_size(self) -> Tuple[int, int]:
+        import pyautogui
+        width, height = pyautogui.size()
+        return width, height
+
+    def grab_array(self, region: Optional[GrabRegion] = None) -> np.ndarray:
+        import pyautogui
+        screenshot = pyautogui.screenshot(region=region) if region is not None else pyautogui.screenshot()
+        return np.asarray(screenshot.convert("RGB")).copy()
+
+
+class FileReplayBackend(CaptureBackend):
+    """
+    Replays image files as screen frames, one per grab, in order.
+    """
+
+    name = "replay"
+
+    def __init__(self, image_paths: Sequence[str], loop: bool = True):
+        """
+        Initialize the backend.
+
+        Args:
+            image_paths: Images returned by successive grabs.
+            loop: Start over after the last image; otherwise keep returning the last one.
+        """
+        if not image_paths:
+            raise ValueError("FileReplayBackend needs at least one image")
+        self.image_paths = list(image_paths)
+        self.loop = loop
+        self._next_index = 0
+        self._decoded: List[Optional[np.ndarray]] = [None] * len(self.image_paths)
+        self._lock = threading.Lock()
+
+    def grab_array(self, region: Optional[GrabRegion] = None) -> np.ndarray:
+        with self._lock:
+            index = self._next_index
+            if self.loop:
+                self._next_index = (index + 1) % len(self.image_paths)
+            else:
+                self._next_index = min(index + 1, len(self.image_paths) - 1)
+            if self._decoded[index] is None:
+                with Image.open(self.image_paths[index]) as image:
+                    self._decoded[index] = np.asarray(image.convert("RGB"))
+            rgb = self._decoded[index]
+
+        if region is not None:
+            left, top, width, height = region
+            rgb = rgb[top:top + height, left:left + width]
+        return rgb.copy()
+
+
+class FrameRingBuffer:
+    """
+    The last N grabbed frames. Frames are read-only, so readers share them without copying.
+    """
+
+    def __init__(self, capacity: int = 8):
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.capacity = capacity
+        self._frames: Deque[Frame] = deque(maxlen=capacity)
+        self._lock = threading.Lock()
+
+    def append(self, frame: Frame) -> None:
+        with self._lock:
+            self._frames.append(frame)
+
+    def latest(self) -> Optional[Frame]:
+        """Get the most recent frame, or None if the buffer is empty"""
+        with self._lock:
+            return self._frames[-1] if self._frames else None
+
+    def latest_before(self, monotonic_time: float, max_age: Optional[float] = None) -> Optional[Frame]:
+        """
+        Get the most recent frame grabbed at or before a point in time.
+
+        Args:
+            monotonic_time: time.monotonic() of the moment of interest, e.g. a click.
+            max_age: Ignore frames grabbed more than this many seconds before that moment.
+
+        Returns:
+            Optional[Frame]: The frame, or None if there is no suitable frame.
+        """
+        with self._lock:
+            for frame in reversed(self._frames):
+                if frame.monotonic_time <= monotonic_time:
+                    if max_age is not None and monotonic_time - frame.monotonic_time > max_age:
+                        return None
+                    return frame
+        return None
+
+    def frames(self) -> List[Frame]:
+        """Get the buffered frames, oldest first"""
+        with self._lock:
+            return list(self._frames)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._frames.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._frames)
+
+
+class FrameSampler:
+    """
+    Background thread grabbing frames into a FrameRingBuffer at a fixed interval.
+    """
+
+    def __init__(self, backend: CaptureBackend, buffer: FrameRingBuffer, interval: float = 0.1,
+                 region: Optional[GrabRegion] = None):
+        self.backend = backend
+        self.buffer = buffer
+        self.interval = interval
+        # Grab only this part of the screen, None for the whole screen
+        self.region = region
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        if self.is_running:
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="frame-sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout=5)
+        self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop_event.is_set():
+            start_time = time.monotonic()
+            try:
+                self.buffer.append(self.backend.grab(self.region))
+            except Exception as e:
+                logger.warning(f"Frame sampler grab failed: {str(e)}")
+            self._stop_event.wait(max(0.0, self.interval - (time.monotonic() - start_time)))
+
+
+def create_capture_backend(name: str = "mss") -> CaptureBackend:
+    """
+    Create a live screen capture backend.
+
+    Args:
+        name: "mss" or "pyautogui". mss falls back to pyautogui when it is not installed.
+
+    Returns:
+        CaptureBackend: The backend.
+    """
+    if name == MSSBackend.name:
+        try:
+            return MSSBackend()
+        except ImportError:
+            logger.warning("mss is not installed, falling back to pyautogui screen capture")
+            return PyAutoGUIBackend()
+    if name == PyAutoGUIBackend.name:
+        return PyAutoGUIBackend()
+    raise ValueError(f"Unknown capture backend: {name}")
+
+
+_default_backend: Optional[CaptureBackend] = None
+_default_backend_lock = threading.Lock()
+
+
+def get_capture_backend_instance() -> CaptureBackend:
+    """Get the process-wide default capture backend"""
+    global _default_backend
+    with _default_backend_lock:
+        if _default_backend is None:
+            _default_backend = create_capture_backend()
+        return _default_backend
+
+
+def set_capture_backend_instance(backend: CaptureBackend) -> None:
+    """Replace the process-wide default capture backend, e.g. with a FileReplayBackend in tests"""
+    global _default_backend
+    with _default_backend_lock:
+        _default_backend = backend
@@ -0,0 +1,109 @@
+"""
+Benchmark the packed bounding box encoding against nested BoundingBox messages.
+
+Builds synthetic frames with many detections and reports the serialized size
+of a VisionDetectResultModel and the time to encode and decode its boxes, with
+the boxes sent as nested merged_ui_icon_bboxes messages and as packed_bboxes.
+
+Usage (from karna-python-backend):
+    python -m scripts.benchmark_bbox_encoding --boxes 500 1000 2000
+"""
+
+import argparse
+import time
+from typing import Callable, Dict, List
+
+import numpy as np
+
+from api.websockets.vision_detect.bbox_encoding import (
+    decode_nested_bounding_box,
+    decode_packed_bounding_boxes,
+    encode_nested_bounding_box,
+    encode_packed_bounding_boxes,
+)
+from generated.vision_detect_pb2 import VisionDetectResultModel as ProtoVisionDetectResultModel
+from inference import BoundingBox, BoundingBoxArray
+
+CLASS_NAMES = ["button", "icon", "text", "input", "image", "checkbox", "link", "menu"]
+
+
+def make_boxes(count: int, width: int = 1920, height: int = 1080, seed: int = 0) -> List[BoundingBox]:
+    rng = np.random.default_rng(seed)
+    sizes = rng.integers(8, 200, size=(count, 2))
+    origins = rng.integers(0, [width, height], size=(count, 2)) % ([width, height] - sizes)
+    xyxy = np.concatenate([origins, origins + sizes], axis=1)
+    array = BoundingBoxArray.from_detections(dict(enumerate(CLASS_NAMES)), xyxy,
+                                             rng.integers(0, len(CLASS_NAMES), count), rng.random(count))
+    return list(array)
+
+
+def best_seconds(run: Callable[[], object], repeats: int) -> float:
+    best = float("inf")
+    for _ in range(repeats):
+        start_time = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - start_time)
+    return best
+
+
+def benchmark_frame(boxes: List[BoundingBox], repeats: int) -> Dict[str, Dict[str, float]]:
+    def encode_nested():
+        message = ProtoVisionDetectResultModel()
+        message.merged_ui_icon_bboxes.extend(encode_nested_bounding_box(bbox) for bbox in boxes)
+        return message.SerializeToString()
+
+    def encode_packed():
+        message = ProtoVisionDetectResultModel()
+        message.packed_bboxes.CopyFrom(encode_packed_bounding_boxes(boxes))
+        return message.SerializeToString()
+
+    nested_bytes, packed_bytes = encode_nested(), encode_packed()
+
+    def decode_nested():
+        message = ProtoVisionDetectResultModel.FromString(nested_bytes)
+        return [decode_nested_bounding_box(proto_bbox) for proto_bbox in message.merged_ui_icon_bboxes]
+
+    def decode_packed(materialize: bool):
+        message = ProtoVisionDetectResultModel.FromString(packed_bytes)
+        array = decode_packed_bounding_boxes(message.packed_bboxes)
+        return list(array) if materialize else array
+
+    if decode_packed(True) != decode_nested():
+        raise SystemExit("Packed and nested encodings decode to different boxes")
+
+    return {
+        "nested": {
+            "bytes": len(nested_bytes),
+            "encode_ms": 1000 * best_seconds(encode_nested, repeats),
+            "decode_ms": 1000 * best_seconds(decode_nested, repeats),
+        },
+        "packed": {
+            "bytes": len(packed_bytes),
+            "encode_ms": 1000 * best_seconds(encode_packed, repeats),
+            "decode_ms": 1000 * best_seconds(lambda: decode_packed(False), repeats),
+            # Decoding into BoundingBox objects, as the handler does
+            "decode_boxes_ms": 1000 * best_seconds(lambda: decode_packed(True), repeats),
+        },
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark packed against nested bounding box encoding.")
+    parser.add_argument("--boxes", type=int, nargs="+", default=[500, 1000, 2000, 5000], help="Boxes per frame")
+    parser.add_argument("--repeats", type=int, default=10, help="Timed runs per measurement (best is reported)")
+    args = parser.parse_args()
+
+    print(f"best of {args.repeats} runs")
+    for count in args.boxes:
+        result = benchmark_frame(make_boxes(count), args.repeats)
+        nested, packed = result["nested"], result["packed"]
+        print(f"{count} boxes")
+        print(f"  size    nested {nested['bytes'] / 1024:7.1f} KiB  packed {packed['bytes'] / 1024:7.1f} KiB"
+              f"  ({packed['bytes'] / nested['bytes']:.2f}x)")
+        print(f"  encode  nested {nested['encode_ms']:6.2f} ms  packed {packed['encode_ms']:6.2f} ms")
+        print(f"  decode  nested {nested['decode_ms']:6.2f} ms  packed {packed['decode_ms']:6.2f} ms"
+              f"  packed to boxes {packed['decode_boxes_ms']:6.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
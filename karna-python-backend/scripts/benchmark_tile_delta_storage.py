@@ -0,0 +1,118 @@
+"""
+Benchmark tile delta storage against plain PNG screenshots.
+
+Stores the sample screenshot sessions under data/ (the ChatGPT and YouTube
+sets) in a temporary tile delta store per session and reports the disk size
+and the decode latency of every frame, sequentially and in random order,
+against decoding the original PNGs.
+
+Usage (from karna-python-backend):
+    python -m scripts.benchmark_tile_delta_storage --keyframe-interval 10
+"""
+
+import argparse
+import os
+import random
+import shutil
+import tempfile
+import time
+from typing import Dict, List
+
+import numpy as np
+from PIL import Image
+
+from utils.tile_delta_store import TileDeltaStore
+
+DEFAULT_DATA_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "data"))
+
+
+def find_sample_sessions(data_dir: str) -> Dict[str, List[str]]:
+    """
+    Find the raw screenshots of every sample session under data_dir, in capture order.
+    """
+    sessions = {}
+    for project_uuid in sorted(os.listdir(data_dir)):
+        project_dir = os.path.join(data_dir, project_uuid)
+        if not os.path.isdir(project_dir):
+            continue
+        for command_uuid in sorted(os.listdir(project_dir)):
+            raw_dir = os.path.join(project_dir, command_uuid, "screenshots", "raw")
+            if os.path.isdir(raw_dir):
+                paths = sorted(os.path.join(raw_dir, name) for name in os.listdir(raw_dir) if name.endswith(".png"))
+                if paths:
+                    sessions[f"{project_uuid}/{command_uuid}"] = paths
+    return sessions
+
+
+def decode_png(path: str) -> np.ndarray:
+    with Image.open(path) as image:
+        return np.asarray(image.convert("RGB"))
+
+
+def time_reads(read, indices: List[int], repeats: int) -> float:
+    """Best seconds per frame over the repeats"""
+    best = float("inf")
+    for _ in range(repeats):
+        start_time = time.perf_counter()
+        for index in indices:
+            read(index)
+        best = min(best, time.perf_counter() - start_time)
+    return best / len(indices)
+
+
+def benchmark_session(paths: List[str], tile_size: int, keyframe_interval: int, repeats: int) -> Dict[str, float]:
+    frames = [decode_png(path) for path in paths]
+    store_dir = tempfile.mkdtemp(prefix="tile_delta_")
+    try:
+        store = TileDeltaStore(store_dir, tile_size=tile_size, keyframe_interval=keyframe_interval)
+        start_time = time.perf_counter()
+        for path, frame in zip(paths, frames):
+            store.append(frame, name=os.path.basename(path))
+        encode_seconds = (time.perf_counter() - start_time) / len(frames)
+
+        for index, frame in enumerate(frames):
+            if not np.array_equal(store.read(index), frame):
+                raise SystemExit(f"Frame {index} does not round trip")
+
+        sequential = list(range(len(frames)))
+        shuffled = random.Random(0).sample(sequential, len(sequential))
+        return {
+            "png_bytes": sum(os.path.getsize(path) for path in paths),
+            "store_bytes": store.size_on_disk(),
+            "encode_ms": 1000 * encode_seconds,
+            "png_decode_ms": 1000 * time_reads(lambda index: decode_png(paths[index]), sequential, repeats),
+            "sequential_ms": 1000 * time_reads(store.read, sequential, repeats),
+            # A fresh store has no cached keyframes, as when a session is opened
+            "random_cold_ms": 1000 * time_reads(
+                lambda index: TileDeltaStore(store_dir).read(index), shuffled, 1),
+            "random_ms": 1000 * time_reads(store.read, shuffled, repeats),
+        }
+    finally:
+        shutil.rmtree(store_dir, ignore_errors=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark tile delta storage against plain PNG.")
+    parser.add_argument("--data-dir", default=DEFAULT_DATA_DIR, help="Directory containing the sample sessions")
+    parser.add_argument("--tile-size", type=int, default=64, help="Tile edge in pixels")
+    parser.add_argument("--keyframe-interval", type=int, default=10, help="Store a full frame every N frames")
+    parser.add_argument("--repeats", type=int, default=3, help="Timed runs per measurement (best is reported)")
+    args = parser.parse_args()
+
+    sessions = find_sample_sessions(args.data_dir)
+    if not sessions:
+        raise SystemExit(f"No sample screenshots found under {args.data_dir}")
+
+    print(f"tile {args.tile_size}px, keyframe every {args.keyframe_interval} frames, best of {args.repeats} runs")
+    for name, paths in sessions.items():
+        result = benchmark_session(paths, args.tile_size, args.keyframe_interval, args.repeats)
+        print(f"{name}: {len(paths)} frames")
+        print(f"  disk    png {result['png_bytes'] / 1024:8.0f} KiB  tiles {result['store_bytes'] / 1024:8.0f} KiB"
+              f"  ({result['store_bytes'] / result['png_bytes']:.2f}x)")
+        print(f"  decode  png {result['png_decode_ms']:6.1f} ms  sequential {result['sequential_ms']:6.1f} ms"
+              f"  random {result['random_ms']:6.1f} ms  random cold {result['random_cold_ms']:6.1f} ms")
+        print(f"  encode  {result['encode_ms']:6.1f} ms/frame")
+
+
+if __name__ == "__main__":
+    main()
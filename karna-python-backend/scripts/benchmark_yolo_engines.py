@@ -0,0 +1,88 @@
+"""
+Benchmark the inference engines of the YOLO UI and icon detectors.
+
+Runs every detector through each engine on the sample screenshot sessions
+under data/ (the ChatGPT and YouTube sets) and reports the per-frame latency
+and how closely the detections match the PyTorch engine's: the recall and
+precision of same-class boxes at the IoU threshold and their mean IoU.
+Engines without an export are skipped; create them with
+python -m scripts.export_yolo_models.
+
+Usage (from karna-python-backend):
+    python -m scripts.benchmark_yolo_engines --engines pytorch onnx onnx_int8
+"""
+
+import argparse
+import os
+import time
+from typing import Dict, List, Tuple
+
+from PIL import Image
+
+from inference import BoundingBoxResult
+from inference.yolo.engines import DetectionParity, InferenceEngine, compare_detections, get_engine_weights_path
+from inference.yolo.icon.yolo_prediction import YOLO_ICON_Prediction
+from inference.yolo.ui.yolo_prediction import YOLO_UI_Prediction
+from scripts.benchmark_tile_delta_storage import DEFAULT_DATA_DIR, find_sample_sessions
+
+MODELS = {
+    "ui": YOLO_UI_Prediction,
+    "icon": YOLO_ICON_Prediction,
+}
+
+
+def run_engine(prediction_class, engine: InferenceEngine, images: List[Image.Image],
+               warmup: int) -> Tuple[float, List[BoundingBoxResult]]:
+    """Seconds per frame and the results of one engine over the images"""
+    detector = prediction_class(device="cpu", engine=engine)
+    for image in images[:warmup]:
+        detector.predict_and_export_bboxes(image)
+    start_time = time.perf_counter()
+    results = [detector.predict_and_export_bboxes(image) for image in images]
+    return (time.perf_counter() - start_time) / len(images), results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the YOLO detectors' inference engines.")
+    parser.add_argument("--data-dir", default=DEFAULT_DATA_DIR, help="Directory containing the sample sessions")
+    parser.add_argument("--models", nargs="+", choices=sorted(MODELS), default=sorted(MODELS),
+                        help="Detectors to benchmark")
+    parser.add_argument("--engines", nargs="+", choices=[engine.value for engine in InferenceEngine],
+                        default=[engine.value for engine in InferenceEngine], help="Engines to benchmark")
+    parser.add_argument("--iou-threshold", type=float, default=0.5, help="Minimum IoU of a matching box")
+    parser.add_argument("--warmup", type=int, default=2, help="Untimed frames before measuring")
+    args = parser.parse_args()
+
+    sessions = find_sample_sessions(args.data_dir)
+    if not sessions:
+        raise SystemExit(f"No sample screenshots found under {args.data_dir}")
+    images: Dict[str, List[Image.Image]] = {
+        name: [Image.open(path).convert("RGB") for path in paths] for name, paths in sessions.items()}
+
+    for model_name in args.models:
+        prediction_class = MODELS[model_name]
+        engines = [InferenceEngine(engine) for engine in args.engines]
+        # Parity is measured against PyTorch, which always runs
+        if InferenceEngine.PYTORCH not in engines:
+            engines.insert(0, InferenceEngine.PYTORCH)
+
+        for session_name, session_images in images.items():
+            print(f"{model_name} detector, {session_name}: {len(session_images)} frames")
+            reference = None
+            for engine in engines:
+                if not os.path.exists(get_engine_weights_path(prediction_class.model_path, engine)):
+                    print(f"  {engine.value:14s} not exported, skipped")
+                    continue
+                seconds, results = run_engine(prediction_class, engine, session_images, args.warmup)
+                if reference is None:
+                    reference = results
+                parity = DetectionParity()
+                for expected, actual in zip(reference, results):
+                    parity.add(compare_detections(expected.bounding_boxes, actual.bounding_boxes,
+                                                  args.iou_threshold))
+                print(f"  {engine.value:14s} {1000 * seconds:8.1f} ms/frame  recall {parity.recall:.3f}"
+                      f"  precision {parity.precision:.3f}  mean IoU {parity.mean_iou:.3f}")
+
+
+if __name__ == "__main__":
+    main()
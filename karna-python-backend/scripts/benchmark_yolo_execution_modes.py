@@ -0,0 +1,82 @@
+"""
+Benchmark the sequential, threaded and multi-process UI/icon detector modes.
+
+Runs Merged_UI_IconBBoxes over the sample screenshot sessions under data/
+(the ChatGPT and YouTube sets) once per execution mode and reports the
+wall-clock time per frame. Frames are decoded once up front so that only the
+detector scheduling is compared.
+
+Usage (from karna-python-backend):
+    python -m scripts.benchmark_yolo_execution_modes --repeats 3
+"""
+
+import argparse
+import glob
+import os
+import time
+from typing import Dict, List
+
+from inference.yolo.concurrent_detection import ExecutionMode
+from inference.yolo.yolo_ui_icon_merged_inference import Merged_UI_IconBBoxes
+
+DEFAULT_DATA_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "data"))
+
+
+def find_sample_screenshots(data_dir: str) -> List[str]:
+    """
+    Find the raw screenshots of every sample session under data_dir.
+    """
+    pattern = os.path.join(data_dir, "*", "*", "screenshots", "raw", "*.png")
+    return sorted(glob.glob(pattern))
+
+
+def benchmark(screenshot_paths: List[str], modes: List[ExecutionMode], repeats: int, should_crop: bool) -> Dict[ExecutionMode, float]:
+    """
+    Time each execution mode over the same decoded frames.
+
+    Returns:
+        Dict[ExecutionMode, float]: Best wall-clock seconds per mode over the repeats.
+    """
+    frames = Merged_UI_IconBBoxes.get_frame_loader(should_crop).load_many(screenshot_paths)
+    Merged_UI_IconBBoxes.warm_up_models()
+
+    timings = {}
+    for mode in modes:
+        # The first call starts the workers (and loads the models in worker processes)
+        Merged_UI_IconBBoxes.get_merged_ui_icon_bboxes_for_frames(frames[:1], execution_mode=mode)
+
+        best = float("inf")
+        for _ in range(repeats):
+            start_time = time.perf_counter()
+            Merged_UI_IconBBoxes.get_merged_ui_icon_bboxes_for_frames(frames, execution_mode=mode)
+            best = min(best, time.perf_counter() - start_time)
+        timings[mode] = best
+        Merged_UI_IconBBoxes.get_detector_executor(mode).shutdown()
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark UI/icon YOLO detector execution modes.")
+    parser.add_argument("--data-dir", default=DEFAULT_DATA_DIR, help="Directory containing the sample sessions")
+    parser.add_argument("--repeats", type=int, default=3, help="Timed runs per mode (best is reported)")
+    parser.add_argument("--modes", nargs="+", default=[mode.value for mode in ExecutionMode],
+                        choices=[mode.value for mode in ExecutionMode], help="Execution modes to compare")
+    parser.add_argument("--no-crop", action="store_true", help="Run on full screenshots instead of the render area")
+    args = parser.parse_args()
+
+    screenshot_paths = find_sample_screenshots(args.data_dir)
+    if not screenshot_paths:
+        raise SystemExit(f"No sample screenshots found under {args.data_dir}")
+
+    modes = [ExecutionMode(mode) for mode in args.modes]
+    timings = benchmark(screenshot_paths, modes, args.repeats, should_crop=not args.no_crop)
+
+    baseline = timings.get(ExecutionMode.SEQUENTIAL)
+    print(f"{len(screenshot_paths)} frames, best of {args.repeats} runs")
+    for mode, seconds in timings.items():
+        speedup = f"  {baseline / seconds:.2f}x" if baseline else ""
+        print(f"{mode.value:<11} {seconds:8.2f}s  {1000 * seconds / len(screenshot_paths):8.1f} ms/frame{speedup}")
+
+
+if __name__ == "__main__":
+    main()
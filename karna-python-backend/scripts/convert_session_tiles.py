@@ -0,0 +1,54 @@
+"""
+Convert the raw screenshots of existing sessions into tile delta stores.
+
+Each session's store is written to <session>/screenshots/tiles, see
+utils/tile_delta_store.py. The PNGs are kept, since the app still reads the
+screenshots from screenshots/raw. Stores are recorded in the session catalog as
+artifacts, so they count against the retention size quota.
+
+Usage (from karna-python-backend):
+    python -m scripts.convert_session_tiles ../data/chatgpt/<command_uuid>
+    python -m scripts.convert_session_tiles --all --data-dir ../data
+"""
+
+import argparse
+import glob
+import os
+from typing import List
+
+from services.session_catalog import ARTIFACT_TILES, get_session_catalog_instance
+from utils.tile_delta_store import convert_session, get_tile_store_dir
+
+DEFAULT_DATA_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "data"))
+
+
+def find_sessions(data_dir: str) -> List[str]:
+    """
+    Find every session directory with raw screenshots under data_dir.
+    """
+    pattern = os.path.join(data_dir, "*", "*", "screenshots", "raw")
+    return sorted(os.path.dirname(os.path.dirname(raw_dir)) for raw_dir in glob.glob(pattern))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Convert session screenshots into tile delta stores.")
+    parser.add_argument("sessions", nargs="*", help="Session directories to convert")
+    parser.add_argument("--all", action="store_true", help="Convert every session under --data-dir")
+    parser.add_argument("--data-dir", default=DEFAULT_DATA_DIR, help="Directory containing the sessions")
+    parser.add_argument("--tile-size", type=int, default=64, help="Tile edge in pixels")
+    parser.add_argument("--keyframe-interval", type=int, default=10, help="Store a full frame every N frames")
+    args = parser.parse_args()
+
+    sessions = find_sessions(args.data_dir) if args.all else args.sessions
+    if not sessions:
+        raise SystemExit("No sessions to convert, pass session directories or --all")
+
+    for session_dir in sessions:
+        store = convert_session(session_dir, tile_size=args.tile_size, keyframe_interval=args.keyframe_interval)
+        get_session_catalog_instance().record_artifact(get_tile_store_dir(session_dir), ARTIFACT_TILES,
+                                                       store.size_on_disk())
+        print(f"{session_dir}: {len(store)} frames, {store.size_on_disk() / 1024:.0f} KiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+"""
+Export the YOLO UI and icon detectors for the CPU inference engines.
+
+Writes each detector's export next to its PyTorch weights, where
+inference/yolo/engines.py looks for it:
+
+- onnx:          <name>.onnx, dynamic batch and input size, simplified graph
+- onnx_int8:     <name>_int8.onnx, the ONNX export with int8 weights (ONNX Runtime dynamic quantization)
+- openvino:      <name>_openvino_model/
+- openvino_int8: <name>_int8_openvino_model/, quantized with NNCF on calibration screenshots
+
+Usage (from karna-python-backend):
+    python -m scripts.export_yolo_models --engines onnx onnx_int8
+    python -m scripts.export_yolo_models --models ui --engines openvino_int8 --data calibration.yaml
+"""
+
+import argparse
+import os
+import shutil
+from typing import Optional
+
+from ultralytics import YOLO
+
+from inference.yolo.engines import InferenceEngine, get_engine_weights_path
+from inference.yolo.icon.yolo_prediction import YOLO_ICON_Prediction
+from inference.yolo.ui.yolo_prediction import YOLO_UI_Prediction
+
+MODELS = {
+    "ui": YOLO_UI_Prediction,
+    "icon": YOLO_ICON_Prediction,
+}
+
+
+def get_train_imgsz(model: YOLO, default: int = 640) -> int:
+    """The input size the detector was trained at, used as the export's default size"""
+    imgsz = model.overrides.get("imgsz", default)
+    return max(imgsz) if isinstance(imgsz, (list, tuple)) else int(imgsz)
+
+
+def export_onnx(model_path: str, imgsz: Optional[int] = None) -> str:
+    model = YOLO(model_path)
+    exported = model.export(format="onnx", dynamic=True, simplify=True, imgsz=imgsz or get_train_imgsz(model))
+    return str(exported)
+
+
+def quantize_onnx(model_path: str, imgsz: Optional[int] = None) -> str:
+    """
+    Quantize the ONNX export's weights to int8, exporting it first if needed.
+
+    Dynamic quantization needs no calibration data. The ultralytics metadata
+    (class names, input size, stride) is copied over so the quantized model loads
+    like the float one.
+    """
+    import onnx
+    from onnxruntime.quantization import QuantType, quantize_dynamic
+
+    onnx_path = get_engine_weights_path(model_path, InferenceEngine.ONNX)
+    if not os.path.exists(onnx_path):
+        onnx_path = export_onnx(model_path, imgsz)
+    int8_path = get_engine_weights_path(model_path, InferenceEngine.ONNX_INT8)
+    quantize_dynamic(onnx_path, int8_path, weight_type=QuantType.QUInt8)
+
+    source, quantized = onnx.load(onnx_path), onnx.load(int8_path)
+    del quantized.metadata_props[:]
+    quantized.metadata_props.extend(source.metadata_props)
+    onnx.save(quantized, int8_path)
+    return int8_path
+
+
+def export_openvino(model_path: str, imgsz: Optional[int] = None, int8: bool = False,
+                    data: Optional[str] = None) -> str:
+    model = YOLO(model_path)
+    kwargs = {"format": "openvino", "dynamic": True, "imgsz": imgsz or get_train_imgsz(model)}
+    if int8:
+        kwargs.update(int8=True, data=data)
+    exported = str(model.export(**kwargs))
+    target = get_engine_weights_path(model_path, InferenceEngine.OPENVINO_INT8 if int8 else InferenceEngine.OPENVINO)
+    if os.path.abspath(exported) != os.path.abspath(target):
+        shutil.rmtree(target, ignore_errors=True)
+        shutil.move(exported, target)
+    return target
+
+
+def export(model_path: str, engine: InferenceEngine, imgsz: Optional[int] = None, data: Optional[str] = None) -> str:
+    """
+    Export a detector's weights for an engine.
+
+    Parameters:
+        model_path (str): Path to the PyTorch weights.
+        engine (InferenceEngine): The engine to export for.
+        imgsz (int, optional): Export input size, defaults to the training size.
+        data (str, optional): Dataset YAML with calibration images, required for OPENVINO_INT8.
+
+    Returns:
+        str: Path of the exported model.
+    """
+    if engine == InferenceEngine.ONNX:
+        return export_onnx(model_path, imgsz)
+    if engine == InferenceEngine.ONNX_INT8:
+        return quantize_onnx(model_path, imgsz)
+    if engine == InferenceEngine.OPENVINO:
+        return export_openvino(model_path, imgsz)
+    if engine == InferenceEngine.OPENVINO_INT8:
+        if not data:
+            raise ValueError("OpenVINO int8 quantization needs calibration images, pass --data")
+        return export_openvino(model_path, imgsz, int8=True, data=data)
+    raise ValueError(f"Nothing to export for {engine.value}")
+
+
+def main():
+    exportable = [engine.value for engine in InferenceEngine if engine != InferenceEngine.PYTORCH]
+    parser = argparse.ArgumentParser(description="Export the YOLO detectors for the CPU inference engines.")
+    parser.add_argument("--models", nargs="+", choices=sorted(MODELS), default=sorted(MODELS),
+                        help="Detectors to export")
+    parser.add_argument("--engines", nargs="+", choices=exportable, default=["onnx"], help="Engines to export for")
+    parser.add_argument("--imgsz", type=int, default=None, help="Export input size (default: training size)")
+    parser.add_argument("--data", default=None, help="Dataset YAML with calibration images for openvino_int8")
+    args = parser.parse_args()
+
+    for name in args.models:
+        model_path = MODELS[name].model_path
+        for engine in args.engines:
+            path = export(model_path, InferenceEngine(engine), imgsz=args.imgsz, data=args.data)
+            print(f"{name} {engine}: {path}")
+
+
+if __name__ == "__main__":
+    main()
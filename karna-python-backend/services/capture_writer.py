@@ -0,0 +1,272 @@
+"""
+Background PNG writer for screen capture frames.
+
+The input listener threads only grab a frame into memory and hand it to the
+CaptureWriter. A pool of writer threads encodes and saves the frames, and a
+single commit thread reports the saved frames in capture order, so events are
+created in the same order as the clicks and key presses that produced them.
+
+Alongside each PNG the writer can save a pyramid of WebP thumbnails, each level
+downscaled from the previous one, so lists and summaries never decode full frames:
+
+    <session>/screenshots/raw/<name>.png
+    <session>/screenshots/thumbnails/<width>/<name>.webp
+"""
+
+import logging
+import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
+from datetime import datetime
+from enum import Enum
+from queue import Queue
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple
+
+from PIL import Image
+from PIL.PngImagePlugin import PngInfo
+
+logger = logging.getLogger(__name__)
+
+
+class BackpressurePolicy(Enum):
+    """What to do with a new frame when the writer queue is full"""
+    # Block the listener until a slot frees up (or block_timeout expires, then drop)
+    BLOCK = "block"
+    # Drop the new frame immediately
+    DROP_NEWEST = "drop_newest"
+
+
+@dataclass
+class CaptureJob:
+    """A grabbed frame waiting to be written to disk"""
+    # None if only the commit step is needed
+    image: Optional[Image.Image]
+    path: str
+    timestamp: datetime
+    # Opaque data handed back to the on_written callback
+    context: Any = None
+    # Thumbnail width -> path, filled in by the writer
+    thumbnail_paths: Dict[int, str] = field(default_factory=dict)
+    # Size of the saved image, filled in by the writer
+    bytes_written: int = 0
+    # PNG text chunks saved with the image, e.g. the origin of a region capture
+    metadata: Dict[str, str] = field(default_factory=dict)
+
+
+def get_thumbnail_path(screenshot_path: str, width: int) -> str:
+    """
+    Get where the thumbnail of a screenshot is stored.
+
+    Args:
+        screenshot_path: Path of the full-size screenshot, in the session's raw directory.
+        width: Thumbnail width in pixels.
+
+    Returns:
+        str: The thumbnail path, screenshots/thumbnails/<width>/<name>.webp.
+    """
+    raw_dir, filename = os.path.split(screenshot_path)
+    name = os.path.splitext(filename)[0]
+    return os.path.join(os.path.dirname(raw_dir), 'thumbnails', str(width), f'{name}.webp')
+
+
+@dataclass
+class CaptureWriterMetrics:
+    """Counters of a CaptureWriter"""
+    submitted: int = 0
+    written: int = 0
+    dropped: int = 0
+    failed: int = 0
+    queue_depth: int = 0
+    max_queue_depth: int = 0
+    total_encode_seconds: float = 0.0
+    thumbnails_written: int = 0
+
+    @property
+    def average_encode_seconds(self) -> float:
+        return self.total_encode_seconds / self.written if self.written else 0.0
+
+
+class CaptureWriter:
+    """
+    Bounded queue of grabbed frames encoded and saved by a pool of writer threads.
+    """
+
+    def __init__(self, on_written: Callable[[CaptureJob], None], num_workers: int = 2, max_queue_size: int = 8,
+                 compress_level: int = 1, policy: BackpressurePolicy = BackpressurePolicy.BLOCK,
+                 block_timeout: float = 5.0, thumbnail_widths: Sequence[int] = (),
+                 thumbnail_quality: int = 80, on_failed: Optional[Callable[[CaptureJob], None]] = None):
+        """
+        Initialize the writer. Threads are started on the first submitted frame.
+
+        Args:
+            on_written: Called from the commit thread, in submission order, once a frame is saved.
+            num_workers: Number of encoding threads.
+            max_queue_size: Maximum number of frames grabbed but not yet committed.
+            compress_level: PNG zlib level, 0 (none) to 9 (smallest). 1 is fast with a reasonable size.
+            policy: What to do with new frames while the queue is full.
+            block_timeout: Maximum seconds a BLOCK submit waits before dropping the frame.
+            thumbnail_widths: Widths of the WebP thumbnails saved with each frame, none by default.
+            thumbnail_quality: WebP quality of the thumbnails, 0 to 100.
+            on_failed: Called from the commit thread, in submission order, if a frame could not be saved or committed.
+        """
+        if num_workers < 1:
+            raise ValueError("num_workers must be at least 1")
+        if max_queue_size < 1:
+            raise ValueError("max_queue_size must be at least 1")
+        if not 0 <= compress_level <= 9:
+            raise ValueError("compress_level must be between 0 and 9")
+        if any(width < 1 for width in thumbnail_widths):
+            raise ValueError("thumbnail widths must be positive")
+        self.on_written = on_written
+        self.on_failed = on_failed
+        self.num_workers = num_workers
+        self.max_queue_size = max_queue_size
+        self.compress_level = compress_level
+        self.policy = policy
+        self.block_timeout = block_timeout
+        # Largest first, each level is downscaled from the one before
+        self.thumbnail_widths = sorted(set(thumbnail_widths), reverse=True)
+        self.thumbnail_quality = thumbnail_quality
+
+        self._slots = threading.BoundedSemaphore(max_queue_size)
+        self._pending: "Queue[Optional[Tuple[CaptureJob, Future]]]" = Queue()
+        self._condition = threading.Condition()
+        self._metrics = CaptureWriterMetrics()
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._commit_thread: Optional[threading.Thread] = None
+
+    def _ensure_started(self) -> None:
+        with self._condition:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(max_workers=self.num_workers, thread_name_prefix="capture-writer")
+                self._commit_thread = threading.Thread(target=self._commit_loop, name="capture-commit", daemon=True)
+                self._commit_thread.start()
+
+    def submit(self, job: CaptureJob) -> bool:
+        """
+        Queue a grabbed frame for writing.
+
+        Args:
+            job: The frame and the path to save it to.
+
+        Returns:
+            bool: False if the frame was dropped because the queue was full.
+        """
+        if self.policy == BackpressurePolicy.BLOCK:
+            accepted = self._slots.acquire(timeout=self.block_timeout)
+        else:
+            accepted = self._slots.acquire(blocking=False)
+
+        with self._condition:
+            if not accepted:
+                self._metrics.dropped += 1
+                logger.warning(f"Capture writer queue full, dropped frame {job.path} ({self._metrics.dropped} total)")
+                return False
+            self._metrics.submitted += 1
+            self._metrics.queue_depth += 1
+            self._metrics.max_queue_depth = max(self._metrics.max_queue_depth, self._metrics.queue_depth)
+
+        self._ensure_started()
+        future = self._pool.submit(self._encode, job)  # type: ignore
+        self._pending.put((job, future))
+        return True
+
+    def _encode(self, job: CaptureJob) -> float:
+        if job.image is None:
+            # Nothing to write, e.g. a duplicate frame referencing an existing file
+            job.thumbnail_paths = {
+                width: path for width, path in self._thumbnail_paths(job.path).items() if os.path.exists(path)
+            }
+            return 0.0
+        start_time = time.perf_counter()
+        pnginfo = None
+        if job.metadata:
+            pnginfo = PngInfo()
+            for key, value in job.metadata.items():
+                pnginfo.add_text(key, value)
+        job.image.save(job.path, format="PNG", compress_level=self.compress_level, pnginfo=pnginfo)  # type: ignore
+        job.bytes_written = os.path.getsize(job.path)
+        self._write_thumbnails(job)
+        # The frame is on disk, release the pixels before the commit
+        job.image = None
+        return time.perf_counter() - start_time
+
+    def _thumbnail_paths(self, path: str) -> Dict[int, str]:
+        return {width: get_thumbnail_path(path, width) for width in self.thumbnail_widths}
+
+    def _write_thumbnails(self, job: CaptureJob) -> None:
+        level = job.image
+        for width, path in self._thumbnail_paths(job.path).items():
+            try:
+                if level.width > width:  # type: ignore
+                    height = max(1, round(level.height * width / level.width))  # type: ignore
+                    level = level.resize((width, height), Image.Resampling.LANCZOS, reducing_gap=2.0)  # type: ignore
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                level.save(path, format="WEBP", quality=self.thumbnail_quality)  # type: ignore
+                job.thumbnail_paths[width] = path
+            except Exception as e:
+                # The full frame is saved, a missing thumbnail only costs previews
+                logger.warning(f"Failed to write {width}px thumbnail of {job.path}: {str(e)}")
+        with self._condition:
+            self._metrics.thumbnails_written += len(job.thumbnail_paths)
+
+    def _commit_loop(self) -> None:
+        while True:
+            item = self._pending.get()
+            if item is None:
+                break
+            job, future = item
+            try:
+                encode_seconds = future.result()
+                self.on_written(job)
+                with self._condition:
+                    self._metrics.written += 1
+                    self._metrics.total_encode_seconds += encode_seconds
+            except Exception as e:
+                logger.error(f"Failed to write captured frame {job.path}: {str(e)}")
+                with self._condition:
+                    self._metrics.failed += 1
+                if self.on_failed:
+                    try:
+                        self.on_failed(job)
+                    except Exception as callback_error:
+                        logger.error(f"Capture failure callback failed for {job.path}: {str(callback_error)}")
+            finally:
+                self._slots.release()
+                with self._condition:
+                    self._metrics.queue_depth -= 1
+                    self._condition.notify_all()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until every submitted frame has been written and committed.
+
+        Args:
+            timeout: Maximum seconds to wait, None to wait indefinitely.
+
+        Returns:
+            bool: False if frames were still pending when the timeout expired.
+        """
+        with self._condition:
+            return self._condition.wait_for(lambda: self._metrics.queue_depth == 0, timeout=timeout)
+
+    def close(self) -> None:
+        """
+        Write the pending frames and stop the threads. The writer restarts on the next submit.
+        """
+        with self._condition:
+            pool, commit_thread = self._pool, self._commit_thread
+            self._pool, self._commit_thread = None, None
+        if pool is None:
+            return
+        self._pending.put(None)
+        if commit_thread is not None:
+            commit_thread.join()
+        pool.shutdown(wait=True)
+
+    def get_metrics(self) -> CaptureWriterMetrics:
+        """Get a copy of the writer counters"""
+        with self._condition:
+            return replace(self._metrics)
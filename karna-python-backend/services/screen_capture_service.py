@@ -1,16 +1,24 @@
 import os
 import uuid
-import pyautogui
-from datetime import datetime, timedelta
+import time
+from datetime import datetime
 from pynput import keyboard, mouse
 import threading
 from PIL import Image, ImageDraw, ImageFont
 import logging
-from typing import Optional, Dict, List
-from collections import defaultdict
+from typing import Optional, Dict, List, Sequence, Tuple
+from collections import Counter, defaultdict
 from services.base_service import BaseService
+from services.capture_writer import BackpressurePolicy, CaptureJob, CaptureWriter, CaptureWriterMetrics
+from robot.capture_backends import CaptureBackend, Frame, FrameRingBuffer, FrameSampler, GrabRegion, get_capture_backend_instance
+from utils.frame_similarity import FrameSignature, compute_signature, similarity
+from utils.annotation_renderer import AnnotationOverlay, draw_annotation
+from utils.image_utils import CAPTURE_ORIGIN_KEY, format_capture_origin, get_capture_region
+from utils.session_journal import SessionJournal, get_session_journal
+from services.session_catalog import ARTIFACT_SUMMARY, ARTIFACT_THUMBNAILS, get_session_catalog_instance
+from base.base_observer import NotificationMode, Observable, Observer
 import shutil
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, field
 from enum import Enum, auto
 import math
 import json
@@ -81,6 +89,80 @@ class ScreenshotEvent:
     key_char: Optional[str] = None
     key_code: Optional[str] = None
     is_special_key: bool = False
+    # Similarity to the last stored frame of the session (1.0 = identical), None for the first frame
+    similarity_score: Optional[float] = None
+    # Set when the frame duplicated an earlier event's and screenshot_path points to that image
+    duplicate_of_event_id: Optional[str] = None
+    # What annotation_path shows; the annotated image is rendered from the raw screenshot on demand
+    annotation_overlay: Optional[AnnotationOverlay] = None
+    # Thumbnail width in pixels -> path of the WebP thumbnail, served under /data like screenshot_path
+    thumbnail_paths: Optional[Dict[int, str]] = None
+    # Screen coordinates of the screenshot's top-left pixel when only a region was captured.
+    # mouse_x and mouse_y stay in screen coordinates.
+    capture_origin: Optional[Tuple[int, int]] = None
+
+    def __post_init__(self):
+        """Restore the overlay, thumbnail widths and origin when the event is loaded from its JSON form"""
+        if isinstance(self.annotation_overlay, dict):
+            self.annotation_overlay = AnnotationOverlay.from_dict(self.annotation_overlay)
+        if self.thumbnail_paths:
+            # JSON object keys are strings
+            self.thumbnail_paths = {int(width): path for width, path in self.thumbnail_paths.items()}
+        if self.capture_origin is not None:
+            # JSON has no tuples
+            x, y = self.capture_origin
+            self.capture_origin = (int(x), int(y))
+
+    def get_preview_path(self, min_width: int) -> str:
+        """Get the smallest stored image at least min_width wide, the screenshot itself if none is"""
+        for width in sorted(self.thumbnail_paths or {}):
+            if width >= min_width:
+                return self.thumbnail_paths[width]  # type: ignore
+        return self.screenshot_path
+
+def event_to_dict(event: ScreenshotEvent) -> dict:
+    """Convert a screenshot event to its JSON form"""
+    event_dict = asdict(event)
+    if isinstance(event_dict['timestamp'], datetime):
+        event_dict['timestamp'] = event_dict['timestamp'].isoformat()
+    return event_dict
+
+def event_from_dict(event_dict: dict) -> ScreenshotEvent:
+    """Create a screenshot event from its JSON form"""
+    if isinstance(event_dict.get('timestamp'), str):
+        event_dict = dict(event_dict, timestamp=datetime.fromisoformat(event_dict['timestamp']))
+    return ScreenshotEvent(**event_dict)
+
+def normalize_event_dict(event_dict: dict) -> dict:
+    """Bring an event dict to the form it has after a JSON round trip, so equal events compare equal"""
+    return json.loads(json.dumps(event_to_dict(event_from_dict(event_dict)), ensure_ascii=False))
+
+# Fields set by the service at capture time; clients cannot change them and may not send them back
+SERVER_OWNED_EVENT_FIELDS = ('similarity_score', 'duplicate_of_event_id', 'annotation_overlay',
+                             'thumbnail_paths', 'capture_origin')
+
+class CaptureDeltaType(Enum):
+    """Kind of change to the screenshot event list of a session"""
+    APPEND = auto()
+    UPDATE = auto()
+    DELETE = auto()
+    RESET = auto()  # events holds the full list of the session
+
+@dataclass
+class CaptureDelta:
+    """A change to the screenshot event list, numbered per session so clients can detect gaps"""
+    project_uuid: str
+    command_uuid: str
+    sequence: int
+    type: CaptureDeltaType
+    is_active: bool
+    events: List[ScreenshotEvent]
+    deleted_event_ids: List[str]
+
+class CaptureDeltaObservable(Observable[CaptureDelta]):
+    """Observable of screenshot event list deltas; observers share one snapshot per delta."""
+    notification_mode = NotificationMode.SHARED_SNAPSHOT
+
 @dataclass
 class SessionStatistics:
     """Statistics for a screen capture session"""
@@ -95,6 +177,129 @@ class SessionStatistics:
     duration_seconds: float = 0.0
     raw_directory_size: int = 0  # in bytes
     annotated_directory_size: int = 0  # in bytes
+    # Referenced files found missing by the last reconciliation
+    missing_files: int = 0
+
+class SessionStatsTracker:
+    """
+    Running statistics of a session, updated as files are written and events change.
+
+    Files are counted once however many events reference them. File sizes are recorded when
+    the capture writer saves a file; reconcile() re-reads them to catch external changes.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._screenshot_refs: Counter = Counter()
+        self._annotation_refs: Counter = Counter()
+        self._file_sizes: Dict[str, int] = {}
+        self._missing: set = set()
+        self._raw_bytes = 0
+        self._annotated_bytes = 0
+        self._key_events = 0
+        self._mouse_events = 0
+
+    def record_file(self, path: str, size: int) -> None:
+        """Record the size of a file written for the session"""
+        with self._lock:
+            self._set_size(path, size)
+
+    def add_event(self, event: ScreenshotEvent) -> None:
+        with self._lock:
+            self._add_ref(self._screenshot_refs, event.screenshot_path, is_raw=True)
+            self._add_ref(self._annotation_refs, event.annotation_path, is_raw=False)
+
+    def remove_event(self, event: ScreenshotEvent) -> None:
+        with self._lock:
+            self._remove_ref(self._screenshot_refs, event.screenshot_path, is_raw=True)
+            self._remove_ref(self._annotation_refs, event.annotation_path, is_raw=False)
+
+    def set_annotation(self, event: ScreenshotEvent, annotation_path: Optional[str]) -> None:
+        """Set an event's annotation_path, moving its reference"""
+        with self._lock:
+            self._remove_ref(self._annotation_refs, event.annotation_path, is_raw=False)
+            event.annotation_path = annotation_path
+            self._add_ref(self._annotation_refs, annotation_path, is_raw=False)
+
+    def add_session_event(self, event: SessionEvent) -> None:
+        with self._lock:
+            if event.type == EventType.KEY_PRESS:
+                self._key_events += 1
+            elif event.type == EventType.MOUSE_CLICK:
+                self._mouse_events += 1
+
+    def reset_events(self, events: Sequence[ScreenshotEvent]) -> None:
+        """Recount the references of a replaced event list; known file sizes are kept"""
+        with self._lock:
+            self._screenshot_refs.clear()
+            self._annotation_refs.clear()
+            self._raw_bytes = self._annotated_bytes = 0
+            for event in events:
+                self._add_ref(self._screenshot_refs, event.screenshot_path, is_raw=True)
+                self._add_ref(self._annotation_refs, event.annotation_path, is_raw=False)
+
+    def reconcile(self) -> int:
+        """
+        Re-read the sizes of every referenced file, e.g. to catch files deleted outside the service.
+
+        Returns:
+            int: Number of referenced files that are missing.
+        """
+        with self._lock:
+            paths = list(self._screenshot_refs) + list(self._annotation_refs)
+        # Outside the lock, the disk is slow and the capture must not wait for it
+        sizes = {path: os.path.getsize(path) if os.path.exists(path) else None for path in paths}
+        with self._lock:
+            for path, size in sizes.items():
+                if size is None:
+                    self._missing.add(path)
+                    size = 0
+                else:
+                    self._missing.discard(path)
+                self._set_size(path, size)
+            return len(self._missing)
+
+    def snapshot(self, stats: SessionStatistics) -> SessionStatistics:
+        """Fill in and return stats with the current totals"""
+        with self._lock:
+            stats.total_screenshots = len(self._screenshot_refs)
+            stats.total_annotations = len(self._annotation_refs)
+            stats.total_key_events = self._key_events
+            stats.total_mouse_events = self._mouse_events
+            stats.raw_directory_size = self._raw_bytes
+            stats.annotated_directory_size = self._annotated_bytes
+            stats.missing_files = len(self._missing.intersection(self._screenshot_refs) |
+                                      self._missing.intersection(self._annotation_refs))
+        return stats
+
+    def _set_size(self, path: str, size: int) -> None:
+        delta = size - self._file_sizes.get(path, 0)
+        self._file_sizes[path] = size
+        if path in self._screenshot_refs:
+            self._raw_bytes += delta
+        if path in self._annotation_refs:
+            self._annotated_bytes += delta
+
+    def _add_ref(self, refs: Counter, path: Optional[str], is_raw: bool) -> None:
+        if not path:
+            return
+        refs[path] += 1
+        if refs[path] == 1:
+            self._add_bytes(path, self._file_sizes.get(path, 0), is_raw)
+
+    def _remove_ref(self, refs: Counter, path: Optional[str], is_raw: bool) -> None:
+        if not path or path not in refs:
+            return
+        refs[path] -= 1
+        if refs[path] == 0:
+            del refs[path]
+            self._add_bytes(path, -self._file_sizes.get(path, 0), is_raw)
+
+    def _add_bytes(self, path: str, size: int, is_raw: bool) -> None:
+        if is_raw:
+            self._raw_bytes += size
+        else:
+            self._annotated_bytes += size
 
 @dataclass
 class ScreenCaptureSession:
@@ -111,12 +316,29 @@ class ScreenCaptureSession:
     session_events: List[SessionEvent] = None  # For storing session events
     screenshot_events: List[ScreenshotEvent] = None  # For storing screenshot events
     key_capture_config: KeyCaptureConfig = None
+    delta_sequence: int = 0  # Sequence number of the last published CaptureDelta
+    # Last frame written to disk and its event
+    dedup_signature: Optional[FrameSignature] = None
+    dedup_screenshot_path: Optional[str] = None
+    dedup_event_id: Optional[str] = None
+    # Last frame queued for writing, that later near-duplicate frames reference; falls back to the
+    # written frame above if its write fails
+    queued_dedup_signature: Optional[FrameSignature] = None
+    queued_dedup_screenshot_path: Optional[str] = None
+    # Persists the screenshot events as they are captured and edited
+    journal: Optional[SessionJournal] = None
+    stats_tracker: SessionStatsTracker = None
+    # Screen region grabbed instead of the full screen, (left, top, width, height)
+    capture_region: Optional[GrabRegion] = None
+    # Held while the screenshot event list changes together with delta_sequence, and while it is read
+    event_lock: threading.RLock = field(default_factory=threading.RLock, repr=False, compare=False)
     
     def __post_init__(self):
         """Initialize event lists after dataclass initialization"""
         self.session_events = []
         self.screenshot_events = []
         self.key_capture_config = KeyCaptureConfig()
+        self.stats_tracker = SessionStatsTracker()
     @property
     def duration(self) -> Optional[float]:
         """Calculate session duration in seconds"""
@@ -129,56 +351,33 @@ class ScreenCaptureSession:
     def add_screenshot_event(self, event: ScreenshotEvent) -> None:
         """Add a screenshot event to the session"""
         self.screenshot_events.append(event)
+        self.stats_tracker.add_event(event)
+
+    def pop_screenshot_event(self) -> ScreenshotEvent:
+        """Remove and return the latest screenshot event"""
+        event = self.screenshot_events.pop()
+        self.stats_tracker.remove_event(event)
+        return event
+
+    def set_screenshot_events(self, events: List[ScreenshotEvent]) -> None:
+        """Replace the screenshot event list, e.g. after client-side edits"""
+        self.screenshot_events = events
+        self.stats_tracker.reset_events(events)
 
     def add_session_event(self, event: SessionEvent) -> None:
         """Add a session event to the session"""
         self.session_events.append(event)
+        self.stats_tracker.add_session_event(event)
 
     def get_statistics(self) -> SessionStatistics:
-        """Get statistics for the current session based on captured events"""
+        """Get statistics for the current session from the running totals, without touching the disk"""
         stats = SessionStatistics(
             project_uuid=self.project_uuid,
             command_uuid=self.command_uuid,
             start_time=self.start_time,
             end_time=self.end_time
         )
-        
-        # Calculate statistics from both event lists
-        screenshot_paths = set()
-        annotated_paths = set()
-        key_events = 0
-        mouse_events = 0
-        
-        # Process screenshot events
-        for event in self.screenshot_events:
-            if event.screenshot_path:
-                screenshot_paths.add(event.screenshot_path)
-                if event.annotation_path:
-                    annotated_paths.add(event.annotation_path)
-
-        # Process session events
-        for event in self.session_events:
-            if event.type == EventType.KEY_PRESS:
-                key_events += 1
-            elif event.type == EventType.MOUSE_CLICK:
-                mouse_events += 1
-        
-        # Update statistics
-        stats.total_screenshots = len(screenshot_paths)
-        stats.total_annotations = len(annotated_paths)
-        stats.total_key_events = key_events
-        stats.total_mouse_events = mouse_events
-        
-        # Calculate directory sizes
-        if self.raw_dir and os.path.exists(self.raw_dir):
-            stats.raw_directory_size = sum(
-                os.path.getsize(path) for path in screenshot_paths if os.path.exists(path)
-            )
-        
-        if self.annotated_dir and os.path.exists(self.annotated_dir):
-            stats.annotated_directory_size = sum(
-                os.path.getsize(path) for path in annotated_paths if os.path.exists(path)
-            )
+        self.stats_tracker.snapshot(stats)
             
         if self.start_time:
             end = self.end_time if self.end_time else datetime.now()
@@ -190,12 +389,64 @@ class ScreenCaptureService(BaseService[List[ScreenshotEvent]]):
     """Service for capturing screen interactions with annotation capability.
     Notifies observers about changes to the screenshot event list."""
     
+    # All observers share one snapshot of the event list per notification
+    notification_mode = NotificationMode.SHARED_SNAPSHOT
+    
+    # Screenshots are encoded and saved off the input listener threads
+    CAPTURE_WRITER_WORKERS = 2
+    CAPTURE_QUEUE_SIZE = 8
+    CAPTURE_PNG_COMPRESS_LEVEL = 1
+    CAPTURE_BACKPRESSURE_POLICY = BackpressurePolicy.BLOCK
+    # Maximum seconds stopping a session waits for pending screenshots
+    CAPTURE_FLUSH_TIMEOUT_SECONDS = 30.0
+    # WebP thumbnails saved with every screenshot, for lists, previews and the session summary
+    CAPTURE_THUMBNAIL_WIDTHS = (320, 960)
+    CAPTURE_THUMBNAIL_QUALITY = 80
+    
+    # Recent frames kept in memory for other components to read
+    CAPTURE_RING_BUFFER_SIZE = 8
+    # Sample the screen during a session so a click uses the frame from just before it
+    CAPTURE_LOOKBACK_ENABLED = True
+    CAPTURE_SAMPLE_INTERVAL_SECONDS = 0.1
+    # Older sampled frames are not trusted for look-back, the screen is grabbed instead
+    CAPTURE_LOOKBACK_MAX_AGE_SECONDS = 0.5
+    
+    # Frames at least this similar to the last stored frame reuse its image instead of a new PNG
+    CAPTURE_DEDUP_ENABLED = True
+    CAPTURE_DEDUP_THRESHOLD = 0.9995
+    
+    # Session statistics are kept up to date as files are written; the disk is re-read only this often
+    CAPTURE_STATS_RECONCILE_INTERVAL_SECONDS = 30.0
+    
+    # Grab only the website render area plus a margin instead of the full screen. Every screenshot
+    # records the region's origin, so consumers cropping to the render area still find it
+    CAPTURE_RENDER_AREA_ONLY = False
+    CAPTURE_RENDER_AREA_MARGIN = 16
+    
     def __init__(self):
         super().__init__()
         self.current_session: Optional[ScreenCaptureSession] = None
         self.lock = threading.Lock()
         self._event_stats: defaultdict[EventType, int] = defaultdict(int)
         self._session_history: List[SessionStatistics] = []
+        self._delta_observable = CaptureDeltaObservable()
+        self._capture_writer = CaptureWriter(
+            on_written=self._on_screenshot_written,
+            on_failed=self._on_screenshot_failed,
+            num_workers=self.CAPTURE_WRITER_WORKERS,
+            max_queue_size=self.CAPTURE_QUEUE_SIZE,
+            compress_level=self.CAPTURE_PNG_COMPRESS_LEVEL,
+            policy=self.CAPTURE_BACKPRESSURE_POLICY,
+            thumbnail_widths=self.CAPTURE_THUMBNAIL_WIDTHS,
+            thumbnail_quality=self.CAPTURE_THUMBNAIL_QUALITY
+        )
+        # None uses the process-wide default backend
+        self.capture_backend: Optional[CaptureBackend] = None
+        self.frame_buffer = FrameRingBuffer(self.CAPTURE_RING_BUFFER_SIZE)
+        self._frame_sampler: Optional[FrameSampler] = None
+        self._dedup_lock = threading.Lock()
+        self._reconcile_stop_event = threading.Event()
+        self._reconcile_thread: Optional[threading.Thread] = None
         
         # Setup logging
         logs_dir = os.path.join('data', 'logs')
@@ -228,9 +479,25 @@ class ScreenCaptureService(BaseService[List[ScreenshotEvent]]):
         if not os.path.exists(self.current_session.raw_dir) or not os.path.exists(self.current_session.annotated_dir):
             raise DirectoryError("Session directories do not exist")
 
+    def _update_session_catalog(self) -> None:
+        """Record the current session's frame count, size and thumbnails in the session catalog"""
+        session = self.current_session
+        if session is None or not session.raw_dir:
+            return
+        stats = session.get_statistics()
+        catalog = get_session_catalog_instance()
+        catalog.update_session(session.project_uuid, session.command_uuid,
+                               frame_count=stats.total_screenshots,
+                               byte_size=stats.raw_directory_size + stats.annotated_directory_size)
+        thumbnails_dir = os.path.join(os.path.dirname(session.raw_dir), 'thumbnails')
+        if os.path.isdir(thumbnails_dir):
+            catalog.record_artifact(thumbnails_dir, ARTIFACT_THUMBNAILS)
+
     def export_screenshot_events_to_json(self) -> str:
         """Export screenshot events to a JSON file.
         
+        The file is the session journal's snapshot; writing it compacts the journal.
+        
         Returns:
             str: Path to the exported JSON file
         
@@ -243,24 +510,12 @@ class ScreenCaptureService(BaseService[List[ScreenshotEvent]]):
             if not self.current_session or not self.current_session.screenshot_events:
                 raise SessionError("No screenshot events to export")
 
-            # Create export path under screenshots directory
-            base_dir = os.path.join('data', self.current_session.project_uuid, 
-                                  self.current_session.command_uuid)
-            os.makedirs(base_dir, exist_ok=True)
-            
-            export_path = os.path.join(base_dir, f'screenshot_events_{self.current_session.command_uuid}.json')
-            
-            # Convert events to serializable format
-            events_data = []
-            for event in self.current_session.screenshot_events:
-                event_dict = asdict(event)
-                # Convert datetime to ISO format string
-                event_dict['timestamp'] = event_dict['timestamp'].isoformat()
-                events_data.append(event_dict)
-            
-            # Write to JSON file with proper formatting
-            with open(export_path, 'w', encoding='utf-8') as f:
-                json.dump(events_data, f, indent=2, ensure_ascii=False)
+            # Store the final event list as the session's snapshot, replacing the capture journal
+            journal = self.current_session.journal or get_session_journal(
+                self.current_session.project_uuid, self.current_session.command_uuid)
+            journal.compact([event_to_dict(event) for event in self.current_session.screenshot_events])
+            export_path = journal.snapshot_path
+            self._update_session_catalog()
             
             logger.info(f"Screenshot events exported to: {export_path}")
             return export_path
@@ -321,7 +576,8 @@ class ScreenCaptureService(BaseService[List[ScreenshotEvent]]):
         self.current_session.add_session_event(event)
         return event
 
-    def _create_capture_event(self, description: str, screenshot_path: str, **kwargs) -> Optional[ScreenshotEvent]:
+    def _create_capture_event(self, description: str, screenshot_path: str,
+                              timestamp: Optional[datetime] = None, **kwargs) -> Optional[ScreenshotEvent]:
         """Create a screen capture event"""
         if not self.current_session or not self.current_session.is_active:
             return None
@@ -330,7 +586,7 @@ class ScreenCaptureService(BaseService[List[ScreenshotEvent]]):
             event_id=str(uuid.uuid4()),
             project_uuid=self.current_session.project_uuid,
             command_uuid=self.current_session.command_uuid,
-            timestamp=datetime.now(),
+            timestamp=timestamp or datetime.now(),
             description=description,
             screenshot_path=screenshot_path,
             **kwargs
@@ -340,47 +596,199 @@ class ScreenCaptureService(BaseService[List[ScreenshotEvent]]):
         self.current_session.add_screenshot_event(event)
         return event
 
+    def _get_capture_backend(self) -> CaptureBackend:
+        return self.capture_backend or get_capture_backend_instance()
+
+    def _grab_frame(self, lookback_time: Optional[float] = None) -> Frame:
+        """Get the frame to store for an input event.
+        
+        Args:
+            lookback_time: time.monotonic() of the input event. If given and the screen is being
+                sampled, the latest frame sampled before it is used instead of a new grab.
+        """
+        if lookback_time is not None and self._frame_sampler and self._frame_sampler.is_running:
+            frame = self.frame_buffer.latest_before(lookback_time, max_age=self.CAPTURE_LOOKBACK_MAX_AGE_SECONDS)
+            if frame is not None:
+                return frame
+        region = self.current_session.capture_region if self.current_session else None
+        frame = self._get_capture_backend().grab(region)
+        self.frame_buffer.append(frame)
+        return frame
+
+    def _get_capture_region(self) -> Optional[GrabRegion]:
+        """Get the screen region to grab, None for the full screen"""
+        if not self.CAPTURE_RENDER_AREA_ONLY:
+            return None
+        try:
+            screen_size = self._get_capture_backend().screen_size()
+            region = get_capture_region(self.CAPTURE_RENDER_AREA_MARGIN, screen_size)
+            if region[2] <= 0 or region[3] <= 0:
+                raise ValueError(f"empty region {region}")
+            logger.info(f"Capturing the website render area only: {region}")
+            return region
+        except Exception as e:
+            logger.warning(f"Failed to get the render area capture region, capturing the full screen: {str(e)}")
+            return None
+
+    def _start_frame_sampler(self) -> None:
+        if not self.CAPTURE_LOOKBACK_ENABLED:
+            return
+        self.frame_buffer.clear()
+        self._frame_sampler = FrameSampler(self._get_capture_backend(), self.frame_buffer,
+                                           interval=self.CAPTURE_SAMPLE_INTERVAL_SECONDS,
+                                           region=self.current_session.capture_region if self.current_session else None)
+        self._frame_sampler.start()
+
+    def _stop_frame_sampler(self) -> None:
+        if self._frame_sampler:
+            self._frame_sampler.stop()
+            self._frame_sampler = None
+
+    def _start_stats_reconciler(self) -> None:
+        session = self.current_session
+        self._reconcile_stop_event.clear()
+        self._reconcile_thread = threading.Thread(target=self._reconcile_stats_loop, args=(session,),
+                                                  name="capture-stats-reconcile", daemon=True)
+        self._reconcile_thread.start()
+
+    def _stop_stats_reconciler(self) -> None:
+        self._reconcile_stop_event.set()
+        if self._reconcile_thread is not None:
+            self._reconcile_thread.join(timeout=5)
+            self._reconcile_thread = None
+
+    def _reconcile_stats_loop(self, session: ScreenCaptureSession) -> None:
+        """Re-read the session's file sizes now and then, the running totals miss external deletions"""
+        while not self._reconcile_stop_event.wait(self.CAPTURE_STATS_RECONCILE_INTERVAL_SECONDS):
+            try:
+                missing = session.stats_tracker.reconcile()
+                if missing:
+                    logger.warning(f"{missing} files of capture session {session.command_uuid} are missing")
+            except Exception as e:
+                logger.error(f"Session statistics reconciliation failed: {str(e)}")
+
     def _take_screenshot(self, event_description: str, x: Optional[int] = None, y: Optional[int] = None, 
                        key_char: Optional[str] = None, key_code: Optional[str] = None, 
-                       is_special_key: bool = False, mouse_event_tool_tip: Optional[str] = None) -> str:
-        """Take a screenshot and create a capture event"""
+                       is_special_key: bool = False, mouse_event_tool_tip: Optional[str] = None,
+                       lookback_time: Optional[float] = None) -> str:
+        """Grab a screenshot and queue it for writing; the capture event is created once it is saved.
+        
+        Runs on the input listener threads, so it only grabs the frame into memory.
+        """
         try:
             self._validate_session()
             
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S_%f')
+            captured_at = datetime.now()
+            timestamp = captured_at.strftime('%Y%m%d_%H%M%S_%f')
             filename = f'screenshot_{timestamp}.png'
             if not self.current_session or not self.current_session.raw_dir:
                 raise SessionError("Session raw directory not initialized")
             filepath = os.path.join(str(self.current_session.raw_dir), filename)
             
             try:
-                screenshot = pyautogui.screenshot()
-                screenshot.save(filepath)
+                frame = self._grab_frame(lookback_time)
             except Exception as e:
-                raise CaptureError(f"Failed to capture or save screenshot: {str(e)}")
+                raise CaptureError(f"Failed to capture screenshot: {str(e)}")
             
-            logger.debug(f"Screenshot saved: {filepath}")
-            
-            # Create capture event with any provided input context
-            event = self._create_capture_event(
+            event_kwargs = dict(
                 description=event_description,
-                screenshot_path=filepath,
                 mouse_x=x,
                 mouse_y=y,
                 key_char=key_char,
                 key_code=key_code,
                 is_special_key=is_special_key,
-                mouse_event_tool_tip=mouse_event_tool_tip
+                mouse_event_tool_tip=mouse_event_tool_tip,
+                capture_origin=frame.origin if self.current_session.capture_region else None
             )
-            if event:
-                # Instead of notifying for each event, notify about the updated list
-                self.notify_session_observers()
+            session = self.current_session
+            with self._dedup_lock:
+                signature, similarity_score = self._compare_to_last_stored_frame(session, frame)
+                event_kwargs["similarity_score"] = similarity_score
+                is_duplicate = similarity_score is not None and similarity_score >= self.CAPTURE_DEDUP_THRESHOLD
+                if is_duplicate:
+                    # Only the event is created, it references the stored image
+                    filepath = str(session.queued_dedup_screenshot_path)
+                    logger.debug(f"Near-duplicate frame ({similarity_score:.5f}), reusing {filepath}")
+                
+                # Create capture event with any provided input context once the frame is written
+                job = CaptureJob(
+                    image=None if is_duplicate else frame.to_pil(),
+                    path=filepath,
+                    timestamp=captured_at,
+                    context=(session, event_kwargs, is_duplicate, signature),
+                    metadata={CAPTURE_ORIGIN_KEY: format_capture_origin(frame.origin)} if session.capture_region else {}
+                )
+                if not self._capture_writer.submit(job):
+                    logger.warning(f"Screenshot dropped, capture writer is behind: {event_description}")
+                elif not is_duplicate and signature is not None:
+                    # The written frame is only recorded once the write succeeds
+                    session.queued_dedup_signature = signature
+                    session.queued_dedup_screenshot_path = filepath
             
             return filepath
         except Exception as e:
             logger.error(f"Screenshot capture failed: {str(e)}")
             raise
 
+    def _compare_to_last_stored_frame(self, session: ScreenCaptureSession,
+                                      frame: Frame) -> tuple[Optional[FrameSignature], Optional[float]]:
+        """Get the frame's signature and its similarity to the session's last stored frame"""
+        if not self.CAPTURE_DEDUP_ENABLED:
+            return None, None
+        signature = compute_signature(frame.rgb)
+        if session.queued_dedup_signature is None:
+            return signature, None
+        return signature, similarity(session.queued_dedup_signature, signature)
+
+    def _on_screenshot_written(self, job: CaptureJob) -> None:
+        """Create the capture event of a saved screenshot and notify observers (capture writer thread)"""
+        session, event_kwargs, is_duplicate, signature = job.context
+        if session is not self.current_session:
+            logger.warning(f"Discarding screenshot of a previous session: {job.path}")
+            return
+        
+        logger.debug(f"Screenshot saved: {job.path}")
+        if is_duplicate:
+            # Jobs commit in capture order, so the referenced image is the last one written unless its write failed
+            if job.path != session.dedup_screenshot_path:
+                raise CaptureError(f"Referenced screenshot was not written: {job.path}")
+            event_kwargs = dict(event_kwargs, duplicate_of_event_id=session.dedup_event_id)
+        else:
+            session.stats_tracker.record_file(job.path, job.bytes_written)
+        with session.event_lock:
+            event = self._create_capture_event(screenshot_path=job.path, timestamp=job.timestamp,
+                                               thumbnail_paths=job.thumbnail_paths or None, **event_kwargs)
+            if event and not is_duplicate:
+                with self._dedup_lock:
+                    session.dedup_signature = signature
+                    session.dedup_screenshot_path = job.path
+                    session.dedup_event_id = event.event_id
+            if event:
+                if session.journal:
+                    session.journal.put([event_to_dict(event)])
+                # Instead of notifying for each event, notify about the updated list
+                self.notify_session_observers()
+                self._publish_delta(CaptureDeltaType.APPEND, events=[event])
+
+    def _on_screenshot_failed(self, job: CaptureJob) -> None:
+        """Stop later frames from referencing a screenshot that was not written (capture writer thread)"""
+        session, _, is_duplicate, _ = job.context
+        if is_duplicate:
+            return
+        with self._dedup_lock:
+            if session.queued_dedup_screenshot_path == job.path:
+                session.queued_dedup_signature = session.dedup_signature
+                session.queued_dedup_screenshot_path = session.dedup_screenshot_path
+
+    def _flush_capture_writer(self) -> None:
+        """Wait for the queued screenshots so the session's event list is complete"""
+        if not self._capture_writer.flush(timeout=self.CAPTURE_FLUSH_TIMEOUT_SECONDS):
+            logger.warning("Timed out waiting for pending screenshots to be written")
+
+    def get_capture_writer_metrics(self) -> CaptureWriterMetrics:
+        """Get the queue depth and write counters of the screenshot writer"""
+        return self._capture_writer.get_metrics()
+
     def _on_key_event_handler(self, key):
         """Handle keyboard events"""
         try:
@@ -435,6 +843,7 @@ class ScreenCaptureService(BaseService[List[ScreenshotEvent]]):
     def _on_click(self, x: int, y: int, button, pressed: bool):
         """Handle mouse click events"""
         if pressed:
+            click_time = time.monotonic()
             event_desc = f"Mouse clicked at ({x}, {y}) with {button}"
             logger.debug(f"Mouse event: {event_desc}")
             
@@ -456,48 +865,37 @@ class ScreenCaptureService(BaseService[List[ScreenshotEvent]]):
                 mouse_y=y
             )
             
-            # Take screenshot with mouse context
+            # Take screenshot with mouse context, showing the screen as it was when clicked
             self._take_screenshot(
                 event_description=event_desc,
                 x=x,
                 y=y,
-                mouse_event_tool_tip=mouse_tooltip
+                mouse_event_tool_tip=mouse_tooltip,
+                lookback_time=click_time
             )
 
     def _annotate_screenshot(self, event: ScreenshotEvent, x: Optional[int] = None, y: Optional[int] = None, 
                            text: Optional[str] = None):
-        """Create an annotated version of the screenshot"""
+        """Record the annotation overlay of a screenshot; the annotated image is rendered on demand"""
         screenshot_path = event.screenshot_path
         if not self.current_session or not self.current_session.annotated_dir:
             logger.warning("Attempted to annotate screenshot without active session")
             return
         
         try:
-            image = Image.open(screenshot_path)
-            draw = ImageDraw.Draw(image)
-
-            # Draw click location if coordinates provided
-            if x is not None and y is not None:
-                radius = 20
-                draw.ellipse((x - radius, y - radius, x + radius, y + radius), 
-                            outline='red', width=5)
-
-            # Add text annotation if provided
-            if text:
-                font_size = max(20, image.width // 30)
-                try:
-                    font = ImageFont.truetype("arial.ttf", font_size)
-                except IOError:
-                    logger.warning("Arial font not found, using default font")
-                    font = ImageFont.load_default()
-                draw.text((10, 10), text, fill='red', font=font)
+            if x is not None and y is not None and event.capture_origin:
+                # The overlay is drawn in the screenshot's pixels, the click is in screen coordinates
+                x, y = x - event.capture_origin[0], y - event.capture_origin[1]
+            event.annotation_overlay = AnnotationOverlay(x=x, y=y, label=text or None)
 
-            # Save annotated version
+            # Where the annotated image is served from, see utils/annotation_renderer.py
             filename = os.path.basename(screenshot_path)
-            annotated_path = os.path.join(self.current_session.annotated_dir, f'annotated_{filename}')
-            image.save(annotated_path)
-            logger.debug(f"Created annotated screenshot: {annotated_path}")
-            event.annotation_path = annotated_path
+            if event.duplicate_of_event_id:
+                # The screenshot is shared with another event, keep the annotations apart
+                name, ext = os.path.splitext(filename)
+                filename = f'{name}_{event.event_id[:8]}{ext}'
+            self.current_session.stats_tracker.set_annotation(
+                event, os.path.join(self.current_session.annotated_dir, f'annotated_{filename}'))
             
             # Create annotation event
             self._create_session_event(
@@ -508,6 +906,16 @@ class ScreenCaptureService(BaseService[List[ScreenshotEvent]]):
         except Exception as e:
             logger.error(f"Failed to annotate screenshot: {str(e)}")
 
+    def _annotate_session_screenshots(self) -> None:
+        """Record the annotation overlay of every screenshot of the current session"""
+        for event in self.current_session.screenshot_events:
+            if not isinstance(event, ScreenshotEvent) or not event.screenshot_path:
+                continue
+            if event.mouse_x is not None and event.mouse_y is not None:
+                self._annotate_screenshot(event, event.mouse_x, event.mouse_y, event.description)
+            else:
+                self._annotate_screenshot(event, text=event.description)
+
     def pre_start_capture(self, project_uuid: str, command_uuid: str) -> None:
         """Pre-start capture setup
         
@@ -553,8 +961,13 @@ class ScreenCaptureService(BaseService[List[ScreenshotEvent]]):
                     is_active=True,
                     start_time=datetime.now(),
                     raw_dir=raw_dir,
-                    annotated_dir=annotated_dir
+                    annotated_dir=annotated_dir,
+                    journal=get_session_journal(project_uuid, command_uuid)
                 )
+                self.current_session.capture_region = self._get_capture_region()
+                # Events of an earlier capture of this command are discarded with its screenshots
+                self.current_session.journal.reset()
+                get_session_catalog_instance().register_session(project_uuid, command_uuid, active=True)
                 
                 try:
                     if self.current_session.key_capture_config.should_process_only_by_key_release:
@@ -567,10 +980,13 @@ class ScreenCaptureService(BaseService[List[ScreenshotEvent]]):
                         )
                     self.current_session.mouse_listener = mouse.Listener(on_click=self._on_click)
                     
+                    # Sample first so the first click already has a frame to look back to
+                    self._start_frame_sampler()
                     self.current_session.keyboard_listener.start()
                     self.current_session.mouse_listener.start()
                 except Exception as e:
                     raise SessionError(f"Failed to initialize input listeners: {str(e)}")
+                self._start_stats_reconciler()
                 
                 # Create session start event
                 event = self._create_session_event(
@@ -581,8 +997,12 @@ class ScreenCaptureService(BaseService[List[ScreenshotEvent]]):
                     self.set_state('capturing', True)
                     
                 self.notify_session_observers()
+                self._publish_delta(CaptureDeltaType.RESET)
                     
             except Exception as e:
+                self._stop_frame_sampler()
+                self._stop_stats_reconciler()
+                get_session_catalog_instance().release_session(project_uuid, command_uuid)
                 self.current_session = None
                 logger.error(f"Failed to start capture: {str(e)}")
                 raise
@@ -593,20 +1013,18 @@ class ScreenCaptureService(BaseService[List[ScreenshotEvent]]):
             self._validate_session()
             
             # Get screenshots with their annotations
-            screenshot_pairs = []
-            for event in self.current_session.screenshot_events:
-                if event.screenshot_path:
-                    screenshot_pairs.append((event.screenshot_path, event.annotation_path))
+            screenshot_events = [event for event in self.current_session.screenshot_events
+                                 if event.screenshot_path]
             
-            if not screenshot_pairs:
+            if not screenshot_events:
                 logger.warning("No screenshots found for session summary")
                 return None
             
             # Sort screenshots by timestamp to maintain order
-            screenshot_pairs.sort(key=lambda x: os.path.basename(x[0])) # type: ignore
+            screenshot_events.sort(key=lambda event: os.path.basename(event.screenshot_path))
             
             # Create a grid layout
-            n_images = len(screenshot_pairs) * 2  # Both raw and annotated versions
+            n_images = len(screenshot_events) * 2  # Both raw and annotated versions
             grid_size = math.ceil(math.sqrt(n_images))
             
             # Calculate thumbnail size and create canvas
@@ -626,7 +1044,8 @@ class ScreenCaptureService(BaseService[List[ScreenshotEvent]]):
                 font = ImageFont.load_default()
             
             # Place images in grid
-            for idx, (raw_path, annotated_path) in enumerate(screenshot_pairs):
+            for idx, event in enumerate(screenshot_events):
+                raw_path = event.screenshot_path
                 # Position for raw screenshot
                 row = (idx * 2) // grid_size
                 col = (idx * 2) % grid_size
@@ -634,18 +1053,27 @@ class ScreenCaptureService(BaseService[List[ScreenshotEvent]]):
                 y = row * (thumb_height + padding)
                 
                 try:
-                    if os.path.exists(raw_path):
-                        # Add raw screenshot
-                        raw_img = Image.open(raw_path)
-                        raw_thumb = raw_img.resize((thumb_width, thumb_height), Image.Resampling.LANCZOS)
-                        canvas.paste(raw_thumb, (x, y))
-                        draw.text((x + 5, y + 5), f"Raw #{idx + 1}", fill='red', font=font)
+                    if not os.path.exists(raw_path):
+                        continue
+                    # Opening only reads the header, the full frame is not decoded
+                    with Image.open(raw_path) as raw_img:
+                        raw_width, raw_height = raw_img.size
+                    # Add raw screenshot from its stored thumbnail, decoded once for both versions
+                    preview_path = event.get_preview_path(thumb_width)
+                    if not os.path.exists(preview_path):
+                        preview_path = raw_path
+                    with Image.open(preview_path) as preview_img:
+                        raw_thumb = preview_img.convert('RGB')
+                    if raw_thumb.size != (thumb_width, thumb_height):
+                        raw_thumb = raw_thumb.resize((thumb_width, thumb_height), Image.Resampling.LANCZOS)
+                    canvas.paste(raw_thumb, (x, y))
+                    draw.text((x + 5, y + 5), f"Raw #{idx + 1}", fill='red', font=font)
                     
-                    # Add annotated version if it exists
-                    if annotated_path and os.path.exists(annotated_path):
-                        anno_img = Image.open(annotated_path)
-                        anno_thumb = anno_img.resize((thumb_width, thumb_height), Image.Resampling.LANCZOS)
-                        canvas.paste(anno_thumb, (x + thumb_width + padding, y))
+                    # Add annotated version, drawn onto the thumbnail
+                    if event.annotation_overlay:
+                        draw_annotation(raw_thumb, event.annotation_overlay, source_width=raw_width,
+                                        scale=(thumb_width / raw_width, thumb_height / raw_height))
+                        canvas.paste(raw_thumb, (x + thumb_width + padding, y))
                         draw.text((x + thumb_width + padding + 5, y + 5), 
                                 f"Annotated #{idx + 1}", fill='red', font=font)
                 except Exception as e:
@@ -660,6 +1088,7 @@ class ScreenCaptureService(BaseService[List[ScreenshotEvent]]):
             summary_path = os.path.join(summary_dir, 'session_summary.png')
             canvas.save(summary_path)
             logger.info(f"Created session summary at: {summary_path}")
+            get_session_catalog_instance().record_artifact(summary_path, ARTIFACT_SUMMARY)
             
             if show_preview:
                 canvas.show()
@@ -684,14 +1113,13 @@ class ScreenCaptureService(BaseService[List[ScreenshotEvent]]):
                         self.current_session.mouse_listener.stop()
                 except Exception as e:
                     logger.error(f"Error stopping listeners: {str(e)}")
+                self._stop_frame_sampler()
+                self._stop_stats_reconciler()
+                
+                self._flush_capture_writer()
                 
                 # Process all screenshots and create annotations
-                for event in self.current_session.screenshot_events:
-                    if isinstance(event, ScreenshotEvent) and event.screenshot_path:
-                        if event.mouse_x is not None and event.mouse_y is not None:
-                            self._annotate_screenshot(event, event.mouse_x, event.mouse_y, event.description)
-                        else:
-                            self._annotate_screenshot(event, text=event.description)
+                self._annotate_session_screenshots()
                 
                 # Create session summary
                 summary_path = self.create_session_summary()
@@ -720,6 +1148,10 @@ class ScreenCaptureService(BaseService[List[ScreenshotEvent]]):
                     self._session_history.append(stats)
                     
                 self.notify_session_observers()
+                # Annotation set every event's annotation_path
+                self._publish_delta(CaptureDeltaType.UPDATE, events=self.current_session.screenshot_events)
+                get_session_catalog_instance().release_session(
+                    self.current_session.project_uuid, self.current_session.command_uuid)
                 # export screenshot events list to a json file
                 self.export_screenshot_events_to_json()
                 
@@ -741,22 +1173,27 @@ class ScreenCaptureService(BaseService[List[ScreenshotEvent]]):
                         self.current_session.mouse_listener.stop()
                 except Exception as e:
                     logger.error(f"Error stopping listeners: {str(e)}")
+                self._stop_frame_sampler()
+                self._stop_stats_reconciler()
+                
+                self._flush_capture_writer()
                 
                 # Remove the latest event which would be the click that initiated the stop request
-                if self.current_session.screenshot_events and len(self.current_session.screenshot_events) > 0:
-                    logger.info("Removing last screenshot event that triggered the stop capture")
-                    # delete the last screenshot file
-                    if self.current_session.screenshot_events[-1].screenshot_path:
-                        os.remove(self.current_session.screenshot_events[-1].screenshot_path)
-                    self.current_session.screenshot_events.pop()
+                with self.current_session.event_lock:
+                    if self.current_session.screenshot_events and len(self.current_session.screenshot_events) > 0:
+                        logger.info("Removing last screenshot event that triggered the stop capture")
+                        removed_event = self.current_session.pop_screenshot_event()
+                        # delete the last screenshot and its thumbnails, unless a near-duplicate event still uses them
+                        self._remove_unreferenced_files(
+                            [asdict(removed_event)],
+                            [asdict(event) for event in self.current_session.screenshot_events]
+                        )
+                        if self.current_session.journal:
+                            self.current_session.journal.delete([removed_event.event_id])
+                        self._publish_delta(CaptureDeltaType.DELETE, deleted_event_ids=[removed_event.event_id])
                 
                 # Process all screenshots and create annotations
-                for event in self.current_session.screenshot_events:
-                    if isinstance(event, ScreenshotEvent) and event.screenshot_path:
-                        if event.mouse_x is not None and event.mouse_y is not None:
-                            self._annotate_screenshot(event, event.mouse_x, event.mouse_y, event.description)
-                        else:
-                            self._annotate_screenshot(event, text=event.description)
+                self._annotate_session_screenshots()
                 
                 # Create session summary
                 summary_path = self.create_session_summary()
@@ -785,6 +1222,10 @@ class ScreenCaptureService(BaseService[List[ScreenshotEvent]]):
                     self._session_history.append(stats)
                     
                 self.notify_session_observers()
+                # Annotation set every event's annotation_path
+                self._publish_delta(CaptureDeltaType.UPDATE, events=self.current_session.screenshot_events)
+                get_session_catalog_instance().release_session(
+                    self.current_session.project_uuid, self.current_session.command_uuid)
                 # export screenshot events list to a json file
                 self.export_screenshot_events_to_json()
                 
@@ -798,13 +1239,14 @@ class ScreenCaptureService(BaseService[List[ScreenshotEvent]]):
         """Update screenshot events after client-side editing.
         
         This method:
-        1. Loads the existing screenshot events from the JSON file
+        1. Loads the existing screenshot events from the session journal
         2. If deleted_events_ids provided:
            - Deletes screenshots and annotations from filesystem for those events
            - Updates the JSON with remaining events
         3. If updated_events provided:
            - Merges updates with existing events (replacing events with same ID)
            - Identifies and removes events that exist in original but not in updated list
+        Only the changed and removed events are appended to the journal.
         
         Args:
             project_uuid: Project identifier
@@ -826,48 +1268,44 @@ class ScreenCaptureService(BaseService[List[ScreenshotEvent]]):
             base_dir = os.path.join('data', project_uuid, command_uuid)
             if not os.path.exists(base_dir):
                 raise DirectoryError(f"Directory not found for project {project_uuid}, command {command_uuid}")
+            get_session_catalog_instance().mark_used(project_uuid, command_uuid)
             
-            json_path = os.path.join(base_dir, f'screenshot_events_{command_uuid}.json')
-            
-            # Load existing events from JSON file
-            if not os.path.exists(json_path):
-                raise SessionError(f"Screenshot events file not found: {json_path}")
+            # Load existing events from the session journal
+            journal = get_session_journal(project_uuid, command_uuid)
+            if not journal.exists():
+                raise SessionError(f"Screenshot events file not found: {journal.snapshot_path}")
             
             try:
-                with open(json_path, 'r', encoding='utf-8') as f:
-                    original_events_data = json.load(f)
+                original_events_data = journal.load()
             except json.JSONDecodeError as e:
                 raise SessionError(f"Invalid JSON in screenshot events file: {str(e)}")
+            # Compared with the client's events in the same form
+            original_events_by_id = {event['event_id']: normalize_event_dict(event) for event in original_events_data}
             
             # For backward compatibility: Handle deleted_events_ids
             if deleted_events_ids:
                 # Delete files and filter events
-                new_events_data = []
-                for event_dict in original_events_data:
-                    if event_dict['event_id'] in deleted_events_ids:
-                        if event_dict['screenshot_path'] and os.path.exists(event_dict['screenshot_path']):
-                            os.remove(event_dict['screenshot_path'])
-                        if event_dict['annotation_path'] and os.path.exists(event_dict['annotation_path']):
-                            os.remove(event_dict['annotation_path'])
-                    else:
-                        new_events_data.append(event_dict)
+                new_events_data = [event_dict for event_dict in original_events_data
+                                   if event_dict['event_id'] not in deleted_events_ids]
+                removed_events_data = [event_dict for event_dict in original_events_data
+                                       if event_dict['event_id'] in deleted_events_ids]
+                self._remove_unreferenced_files(removed_events_data, new_events_data)
+                journal.delete(event_dict['event_id'] for event_dict in removed_events_data)
                 
                 logger.info(f"Deleted {len(deleted_events_ids)} events from {project_uuid}/{command_uuid}")
             
             # Handle updated events (includes tooltip edits)
             elif updated_events:
-                # Create a map of original events by ID for quick lookups
-                original_events_by_id = {event['event_id']: event for event in original_events_data}
-                
                 # Convert updated events to dict format
                 updated_events_data = []
                 updated_event_ids = set()
                 
                 for event in updated_events:
-                    event_dict = asdict(event)
-                    # Convert datetime to ISO format string if it's a datetime object
-                    if isinstance(event_dict['timestamp'], datetime):
-                        event_dict['timestamp'] = event_dict['timestamp'].isoformat()
+                    event_dict = normalize_event_dict(event_to_dict(event))
+                    original = original_events_by_id.get(event_dict['event_id'])
+                    if original:
+                        for key in SERVER_OWNED_EVENT_FIELDS:
+                            event_dict[key] = original[key]
                     updated_events_data.append(event_dict)
                     updated_event_ids.add(event_dict['event_id'])
                 
@@ -875,12 +1313,22 @@ class ScreenCaptureService(BaseService[List[ScreenshotEvent]]):
                 deleted_ids = set(original_events_by_id.keys()) - updated_event_ids
                 
                 # Delete files for events that were removed
-                for event_id in deleted_ids:
-                    event_dict = original_events_by_id[event_id]
-                    if event_dict['screenshot_path'] and os.path.exists(event_dict['screenshot_path']):
-                        os.remove(event_dict['screenshot_path'])
-                    if event_dict['annotation_path'] and os.path.exists(event_dict['annotation_path']):
-                        os.remove(event_dict['annotation_path'])
+                self._remove_unreferenced_files(
+                    [original_events_by_id[event_id] for event_id in deleted_ids],
+                    updated_events_data
+                )
+                
+                # Journal entries keep the original order and append new events at the end
+                kept_ids = [event['event_id'] for event in original_events_data if event['event_id'] not in deleted_ids]
+                new_ids = [event['event_id'] for event in updated_events_data if event['event_id'] not in original_events_by_id]
+                if [event['event_id'] for event in updated_events_data] == kept_ids + new_ids:
+                    # Journal only what changed, an edited tooltip is one appended line
+                    journal.delete(deleted_ids)
+                    journal.put(event_dict for event_dict in updated_events_data
+                                if event_dict != original_events_by_id.get(event_dict['event_id']))
+                else:
+                    # Reordered by the client, store the new order
+                    journal.compact(updated_events_data)
                 
                 new_events_data = updated_events_data
                 logger.info(f"Updated {len(updated_events)} events for {project_uuid}/{command_uuid}")
@@ -889,33 +1337,109 @@ class ScreenCaptureService(BaseService[List[ScreenshotEvent]]):
                 # No updates or deletions specified
                 logger.warning("No updates or deletions specified in update request")
                 new_events_data = original_events_data
-            
-            # Write updated event data back to file
-            with open(json_path, 'w', encoding='utf-8') as f:
-                json.dump(new_events_data, f, indent=2, ensure_ascii=False)
                 
             # Convert JSON data back to ScreenshotEvent objects
-            updated_events_list = []
-            for event_dict in new_events_data:
-                # Convert ISO format string back to datetime if needed
-                if isinstance(event_dict.get('timestamp'), str):
-                    event_dict['timestamp'] = datetime.fromisoformat(event_dict['timestamp']) # type: ignore
-                event = ScreenshotEvent(**event_dict)
-                updated_events_list.append(event)
+            updated_events_list = [event_from_dict(event_dict) for event_dict in new_events_data]
             
             logger.info(f"Successfully updated screenshot events for {project_uuid}/{command_uuid}")
-            self.current_session.screenshot_events = updated_events_list
+            with self.current_session.event_lock:
+                previous_events = self.current_session.screenshot_events
+                self.current_session.set_screenshot_events(updated_events_list)
+                self._publish_list_changes(previous_events, updated_events_list)
             return updated_events_list
             
         except Exception as e:
             logger.error(f"Failed to update screenshot events: {str(e)}")
             raise DirectoryError(f"Screenshot events update failed: {str(e)}")
 
+    @staticmethod
+    def _remove_unreferenced_files(removed_events: List[dict], remaining_events: List[dict]) -> None:
+        """Delete the images of removed events that no remaining event references"""
+        def event_files(event_dict: dict) -> List[Optional[str]]:
+            return [event_dict.get('screenshot_path'), event_dict.get('annotation_path'),
+                    *(event_dict.get('thumbnail_paths') or {}).values()]
+
+        referenced = set()
+        for event_dict in remaining_events:
+            referenced.update(event_files(event_dict))
+        for event_dict in removed_events:
+            for path in event_files(event_dict):
+                if path and path not in referenced and os.path.exists(path):
+                    os.remove(path)
+                    # Several removed events may share the file
+                    referenced.add(path)
+
     def notify_session_observers(self):
         """Notify observers with the current list of screenshots"""
         if self.current_session:
             self.notify_observers(self.current_session.screenshot_events)
 
+    def add_delta_observer(self, observer: Observer[CaptureDelta]) -> None:
+        """Add an observer notified with a CaptureDelta for every change to the screenshot event list"""
+        self._delta_observable.add_observer(observer)
+
+    def remove_delta_observer(self, observer: Observer[CaptureDelta]) -> None:
+        """Remove a screenshot event list delta observer"""
+        self._delta_observable.remove_observer(observer)
+
+    def _publish_delta(self, delta_type: CaptureDeltaType, events: Sequence[ScreenshotEvent] = (),
+                       deleted_event_ids: Sequence[str] = ()) -> None:
+        """Number a change to the current session's event list and notify the delta observers"""
+        session = self.current_session
+        if not session:
+            return
+        # Callers that changed the event list already hold the lock, so deltas go out in sequence order
+        with session.event_lock:
+            session.delta_sequence += 1
+            if delta_type == CaptureDeltaType.RESET:
+                events = session.screenshot_events
+            self._delta_observable.notify_observers(CaptureDelta(
+                project_uuid=session.project_uuid,
+                command_uuid=session.command_uuid,
+                sequence=session.delta_sequence,
+                type=delta_type,
+                is_active=session.is_active,
+                events=list(events),
+                deleted_event_ids=list(deleted_event_ids)
+            ))
+
+    def _publish_list_changes(self, previous_events: List[ScreenshotEvent], new_events: List[ScreenshotEvent]) -> None:
+        """Publish the deltas that turn previous_events into new_events"""
+        previous_by_id = {event.event_id: event for event in previous_events}
+        new_ids = {event.event_id for event in new_events}
+        kept = [event for event in new_events if event.event_id in previous_by_id]
+        added = new_events[len(kept):]
+        if any(event.event_id in previous_by_id for event in added) or \
+                [e.event_id for e in kept] != [e.event_id for e in previous_events if e.event_id in new_ids]:
+            # Reordered or inserted mid-list: appends, updates and deletes cannot express it
+            self._publish_delta(CaptureDeltaType.RESET)
+            return
+
+        deleted_ids = [event.event_id for event in previous_events if event.event_id not in new_ids]
+        changed = [event for event in kept if event != previous_by_id[event.event_id]]
+        if deleted_ids:
+            self._publish_delta(CaptureDeltaType.DELETE, deleted_event_ids=deleted_ids)
+        if changed:
+            self._publish_delta(CaptureDeltaType.UPDATE, events=changed)
+        if added:
+            self._publish_delta(CaptureDeltaType.APPEND, events=added)
+
+    def get_capture_snapshot(self) -> Optional[CaptureDelta]:
+        """Get the full event list of the current session as a RESET delta at the current sequence number"""
+        session = self.current_session
+        if not session:
+            return None
+        with session.event_lock:
+            return CaptureDelta(
+                project_uuid=session.project_uuid,
+                command_uuid=session.command_uuid,
+                sequence=session.delta_sequence,
+                type=CaptureDeltaType.RESET,
+                is_active=session.is_active,
+                events=list(session.screenshot_events),
+                deleted_event_ids=[]
+            )
+
     def get_current_session_stats(self) -> Optional[SessionStatistics]:
         """Get statistics for the current session"""
         if not self.current_session:
@@ -931,43 +1455,12 @@ class ScreenCaptureService(BaseService[List[ScreenshotEvent]]):
         return dict(self._event_stats)
 
     def cleanup_old_sessions(self, days_to_keep: int = 7) -> None:
-        """Clean up screenshot directories older than specified days"""
-        try:
-            base_dir = os.path.join('data')
-            if not os.path.exists(base_dir):
-                return
-
-            cutoff_date = datetime.now() - timedelta(days=days_to_keep)
-            
-            # Iterate through project directories
-            for project_uuid in os.listdir(base_dir):
-                project_dir = os.path.join(base_dir, project_uuid)
-                if not os.path.isdir(project_dir):
-                    continue
-                
-                # Iterate through command directories
-                for command_uuid in os.listdir(project_dir):
-                    command_dir = os.path.join(project_dir, command_uuid)
-                    if not os.path.isdir(command_dir):
-                        continue
-                    
-                    # Check directory modification time
-                    mod_time = datetime.fromtimestamp(os.path.getmtime(command_dir))
-                    if mod_time < cutoff_date:
-                        try:
-                            shutil.rmtree(command_dir)
-                            logger.info(f"Cleaned up old session directory: {project_uuid}/{command_uuid}")
-                        except Exception as e:
-                            logger.error(f"Failed to clean up directory {project_uuid}/{command_uuid}: {str(e)}")
-                
-                # Remove empty project directories
-                try:
-                    if not os.listdir(project_dir):
-                        os.rmdir(project_dir)
-                        logger.info(f"Removed empty project directory: {project_uuid}")
-                except Exception as e:
-                    logger.error(f"Failed to remove empty project directory {project_uuid}: {str(e)}")
+        """Remove sessions not used for the specified days, then enforce the session size quota.
         
+        Sessions are found through the session catalog instead of walking the data directory.
+        """
+        try:
+            get_session_catalog_instance().enforce_retention(max_age_days=days_to_keep)
         except Exception as e:
             logger.error(f"Error during session cleanup: {str(e)}")
             raise DirectoryError(f"Session cleanup failed: {str(e)}")
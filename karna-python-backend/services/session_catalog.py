@@ -0,0 +1,383 @@
+"""
+Catalog of the capture sessions stored in data/<project_uuid>/<command_uuid>.
+
+The catalog is kept in the SQLite cache database and updated as sessions are
+captured and as artifacts derived from them (thumbnails, detection results,
+summaries) are written, and every read of a session marks it as used. It
+answers session lookups without probing the data directory, and drives
+retention: sessions not used for RETENTION_MAX_AGE_DAYS are removed, then the
+least recently used sessions are evicted until the data directory fits in
+RETENTION_MAX_BYTES.
+
+Retention deletes recordings, so it only runs on its own when
+RETENTION_ENABLED is set; the background scheduler then enforces it every
+RETENTION_INTERVAL_SECONDS. Sessions found on disk are catalogued as used
+when they are found, so enabling retention never removes a session the
+catalog has not seen age.
+
+Catalog failures are logged and never interrupt a capture.
+"""
+
+import logging
+import os
+import glob
+import shutil
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Set, Tuple
+
+from database.config import Base
+from database.models import CaptureSessionRecord, SessionArtifact
+from database.repositories.capture_session_repository import CaptureSessionRepository
+
+logger = logging.getLogger(__name__)
+
+ARTIFACT_THUMBNAILS = "thumbnails"
+ARTIFACT_DETECTIONS = "detections"
+ARTIFACT_SUMMARY = "summary"
+ARTIFACT_TILES = "tiles"
+
+# (project_uuid, command_uuid)
+SessionKey = Tuple[str, str]
+
+
+def _directory_size(path: str) -> int:
+    """Total size of the files below a directory, in bytes"""
+    total = 0
+    for root, _, files in os.walk(path):
+        for name in files:
+            try:
+                total += os.path.getsize(os.path.join(root, name))
+            except OSError:
+                # Removed while walking
+                continue
+    return total
+
+
+def is_session_dir(path: str) -> bool:
+    """Whether a directory holds a capture session: raw screenshots or a screenshot events file"""
+    return (os.path.isdir(os.path.join(path, "screenshots", "raw"))
+            or bool(glob.glob(os.path.join(glob.escape(path), "screenshot_events_*.json"))))
+
+
+class SessionCatalog:
+    """Index of capture sessions with size- and age-based retention"""
+
+    # Remove sessions automatically. Off by default: retention deletes recordings
+    RETENTION_ENABLED = False
+    RETENTION_MAX_BYTES = 20 * 1024 ** 3
+    RETENTION_MAX_AGE_DAYS = 30
+    RETENTION_INTERVAL_SECONDS = 15 * 60
+    # Reads of a session within this interval mark it as used only once
+    TOUCH_INTERVAL_SECONDS = 60
+
+    def __init__(self, data_dir: str = "data", repository: Optional[CaptureSessionRepository] = None):
+        """
+        Initialize the catalog.
+
+        Args:
+            data_dir: Root of the session directories.
+            repository: Repository of the catalog tables. Defaults to the cache database.
+        """
+        self.data_dir = data_dir
+        self._repository = repository or CaptureSessionRepository()
+        self._lock = threading.Lock()
+        self._tables_ready = False
+        # Sessions being captured, never evicted
+        self._active_sessions: Set[SessionKey] = set()
+        # Monotonic time each session was last marked as used
+        self._last_touched: Dict[SessionKey, float] = {}
+        self._scheduler_thread: Optional[threading.Thread] = None
+        self._scheduler_stop = threading.Event()
+
+    def get_session_dir(self, project_uuid: str, command_uuid: str) -> str:
+        return os.path.join(self.data_dir, project_uuid, command_uuid)
+
+    def register_session(self, project_uuid: str, command_uuid: str, active: bool = False) -> None:
+        """
+        Add a session to the catalog, or mark it as used if it is there.
+
+        Args:
+            project_uuid: Project identifier
+            command_uuid: Command identifier
+            active: Protect the session from eviction until release_session is called.
+        """
+        if active:
+            with self._lock:
+                self._active_sessions.add((project_uuid, command_uuid))
+        try:
+            with self._repository.get_db() as db:
+                self._ensure_tables(db)
+                self._repository.upsert_session(db, project_uuid, command_uuid)
+        except Exception as e:
+            logger.error(f"Failed to register session {project_uuid}/{command_uuid}: {str(e)}")
+
+    def release_session(self, project_uuid: str, command_uuid: str) -> None:
+        """Allow a session registered as active to be evicted again"""
+        with self._lock:
+            self._active_sessions.discard((project_uuid, command_uuid))
+
+    def mark_used(self, project_uuid: str, command_uuid: str) -> None:
+        """
+        Mark a session as used, at most once per TOUCH_INTERVAL_SECONDS.
+
+        Sessions captured before the catalog existed are added to it.
+
+        Args:
+            project_uuid: Project identifier
+            command_uuid: Command identifier
+        """
+        key = (project_uuid, command_uuid)
+        now = time.monotonic()
+        with self._lock:
+            last_touched = self._last_touched.get(key)
+            if last_touched is not None and now - last_touched < self.TOUCH_INTERVAL_SECONDS:
+                return
+            self._last_touched[key] = now
+        try:
+            with self._repository.get_db() as db:
+                self._ensure_tables(db)
+                if self._repository.touch(db, project_uuid, command_uuid):
+                    return
+        except Exception as e:
+            logger.error(f"Failed to mark session {project_uuid}/{command_uuid} as used: {str(e)}")
+            return
+        if is_session_dir(self.get_session_dir(project_uuid, command_uuid)):
+            self._import_session(project_uuid, command_uuid)
+
+    def update_session(self, project_uuid: str, command_uuid: str, frame_count: int, byte_size: int) -> None:
+        """
+        Record the frame count and size of a session's captured files.
+
+        Args:
+            project_uuid: Project identifier
+            command_uuid: Command identifier
+            frame_count: Number of screenshots.
+            byte_size: Bytes of the screenshots and annotations, without artifacts.
+        """
+        try:
+            with self._repository.get_db() as db:
+                self._ensure_tables(db)
+                self._repository.upsert_session(db, project_uuid, command_uuid,
+                                                frame_count=frame_count, byte_size=byte_size)
+        except Exception as e:
+            logger.error(f"Failed to update session {project_uuid}/{command_uuid}: {str(e)}")
+
+    def record_artifact(self, path: str, kind: str, byte_size: Optional[int] = None) -> None:
+        """
+        Record a file or directory derived from a session, sized into the session's total.
+
+        Args:
+            path: Path of the artifact inside the session directory. Paths outside the data directory are ignored.
+            kind: Artifact kind, e.g. ARTIFACT_DETECTIONS.
+            byte_size: Size in bytes. Defaults to the size on disk.
+        """
+        session = self._resolve_session(path)
+        if session is None:
+            return
+        project_uuid, command_uuid, relative_path = session
+        try:
+            if byte_size is None:
+                byte_size = _directory_size(path) if os.path.isdir(path) else os.path.getsize(path)
+            with self._repository.get_db() as db:
+                self._ensure_tables(db)
+                self._repository.record_artifact(db, project_uuid, command_uuid, kind, relative_path, byte_size)
+        except Exception as e:
+            logger.error(f"Failed to record {kind} artifact {path}: {str(e)}")
+
+    def find_session_dir(self, project_uuid: str, command_uuid: str) -> Optional[str]:
+        """
+        Look up a session directory and mark the session as used.
+
+        Sessions captured before the catalog existed are found on disk and added to it.
+
+        Args:
+            project_uuid: Project identifier
+            command_uuid: Command identifier
+
+        Returns:
+            Optional[str]: The session directory, or None if the session does not exist.
+        """
+        session_dir = self.get_session_dir(project_uuid, command_uuid)
+        try:
+            with self._repository.get_db() as db:
+                self._ensure_tables(db)
+                if self._repository.touch(db, project_uuid, command_uuid):
+                    with self._lock:
+                        self._last_touched[(project_uuid, command_uuid)] = time.monotonic()
+                    return session_dir
+        except Exception as e:
+            logger.error(f"Session catalog lookup failed for {project_uuid}/{command_uuid}: {str(e)}")
+            return session_dir if os.path.isdir(session_dir) else None
+
+        if not os.path.isdir(session_dir):
+            return None
+        if is_session_dir(session_dir):
+            self._import_session(project_uuid, command_uuid)
+        return session_dir
+
+    def import_existing_sessions(self) -> int:
+        """
+        Add the session directories on disk to an empty catalog, as used now.
+
+        Only directories holding screenshots or a screenshot events file are sessions.
+
+        Returns:
+            int: Number of sessions added.
+        """
+        with self._repository.get_db() as db:
+            self._ensure_tables(db)
+            if self._repository.count(db) > 0 or not os.path.isdir(self.data_dir):
+                return 0
+
+        imported = 0
+        for project_uuid in os.listdir(self.data_dir):
+            project_dir = os.path.join(self.data_dir, project_uuid)
+            if not os.path.isdir(project_dir):
+                continue
+            for command_uuid in os.listdir(project_dir):
+                if is_session_dir(os.path.join(project_dir, command_uuid)):
+                    self._import_session(project_uuid, command_uuid)
+                    imported += 1
+        logger.info(f"Imported {imported} existing capture sessions into the session catalog")
+        return imported
+
+    def enforce_retention(self, max_bytes: Optional[int] = None,
+                          max_age_days: Optional[float] = None) -> List[SessionKey]:
+        """
+        Remove expired sessions, then evict the least recently used ones until the quota is met.
+
+        Args:
+            max_bytes: Size quota of all sessions. Defaults to RETENTION_MAX_BYTES.
+            max_age_days: Remove sessions not used for this many days. Defaults to RETENTION_MAX_AGE_DAYS.
+
+        Returns:
+            List[SessionKey]: (project_uuid, command_uuid) of the removed sessions.
+        """
+        max_bytes = self.RETENTION_MAX_BYTES if max_bytes is None else max_bytes
+        max_age_days = self.RETENTION_MAX_AGE_DAYS if max_age_days is None else max_age_days
+        removed = []
+        with self._repository.get_db() as db:
+            self._ensure_tables(db)
+            cutoff = datetime.now() - timedelta(days=max_age_days)
+            for record in self._repository.find_not_accessed_since(db, cutoff):
+                key = (record.project_uuid, record.command_uuid)
+                if not self._is_active(key) and self._remove_session(db, record):
+                    removed.append(key)
+
+            total_size = self._repository.get_total_size(db)
+            if total_size > max_bytes:
+                for record in self._repository.find_least_recently_used(db):
+                    if total_size <= max_bytes:
+                        break
+                    key = (record.project_uuid, record.command_uuid)
+                    if self._is_active(key):
+                        continue
+                    session_size = self._repository.get_session_size(db, record)
+                    if self._remove_session(db, record):
+                        removed.append(key)
+                        total_size -= session_size
+
+        if removed:
+            logger.info(f"Session retention removed {len(removed)} sessions")
+        return removed
+
+    def start_scheduler(self) -> None:
+        """Enforce retention in a background thread every RETENTION_INTERVAL_SECONDS, if RETENTION_ENABLED"""
+        if not self.RETENTION_ENABLED:
+            logger.info("Session retention is disabled, sessions are only removed on request")
+            return
+        if self._scheduler_thread and self._scheduler_thread.is_alive():
+            return
+        self._scheduler_stop.clear()
+        self._scheduler_thread = threading.Thread(target=self._run_scheduler, name="session-retention",
+                                                  daemon=True)
+        self._scheduler_thread.start()
+
+    def stop_scheduler(self, timeout: float = 5.0) -> None:
+        self._scheduler_stop.set()
+        if self._scheduler_thread:
+            self._scheduler_thread.join(timeout=timeout)
+            self._scheduler_thread = None
+
+    def _run_scheduler(self) -> None:
+        try:
+            self.import_existing_sessions()
+        except Exception as e:
+            logger.error(f"Failed to import existing sessions: {str(e)}")
+        while True:
+            try:
+                self.enforce_retention()
+            except Exception as e:
+                logger.error(f"Session retention failed: {str(e)}")
+            if self._scheduler_stop.wait(self.RETENTION_INTERVAL_SECONDS):
+                return
+
+    def _ensure_tables(self, db) -> None:
+        """Create the catalog tables in databases created before the catalog migration"""
+        if self._tables_ready:
+            return
+        Base.metadata.create_all(bind=db.get_bind(),
+                                 tables=[CaptureSessionRecord.__table__, SessionArtifact.__table__])
+        self._tables_ready = True
+
+    def _is_active(self, key: SessionKey) -> bool:
+        with self._lock:
+            return key in self._active_sessions
+
+    def _resolve_session(self, path: str) -> Optional[Tuple[str, str, str]]:
+        """The project and command uuid of the session a path belongs to, and the path relative to the session"""
+        relative_path = os.path.relpath(os.path.abspath(path), os.path.abspath(self.data_dir))
+        parts = relative_path.replace("\\", "/").split("/")
+        if parts[0] == ".." or len(parts) < 3:
+            return None
+        return parts[0], parts[1], "/".join(parts[2:])
+
+    def _import_session(self, project_uuid: str, command_uuid: str) -> None:
+        """Catalog a session found on disk. Its age counts from now, not from its files' times"""
+        session_dir = self.get_session_dir(project_uuid, command_uuid)
+        try:
+            modified_at = datetime.fromtimestamp(os.path.getmtime(session_dir))
+            with self._repository.get_db() as db:
+                self._ensure_tables(db)
+                self._repository.upsert_session(db, project_uuid, command_uuid,
+                                                byte_size=_directory_size(session_dir),
+                                                created_at=modified_at, last_accessed_at=datetime.now())
+        except Exception as e:
+            logger.error(f"Failed to import session {project_uuid}/{command_uuid}: {str(e)}")
+
+    def _remove_session(self, db, record: CaptureSessionRecord) -> bool:
+        session_dir = self.get_session_dir(record.project_uuid, record.command_uuid)
+        try:
+            if os.path.isdir(session_dir):
+                shutil.rmtree(session_dir)
+        except Exception as e:
+            logger.error(f"Failed to remove session directory {record.project_uuid}/{record.command_uuid}: {str(e)}")
+            return False
+        self._repository.delete(db, record.uuid)
+        with self._lock:
+            self._last_touched.pop((record.project_uuid, record.command_uuid), None)
+        logger.info(f"Removed session {record.project_uuid}/{record.command_uuid}")
+
+        # Remove empty project directories
+        project_dir = os.path.join(self.data_dir, record.project_uuid)
+        try:
+            if os.path.isdir(project_dir) and not os.listdir(project_dir):
+                os.rmdir(project_dir)
+        except OSError as e:
+            logger.error(f"Failed to remove empty project directory {record.project_uuid}: {str(e)}")
+        return True
+
+
+_catalog: Optional[SessionCatalog] = None
+_catalog_lock = threading.Lock()
+
+
+def get_session_catalog_instance() -> SessionCatalog:
+    """Get the process-wide catalog of the sessions in data/"""
+    global _catalog
+    with _catalog_lock:
+        if _catalog is None:
+            _catalog = SessionCatalog()
+        return _catalog
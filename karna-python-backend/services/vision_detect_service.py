@@ -1,21 +1,82 @@
 from base import SingletonMeta
-from typing import List, Optional
+from base.base_observer import NotificationMode, Observable, Observer, Priority
+from typing import Dict, List, Optional, Set, Tuple
+import asyncio
+import copy
 import logging
+import queue
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
 from datetime import datetime
 import os
 import json
 from PIL import Image
 import uuid
 
-from inference import VisionDetectResultModelList
+from inference import VisionDetectResultModel, VisionDetectResultModelList
 from inference.yolo.yolo_ui_icon_merged_inference import Merged_UI_IconBBoxes
-from services.screen_capture_service import ScreenshotEvent
+from inference.yolo.model_registry import ModelRegistryStats, get_model_registry_instance
+from inference.yolo.tiling import get_pixel_rate_limiter_instance
+from services.screen_capture_service import ScreenCaptureService, ScreenshotEvent
 from services.base_service import BaseService
+from services.session_catalog import ARTIFACT_DETECTIONS, get_session_catalog_instance
 
 # Create a logger for this service
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
+@dataclass
+class VisionDetectResultDelta:
+    """
+    Result of a single frame, detected while a capture session is still recording.
+    """
+    project_uuid: str
+    command_uuid: str
+    result: VisionDetectResultModel
+    processed_count: int
+    pending_count: int
+
+
+def snapshot_sharing_images(data, images: List[Image.Image]):
+    """
+    Deep copy a payload while sharing its PIL images, which observers never modify.
+    
+    Args:
+        data: The payload to copy.
+        images: Images referenced by the payload that the copy should share.
+    """
+    memo = {id(image): image for image in images}
+    return copy.deepcopy(data, memo)
+
+
+class VisionDetectDeltaObservable(Observable[VisionDetectResultDelta]):
+    """
+    Observable of live detection deltas; one snapshot per delta is shared by all observers.
+    """
+    notification_mode = NotificationMode.SHARED_SNAPSHOT
+    
+    def _make_snapshot(self, data: VisionDetectResultDelta) -> VisionDetectResultDelta:
+        images = [data.result.cropped_image] if data.result.cropped_image is not None else []
+        return snapshot_sharing_images(data, images)
+
+
+class ScreenCaptureEventsObserver(Observer[List[ScreenshotEvent]]):
+    """
+    Observer of the ScreenCaptureService that feeds newly captured frames to live detection.
+    
+    The capture service notifies from its input listener threads, so this observer only
+    enqueues work and never runs inference itself.
+    """
+    
+    def __init__(self, service: "VisionDetectService"):
+        super().__init__(Priority.LOW)
+        self._service = service
+    
+    def update(self, data: List[ScreenshotEvent]) -> None:
+        self._service.enqueue_screenshot_events(data)
+
+
 class VisionDetectService(BaseService[VisionDetectResultModelList], metaclass=SingletonMeta):
     """
     Service for processing screenshot events and storing VisionDetectResultModelList.
@@ -26,6 +87,21 @@ class VisionDetectService(BaseService[VisionDetectResultModelList], metaclass=Si
     allowing observers to be notified when vision detection results change.
     """
     
+    # All observers (one per websocket client) share one snapshot of the results
+    notification_mode = NotificationMode.SHARED_SNAPSHOT
+    
+    # Evict YOLO models after this many idle seconds to free RAM on small machines (None keeps them loaded)
+    MODEL_IDLE_TIMEOUT_SECONDS: Optional[float] = None
+    # Cap on the pixels fed to the YOLO models per second, shared by every detection (None is unlimited)
+    MAX_DETECTION_PIXELS_PER_SECOND: Optional[float] = None
+    # Reuse detections stored in <session_dir>/detection_cache for unchanged screenshots
+    USE_DETECTION_CACHE: bool = True
+    # Detect frames while a capture session records. Disable on low-RAM machines: it runs the
+    # detection pipeline during capture on top of the capture itself
+    LIVE_DETECTION_ENABLED: bool = True
+    # Whether frames detected live during a capture session are cropped to the website render area
+    LIVE_DETECTION_SHOULD_CROP: bool = True
+    
     def __init__(self, screenshot_events: Optional[List[ScreenshotEvent]] = None):
         """
         Initialize the VisionDetectService.
@@ -37,17 +113,46 @@ class VisionDetectService(BaseService[VisionDetectResultModelList], metaclass=Si
             super().__init__()
             self._screenshot_events: List[ScreenshotEvent] = screenshot_events or []
             self._vision_detect_results: Optional[VisionDetectResultModelList] = None
+            # Live detection of frames as they are captured
+            self._delta_observable = VisionDetectDeltaObservable()
+            self._capture_observer: Optional[ScreenCaptureEventsObserver] = None
+            self._capture_service: Optional[ScreenCaptureService] = None
+            self._live_queue: "queue.Queue[Optional[ScreenshotEvent]]" = queue.Queue()
+            self._live_lock = threading.Lock()
+            self._live_session: Optional[Tuple[str, str]] = None
+            self._live_event_ids: Set[str] = set()
+            self._live_results: "OrderedDict[str, VisionDetectResultModel]" = OrderedDict()
+            self._live_worker: Optional[threading.Thread] = None
+            # Held around every detection run, so live and requested detections take turns
+            self._detection_lock = threading.Lock()
+            # Cached detections count toward their session's size in the catalog
+            Merged_UI_IconBBoxes.get_detection_cache().on_write = self._record_detections_artifact
             self._initialized = True
             # Set initial state
             self.set_state('has_results', False)
             self.set_state('processing', False)
             logger.info("VisionDetectService instance created")
     
+    @staticmethod
+    def _record_detections_artifact(path: str, byte_size: int) -> None:
+        get_session_catalog_instance().record_artifact(path, ARTIFACT_DETECTIONS, byte_size)
+    
+    def _make_snapshot(self, data: VisionDetectResultModelList) -> VisionDetectResultModelList:
+        """
+        Snapshot the results for observers without copying the cropped images.
+        """
+        images = [model.cropped_image for model in data.vision_detect_result_models if model.cropped_image is not None]
+        return snapshot_sharing_images(data, images)
+    
     async def initialize(self) -> None:
         """Initialize service resources"""
         try:
             logger.info("Initializing VisionDetectService...")
-            # No specific initialization needed at this point
+            registry = get_model_registry_instance()
+            registry.set_idle_timeout(self.MODEL_IDLE_TIMEOUT_SECONDS)
+            get_pixel_rate_limiter_instance().set_rate(self.MAX_DETECTION_PIXELS_PER_SECOND)
+            # Load the YOLO weights now so the first request does not pay for it
+            await asyncio.to_thread(Merged_UI_IconBBoxes.warm_up_models)
             logger.info("VisionDetectService initialized successfully")
         except Exception as e:
             logger.error(f"Failed to initialize VisionDetectService: {str(e)}")
@@ -56,6 +161,7 @@ class VisionDetectService(BaseService[VisionDetectResultModelList], metaclass=Si
     async def shutdown(self) -> None:
         """Clean up service resources"""
         logger.info("Shutting down VisionDetectService...")
+        self.detach_from_screen_capture()
         # Clear any stored results to free memory
         self._vision_detect_results = None
         self.set_state('has_results', False)
@@ -112,10 +218,12 @@ class VisionDetectService(BaseService[VisionDetectResultModelList], metaclass=Si
             command_uuid = self._screenshot_events[0].command_uuid if self._screenshot_events else str(uuid.uuid4())
             
             # Use the Merged_UI_IconBBoxes class to process the screenshot events
-            vision_detect_result_models = Merged_UI_IconBBoxes.get_inference_result_models_pil(
-                self._screenshot_events,
-                should_crop=should_crop
-            )
+            with self._detection_lock:
+                vision_detect_result_models = Merged_UI_IconBBoxes.get_inference_result_models_pil(
+                    self._screenshot_events,
+                    should_crop=should_crop,
+                    use_cache=self.USE_DETECTION_CACHE
+                )
             
             # Create a VisionDetectResultModelList from the result models
             self._vision_detect_results = VisionDetectResultModelList(
@@ -150,12 +258,166 @@ class VisionDetectService(BaseService[VisionDetectResultModelList], metaclass=Si
         """
         try:
             logger.info(f"Setting and processing {len(screenshot_events)} screenshot events")
+            # Detection reads the sessions' screenshots, so retention keeps them
+            for project_uuid, command_uuid in {(event.project_uuid, event.command_uuid) for event in screenshot_events}:
+                get_session_catalog_instance().mark_used(project_uuid, command_uuid)
             self.set_screenshot_events(screenshot_events)
             self.process_screenshot_events()
         except Exception as e:
             logger.error(f"Error setting and processing screenshot events: {str(e)}")
             raise
     
+    def attach_to_screen_capture(self, screen_capture_service: ScreenCaptureService) -> None:
+        """
+        Run detection on every frame as soon as the screen capture service captures it.
+        
+        Does nothing unless LIVE_DETECTION_ENABLED is set. Live frames are detected one at a
+        time on a worker thread, taking turns with process_screenshot_events.
+        
+        Args:
+            screen_capture_service: The capture service to observe.
+        """
+        if not self.LIVE_DETECTION_ENABLED:
+            logger.info("Live vision detection is disabled")
+            return
+        self.detach_from_screen_capture()
+        # Observables hold observers weakly, so the service keeps the strong reference
+        self._capture_observer = ScreenCaptureEventsObserver(self)
+        self._capture_service = screen_capture_service
+        screen_capture_service.add_observer(self._capture_observer)
+        
+        if self._live_worker is None or not self._live_worker.is_alive():
+            self._live_worker = threading.Thread(
+                target=self._live_detection_loop,
+                name="VisionDetectLiveWorker",
+                daemon=True
+            )
+            self._live_worker.start()
+        logger.info("Live vision detection attached to screen capture")
+    
+    def detach_from_screen_capture(self) -> None:
+        """
+        Stop observing the screen capture service and stop the live detection worker.
+        """
+        if self._capture_service is not None and self._capture_observer is not None:
+            self._capture_service.remove_observer(self._capture_observer)
+        self._capture_service = None
+        self._capture_observer = None
+        
+        if self._live_worker is not None and self._live_worker.is_alive():
+            self._live_queue.put(None)
+            self._live_worker.join(timeout=5)
+        self._live_worker = None
+    
+    def enqueue_screenshot_events(self, screenshot_events: List[ScreenshotEvent]) -> None:
+        """
+        Queue the frames of the capture session that have not been queued yet.
+        
+        The capture service always publishes its full event list. A list from another
+        session starts a new live session, and events that disappear from the list
+        (e.g. the click that stopped the capture) are dropped from the live results.
+        
+        Args:
+            screenshot_events: The current screenshot events of the capture session.
+        """
+        if not screenshot_events:
+            return
+        
+        session = (screenshot_events[0].project_uuid, screenshot_events[0].command_uuid)
+        current_ids = {event.event_id for event in screenshot_events}
+        with self._live_lock:
+            if session != self._live_session:
+                self._live_session = session
+                self._live_event_ids = set()
+                self._live_results = OrderedDict()
+            
+            for event_id in list(self._live_results.keys()):
+                if event_id not in current_ids:
+                    del self._live_results[event_id]
+            self._live_event_ids &= current_ids
+            
+            new_events = [event for event in screenshot_events if event.event_id not in self._live_event_ids]
+            for event in new_events:
+                self._live_event_ids.add(event.event_id)
+                self._live_queue.put(event)
+        
+        if new_events:
+            logger.info(f"Queued {len(new_events)} frames for live detection")
+            self.set_state('live_pending', self._live_queue.qsize())
+    
+    def _live_detection_loop(self) -> None:
+        while True:
+            event = self._live_queue.get()
+            if event is None:
+                break
+            try:
+                self._detect_live_event(event)
+            except Exception as e:
+                logger.error(f"Live detection failed for event {event.event_id}: {str(e)}")
+                self.set_state('last_error', str(e))
+            finally:
+                self._live_queue.task_done()
+    
+    def _detect_live_event(self, event: ScreenshotEvent) -> None:
+        with self._live_lock:
+            # Skip frames of an older session or frames removed since they were queued
+            if (event.project_uuid, event.command_uuid) != self._live_session or event.event_id not in self._live_event_ids:
+                return
+        
+        with self._detection_lock:
+            result_models = Merged_UI_IconBBoxes.get_inference_result_models_pil(
+                [event],
+                should_crop=self.LIVE_DETECTION_SHOULD_CROP,
+                use_cache=self.USE_DETECTION_CACHE
+            )
+        if not result_models:
+            return
+        
+        with self._live_lock:
+            if event.event_id not in self._live_event_ids:
+                return
+            self._live_results[event.event_id] = result_models[0]
+            processed_count = len(self._live_results)
+        
+        pending_count = self._live_queue.qsize()
+        self.set_state('live_pending', pending_count)
+        self._delta_observable.notify_observers(VisionDetectResultDelta(
+            project_uuid=event.project_uuid,
+            command_uuid=event.command_uuid,
+            result=result_models[0],
+            processed_count=processed_count,
+            pending_count=pending_count
+        ))
+    
+    def get_live_results(self) -> Optional[VisionDetectResultModelList]:
+        """
+        Get the results detected so far for the current capture session.
+        
+        Returns:
+            Optional[VisionDetectResultModelList]: The live results in capture order, or None if no session was observed.
+        """
+        with self._live_lock:
+            if self._live_session is None:
+                return None
+            project_uuid, command_uuid = self._live_session
+            return VisionDetectResultModelList(
+                project_uuid=project_uuid,
+                command_uuid=command_uuid,
+                vision_detect_result_models=list(self._live_results.values())
+            )
+    
+    def add_delta_observer(self, observer: Observer[VisionDetectResultDelta]) -> None:
+        """
+        Add an observer notified with a VisionDetectResultDelta for every live-detected frame.
+        """
+        self._delta_observable.add_observer(observer)
+    
+    def remove_delta_observer(self, observer: Observer[VisionDetectResultDelta]) -> None:
+        """
+        Remove a live detection observer.
+        """
+        self._delta_observable.remove_observer(observer)
+    
     def get_vision_detect_results(self) -> Optional[VisionDetectResultModelList]:
         """
         Get the processed vision detect results.
@@ -184,6 +446,15 @@ class VisionDetectService(BaseService[VisionDetectResultModelList], metaclass=Si
         
         return f"Processed {len(self._vision_detect_results.vision_detect_result_models)} vision detect results"
     
+    def get_model_stats(self) -> List[ModelRegistryStats]:
+        """
+        Get load-time and hit metrics of the YOLO models used by this service.
+        
+        Returns:
+            List[ModelRegistryStats]: Per-model registry statistics.
+        """
+        return get_model_registry_instance().get_stats()
+    
     def clear_results(self) -> None:
         """
         Clear the vision detect results.
@@ -0,0 +1,41 @@
+import pytest
+from api.websockets.vision_detect.bbox_encoding import (
+    decode_nested_bounding_box,
+    decode_packed_bounding_boxes,
+    encode_nested_bounding_box,
+    encode_packed_bounding_boxes,
+)
+from generated.vision_detect_pb2 import PackedBoundingBoxes, VisionDetectResultModel
+from inference import BoundingBox # type: ignore
+
+
+def test_packed_encoding_matches_nested_encoding():
+    boxes = [
+        BoundingBox(0, 0, 10, 10, "button", 0.9, id="a"),
+        BoundingBox(5, 7, 12, 3, "icon", 0.5, id="b"),
+        BoundingBox(100, 50, 20, 40, "button", 0.7, id="c"),
+    ]
+
+    message = VisionDetectResultModel()
+    message.packed_bboxes.CopyFrom(encode_packed_bounding_boxes(boxes))
+    packed = VisionDetectResultModel.FromString(message.SerializeToString()).packed_bboxes
+
+    assert list(packed.class_names) == ["button", "icon"]
+    assert list(packed.class_index) == [0, 1, 0]
+    decoded = list(decode_packed_bounding_boxes(packed))
+    assert decoded == [decode_nested_bounding_box(encode_nested_bounding_box(bbox)) for bbox in boxes]
+    assert [(b.x, b.y, b.width, b.height, b.id) for b in decoded] == [(b.x, b.y, b.width, b.height, b.id) for b in boxes]
+    assert len(decode_packed_bounding_boxes(encode_packed_bounding_boxes([]))) == 0
+
+def test_decode_rejects_malformed_columns():
+    packed = encode_packed_bounding_boxes([BoundingBox(0, 0, 10, 10, "button", 0.9, id="a")])
+
+    truncated = PackedBoundingBoxes()
+    truncated.CopyFrom(packed)
+    del truncated.width[:]
+    with pytest.raises(ValueError):
+        decode_packed_bounding_boxes(truncated)
+
+    packed.class_index[0] = 3
+    with pytest.raises(ValueError):
+        decode_packed_bounding_boxes(packed)
@@ -0,0 +1,95 @@
+# type: ignore
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from fastapi import WebSocket
+
+from api.websockets.fanout import FanoutHub
+from api.websockets.status.status_handler import StatusWebSocketHandler
+from domain.status import StatusContext
+
+
+def make_websocket() -> MagicMock:
+    mock = MagicMock(spec=WebSocket)
+    mock.accept = AsyncMock()
+    mock.send_bytes = AsyncMock()
+    return mock
+
+
+@pytest.mark.asyncio
+async def test_slow_client_does_not_stall_others():
+    """A blocked client keeps its bounded backlog while the others receive every message"""
+    hub = FanoutHub("test", max_queue_size=2, send_timeout=0.05)
+    fast = make_websocket()
+    slow = make_websocket()
+    release = asyncio.Event()
+
+    async def blocked_send(data):
+        await release.wait()
+    slow.send_bytes.side_effect = blocked_send
+
+    hub.add_client("fast", fast)
+    hub.add_client("slow", slow)
+    for i in range(5):
+        await hub.broadcast(b"msg%d" % i)
+
+    assert [c.args[0] for c in fast.send_bytes.call_args_list] == [b"msg%d" % i for i in range(5)]
+    # One message in flight plus a full queue, the rest were dropped oldest first
+    assert hub.get_stats()["slow"].dropped == 2
+
+    release.set()
+    await hub.drain()
+    assert [c.args[0] for c in slow.send_bytes.call_args_list] == [b"msg0", b"msg3", b"msg4"]
+    hub.remove_client("fast")
+    hub.remove_client("slow")
+
+
+@pytest.mark.asyncio
+async def test_slow_client_with_resync_message_gets_a_snapshot_instead_of_losing_messages():
+    """Pending messages of a client that has a resync message are replaced, never dropped one by one"""
+    hub = FanoutHub("test", max_queue_size=2, send_timeout=0.05,
+                    get_resync_message=lambda client_id: b"reset" if client_id == "slow" else None)
+    slow = make_websocket()
+    release = asyncio.Event()
+
+    async def blocked_send(data):
+        await release.wait()
+    slow.send_bytes.side_effect = blocked_send
+
+    hub.add_client("slow", slow)
+    for i in range(5):
+        await hub.broadcast(b"delta%d" % i)
+
+    release.set()
+    await hub.drain()
+    # delta1-3 were superseded by the snapshot, delta4 came after it
+    assert [c.args[0] for c in slow.send_bytes.call_args_list] == [b"delta0", b"reset", b"delta4"]
+    assert hub.get_stats()["slow"].resyncs == 2
+    hub.remove_client("slow")
+    # Let the cancelled sender task finish before the loop closes
+    await asyncio.sleep(0)
+
+
+@pytest.mark.asyncio
+async def test_handler_shares_one_observer_and_drops_failed_clients():
+    """Clients without a custom observer share one, and a failed send disconnects the client"""
+    handler = StatusWebSocketHandler()
+    first, second = make_websocket(), make_websocket()
+    await handler.connect(first)
+    await handler.connect(second)
+
+    observers = {conn.observer for conn in handler.active_connections.values()}
+    assert observers == {handler._shared_observer}
+
+    second.send_bytes.side_effect = RuntimeError("connection reset")
+    await handler.broadcast_system_status(StatusContext())
+    await asyncio.sleep(0)
+
+    first.send_bytes.assert_called_once()
+    assert str(id(second)) not in handler.active_connections
+    assert handler._shared_observer is not None
+
+    handler.disconnect(first)
+    assert handler._shared_observer is None
+    assert handler.fanout.client_count == 0
@@ -0,0 +1,65 @@
+import re
+
+import numpy as np
+import pytest
+from inference import BoundingBox, BoundingBoxArray # type: ignore
+
+
+@pytest.fixture
+def boxes():
+    return [
+        BoundingBox(0, 0, 10, 10, "button", 0.9, id="a"),
+        BoundingBox(5, 0, 10, 10, "icon", 0.5, id="b"),
+        BoundingBox(100, 50, 20, 40, "button", 0.7, id="c"),
+    ]
+
+def test_round_trips_boxes_and_builds_objects_lazily(boxes):
+    array = BoundingBoxArray.from_boxes(boxes)
+
+    assert list(array) == boxes
+    assert array[0] is boxes[0]
+    assert array == boxes
+
+    moved = array.translate(1.5, 2)
+    # Nothing is built until the boxes are used
+    assert moved._boxes is None
+    assert [(b.x, b.y, b.id) for b in moved] == [(1, 2, "a"), (6, 2, "b"), (101, 52, "c")]
+
+    renamed = array.with_new_ids()
+    assert [(b.x, b.y, b.class_name) for b in renamed] == [(b.x, b.y, b.class_name) for b in boxes]
+    assert len(set(renamed.ids) | {"a", "b", "c"}) == 6
+
+    detected = BoundingBoxArray.from_detections({0: "button", 3: "icon"}, np.array([[1.7, 2.2, 11.9, 7.5]] * 2),
+                                                np.array([3.0, 0.0]), np.array([0.4, 0.8]))
+    assert detected._ids is None
+    assert [(b.x, b.width, b.height, b.class_name) for b in detected] == [(1, 10, 5, "icon"), (1, 10, 5, "button")]
+    assert all(re.fullmatch(r"[0-9a-f]{8}-[0-9a-f]{4}-4[0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}", box_id)
+               for box_id in detected.ids)
+    # Ids are generated once
+    assert [b.id for b in detected] == list(detected.ids)
+
+def test_vectorised_geometry_and_selection(boxes):
+    array = BoundingBoxArray.from_boxes(boxes)
+
+    assert array.area().tolist() == [100, 100, 800]
+    assert array.iou(array)[0, 1] == pytest.approx(50 / 150)
+    assert array.containment(array.scale(2))[:, 0].tolist() == [1.0, 1.0, 0.0]
+    assert array.clip(110, 60).xyxy[2].tolist() == [100, 50, 110, 60]
+
+    assert [b.id for b in array.sort_by_confidence()] == ["a", "c", "b"]
+    assert [b.id for b in array.filter_confidence(0.6)] == ["a", "c"]
+    assert [b.id for b in array.filter_classes(["icon"])] == ["b"]
+    assert [b.id for b in array[array.widths > 15]] == ["c"]
+    assert [b.id for b in array.nms(0.3, class_aware=False)] == ["a", "c"]
+    assert len(array.nms(0.3)) == 3
+
+def test_concatenate_merges_class_tables(boxes):
+    first = BoundingBoxArray.from_boxes(boxes[:2])
+    second = BoundingBoxArray.from_boxes([BoundingBox(1, 1, 2, 2, "text", 0.3, id="d")])
+
+    joined = BoundingBoxArray.concatenate([first, second, []])
+
+    assert joined.class_table == ("button", "icon", "text")
+    assert joined.class_names.tolist() == ["button", "icon", "text"]
+    assert [b.id for b in joined] == ["a", "b", "d"]
+    assert len(BoundingBoxArray.concatenate([])) == 0
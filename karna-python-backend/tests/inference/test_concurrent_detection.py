@@ -0,0 +1,82 @@
+import numpy as np
+import pytest
+from inference.yolo import concurrent_detection, model_registry
+from inference.yolo.concurrent_detection import DetectorExecutor, ExecutionMode
+from inference.yolo.model_registry import get_model_registry_instance
+from inference.yolo.preprocess import PreprocessedFrame
+
+
+class FakeArray:
+    def __init__(self, values):
+        self.values = np.asarray(values, dtype=np.float32)
+
+    def cpu(self):
+        return self
+
+    def numpy(self):
+        return self.values
+
+class FakeResult:
+    def __init__(self, image, class_index):
+        # One box over the brightest pixel so results depend on the frame content
+        y, x = np.unravel_index(image[..., 0].argmax(), image.shape[:2])
+        self.boxes = type("Boxes", (), {
+            "xyxy": FakeArray([[x, y, x + 8, y + 8]]),
+            "cls": FakeArray([class_index]),
+            "conf": FakeArray([0.9]),
+        })()
+
+class FakeYOLO:
+    overrides = {"imgsz": 64}
+
+    def __init__(self, weights_path):
+        self.class_index = 1 if "icon" in weights_path else 0
+        self.names = {0: "ui", 1: "icon"}
+
+    def __call__(self, images, **kwargs):
+        return [FakeResult(image, self.class_index) for image in images]
+
+@pytest.fixture(autouse=True)
+def fake_models(monkeypatch):
+    monkeypatch.setattr(model_registry, "YOLO", FakeYOLO)
+    get_model_registry_instance().clear()
+    yield
+    get_model_registry_instance().clear()
+
+def make_frames(count):
+    frames = []
+    for index in range(count):
+        bgr = np.zeros((48, 64, 3), dtype=np.uint8)
+        bgr[10 + index, 20 + index] = 255
+        frames.append(PreprocessedFrame(bgr, f"frame_{index}.png"))
+    return frames
+
+def summarise(results):
+    return [(r.image_path, [(b.x, b.y, b.class_name) for b in r.bounding_boxes]) for r in results]
+
+def test_threaded_mode_matches_sequential():
+    sequential = DetectorExecutor(ExecutionMode.SEQUENTIAL).run(make_frames(5))
+    executor = DetectorExecutor(ExecutionMode.THREADED)
+    try:
+        threaded = executor.run(make_frames(5))
+    finally:
+        executor.shutdown()
+
+    assert [summarise(r) for r in threaded] == [summarise(r) for r in sequential]
+    assert {b.class_name for r in threaded[1] for b in r.bounding_boxes} == {"icon"}
+
+def test_shared_memory_worker_reads_frames_from_block(monkeypatch):
+    frames = make_frames(3)
+    monkeypatch.setattr(concurrent_detection, "_worker_prediction", concurrent_detection.YOLO_UI_Prediction())
+    captured = {}
+
+    class InlinePool:
+        def submit(self, fn, *args):
+            captured.setdefault("results", []).append(fn(*args))
+            return type("Done", (), {"result": lambda _self, r=captured["results"][-1]: r})()
+
+    executor = DetectorExecutor(ExecutionMode.PROCESS)
+    monkeypatch.setattr(executor, "_get_process_pool", lambda detector: InlinePool())
+    ui_results, _ = executor.run(frames)
+
+    assert summarise(ui_results) == summarise(DetectorExecutor().run(make_frames(3))[0])
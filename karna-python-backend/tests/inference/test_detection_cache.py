@@ -0,0 +1,67 @@
+import numpy as np
+
+from inference import BoundingBox, BoundingBoxResult
+from inference.yolo.detection_cache import DetectionCache, get_session_dir
+from inference.yolo.frame_loader import LoadedFrame # type: ignore
+from inference.yolo.yolo_ui_icon_merged_inference import Merged_UI_IconBBoxes # type: ignore
+
+
+def make_session(tmp_path):
+    raw_dir = tmp_path / "project" / "command" / "screenshots" / "raw"
+    raw_dir.mkdir(parents=True)
+    screenshot = raw_dir / "screenshot.png"
+    screenshot.write_bytes(b"fake png bytes")
+    weights = tmp_path / "weights.pt"
+    weights.write_bytes(b"weights")
+    return str(screenshot), str(weights)
+
+def test_result_round_trips_next_to_session(tmp_path):
+    screenshot, weights = make_session(tmp_path)
+    written = []
+    cache = DetectionCache(on_write=lambda path, byte_size: written.append((path, byte_size)))
+    key = cache.make_key("image-digest", [weights], (0, 121, 1920, 1040), {"conf": 0.25})
+    bbox = BoundingBox(x=1, y=2, width=3, height=4, class_name="button", confidence=0.5)
+
+    assert cache.get(screenshot, key) is None
+    cache.put(screenshot, key, BoundingBoxResult(screenshot, 1920, 1080, [bbox]))
+    cached = cache.get(screenshot, key)
+
+    assert get_session_dir(screenshot) == str(tmp_path / "project" / "command")
+    entry = tmp_path / "project" / "command" / "detection_cache" / f"{key}.json"
+    assert written == [(str(entry), entry.stat().st_size)]
+    assert cached.bounding_boxes == [bbox]
+    assert (cached.original_width, cached.original_height) == (1920, 1080)
+    assert (cache.hits, cache.misses) == (1, 1)
+
+def test_key_changes_with_weights_crop_and_thresholds(tmp_path):
+    _, weights = make_session(tmp_path)
+    key = DetectionCache.make_key("image-digest", [weights], (0, 121, 1920, 1040), {"conf": 0.25})
+
+    assert key == DetectionCache.make_key("image-digest", [weights], (0, 121, 1920, 1040), {"conf": 0.25})
+    assert key != DetectionCache.make_key("image-digest", [weights], None, {"conf": 0.25})
+    assert key != DetectionCache.make_key("image-digest", [weights], (0, 121, 1920, 1040), {"conf": 0.5})
+    assert key != DetectionCache.make_key("other-digest", [weights], (0, 121, 1920, 1040), {"conf": 0.25})
+
+def test_near_duplicates_get_own_box_ids_on_hits_and_misses(tmp_path, monkeypatch):
+    screenshot, _ = make_session(tmp_path)
+    bbox = BoundingBox(x=1, y=2, width=3, height=4, class_name="button", confidence=0.5)
+    detected_frames = []
+
+    def detect(frames):
+        detected_frames.extend(frames)
+        return [BoundingBoxResult(frame.image_path, 1920, 1080, [bbox]) for frame in frames]
+
+    monkeypatch.setattr(Merged_UI_IconBBoxes, "_detection_cache", DetectionCache())
+    monkeypatch.setattr(Merged_UI_IconBBoxes, "detection_cache_key", lambda frame: "frame-key")
+    monkeypatch.setattr(Merged_UI_IconBBoxes, "get_merged_ui_icon_bboxes_for_frames", detect)
+    # A near-duplicate event reuses the first event's image
+    frames = [LoadedFrame(screenshot, np.zeros((1080, 1920, 3), np.uint8), 1920, 1080) for _ in range(2)]
+
+    for run in range(2):
+        results = Merged_UI_IconBBoxes.get_merged_ui_icon_bboxes_for_frames_cached(frames)
+        first_ids, repeat_ids = ([box.id for box in result.bounding_boxes] for result in results)
+        assert results[0] is not results[1]
+        assert [b.x for b in results[1].bounding_boxes] == [b.x for b in results[0].bounding_boxes]
+        assert not set(first_ids) & set(repeat_ids)
+        # The second run is served from the cache
+        assert len(detected_frames) == 1
@@ -0,0 +1,41 @@
+import os
+import numpy as np
+import pytest
+from PIL import Image
+from inference.yolo.frame_loader import FrameLoader
+
+
+@pytest.fixture
+def screenshot(tmp_path):
+    path = tmp_path / "screenshot.png"
+    pixels = np.zeros((100, 200, 3), dtype=np.uint8)
+    pixels[10:20, 30:40] = (255, 0, 0)
+    Image.fromarray(pixels).save(path)
+    return str(path)
+
+def test_frame_is_cropped_once_and_read_only(screenshot):
+    frame = FrameLoader(render_area=(30, 10, 500, 20)).load(screenshot)
+
+    assert frame.crop_box == (30, 10, 200, 20)
+    assert (frame.original_width, frame.original_height) == (200, 100)
+    assert (frame.width, frame.height) == (170, 10)
+    assert not frame.bgr.flags.writeable
+    # Stored as BGR, handed out as RGB
+    assert frame.bgr[0, 0].tolist() == [0, 0, 255]
+    assert frame.to_pil().getpixel((0, 0)) == (255, 0, 0)
+
+def test_lru_is_keyed_by_mtime(screenshot):
+    loader = FrameLoader(should_crop=False, cache_size=1)
+
+    first = loader.load(screenshot)
+    assert loader.load(screenshot) is first
+
+    stat = os.stat(screenshot)
+    os.utime(screenshot, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert loader.load(screenshot) is not first
+    assert (loader.hits, loader.misses) == (1, 2)
+
+def test_load_many_skips_missing_files(screenshot):
+    frames = FrameLoader(should_crop=False).load_many([screenshot, "missing.png"])
+
+    assert [frame.image_path for frame in frames] == [screenshot]
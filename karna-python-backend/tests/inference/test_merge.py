@@ -0,0 +1,67 @@
+import numpy as np
+import pytest
+from inference import BoundingBox, BoundingBoxResult # type: ignore
+from inference.yolo.merge import MergeRule, merge_bounding_boxes, merge_detections
+from inference.yolo.yolo_ui_icon_merged_inference import Merged_UI_IconBBoxes
+
+
+@pytest.fixture
+def overlapping_detections():
+    """Icon and UI detections of one frame with known duplicates"""
+    icon = [
+        # Same element as the "button" UI box, less confident
+        BoundingBox(10, 10, 20, 20, "icon", 0.6, id="icon-dup"),
+        # Nested in the "container" UI box, a different element
+        BoundingBox(200, 200, 16, 16, "icon", 0.8, id="icon-nested"),
+        # Mostly inside the "text" UI box, but below the IoU threshold
+        BoundingBox(300, 300, 18, 18, "icon", 0.5, id="icon-in-text"),
+        # More confident than the UI box detecting the same element
+        BoundingBox(400, 400, 30, 30, "icon", 0.95, id="icon-wins"),
+    ]
+    ui = [
+        BoundingBox(11, 10, 20, 20, "button", 0.9, id="ui-button"),
+        BoundingBox(150, 150, 200, 200, "container", 0.9, id="ui-container"),
+        BoundingBox(299, 299, 24, 24, "text", 0.7, id="ui-text"),
+        BoundingBox(401, 401, 30, 30, "button", 0.4, id="ui-dup"),
+        # Overlaps the other UI button: the same model never suppresses itself
+        BoundingBox(12, 10, 20, 20, "button", 0.85, id="ui-button-2"),
+    ]
+    return icon, ui
+
+def test_merge_drops_cross_model_duplicates(overlapping_detections):
+    icon, ui = overlapping_detections
+
+    merged, report = merge_bounding_boxes([icon, ui])
+
+    assert [box.id for box in merged] == ["icon-nested", "icon-in-text", "icon-wins", "ui-button",
+                                          "ui-container", "ui-text", "ui-button-2"]
+    assert report.suppressed == 2
+    assert report.suppressed_by_pair == {("icon", "button"): 1, ("button", "icon"): 1}
+
+def test_containment_rule_applies_to_its_class_pair(overlapping_detections):
+    icon, ui = overlapping_detections
+    rules = {("*", "*"): MergeRule(), ("icon", "text"): MergeRule(containment_threshold=0.9)}
+
+    merged, report = merge_bounding_boxes([icon, ui], rules)
+
+    assert "icon-in-text" not in {box.id for box in merged}
+    # The same containment with another class pair keeps the nested icon
+    assert "icon-nested" in {box.id for box in merged}
+    assert report.suppressed_by_pair[("icon", "text")] == 1
+
+def test_merge_detections_works_on_arrays():
+    xyxy = np.array([[0, 0, 10, 10], [0, 0, 10, 10], [0, 0, 10, 10]])
+    keep, report = merge_detections(xyxy, np.array([0.5, 0.9, 0.7]), ["a", "a", "a"], np.array([0, 1, 2]))
+
+    assert keep.tolist() == [False, True, False]
+    assert (report.input_boxes, report.kept_boxes) == (3, 1)
+
+def test_merge_icon_ui_bboxes_reports_suppressed_boxes(overlapping_detections):
+    icon, ui = overlapping_detections
+    Merged_UI_IconBBoxes.merge_stats.reset()
+
+    merged = Merged_UI_IconBBoxes.merge_icon_ui_bboxes(BoundingBoxResult("frame.png", 640, 480, icon),
+                                                       BoundingBoxResult("frame.png", 640, 480, ui))
+
+    assert len(merged.bounding_boxes) == 7
+    assert Merged_UI_IconBBoxes.merge_stats.snapshot().suppressed == 2
@@ -0,0 +1,80 @@
+import threading
+import time
+import pytest
+from inference.yolo import model_registry
+from inference.yolo.model_registry import get_model_registry_instance
+from inference.yolo.ui.yolo_prediction import YOLO_UI_Prediction
+
+
+class FakeYOLO:
+    """Stand-in for ultralytics.YOLO that records how often weights are loaded."""
+    load_count = 0
+
+    def __init__(self, weights_path):
+        FakeYOLO.load_count += 1
+        self.weights_path = weights_path
+
+    def to(self, device):
+        self.device = device
+        return self
+
+@pytest.fixture
+def registry(monkeypatch):
+    FakeYOLO.load_count = 0
+    monkeypatch.setattr(model_registry, "YOLO", FakeYOLO)
+    registry = get_model_registry_instance()
+    registry.clear()
+    yield registry
+    registry.set_idle_timeout(None)
+    registry.clear()
+
+def test_model_loaded_once_per_weights_and_device(registry):
+    first = registry.get_model("weights/a.pt")
+    second = registry.get_model("weights/a.pt")
+    other_device = registry.get_model("weights/a.pt", device="cpu")
+
+    assert first is second
+    assert other_device is not first
+    assert FakeYOLO.load_count == 2
+
+    stats = {(s.weights_path.endswith("a.pt"), s.device): s for s in registry.get_stats()}
+    assert stats[(True, "auto")].loads == 1
+    assert stats[(True, "auto")].hits == 1
+    assert stats[(True, "cpu")].loads == 1
+
+def test_prediction_objects_share_registry_model(registry):
+    assert YOLO_UI_Prediction().model is YOLO_UI_Prediction().model
+    assert FakeYOLO.load_count == 1
+
+def test_idle_eviction_reloads_on_next_use(registry):
+    registry.get_model("weights/b.pt")
+    registry.set_idle_timeout(0.01)
+    # Force the entry to look idle instead of sleeping in the test
+    for entry in registry._entries.values():
+        entry.last_used_monotonic -= 1.0
+
+    evicted = registry.evict_idle()
+
+    assert len(evicted) == 1
+    assert not registry.is_loaded("weights/b.pt")
+    registry.get_model("weights/b.pt")
+    assert FakeYOLO.load_count == 2
+
+def test_shared_model_runs_one_prediction_at_a_time(registry, monkeypatch):
+    state = {"running": 0, "overlapped": False}
+
+    def call(self, images, **kwargs):
+        state["running"] += 1
+        state["overlapped"] |= state["running"] > 1
+        time.sleep(0.01)
+        state["running"] -= 1
+        return []
+
+    monkeypatch.setattr(FakeYOLO, "__call__", call, raising=False)
+    threads = [threading.Thread(target=YOLO_UI_Prediction().predict_batch, args=(["a.png"],)) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert not state["overlapped"]
@@ -0,0 +1,25 @@
+import numpy as np
+from PIL import Image
+from inference.yolo.preprocess import PreprocessedFrame, iter_batches, letterbox, preprocess_frames
+
+
+def test_iter_batches_keeps_order_and_remainder():
+    assert list(iter_batches(range(5), 2)) == [[0, 1], [2, 3], [4]]
+
+def test_letterbox_maps_boxes_back_to_original_frame():
+    frame = np.zeros((1080, 1920, 3), dtype=np.uint8)
+    lb = letterbox(frame, 1024)
+
+    assert lb.image.shape == (1024, 1024, 3)
+    # A box covering the whole letterboxed content maps back to the full frame
+    content = np.array([[lb.pad_left, lb.pad_top, 1024 - lb.pad_left, 1024 - lb.pad_top]])
+    np.testing.assert_allclose(lb.to_original_xyxy(content), [[0, 0, 1920, 1080]], atol=1.0)
+
+def test_frames_are_letterboxed_once_per_size_and_shared():
+    image = Image.new("RGB", (200, 100), color=(255, 0, 0))
+    frames = preprocess_frames([image], ["shot.png"])
+
+    assert frames[0].image_path == "shot.png"
+    assert frames[0].bgr[0, 0].tolist() == [0, 0, 255]
+    assert frames[0].letterboxed(64) is frames[0].letterboxed(64)
+    assert preprocess_frames(frames)[0] is frames[0]
@@ -0,0 +1,123 @@
+import numpy as np
+import pytest
+from inference.yolo import model_registry, tiling
+from inference.yolo.model_registry import get_model_registry_instance
+from inference.yolo.preprocess import PreprocessedFrame
+from inference.yolo.tiling import PixelRateLimiter, merge_tile_detections, plan_resolution
+from inference.yolo.ui.yolo_prediction import YOLO_UI_Prediction
+
+
+class FakeArray:
+    def __init__(self, values):
+        self.values = values
+
+    def cpu(self):
+        return self
+
+    def numpy(self):
+        return self.values
+
+class FakeResult:
+    def __init__(self, image):
+        # One 8x8 box at the brightest pixel, none on an input without a white pixel
+        points = [] if image.max() < 255 else [np.unravel_index(image[..., 0].argmax(), image.shape[:2])[::-1]]
+        self.boxes = type("Boxes", (), {
+            "xyxy": FakeArray(np.array([[x - 4, y - 4, x + 4, y + 4] for x, y in points], dtype=np.float32).reshape(-1, 4)),
+            "cls": FakeArray(np.zeros(len(points), dtype=np.float32)),
+            "conf": FakeArray(np.full(len(points), 0.9, dtype=np.float32)),
+        })()
+
+class FakeYOLO:
+    overrides = {"imgsz": 64}
+    names = {0: "ui"}
+
+    def __init__(self, weights_path):
+        self.calls = []
+
+    def __call__(self, images, imgsz=None, **kwargs):
+        self.calls.append((len(images), imgsz))
+        return [FakeResult(image) for image in images]
+
+class SmallTileDetector(YOLO_UI_Prediction):
+    # Frames needing more than a 64px input are split into 128px tiles
+    max_imgsz = 64
+    min_element_size = 16
+    min_element_input_size = 8
+
+@pytest.fixture
+def fake_model(monkeypatch):
+    monkeypatch.setattr(model_registry, "YOLO", FakeYOLO)
+    get_model_registry_instance().clear()
+    yield
+    get_model_registry_instance().clear()
+
+def test_plan_picks_input_size_from_frame_resolution():
+    def plan(width, height):
+        return plan_resolution(width, height, trained_imgsz=1024, min_element_size=16,
+                               min_element_input_size=8, max_imgsz=1280, tile_overlap=0.2)
+
+    # Small crops are not padded up to the trained size
+    assert plan(300, 200) == tiling.ResolutionPlan(imgsz=320)
+    assert plan(1920, 1080) == tiling.ResolutionPlan(imgsz=1024)
+    assert plan(2560, 1440) == tiling.ResolutionPlan(imgsz=1280)
+
+    tall = plan(1280, 8000)
+    assert tall.imgsz == 1280 and len(tall.tiles) == 4
+    assert tall.tiles[0][1] == 0 and tall.tiles[-1][3] == 8000
+    # Neighbouring tiles overlap by at least 20% of the 2560px tile
+    assert all(above[3] - below[1] >= 512 for above, below in zip(tall.tiles, tall.tiles[1:]))
+
+def test_merge_keeps_one_box_for_elements_on_tile_borders():
+    tiles = [(0, 0, 100, 100), (70, 0, 170, 100)]
+    frame_size = (170, 100)
+    tile_boxes = [
+        # Element at x 90-110: cut off by the first tile's right edge, whole in the second tile
+        np.array([[90, 10, 100, 20], [75, 50, 85, 60]]),
+        np.array([[90, 10, 110, 20], [75, 50, 85, 60]]),
+    ]
+    labels = [np.array([0, 0]), np.array([0, 0])]
+    confidences = [np.array([0.9, 0.8]), np.array([0.7, 0.6])]
+
+    xyxy, merged_labels, merged_confidences = merge_tile_detections(
+        tiles, tile_boxes, labels, confidences, frame_size)
+
+    assert sorted(xyxy.tolist()) == [[75, 50, 85, 60], [90, 10, 110, 20]]
+    # The duplicate seen whole by both tiles keeps its most confident detection
+    assert 0.8 in merged_confidences.tolist()
+
+def test_large_frames_are_detected_tile_by_tile(fake_model):
+    bgr = np.zeros((100, 300, 3), dtype=np.uint8)
+    bgr[48:52, 108:112] = 255
+    small = np.zeros((32, 24, 3), dtype=np.uint8)
+    small[14:18, 10:14] = 255
+    detector = SmallTileDetector()
+
+    tiled, whole = detector.predict_frames_stream([PreprocessedFrame(bgr, "large.png"),
+                                                   PreprocessedFrame(small, "small.png")])
+
+    assert len(detector.plan_resolution(PreprocessedFrame(bgr, "large.png")).tiles) == 3
+    # The square lies in the overlap of two tiles but is reported once, in frame coordinates
+    assert len(tiled.bounding_boxes) == 1
+    box = tiled.bounding_boxes[0]
+    assert box.x <= 108 and box.x + box.width >= 112 and box.y <= 48 and box.y + box.height >= 52
+    assert (tiled.original_width, tiled.original_height) == (300, 100)
+    assert [(b.x, b.y, b.width, b.height) for b in whole.bounding_boxes] == [(6, 10, 8, 8)]
+    # The small frame runs at its own size, the tiles at max_imgsz
+    assert sorted(imgsz for _, imgsz in detector.model.calls) == [32, 64]
+
+def test_rate_limiter_waits_for_the_pixel_budget(monkeypatch):
+    clock = {"now": 0.0}
+    sleeps = []
+    monkeypatch.setattr(tiling.time, "monotonic", lambda: clock["now"])
+    monkeypatch.setattr(tiling.time, "sleep", sleeps.append)
+    limiter = PixelRateLimiter(pixels_per_second=1000)
+
+    assert limiter.acquire(1000) == 0.0
+    assert limiter.acquire(500) == pytest.approx(0.5)
+    clock["now"] = 2.0
+    # Refilled, but never beyond one second of pixels
+    assert limiter.acquire(1000) == 0.0
+    assert sleeps == [pytest.approx(0.5)]
+
+    limiter.set_rate(None)
+    assert limiter.acquire(10 ** 9) == 0.0
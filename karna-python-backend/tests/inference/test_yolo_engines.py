@@ -0,0 +1,67 @@
+import glob
+import os
+
+import pytest
+from inference import BoundingBox # type: ignore
+from inference.yolo.engines import (InferenceEngine, compare_detections, get_engine_weights_path,
+                                    resolve_weights_path)
+from inference.yolo.ui.yolo_prediction import YOLO_UI_Prediction
+
+SAMPLE_SCREENSHOTS = sorted(glob.glob(os.path.join(
+    os.path.dirname(__file__), "..", "..", "..", "data", "*", "*", "screenshots", "raw", "*.png")))
+
+
+def is_real_weights(path: str) -> bool:
+    """Git LFS pointers are checked out instead of the weights when LFS is not installed"""
+    return os.path.exists(path) and os.path.getsize(path) > 1024 * 1024
+
+
+def test_engine_weights_are_exported_next_to_pytorch_weights(tmp_path):
+    model_path = str(tmp_path / "detector.pt")
+
+    assert get_engine_weights_path(model_path, InferenceEngine.PYTORCH) == model_path
+    assert get_engine_weights_path(model_path, InferenceEngine.ONNX_INT8) == str(tmp_path / "detector_int8.onnx")
+    assert get_engine_weights_path(model_path, InferenceEngine.OPENVINO) == str(tmp_path / "detector_openvino_model")
+
+    # Without an export the PyTorch weights are loaded
+    assert resolve_weights_path(model_path, InferenceEngine.ONNX) == model_path
+    (tmp_path / "detector.onnx").touch()
+    assert resolve_weights_path(model_path, InferenceEngine.ONNX) == str(tmp_path / "detector.onnx")
+
+
+def test_compare_detections_matches_same_class_boxes_once():
+    reference = [BoundingBox(0, 0, 10, 10, "button", 0.9), BoundingBox(50, 50, 10, 10, "icon", 0.8)]
+    candidate = [
+        BoundingBox(1, 0, 10, 10, "button", 0.9),
+        # Overlaps the first reference box too, but that box is already matched
+        BoundingBox(0, 1, 10, 10, "button", 0.7),
+        # Right place, wrong class
+        BoundingBox(50, 50, 10, 10, "button", 0.8),
+    ]
+
+    parity = compare_detections(reference, candidate, iou_threshold=0.5)
+
+    assert parity.matched == 1
+    assert parity.recall == 0.5
+    assert parity.precision == pytest.approx(1 / 3)
+    assert parity.mean_iou == pytest.approx(90 / 110)
+
+
+@pytest.mark.parametrize("engine", [InferenceEngine.ONNX, InferenceEngine.ONNX_INT8,
+                                    InferenceEngine.OPENVINO, InferenceEngine.OPENVINO_INT8])
+def test_exported_engine_matches_pytorch(engine):
+    model_path = YOLO_UI_Prediction.model_path
+    if not is_real_weights(model_path):
+        pytest.skip("YOLO UI weights are not available")
+    if not os.path.exists(get_engine_weights_path(model_path, engine)):
+        pytest.skip(f"No {engine.value} export, run python -m scripts.export_yolo_models")
+    if not SAMPLE_SCREENSHOTS:
+        pytest.skip("No sample screenshots")
+
+    pytorch = YOLO_UI_Prediction(device="cpu", engine=InferenceEngine.PYTORCH)
+    exported = YOLO_UI_Prediction(device="cpu", engine=engine)
+    for path in SAMPLE_SCREENSHOTS[:4]:
+        parity = compare_detections(pytorch.predict_and_export_bboxes(path).bounding_boxes,
+                                    exported.predict_and_export_bboxes(path).bounding_boxes)
+        assert parity.recall >= 0.9
+        assert parity.mean_iou >= 0.9
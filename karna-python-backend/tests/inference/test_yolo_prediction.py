@@ -70,10 +70,11 @@ def test_merged_ui_icon_predictions(yolo_ui_prediction, yolo_icon_prediction, sc
     assert len(merged_results) > 0
     assert isinstance(merged_results, list)
     
-    # Check that each merged result has more bounding boxes than either UI or icon results alone
+    # Check that each merged result has every box except the UI/icon duplicates
     for i, (merged, ui, icon) in enumerate(zip(merged_results, ui_results, icon_results)):
+        _, report = Merged_UI_IconBBoxes.merge_icon_ui_bboxes_with_report(icon, ui)
         logger.info(f"Result {i}: UI: {len(ui.bounding_boxes)} boxes, Icon: {len(icon.bounding_boxes)} boxes, Merged: {len(merged.bounding_boxes)} boxes")
-        assert len(merged.bounding_boxes) == len(ui.bounding_boxes) + len(icon.bounding_boxes)
+        assert len(merged.bounding_boxes) + report.suppressed == len(ui.bounding_boxes) + len(icon.bounding_boxes)
 
 def test_merged_ui_icon_predictions_from_json(screenshot_events):
     # Set up logging for this test
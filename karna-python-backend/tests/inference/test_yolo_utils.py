@@ -0,0 +1,41 @@
+import numpy as np
+from inference.yolo.yolo_utils import boxes_to_bounding_boxes, export_bounding_boxes
+
+
+class FakeTensor:
+    def __init__(self, values):
+        self.values = np.asarray(values)
+
+    def cpu(self):
+        return self
+
+    def numpy(self):
+        return self.values
+
+class FakeBoxes:
+    def __init__(self, xyxy, cls, conf):
+        self.xyxy, self.cls, self.conf = FakeTensor(xyxy), FakeTensor(cls), FakeTensor(conf)
+
+class FakeResult:
+    def __init__(self, boxes, orig_shape):
+        self.boxes = boxes
+        self.orig_shape = orig_shape
+
+class FakeModel:
+    names = {0: "button", 1: "icon"}
+
+def test_boxes_to_bounding_boxes_truncates_like_int():
+    bboxes = boxes_to_bounding_boxes(FakeModel.names, np.array([[10.7, 20.2, 30.9, 45.5]]), np.array([1.0]), np.array([0.5]))
+
+    assert len(bboxes) == 1
+    assert (bboxes[0].x, bboxes[0].y, bboxes[0].width, bboxes[0].height) == (10, 20, 20, 25)
+    assert bboxes[0].class_name == "icon"
+    assert isinstance(bboxes[0].x, int) and isinstance(bboxes[0].confidence, float)
+
+def test_export_reads_dimensions_from_results_without_opening_file():
+    result = FakeResult(FakeBoxes([[0, 0, 5, 5], [1, 2, 3, 4]], [0, 1], [0.9, 0.8]), orig_shape=(1080, 1920))
+
+    bbox_result = export_bounding_boxes(FakeModel(), image_path="not/a/real/file.png", results=[result])
+
+    assert (bbox_result.original_width, bbox_result.original_height) == (1920, 1080)
+    assert [b.class_name for b in bbox_result.bounding_boxes] == ["button", "icon"]
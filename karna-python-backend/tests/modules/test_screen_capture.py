@@ -1,15 +1,28 @@
+import io
+import json
 import unittest
 import os
 import shutil
+import tempfile
 import time
+from dataclasses import asdict, replace
+from datetime import datetime
 from typing import List
 from services.screen_capture_service import (
     ScreenCaptureService, 
+    ScreenCaptureSession,
     ScreenshotEvent,
-    SessionError
+    SessionError,
+    CaptureDelta,
+    CaptureDeltaType
 )
 from base.base_observer import Observer, Priority
+from robot.capture_backends import FileReplayBackend, FrameRingBuffer, FrameSampler
+from utils.annotation_renderer import AnnotationPreviewCache, find_session_annotation
 from PIL import Image
+from unittest.mock import patch
+import numpy as np
+from utils.image_utils import crop_to_render_area, get_capture_origin
 
 class TestObserver(Observer[List[ScreenshotEvent]]):
     """Observer to track and display screen capture events.
@@ -183,5 +196,375 @@ class TestScreenCapture(unittest.TestCase):
         except Exception as e:
             self.fail(f"Interactive test failed: {str(e)}")
 
+class DeltaRecorder(Observer[CaptureDelta]):
+    """Observer recording every screenshot event list delta"""
+    def __init__(self):
+        super().__init__(Priority.NORMAL)
+        self.deltas: List[CaptureDelta] = []
+
+    def update(self, data: CaptureDelta) -> None:
+        self.deltas.append(data)
+
+class TestScreenCaptureDeltas(unittest.TestCase):
+    def setUp(self):
+        self.service = ScreenCaptureService()
+        self.recorder = DeltaRecorder()
+        self.service.add_delta_observer(self.recorder)
+        self.temp_dir = tempfile.mkdtemp()
+        frame_path = os.path.join(self.temp_dir, 'frame.png')
+        Image.new('RGB', (8, 8)).save(frame_path)
+        self.service.capture_backend = FileReplayBackend([frame_path])
+        self.service.current_session = ScreenCaptureSession(
+            project_uuid="test_project_123",
+            command_uuid="test_capture_123",
+            is_active=True,
+            raw_dir=self.temp_dir,
+            annotated_dir=self.temp_dir
+        )
+
+    def tearDown(self):
+        self.service.remove_delta_observer(self.recorder)
+        shutil.rmtree(self.temp_dir)
+
+    def test_each_capture_publishes_one_append_delta(self):
+        """Captures publish only the new event, numbered per session"""
+        for i in range(3):
+            self.service._take_screenshot(f"click {i}", x=i, y=i)
+        self.assertTrue(self.service._capture_writer.flush(timeout=10))
+
+        self.assertEqual([d.sequence for d in self.recorder.deltas], [1, 2, 3])
+        self.assertTrue(all(d.type == CaptureDeltaType.APPEND and len(d.events) == 1 for d in self.recorder.deltas))
+        events = self.service.current_session.screenshot_events
+        self.assertEqual([d.events[0].event_id for d in self.recorder.deltas], [e.event_id for e in events])
+
+        snapshot = self.service.get_capture_snapshot()
+        self.assertEqual(snapshot.type, CaptureDeltaType.RESET)
+        self.assertEqual(snapshot.sequence, 3)
+        self.assertEqual(len(snapshot.events), 3)
+
+    def test_snapshot_matches_its_sequence(self):
+        """A snapshot taken while captures are committed holds exactly the events its sequence number counts"""
+        snapshots = []
+        for i in range(20):
+            self.service._take_screenshot(f"click {i}", x=i, y=i)
+            snapshots.append(self.service.get_capture_snapshot())
+        self.assertTrue(self.service._capture_writer.flush(timeout=10))
+
+        self.assertTrue(all(len(snapshot.events) == snapshot.sequence for snapshot in snapshots))
+
+    def test_list_edit_publishes_update_and_delete(self):
+        """Editing the list publishes the removed ids and the changed events only"""
+        events = [
+            ScreenshotEvent(event_id=str(i), project_uuid="p", command_uuid="c",
+                            timestamp=datetime.now(), description=f"event {i}", screenshot_path=f"{i}.png")
+            for i in range(4)
+        ]
+        edited = [events[0], replace(events[2], mouse_event_tool_tip="Right Click"), events[3]]
+        self.service._publish_list_changes(events, edited)
+
+        self.assertEqual([d.type for d in self.recorder.deltas], [CaptureDeltaType.DELETE, CaptureDeltaType.UPDATE])
+        self.assertEqual(self.recorder.deltas[0].deleted_event_ids, ["1"])
+        self.assertEqual([e.event_id for e in self.recorder.deltas[1].events], ["2"])
+
+        self.recorder.deltas.clear()
+        self.service._publish_list_changes(edited, list(reversed(edited)))
+        self.assertEqual([d.type for d in self.recorder.deltas], [CaptureDeltaType.RESET])
+
+class TestCaptureBackends(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.paths = []
+        for i in range(3):
+            path = os.path.join(self.temp_dir, f'frame_{i}.png')
+            Image.new('RGB', (16, 12), (i * 50, 0, 0)).save(path)
+            self.paths.append(path)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_replay_backend_is_deterministic(self):
+        """Replayed frames come back in order, read-only, and regions are cropped"""
+        backend = FileReplayBackend(self.paths)
+        frames = [backend.grab() for _ in range(4)]
+        self.assertEqual([int(f.rgb[0, 0, 0]) for f in frames], [0, 50, 100, 0])
+        self.assertFalse(frames[0].rgb.flags.writeable)
+
+        region_frame = backend.grab((2, 3, 5, 4))
+        self.assertEqual((region_frame.width, region_frame.height), (5, 4))
+        self.assertEqual(region_frame.origin, (2, 3))
+
+    def test_ring_buffer_lookback(self):
+        """The sampler fills a bounded buffer and look-back returns the last frame before a time"""
+        buffer = FrameRingBuffer(capacity=2)
+        sampler = FrameSampler(FileReplayBackend(self.paths), buffer, interval=0.01)
+        sampler.start()
+        deadline = time.monotonic() + 5
+        while len(buffer) < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        sampler.stop()
+
+        frames = buffer.frames()
+        self.assertEqual(len(frames), 2)
+        self.assertIs(buffer.latest_before(frames[1].monotonic_time - 1e-6), frames[0])
+        self.assertIs(buffer.latest_before(time.monotonic()), frames[1])
+        self.assertIsNone(buffer.latest_before(time.monotonic() + 10, max_age=1))
+
+class TestDuplicateSuppression(unittest.TestCase):
+    def setUp(self):
+        self.service = ScreenCaptureService()
+        self.temp_dir = tempfile.mkdtemp()
+        self.raw_dir = os.path.join(self.temp_dir, 'raw')
+        os.makedirs(self.raw_dir)
+        frame_paths = []
+        for i, color in enumerate([(255, 255, 255), (255, 255, 255), (0, 0, 255)]):
+            path = os.path.join(self.temp_dir, f'frame_{i}.png')
+            Image.new('RGB', (320, 180), color).save(path)
+            frame_paths.append(path)
+        self.service.capture_backend = FileReplayBackend(frame_paths, loop=False)
+        self.service.current_session = ScreenCaptureSession(
+            project_uuid="test_project_123",
+            command_uuid="test_capture_123",
+            is_active=True,
+            raw_dir=self.raw_dir,
+            annotated_dir=self.temp_dir
+        )
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_duplicate_frame_references_previous_image(self):
+        """An unchanged frame creates an event pointing at the stored image instead of a new PNG"""
+        for i in range(3):
+            self.service._take_screenshot(f"click {i}", x=10, y=10)
+            # Distinct timestamps for the file names
+            time.sleep(0.001)
+        self.assertTrue(self.service._capture_writer.flush(timeout=10))
+
+        first, duplicate, changed = self.service.current_session.screenshot_events
+        self.assertIsNone(first.similarity_score)
+        self.assertEqual(duplicate.screenshot_path, first.screenshot_path)
+        self.assertEqual(duplicate.duplicate_of_event_id, first.event_id)
+        self.assertAlmostEqual(duplicate.similarity_score, 1.0)
+        self.assertIsNone(changed.duplicate_of_event_id)
+        self.assertLess(changed.similarity_score, self.service.CAPTURE_DEDUP_THRESHOLD)
+        self.assertEqual(len(os.listdir(self.raw_dir)), 2)
+
+        # The shared image survives deleting one of the events that use it
+        self.service._remove_unreferenced_files([asdict(duplicate)], [asdict(first), asdict(changed)])
+        self.assertTrue(os.path.exists(first.screenshot_path))
+
+    def test_failed_write_is_not_referenced(self):
+        """A frame whose write failed is not the image later identical frames point at"""
+        with patch.object(Image.Image, 'save', side_effect=OSError("No space left on device")):
+            self.service._take_screenshot("click 0", x=10, y=10)
+            self.assertTrue(self.service._capture_writer.flush(timeout=10))
+        self.assertEqual(self.service.current_session.screenshot_events, [])
+
+        time.sleep(0.001)
+        self.service._take_screenshot("click 1", x=10, y=10)
+        self.assertTrue(self.service._capture_writer.flush(timeout=10))
+
+        event, = self.service.current_session.screenshot_events
+        self.assertIsNone(event.duplicate_of_event_id)
+        self.assertTrue(os.path.exists(event.screenshot_path))
+
+    def test_statistics_follow_written_files(self):
+        """Statistics are updated as frames are written; reconciliation catches external deletions"""
+        for i in range(3):
+            self.service._take_screenshot(f"click {i}", x=10, y=10)
+            time.sleep(0.001)
+        self.assertTrue(self.service._capture_writer.flush(timeout=10))
+        first, _, changed = self.service.current_session.screenshot_events
+        sizes = [os.path.getsize(first.screenshot_path), os.path.getsize(changed.screenshot_path)]
+
+        stats = self.service.get_current_session_stats()
+        self.assertEqual(stats.total_screenshots, 2)
+        self.assertEqual(stats.raw_directory_size, sum(sizes))
+        self.assertEqual(stats.missing_files, 0)
+
+        # Removing the last event drops the file it alone referenced
+        self.service.current_session.pop_screenshot_event()
+        self.assertEqual(self.service.get_current_session_stats().raw_directory_size, sizes[0])
+
+        os.remove(first.screenshot_path)
+        self.assertEqual(self.service.current_session.stats_tracker.reconcile(), 1)
+        stats = self.service.get_current_session_stats()
+        self.assertEqual((stats.total_screenshots, stats.raw_directory_size, stats.missing_files), (1, 0, 1))
+
+class TestAnnotationOverlays(unittest.TestCase):
+    def setUp(self):
+        self.service = ScreenCaptureService()
+        self.temp_dir = tempfile.mkdtemp()
+        self.command_dir = os.path.join(self.temp_dir, 'test_project_123', 'test_capture_123')
+        self.raw_dir = os.path.join(self.command_dir, 'screenshots', 'raw')
+        self.annotated_dir = os.path.join(self.command_dir, 'screenshots', 'annotated')
+        os.makedirs(self.raw_dir)
+        os.makedirs(self.annotated_dir)
+        self.screenshot_path = os.path.join(self.raw_dir, 'screenshot_1.png')
+        Image.new('RGB', (320, 180), 'white').save(self.screenshot_path)
+        self.service.current_session = ScreenCaptureSession(
+            project_uuid="test_project_123",
+            command_uuid="test_capture_123",
+            is_active=True,
+            raw_dir=self.raw_dir,
+            annotated_dir=self.annotated_dir
+        )
+        self.event = ScreenshotEvent(
+            event_id="event-1",
+            project_uuid="test_project_123",
+            command_uuid="test_capture_123",
+            timestamp=datetime.now(),
+            description="Clicked OK",
+            screenshot_path=self.screenshot_path,
+            mouse_x=100,
+            mouse_y=50
+        )
+        self.service.current_session.add_screenshot_event(self.event)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_annotation_is_recorded_not_written(self):
+        """Annotating records an overlay in the event metadata and renders it only on request"""
+        self.service._annotate_session_screenshots()
+
+        self.assertEqual(self.event.annotation_overlay.x, 100)
+        self.assertEqual(self.event.annotation_overlay.label, "Clicked OK")
+        self.assertEqual(os.listdir(self.annotated_dir), [])
+
+        # The overlay survives the JSON round trip of the session metadata
+        event_dict = asdict(self.event)
+        self.assertEqual(ScreenshotEvent(**event_dict).annotation_overlay, self.event.annotation_overlay)
+
+        cache = AnnotationPreviewCache(max_entries=2)
+        png = cache.get_png(self.screenshot_path, self.event.annotation_overlay)
+        self.assertIs(cache.get_png(self.screenshot_path, self.event.annotation_overlay), png)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+        with Image.open(io.BytesIO(png)) as rendered:
+            self.assertEqual(rendered.size, (320, 180))
+            # The click circle is drawn at the recorded point
+            self.assertEqual(rendered.convert('RGB').getpixel((100 + 20, 50)), (255, 0, 0))
+
+    def test_session_annotation_lookup(self):
+        """Annotated file names resolve to the raw screenshot and overlay of the exported session"""
+        self.service._annotate_session_screenshots()
+        event_dict = asdict(self.event)
+        event_dict['timestamp'] = event_dict['timestamp'].isoformat()
+        with open(os.path.join(self.command_dir, 'screenshot_events_test_capture_123.json'), 'w') as f:
+            json.dump([event_dict], f)
+
+        annotation = find_session_annotation(
+            'test_project_123', 'test_capture_123', os.path.basename(self.event.annotation_path), self.temp_dir)
+        self.assertIsNotNone(annotation)
+        screenshot_path, overlay = annotation
+        self.assertEqual(os.path.normpath(screenshot_path), os.path.normpath(self.screenshot_path))
+        self.assertEqual(overlay, self.event.annotation_overlay)
+        self.assertIsNone(find_session_annotation('test_project_123', 'test_capture_123', 'annotated_missing.png',
+                                                  self.temp_dir))
+
+class TestScreenshotEventEdits(unittest.TestCase):
+    def setUp(self):
+        self.service = ScreenCaptureService()
+        self.temp_dir = tempfile.mkdtemp()
+        self.previous_cwd = os.getcwd()
+        # The service keeps sessions under ./data
+        os.chdir(self.temp_dir)
+        self.catalog_patcher = patch('services.screen_capture_service.get_session_catalog_instance')
+        self.catalog_patcher.start()
+        self.command_dir = os.path.join('data', 'test_project_123', 'test_capture_123')
+        os.makedirs(self.command_dir)
+        self.events = [
+            ScreenshotEvent(event_id=str(i), project_uuid="test_project_123", command_uuid="test_capture_123",
+                            timestamp=datetime.now(), description=f"click {i}", screenshot_path="0.png",
+                            mouse_event_tool_tip="Left Click", similarity_score=0.97 if i else None,
+                            duplicate_of_event_id="0" if i else None, thumbnail_paths={64: f"{i}_64.webp"},
+                            capture_origin=(10, 20))
+            for i in range(2)
+        ]
+        self.service.current_session = ScreenCaptureSession(
+            project_uuid="test_project_123",
+            command_uuid="test_capture_123",
+            is_active=False,
+            raw_dir=self.command_dir,
+            annotated_dir=self.command_dir
+        )
+        self.service.current_session.set_screenshot_events(list(self.events))
+        self.service.export_screenshot_events_to_json()
+
+    def tearDown(self):
+        self.catalog_patcher.stop()
+        os.chdir(self.previous_cwd)
+        shutil.rmtree(self.temp_dir)
+
+    def test_tooltip_edit_appends_one_record(self):
+        """Editing one tooltip journals only that event and keeps the fields clients do not send"""
+        # As received from a client: float32 precision, no dedup fields, overlays or thumbnails
+        client_events = [
+            replace(event, similarity_score=float(np.float32(event.similarity_score)) if event.similarity_score else None,
+                    duplicate_of_event_id=None, thumbnail_paths=None, capture_origin=None)
+            for event in self.events
+        ]
+        client_events[1] = replace(client_events[1], mouse_event_tool_tip="Right Click")
+        self.service.update_screenshot_events_json_file("test_project_123", "test_capture_123", client_events)
+
+        journal_path = os.path.join(self.command_dir, 'screenshot_events_test_capture_123.jsonl')
+        with open(journal_path) as f:
+            records = [json.loads(line) for line in f]
+        self.assertEqual(len(records), 1)
+        self.assertEqual(records[0]['event']['event_id'], "1")
+
+        first, edited = self.service.current_session.screenshot_events
+        self.assertEqual(edited.mouse_event_tool_tip, "Right Click")
+        self.assertEqual(edited.similarity_score, 0.97)
+        self.assertEqual(edited.duplicate_of_event_id, "0")
+        self.assertEqual(edited.thumbnail_paths, {64: "1_64.webp"})
+        self.assertEqual(edited.capture_origin, (10, 20))
+        self.assertEqual(first, self.events[0])
+
+class TestRenderAreaCapture(unittest.TestCase):
+    def setUp(self):
+        self.service = ScreenCaptureService()
+        self.service.CAPTURE_RENDER_AREA_ONLY = True
+        self.service.CAPTURE_RENDER_AREA_MARGIN = 8
+        self.temp_dir = tempfile.mkdtemp()
+        self.raw_dir = os.path.join(self.temp_dir, 'raw')
+        os.makedirs(self.raw_dir)
+        self.screen = Image.fromarray(np.random.RandomState(0).randint(0, 256, (180, 320, 3), dtype=np.uint8))
+        screen_path = os.path.join(self.temp_dir, 'screen.png')
+        self.screen.save(screen_path)
+        self.service.capture_backend = FileReplayBackend([screen_path])
+        self.service.current_session = ScreenCaptureSession(
+            project_uuid="test_project_123",
+            command_uuid="test_capture_123",
+            is_active=True,
+            raw_dir=self.raw_dir,
+            annotated_dir=self.temp_dir
+        )
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    @patch('utils.image_utils.get_website_render_area', return_value=(20, 30, 300, 150))
+    def test_region_capture_maps_back_to_the_screen(self, _):
+        """Only the render area plus margin is stored; its origin keeps crops and clicks in place"""
+        self.service.current_session.capture_region = self.service._get_capture_region()
+        self.assertEqual(self.service.current_session.capture_region, (12, 22, 296, 136))
+
+        self.service._take_screenshot("click", x=100, y=60)
+        self.assertTrue(self.service._capture_writer.flush(timeout=10))
+        event = self.service.current_session.screenshot_events[0]
+
+        self.assertEqual(event.capture_origin, (12, 22))
+        self.assertEqual(get_capture_origin(event.screenshot_path), (12, 22))
+        with Image.open(event.screenshot_path) as image:
+            self.assertEqual(image.size, (296, 136))
+        # Consumers cropping to the render area get the same pixels as from a full screen capture
+        cropped = crop_to_render_area(event.screenshot_path)
+        self.assertTrue(np.array_equal(np.asarray(cropped), np.asarray(self.screen.crop((20, 30, 300, 150)))))
+
+        self.service._annotate_session_screenshots()
+        self.assertEqual((event.annotation_overlay.x, event.annotation_overlay.y), (88, 38))
+        self.assertEqual((event.mouse_x, event.mouse_y), (100, 60))
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
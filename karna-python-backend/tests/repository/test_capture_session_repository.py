@@ -0,0 +1,134 @@
+import os
+from datetime import datetime, timedelta
+from uuid import uuid4
+import pytest
+from database.models import CaptureSessionRecord, SessionArtifact
+from database.repositories.capture_session_repository import CaptureSessionRepository
+from services.session_catalog import ARTIFACT_DETECTIONS, SessionCatalog
+
+@pytest.fixture
+def repo(test_session_factory):
+    return CaptureSessionRepository(session_factory=test_session_factory)
+
+@pytest.fixture
+def empty_catalog(repo):
+    """The catalog tables without rows left by other tests.
+
+    The catalog opens its own database sessions, and the in-memory test database has a
+    single connection, so these tests use short-lived sessions from repo.get_db().
+    """
+    with repo.get_db() as db:
+        db.query(SessionArtifact).delete()
+        db.query(CaptureSessionRecord).delete()
+        db.commit()
+
+def make_session_dir(data_dir, project_uuid, command_uuid, size):
+    session_dir = os.path.join(data_dir, project_uuid, command_uuid, "screenshots", "raw")
+    os.makedirs(session_dir)
+    with open(os.path.join(session_dir, "frame.png"), "wb") as f:
+        f.write(b"\0" * size)
+    return os.path.dirname(os.path.dirname(session_dir))
+
+def test_upsert_touch_and_artifact_sizes(test_db, repo):
+    command_uuid = str(uuid4())
+    record = repo.upsert_session(test_db, "project", command_uuid)
+    assert record.frame_count == 0
+
+    record = repo.upsert_session(test_db, "project", command_uuid, frame_count=3, byte_size=300)
+    repo.record_artifact(test_db, "project", command_uuid, ARTIFACT_DETECTIONS, "detection_cache/a.json", 20)
+    # Rewriting an artifact replaces its size
+    repo.record_artifact(test_db, "project", command_uuid, ARTIFACT_DETECTIONS, "detection_cache/a.json", 50)
+    assert repo.get_session_size(test_db, record) == 350
+    assert repo.record_artifact(test_db, "project", str(uuid4()), ARTIFACT_DETECTIONS, "x.json", 1) is None
+
+    # The same command uuid in another project is another session
+    other = repo.upsert_session(test_db, "other", command_uuid, byte_size=7)
+    assert other.uuid != record.uuid
+    assert repo.get_session_size(test_db, other) == 7
+
+    earlier = datetime.now() - timedelta(days=1)
+    assert repo.touch(test_db, "project", command_uuid, when=earlier)
+    assert repo.get_session(test_db, "project", command_uuid).last_accessed_at == earlier
+    assert repo.get_session(test_db, "other", command_uuid).last_accessed_at != earlier
+    assert not repo.touch(test_db, "project", str(uuid4()))
+
+def test_retention_removes_expired_then_least_recently_used(tmp_path, empty_catalog, repo):
+    data_dir = str(tmp_path)
+    catalog = SessionCatalog(data_dir=data_dir, repository=repo)
+    now = datetime.now()
+    sessions = {"expired": now - timedelta(days=40), "oldest": now - timedelta(days=3),
+                "older": now - timedelta(days=2), "recent": now - timedelta(days=1), "active": now - timedelta(days=5)}
+    for command_uuid, last_accessed_at in sessions.items():
+        make_session_dir(data_dir, "project", command_uuid, 100)
+        with repo.get_db() as db:
+            repo.upsert_session(db, "project", command_uuid, byte_size=100, last_accessed_at=last_accessed_at)
+    catalog.register_session("project", "active", active=True)
+    with repo.get_db() as db:
+        repo.touch(db, "project", "active", when=sessions["active"])
+
+    removed = catalog.enforce_retention(max_bytes=250, max_age_days=30)
+
+    assert removed == [("project", "expired"), ("project", "oldest"), ("project", "older")]
+    assert sorted(os.listdir(os.path.join(data_dir, "project"))) == ["active", "recent"]
+    with repo.get_db() as db:
+        assert repo.get_total_size(db) == 200
+
+    catalog.release_session("project", "active")
+    assert catalog.enforce_retention(max_bytes=0, max_age_days=30) == [("project", "active"), ("project", "recent")]
+    # Empty project directories are removed with their last session
+    assert os.listdir(data_dir) == []
+
+def test_lookup_registers_sessions_captured_before_the_catalog(tmp_path, empty_catalog, repo):
+    data_dir = str(tmp_path)
+    catalog = SessionCatalog(data_dir=data_dir, repository=repo)
+    session_dir = make_session_dir(data_dir, "project", "legacy", 64)
+
+    assert catalog.find_session_dir("project", "legacy") == session_dir
+    with repo.get_db() as db:
+        assert repo.get_session_size(db, repo.get_session(db, "project", "legacy")) == 64
+    assert catalog.find_session_dir("project", "missing") is None
+
+    catalog.record_artifact(os.path.join(session_dir, "detection_cache", "k.json"), ARTIFACT_DETECTIONS, 16)
+    # Files outside the data directory are not catalogued
+    catalog.record_artifact(os.path.join(str(tmp_path.parent), "elsewhere.json"), ARTIFACT_DETECTIONS, 16)
+    with repo.get_db() as db:
+        assert repo.get_session_size(db, repo.get_session(db, "project", "legacy")) == 80
+
+def test_existing_sessions_are_imported_as_used_and_retention_is_opt_in(tmp_path, empty_catalog, repo):
+    data_dir = str(tmp_path)
+    catalog = SessionCatalog(data_dir=data_dir, repository=repo)
+    old = (datetime.now() - timedelta(days=40)).timestamp()
+    for project_uuid in ("project", "other"):
+        session_dir = make_session_dir(data_dir, project_uuid, "task1", 10)
+        os.utime(session_dir, (old, old))
+    events_dir = os.path.join(data_dir, "project", "events_only")
+    os.makedirs(events_dir)
+    with open(os.path.join(events_dir, "screenshot_events_events_only.json"), "w") as f:
+        f.write("[]")
+    # Directories without screenshots or events are not sessions
+    os.makedirs(os.path.join(data_dir, "screenshots", "task1"))
+
+    assert catalog.import_existing_sessions() == 3
+    # Old files do not make a session expired: its age counts from the import
+    assert catalog.enforce_retention(max_age_days=30) == []
+    assert os.path.isdir(os.path.join(data_dir, "screenshots", "task1"))
+
+    catalog.start_scheduler()
+    assert catalog._scheduler_thread is None
+
+def test_reads_mark_sessions_as_used(tmp_path, empty_catalog, repo):
+    catalog = SessionCatalog(data_dir=str(tmp_path), repository=repo)
+    make_session_dir(str(tmp_path), "project", "task", 10)
+    catalog.mark_used("project", "task")
+    earlier = datetime.now() - timedelta(days=40)
+    with repo.get_db() as db:
+        repo.touch(db, "project", "task", when=earlier)
+
+    # Repeated reads within TOUCH_INTERVAL_SECONDS write once
+    catalog.mark_used("project", "task")
+    with repo.get_db() as db:
+        assert repo.get_session(db, "project", "task").last_accessed_at == earlier
+
+    catalog.TOUCH_INTERVAL_SECONDS = 0
+    catalog.mark_used("project", "task")
+    assert catalog.enforce_retention(max_age_days=30) == []
@@ -0,0 +1,76 @@
+import os
+import threading
+from datetime import datetime
+
+from PIL import Image
+
+from services.capture_writer import BackpressurePolicy, CaptureJob, CaptureWriter, get_thumbnail_path
+
+
+def make_job(directory, index: int) -> CaptureJob:
+    return CaptureJob(
+        image=Image.new("RGB", (64, 48), (index, 0, 0)),
+        path=os.path.join(directory, f"screenshot_{index}.png"),
+        timestamp=datetime.now(),
+        context=index
+    )
+
+
+def test_frames_are_committed_in_submission_order(tmp_path):
+    """Frames are encoded in parallel but reported in the order they were grabbed"""
+    committed = []
+    writer = CaptureWriter(on_written=lambda job: committed.append(job.context), num_workers=4, max_queue_size=4)
+    try:
+        for i in range(20):
+            assert writer.submit(make_job(str(tmp_path), i))
+        assert writer.flush(timeout=10)
+    finally:
+        writer.close()
+
+    assert committed == list(range(20))
+    assert all(os.path.exists(tmp_path / f"screenshot_{i}.png") for i in range(20))
+    metrics = writer.get_metrics()
+    assert (metrics.submitted, metrics.written, metrics.dropped, metrics.queue_depth) == (20, 20, 0, 0)
+    assert 1 <= metrics.max_queue_depth <= 4
+
+
+def test_drop_newest_policy_drops_frames_while_full(tmp_path):
+    """A full queue drops new frames instead of blocking the listener"""
+    release = threading.Event()
+    writer = CaptureWriter(on_written=lambda job: release.wait(), num_workers=1, max_queue_size=2,
+                           policy=BackpressurePolicy.DROP_NEWEST)
+    try:
+        accepted = [writer.submit(make_job(str(tmp_path), i)) for i in range(4)]
+        release.set()
+        assert writer.flush(timeout=10)
+    finally:
+        writer.close()
+
+    assert accepted == [True, True, False, False]
+    metrics = writer.get_metrics()
+    assert (metrics.written, metrics.dropped) == (2, 2)
+
+
+def test_thumbnail_pyramid_is_written_with_each_frame(tmp_path):
+    """Each frame gets one WebP thumbnail per configured width, never upscaled"""
+    raw_dir = tmp_path / "raw"
+    raw_dir.mkdir()
+    committed = []
+    writer = CaptureWriter(on_written=committed.append, thumbnail_widths=(32, 16, 128))
+    try:
+        assert writer.submit(make_job(str(raw_dir), 1))
+        assert writer.flush(timeout=10)
+    finally:
+        writer.close()
+
+    job = committed[0]
+    assert sorted(job.thumbnail_paths) == [16, 32, 128]
+    assert job.thumbnail_paths[16] == str(tmp_path / "thumbnails" / "16" / "screenshot_1.webp")
+    assert job.thumbnail_paths[32] == get_thumbnail_path(job.path, 32)
+    sizes = {}
+    for width, path in job.thumbnail_paths.items():
+        with Image.open(path) as thumbnail:
+            assert thumbnail.format == "WEBP"
+            sizes[width] = thumbnail.size
+    assert sizes == {16: (16, 12), 32: (32, 24), 128: (64, 48)}
+    assert writer.get_metrics().thumbnails_written == 3
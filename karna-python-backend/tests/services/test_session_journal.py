@@ -0,0 +1,87 @@
+import json
+import os
+
+import pytest
+
+from utils.session_journal import SessionJournal
+
+
+def make_event(event_id: str, description: str = "click") -> dict:
+    return {"event_id": event_id, "description": description}
+
+
+def test_edits_are_appended_and_replayed_in_order(tmp_path):
+    """Edits append journal records; loading replays them over the snapshot in place"""
+    journal = SessionJournal(str(tmp_path), "cmd")
+    journal.compact([make_event("a"), make_event("b"), make_event("c")])
+
+    journal.put([make_event("b", "edited tooltip")])
+    journal.delete(["a"])
+    journal.put([make_event("d")])
+
+    with open(journal.journal_path, encoding="utf-8") as f:
+        assert len(f.readlines()) == 3
+    assert journal.load() == [make_event("b", "edited tooltip"), make_event("c"), make_event("d")]
+
+    # The snapshot is only rewritten by compaction
+    with open(journal.snapshot_path, encoding="utf-8") as f:
+        assert [event["event_id"] for event in json.load(f)["events"]] == ["a", "b", "c"]
+    journal.compact()
+    assert not os.path.exists(journal.journal_path)
+    assert SessionJournal(str(tmp_path), "cmd").load() == [make_event("b", "edited tooltip"), make_event("c"),
+                                                           make_event("d")]
+
+
+def test_torn_record_is_skipped_and_terminated(tmp_path):
+    """A record cut short by a crash is ignored and does not swallow the next append"""
+    journal = SessionJournal(str(tmp_path), "cmd")
+    journal.put([make_event("a")])
+    with open(journal.journal_path, "a", encoding="utf-8") as f:
+        f.write('{"op": "put", "event": {"event_id": "b"')
+
+    journal.put([make_event("c")])
+
+    assert journal.load() == [make_event("a"), make_event("c")]
+
+
+def test_journal_compacts_after_threshold(tmp_path):
+    journal = SessionJournal(str(tmp_path), "cmd", compact_after=3)
+    for i in range(4):
+        journal.put([make_event(str(i))])
+
+    with open(journal.snapshot_path, encoding="utf-8") as f:
+        assert len(json.load(f)["events"]) == 3
+    assert [event["event_id"] for event in journal.load()] == ["0", "1", "2", "3"]
+    journal.reset()
+    assert journal.load() == []
+
+
+def test_crash_after_snapshot_replace_skips_the_old_journal(tmp_path, monkeypatch):
+    """A journal left next to a newer snapshot by a crash during compaction is not replayed"""
+    journal = SessionJournal(str(tmp_path), "cmd")
+    journal.compact([make_event("a")])
+    journal.put([make_event("b")])
+
+    def crash(path):
+        raise KeyboardInterrupt
+    monkeypatch.setattr(os, "remove", crash)
+    with pytest.raises(KeyboardInterrupt):
+        journal.compact([make_event("c")])
+    monkeypatch.undo()
+
+    assert os.path.exists(journal.journal_path)
+    reopened = SessionJournal(str(tmp_path), "cmd")
+    assert reopened.load() == [make_event("c")]
+    reopened.put([make_event("d")])
+    assert SessionJournal(str(tmp_path), "cmd").load() == [make_event("c"), make_event("d")]
+
+
+def test_snapshot_without_generation_is_read(tmp_path):
+    """Sessions written before snapshots had a generation still load and take edits"""
+    journal = SessionJournal(str(tmp_path), "cmd")
+    with open(journal.snapshot_path, "w", encoding="utf-8") as f:
+        json.dump([make_event("a")], f)
+
+    journal.put([make_event("a", "edited tooltip")])
+
+    assert SessionJournal(str(tmp_path), "cmd").load() == [make_event("a", "edited tooltip")]
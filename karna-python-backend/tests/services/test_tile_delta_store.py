@@ -0,0 +1,64 @@
+import os
+
+import numpy as np
+from PIL import Image
+
+from utils.tile_delta_store import TileDeltaStore, changed_tiles, convert_session
+
+
+def make_frames(count: int) -> list:
+    """A typing-like sequence: a noisy background with a growing text box"""
+    background = np.random.RandomState(0).randint(0, 256, (150, 200, 3), dtype=np.uint8)
+    frames = []
+    for i in range(count):
+        frame = background.copy()
+        frame[100:110, 10:10 + 15 * i] = 255
+        frames.append(frame)
+    return frames
+
+
+def test_changed_tiles_include_partial_edge_tiles():
+    previous = np.zeros((150, 200, 3), dtype=np.uint8)
+    current = previous.copy()
+    current[0, 0] = 1
+    current[149, 199] = 1
+    assert changed_tiles(previous, current, 64) == [(0, 0), (3, 2)]
+
+
+def test_frames_round_trip_with_random_access(tmp_path):
+    """Every frame rebuilds exactly, in any order, and only changed tiles are stored"""
+    frames = make_frames(7)
+    store = TileDeltaStore(str(tmp_path), tile_size=64, keyframe_interval=3, cache_size=1)
+    for i, frame in enumerate(frames):
+        assert store.append(frame, name=f"frame_{i}.png") == i
+
+    records = store.records
+    assert [record.is_keyframe for record in records] == [True, False, False, True, False, False, True]
+    assert all(len(record.tiles) <= 2 for record in records if not record.is_keyframe)
+
+    for index in [5, 0, 6, 2, 4, 1, 3]:
+        assert np.array_equal(store.read(index), frames[index])
+    assert store.keyframe_misses >= 3
+
+    # Reopening the store continues the sequence from the stored frames
+    reopened = TileDeltaStore(str(tmp_path), keyframe_interval=3)
+    assert reopened.index_of("frame_5.png") == 5
+    reopened.append(frames[0])
+    assert np.array_equal(reopened.read(-1), frames[0])
+    assert np.array_equal(reopened.read(5), frames[5])
+
+
+def test_convert_session_keeps_frames_identical(tmp_path):
+    raw_dir = tmp_path / "screenshots" / "raw"
+    raw_dir.mkdir(parents=True)
+    frames = make_frames(4)
+    for i, frame in enumerate(frames):
+        Image.fromarray(frame).save(raw_dir / f"screenshot_{i}.png")
+
+    store = convert_session(str(tmp_path), keyframe_interval=2)
+
+    # The app reads the PNGs, so they are kept
+    assert len(os.listdir(raw_dir)) == 4
+    assert len(store) == 4
+    for i, frame in enumerate(frames):
+        assert np.array_equal(store.read(store.index_of(f"screenshot_{i}.png")), frame)
@@ -11,15 +11,17 @@ import shutil
 import tempfile
 import json
 import copy
+import time
 
 # Add the project root to the Python path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-from services.vision_detect_service import VisionDetectService, get_vision_detect_service_instance
+from services.vision_detect_service import VisionDetectResultDelta, VisionDetectService, get_vision_detect_service_instance
 from services.screen_capture_service import ScreenshotEvent
 # Import directly from the modules where these classes are defined
 from inference.__init__ import VisionDetectResultModelList, VisionDetectResultModel, BoundingBox
-from base.base_observer import Observer, Priority, AsyncCapableObserver
+from base.base_observer import Observable, Observer, Priority, AsyncCapableObserver
+from inference.yolo.yolo_ui_icon_merged_inference import Merged_UI_IconBBoxes
 from config.paths import workspace_data_dir, workspace_dir
 
 # Configure logging
@@ -228,6 +230,135 @@ async def test_async_observer(screenshot_events):
         service._screenshot_events = []
         service._vision_detect_results = None
 
+class DeltaObserver(Observer[VisionDetectResultDelta]):
+    """Observer collecting live detection deltas."""
+    def __init__(self):
+        super().__init__(Priority.NORMAL)
+        self.deltas: List[VisionDetectResultDelta] = []
+    
+    def update(self, data: VisionDetectResultDelta) -> None:
+        self.deltas.append(data)
+
+def make_live_event(event_id: str, command_uuid: str = "command") -> ScreenshotEvent:
+    return ScreenshotEvent(
+        event_id=event_id,
+        project_uuid="project",
+        command_uuid=command_uuid,
+        timestamp=datetime.now(),
+        description=f"event {event_id}",
+        screenshot_path=f"{event_id}.png"
+    )
+
+def test_live_detection_streams_each_captured_frame(monkeypatch):
+    """Frames published by the capture service are detected one by one and pushed as deltas."""
+    detected_event_ids = []
+    
+    def fake_inference(events, should_crop=True, use_cache=False):
+        detected_event_ids.extend(event.event_id for event in events)
+        return [VisionDetectResultModel(
+            event_id=event.event_id,
+            project_uuid=event.project_uuid,
+            command_uuid=event.command_uuid,
+            timestamp=event.timestamp,
+            description=event.description,
+            original_image_path=event.screenshot_path,
+            original_width=1920,
+            original_height=1080,
+            is_cropped=False,
+            merged_ui_icon_bboxes=[]
+        ) for event in events]
+    
+    monkeypatch.setattr(Merged_UI_IconBBoxes, "get_inference_result_models_pil", fake_inference)
+    service = get_vision_detect_service_instance()
+    capture_service = Observable[List[ScreenshotEvent]]()
+    delta_observer = DeltaObserver()
+    service.add_delta_observer(delta_observer)
+    service.attach_to_screen_capture(capture_service)  # type: ignore
+    try:
+        first, second = make_live_event("first"), make_live_event("second")
+        capture_service.notify_observers([first])
+        capture_service.notify_observers([first, second])
+        service._live_queue.join()
+        
+        assert detected_event_ids == ["first", "second"]
+        assert [delta.result.event_id for delta in delta_observer.deltas] == ["first", "second"]
+        assert delta_observer.deltas[-1].processed_count == 2
+        
+        # The stop click is removed from the session, and a new session starts from scratch
+        capture_service.notify_observers([first])
+        assert [r.event_id for r in service.get_live_results().vision_detect_result_models] == ["first"]  # type: ignore
+        capture_service.notify_observers([make_live_event("third", command_uuid="other")])
+        service._live_queue.join()
+        assert [r.event_id for r in service.get_live_results().vision_detect_result_models] == ["third"]  # type: ignore
+    finally:
+        service.detach_from_screen_capture()
+        service.remove_delta_observer(delta_observer)
+
+def test_live_and_requested_detections_take_turns(monkeypatch):
+    """Live frames and client requests never run the shared models at the same time."""
+    state = {"running": 0, "overlapped": False}
+    
+    def fake_inference(events, should_crop=True, use_cache=False):
+        state["running"] += 1
+        state["overlapped"] |= state["running"] > 1
+        time.sleep(0.02)
+        state["running"] -= 1
+        return []
+    
+    monkeypatch.setattr(Merged_UI_IconBBoxes, "get_inference_result_models_pil", fake_inference)
+    service = get_vision_detect_service_instance()
+    capture_service = Observable[List[ScreenshotEvent]]()
+    service.attach_to_screen_capture(capture_service)  # type: ignore
+    try:
+        capture_service.notify_observers([make_live_event(f"live-{index}", command_uuid="turns") for index in range(3)])
+        service.set_screenshot_events([make_live_event("requested")])
+        service.process_screenshot_events()
+        service._live_queue.join()
+        assert not state["overlapped"]
+    finally:
+        service.detach_from_screen_capture()
+    
+    monkeypatch.setattr(VisionDetectService, "LIVE_DETECTION_ENABLED", False)
+    service.attach_to_screen_capture(capture_service)  # type: ignore
+    assert service._live_worker is None
+
+def test_observers_share_one_snapshot_without_copying_images():
+    """All observers receive the same snapshot and the cropped images are not copied."""
+    from PIL import Image
+    service = get_vision_detect_service_instance()
+    image = Image.new("RGB", (4, 4))
+    results = VisionDetectResultModelList(project_uuid="project", command_uuid="command", vision_detect_result_models=[
+        VisionDetectResultModel(
+            event_id="event", project_uuid="project", command_uuid="command", timestamp=datetime.now(),
+            description="", original_image_path="event.png", original_width=4, original_height=4,
+            is_cropped=True, merged_ui_icon_bboxes=[BoundingBox(0, 0, 1, 1, "button", 0.9)], cropped_image=image
+        )
+    ])
+    observers = [TestObserver(), TestObserver()]
+    for observer in observers:
+        service.add_observer(observer)
+    try:
+        service.notify_observers(results)
+        
+        assert observers[0].results is observers[1].results
+        assert observers[0].results is not results
+        snapshot_model = observers[0].results.vision_detect_result_models[0]  # type: ignore
+        assert snapshot_model.cropped_image is image
+        assert snapshot_model.merged_ui_icon_bboxes[0] is not results.vision_detect_result_models[0].merged_ui_icon_bboxes[0]
+    finally:
+        for observer in observers:
+            service.remove_observer(observer)
+
+def test_state_history_is_bounded():
+    """The state history keeps only the most recent changes."""
+    observable = Observable[int]()
+    for value in range(observable.state_history_limit + 10):  # type: ignore
+        observable.set_state("value", value)
+    
+    history = observable.get_state_history("value")
+    assert len(history) == observable.state_history_limit
+    assert history[-1].new_value == observable.state_history_limit + 9  # type: ignore
+
 if __name__ == "__main__":
     # This allows running the tests directly with python\
     # python -m pytest tests/services/test_vision_detect_service.py -v
@@ -0,0 +1,219 @@
+"""
+Vector annotations of screenshots, rendered on demand.
+
+A capture session stores one AnnotationOverlay (click point, radius, label) per
+screenshot event instead of a second, annotated copy of the image. The annotated
+image is drawn from the raw screenshot when something asks for it, and recently
+rendered images are kept in a small in-memory LRU cache.
+"""
+
+import io
+import logging
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple
+
+from PIL import Image, ImageDraw, ImageFont
+
+from utils.session_journal import get_session_journal
+
+logger = logging.getLogger("annotation_renderer")
+
+ANNOTATION_COLOR = "red"
+CLICK_RADIUS = 20
+CLICK_OUTLINE_WIDTH = 5
+LABEL_POSITION = (10, 10)
+MIN_FONT_SIZE = 20
+PNG_COMPRESS_LEVEL = 1
+
+
+@dataclass(frozen=True)
+class AnnotationOverlay:
+    """What to draw over a screenshot, in the screenshot's pixel coordinates"""
+    x: Optional[int] = None
+    y: Optional[int] = None
+    radius: int = CLICK_RADIUS
+    label: Optional[str] = None
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "AnnotationOverlay":
+        """Create an overlay from its asdict() form, e.g. as stored in the session JSON"""
+        return cls(x=data.get("x"), y=data.get("y"), radius=data.get("radius", CLICK_RADIUS),
+                   label=data.get("label"))
+
+
+@lru_cache(maxsize=16)
+def _load_font(size: int) -> ImageFont.FreeTypeFont | ImageFont.ImageFont:
+    try:
+        return ImageFont.truetype("arial.ttf", size)
+    except IOError:
+        logger.warning("Arial font not found, using default font")
+        return ImageFont.load_default()
+
+
+def draw_annotation(image: Image.Image, overlay: AnnotationOverlay, source_width: Optional[int] = None,
+                    scale: Tuple[float, float] = (1.0, 1.0)) -> None:
+    """
+    Draw an overlay onto an image in place.
+
+    Parameters:
+        image (Image.Image): The screenshot, or a resized copy of it.
+        overlay (AnnotationOverlay): The annotation, in the original screenshot's coordinates.
+        source_width (Optional[int]): Width of the original screenshot, used for the label size. Defaults to the image width.
+        scale (Tuple[float, float]): (x, y) factors from the original screenshot to the image.
+    """
+    draw = ImageDraw.Draw(image)
+    scale_x, scale_y = scale
+    line_scale = min(scale_x, scale_y)
+
+    if overlay.x is not None and overlay.y is not None:
+        x, y = overlay.x * scale_x, overlay.y * scale_y
+        radius = overlay.radius * line_scale
+        draw.ellipse((x - radius, y - radius, x + radius, y + radius), outline=ANNOTATION_COLOR,
+                     width=max(1, round(CLICK_OUTLINE_WIDTH * line_scale)))
+
+    if overlay.label:
+        font_size = max(MIN_FONT_SIZE, (source_width or image.width) // 30)
+        font = _load_font(max(1, round(font_size * line_scale)))
+        position = (LABEL_POSITION[0] * scale_x, LABEL_POSITION[1] * scale_y)
+        draw.text(position, overlay.label, fill=ANNOTATION_COLOR, font=font)
+
+
+def render_annotation(screenshot_path: str, overlay: AnnotationOverlay) -> bytes:
+    """
+    Render an annotated screenshot.
+
+    Parameters:
+        screenshot_path (str): Path to the raw screenshot.
+        overlay (AnnotationOverlay): The annotation to draw.
+
+    Returns:
+        bytes: The annotated image, PNG encoded.
+    """
+    with Image.open(screenshot_path) as source:
+        image = source.convert("RGB")
+    draw_annotation(image, overlay)
+    buffer = io.BytesIO()
+    image.save(buffer, format="PNG", compress_level=PNG_COMPRESS_LEVEL)
+    return buffer.getvalue()
+
+
+class AnnotationPreviewCache:
+    """
+    LRU cache of rendered annotated screenshots, keyed by the raw file and the overlay.
+    """
+
+    def __init__(self, max_entries: int = 32):
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[tuple, bytes]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_png(self, screenshot_path: str, overlay: AnnotationOverlay) -> bytes:
+        """
+        Get the rendered annotated screenshot, rendering it on a cache miss.
+
+        Parameters:
+            screenshot_path (str): Path to the raw screenshot.
+            overlay (AnnotationOverlay): The annotation to draw.
+
+        Returns:
+            bytes: The annotated image, PNG encoded.
+        """
+        # The modification time makes a replaced screenshot a cache miss
+        key = (os.path.abspath(screenshot_path), os.stat(screenshot_path).st_mtime_ns, overlay)
+        with self._lock:
+            png = self._entries.get(key)
+            if png is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return png
+            self.misses += 1
+
+        png = render_annotation(screenshot_path, overlay)
+        with self._lock:
+            self._entries[key] = png
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return png
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+_preview_cache: Optional[AnnotationPreviewCache] = None
+_preview_cache_lock = threading.Lock()
+
+
+def get_annotation_preview_cache() -> AnnotationPreviewCache:
+    """Get the process-wide cache of rendered annotated screenshots"""
+    global _preview_cache
+    with _preview_cache_lock:
+        if _preview_cache is None:
+            _preview_cache = AnnotationPreviewCache()
+        return _preview_cache
+
+
+def ensure_annotation_file(annotation_path: str, screenshot_path: str, overlay: AnnotationOverlay) -> str:
+    """
+    Write an annotated screenshot to disk if it is not there yet, for consumers that need a file.
+
+    Parameters:
+        annotation_path (str): Where the annotated screenshot belongs.
+        screenshot_path (str): Path to the raw screenshot.
+        overlay (AnnotationOverlay): The annotation to draw.
+
+    Returns:
+        str: annotation_path. Nothing is written if the raw screenshot is missing.
+    """
+    if not os.path.exists(annotation_path) and os.path.exists(screenshot_path):
+        os.makedirs(os.path.dirname(annotation_path) or ".", exist_ok=True)
+        png = get_annotation_preview_cache().get_png(screenshot_path, overlay)
+        with open(annotation_path, "wb") as f:
+            f.write(png)
+    return annotation_path
+
+
+def find_session_annotation(project_uuid: str, command_uuid: str, annotated_filename: str,
+                            data_dir: str = "data") -> Optional[Tuple[str, AnnotationOverlay]]:
+    """
+    Look up the overlay of an annotated screenshot in a session's events.
+
+    Parameters:
+        project_uuid (str): Project of the session.
+        command_uuid (str): Command of the session.
+        annotated_filename (str): File name of the annotated screenshot.
+        data_dir (str): Root of the session directories.
+
+    Returns:
+        Optional[Tuple[str, AnnotationOverlay]]: The raw screenshot path, resolved inside
+            data_dir/<project_uuid>/<command_uuid>, and the overlay, or None if no event has that annotation.
+    """
+    command_dir = os.path.join(data_dir, project_uuid, command_uuid)
+    journal = get_session_journal(project_uuid, command_uuid, data_dir)
+    if not journal.exists():
+        return None
+    events_data = journal.load()
+
+    for event_dict in events_data:
+        annotation_path = event_dict.get("annotation_path")
+        overlay_data = event_dict.get("annotation_overlay")
+        if not annotation_path or not overlay_data or os.path.basename(annotation_path) != annotated_filename:
+            continue
+        # Stored paths are relative to the server's working directory, resolve them from the session instead
+        raw_name = os.path.basename(event_dict["screenshot_path"])
+        screenshot_path = os.path.join(command_dir, "screenshots", "raw", raw_name)
+        return screenshot_path, AnnotationOverlay.from_dict(overlay_data)
+    return None
@@ -0,0 +1,99 @@
+"""
+Perceptual similarity of screen frames, used to suppress near-duplicate captures.
+
+Two measures are combined:
+
+- a 64-bit difference hash (dHash) as a cheap global check, and
+- a tile diff: the mean absolute difference of small grayscale thumbnails in each
+  cell of a grid. The similarity is driven by the most changed tile, so a small
+  local change (a typed character, a toggled checkbox) is not averaged away.
+"""
+
+import logging
+from dataclasses import dataclass
+from typing import Tuple
+
+import cv2
+import numpy as np
+
+logger = logging.getLogger("frame_similarity")
+
+DHASH_SIZE = 8
+DHASH_MAX_DISTANCE = 6
+THUMBNAIL_SIZE = (320, 180)  # (width, height)
+TILE_GRID = (16, 9)  # (columns, rows)
+
+
+@dataclass(frozen=True)
+class FrameSignature:
+    """Compact description of a frame for similarity checks"""
+    dhash: int
+    # Grayscale THUMBNAIL_SIZE thumbnail, float32 in [0, 1]
+    thumbnail: np.ndarray
+    shape: Tuple[int, ...]
+
+
+def compute_signature(rgb: np.ndarray) -> FrameSignature:
+    """
+    Compute the signature of an RGB frame.
+
+    Parameters:
+        rgb (np.ndarray): HxWx3 uint8 RGB frame.
+
+    Returns:
+        FrameSignature: The frame's dHash and thumbnail.
+    """
+    gray = cv2.cvtColor(rgb, cv2.COLOR_RGB2GRAY)
+    thumbnail = cv2.resize(gray, THUMBNAIL_SIZE, interpolation=cv2.INTER_AREA)
+    # dHash from the thumbnail rather than the full frame, it is already area-averaged
+    small = cv2.resize(thumbnail, (DHASH_SIZE + 1, DHASH_SIZE), interpolation=cv2.INTER_AREA)
+    bits = (small[:, 1:] > small[:, :-1]).flatten()
+    dhash = int(np.packbits(bits).view(">u8")[0])
+    thumbnail = thumbnail.astype(np.float32) / 255.0
+    thumbnail.setflags(write=False)
+    return FrameSignature(dhash=dhash, thumbnail=thumbnail, shape=rgb.shape)
+
+
+def hamming_distance(a: int, b: int) -> int:
+    """Number of differing bits between two hashes"""
+    return bin(a ^ b).count("1")
+
+
+def max_tile_difference(a: np.ndarray, b: np.ndarray, grid: Tuple[int, int] = TILE_GRID) -> float:
+    """
+    Largest per-tile mean absolute difference between two thumbnails.
+
+    Parameters:
+        a (np.ndarray): Thumbnail in [0, 1].
+        b (np.ndarray): Thumbnail of the same shape in [0, 1].
+        grid (Tuple[int, int]): Number of (columns, rows) tiles.
+
+    Returns:
+        float: Difference of the most changed tile, 0 (identical) to 1.
+    """
+    columns, rows = grid
+    height, width = a.shape
+    diff = np.abs(a - b)
+    # Trim so the thumbnail splits evenly into tiles
+    tile_height, tile_width = height // rows, width // columns
+    diff = diff[:tile_height * rows, :tile_width * columns]
+    tiles = diff.reshape(rows, tile_height, columns, tile_width).mean(axis=(1, 3))
+    return float(tiles.max())
+
+
+def similarity(a: FrameSignature, b: FrameSignature) -> float:
+    """
+    Similarity of two frames, 1.0 for identical frames.
+
+    Frames of different sizes are never similar. Otherwise the score is the tile diff
+    similarity, capped by the dHash similarity when the hashes differ by more than
+    DHASH_MAX_DISTANCE bits. Flat screen areas make single dHash bits flip on tiny
+    changes, so a few differing bits alone do not lower the score.
+    """
+    if a.shape != b.shape:
+        return 0.0
+    score = 1.0 - max_tile_difference(a.thumbnail, b.thumbnail)
+    distance = hamming_distance(a.dhash, b.dhash)
+    if distance > DHASH_MAX_DISTANCE:
+        score = min(score, 1.0 - distance / (DHASH_SIZE * DHASH_SIZE))
+    return score
@@ -7,6 +7,124 @@ from robot.bbox_factory import BBoxFactory, BoundingBoxType
 
 logger = logging.getLogger("image_utils")
 
+# Default values from chrome_system_bounding_boxes.json
+DEFAULT_RENDER_AREA = (0, 121, 1920, 1040)
+
+# PNG text chunk with the screen coordinates of a region capture's top-left pixel, "x,y"
+CAPTURE_ORIGIN_KEY = "karna:capture_origin"
+
+def get_website_render_area() -> Tuple[int, int, int, int]:
+    """
+    Get the website render area from BBoxFactory.
+    
+    Returns:
+        Tuple[int, int, int, int]: The render area coordinates (left, top, right, bottom),
+            or DEFAULT_RENDER_AREA if BBoxFactory is unavailable.
+    """
+    try:
+        bbox_factory = BBoxFactory()
+        website_render_bbox = bbox_factory.get_website_render_bbox()
+        render_area = (
+            website_render_bbox.x,
+            website_render_bbox.y,
+            website_render_bbox.x + website_render_bbox.width,
+            website_render_bbox.y + website_render_bbox.height
+        )
+        logger.info(f"Using website render area from BBoxFactory: {render_area}")
+        return render_area
+    except Exception as e:
+        # Fallback to default values if BBoxFactory fails
+        logger.warning(f"Failed to get render area from BBoxFactory: {str(e)}. Using default values.")
+        return DEFAULT_RENDER_AREA
+
+def get_capture_region(margin: int = 0, screen_size: Optional[Tuple[int, int]] = None) -> Tuple[int, int, int, int]:
+    """
+    Get the screen region to grab for a capture of the website render area only.
+    
+    Parameters:
+        margin (int): Pixels added around the render area on every side.
+        screen_size (Optional[Tuple[int, int]]): (width, height) of the screen, to keep the region on screen.
+        
+    Returns:
+        Tuple[int, int, int, int]: The region (left, top, width, height), as for CaptureBackend.grab.
+    """
+    left, top, right, bottom = get_website_render_area()
+    left, top, right, bottom = left - margin, top - margin, right + margin, bottom + margin
+    if screen_size is not None:
+        left, top, right, bottom = clamp_render_area((left, top, right, bottom), *screen_size)
+    else:
+        left, top = max(0, left), max(0, top)
+    return left, top, right - left, bottom - top
+
+def get_capture_origin(image_source: Union[str, Image.Image]) -> Tuple[int, int]:
+    """
+    Get the screen coordinates of an image's top-left pixel.
+    
+    Region captures store their origin in a PNG text chunk; full screen captures have none.
+    
+    Parameters:
+        image_source (Union[str, Image.Image]): Path to the image or PIL Image object.
+        
+    Returns:
+        Tuple[int, int]: The (x, y) origin, (0, 0) for full screen captures.
+    """
+    if isinstance(image_source, str):
+        # Opening only reads the header chunks, the pixels are not decoded
+        with Image.open(image_source) as image:
+            origin = image.info.get(CAPTURE_ORIGIN_KEY)
+    else:
+        origin = image_source.info.get(CAPTURE_ORIGIN_KEY)
+    if not origin:
+        return 0, 0
+    try:
+        x, y = (int(value) for value in str(origin).split(","))
+        return x, y
+    except ValueError:
+        logger.warning(f"Ignoring invalid capture origin: {origin}")
+        return 0, 0
+
+def format_capture_origin(origin: Tuple[int, int]) -> str:
+    """
+    Format a capture origin for the CAPTURE_ORIGIN_KEY text chunk.
+    
+    Parameters:
+        origin (Tuple[int, int]): The (x, y) screen coordinates of the image's top-left pixel.
+        
+    Returns:
+        str: The chunk value, "x,y".
+    """
+    return f"{origin[0]},{origin[1]}"
+
+def to_image_render_area(render_area: Tuple[int, int, int, int], origin: Tuple[int, int]) -> Tuple[int, int, int, int]:
+    """
+    Convert a render area from screen coordinates to the coordinates of an image captured at origin.
+    
+    Parameters:
+        render_area (Tuple[int, int, int, int]): The render area in screen coordinates (left, top, right, bottom).
+        origin (Tuple[int, int]): The screen coordinates of the image's top-left pixel.
+        
+    Returns:
+        Tuple[int, int, int, int]: The render area in image coordinates, not clamped to the image.
+    """
+    left, top, right, bottom = render_area
+    origin_x, origin_y = origin
+    return left - origin_x, top - origin_y, right - origin_x, bottom - origin_y
+
+def clamp_render_area(render_area: Tuple[int, int, int, int], img_width: int, img_height: int) -> Tuple[int, int, int, int]:
+    """
+    Adjust a render area so that it does not exceed the image dimensions.
+    
+    Parameters:
+        render_area (Tuple[int, int, int, int]): The render area coordinates (left, top, right, bottom).
+        img_width (int): Width of the image.
+        img_height (int): Height of the image.
+        
+    Returns:
+        Tuple[int, int, int, int]: The clamped render area.
+    """
+    left, top, right, bottom = render_area
+    return max(0, left), max(0, top), min(img_width, right), min(img_height, bottom)
+
 def crop_to_render_area(
     image_source: Union[str, Image.Image], 
     render_area: Optional[Tuple[int, int, int, int]] = None,
@@ -17,7 +135,7 @@ def crop_to_render_area(
     
     Parameters:
         image_source (Union[str, Image.Image]): Path to the image or PIL Image object.
-        render_area (Optional[Tuple[int, int, int, int]]): The render area coordinates (left, top, right, bottom).
+        render_area (Optional[Tuple[int, int, int, int]]): The render area in screen coordinates (left, top, right, bottom).
             If None, the render area from BBoxFactory will be used.
         should_crop (bool): Whether to crop the image or not. Default is True.
         
@@ -53,30 +171,13 @@ def crop_to_render_area(
     
     # If render_area is not provided, get it from BBoxFactory
     if render_area is None:
-        try:
-            bbox_factory = BBoxFactory()
-            website_render_bbox = bbox_factory.get_website_render_bbox()
-            render_area = (
-                website_render_bbox.x,
-                website_render_bbox.y,
-                website_render_bbox.x + website_render_bbox.width,
-                website_render_bbox.y + website_render_bbox.height
-            )
-            logger.info(f"Using website render area from BBoxFactory: {render_area}")
-        except Exception as e:
-            # Fallback to default values if BBoxFactory fails
-            logger.warning(f"Failed to get render area from BBoxFactory: {str(e)}. Using default values.")
-            render_area = (0, 121, 1920, 1040)  # Default values from chrome_system_bounding_boxes.json
+        render_area = get_website_render_area()
     
-    # Ensure the render area is within the image bounds
-    img_width, img_height = image.size
-    left, top, right, bottom = render_area
+    # Region captures start at their origin rather than the screen's top-left corner
+    render_area = to_image_render_area(render_area, get_capture_origin(image))
     
-    # Adjust the render area if it exceeds the image dimensions
-    left = max(0, left)
-    top = max(0, top)
-    right = min(img_width, right)
-    bottom = min(img_height, bottom)
+    # Ensure the render area is within the image bounds
+    left, top, right, bottom = clamp_render_area(render_area, *image.size)
     
     # Crop the image to the render area
     logger.info(f"Cropping image to render area: {(left, top, right, bottom)}")
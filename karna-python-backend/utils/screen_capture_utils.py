@@ -2,8 +2,9 @@ import os
 import json
 import logging
 from typing import List
-from datetime import datetime
-from services.screen_capture_service import ScreenshotEvent
+from services.screen_capture_service import ScreenshotEvent, event_from_dict
+from services.session_catalog import get_session_catalog_instance
+from utils.session_journal import get_session_journal
 
 logger = logging.getLogger(__name__)
 
@@ -15,8 +16,8 @@ class ScreenCaptureUtilError(Exception):
 def load_screenshot_events_from_cache(project_uuid: str, command_uuid: str) -> List[ScreenshotEvent]:
     """Load screenshot events from the workspace data directory cache.
     
-    This is a standalone utility function that loads screenshot events from a JSON file
-    in the data directory without requiring a screen capture session or service.
+    This is a standalone utility function that loads screenshot events from the session
+    journal in the data directory without requiring a screen capture session or service.
     
     Args:
         project_uuid: Project identifier
@@ -29,34 +30,29 @@ def load_screenshot_events_from_cache(project_uuid: str, command_uuid: str) -> L
         ScreenCaptureUtilError: If directory or file not found, or if JSON is invalid
     """
     try:
-        base_dir = os.path.join('data', project_uuid, command_uuid)
-        if not os.path.exists(base_dir):
+        # The catalog knows the session, and marks it as used so retention keeps it
+        base_dir = get_session_catalog_instance().find_session_dir(project_uuid, command_uuid)
+        if base_dir is None:
             raise ScreenCaptureUtilError(f"Directory not found for project {project_uuid}, command {command_uuid}")
         
-        json_path = os.path.join(base_dir, f'screenshot_events_{command_uuid}.json')
+        journal = get_session_journal(project_uuid, command_uuid)
         
-        # Check if JSON file exists
-        if not os.path.exists(json_path):
-            raise ScreenCaptureUtilError(f"Screenshot events file not found: {json_path}")
+        # Check if the snapshot or the journal exists
+        if not journal.exists():
+            raise ScreenCaptureUtilError(f"Screenshot events file not found: {journal.snapshot_path}")
         
-        # Load events from JSON file
+        # Load the snapshot and stream the journal records over it
         try:
-            with open(json_path, 'r', encoding='utf-8') as f:
-                events_data = json.load(f)
+            events_data = journal.load()
         except json.JSONDecodeError as e:
             raise ScreenCaptureUtilError(f"Invalid JSON in screenshot events file: {str(e)}")
         
         # Convert JSON data back to ScreenshotEvent objects
         screenshot_events = []
         for event_dict in events_data:
-            # Convert ISO format string back to datetime
-            if 'timestamp' in event_dict:
-                event_dict['timestamp'] = datetime.fromisoformat(event_dict['timestamp'])
-            
             # Create ScreenshotEvent object
             try:
-                event = ScreenshotEvent(**event_dict)
-                screenshot_events.append(event)
+                screenshot_events.append(event_from_dict(event_dict))
             except (TypeError, ValueError) as e:
                 logger.warning(f"Skipping invalid event: {str(e)}")
         
@@ -0,0 +1,235 @@
+"""
+Append-only journal of a capture session's screenshot events.
+
+A session's events are stored in two files in data/<project_uuid>/<command_uuid>/:
+
+- screenshot_events_<command_uuid>.json: the snapshot, {"generation": n, "events": [...]}
+  with the list of event dicts (older sessions store the bare list), and
+- screenshot_events_<command_uuid>.jsonl: changes made since the snapshot, one JSON
+  record per line: {"op": "put", "generation": n, "event": {...}} or
+  {"op": "delete", "generation": n, "event_ids": [...]}.
+
+Adding or editing an event appends one fsync'd line instead of rewriting the whole
+session. Loading replays the journal records of the snapshot's generation over it.
+Compaction writes a snapshot of the next generation to a temporary file, atomically
+renames it into place and then removes the journal. A crash before the rename keeps
+the old snapshot and journal; a crash after it leaves only records of an older
+generation, which loading skips. A crash can also leave a torn last line in the
+journal, which loading skips too.
+"""
+
+import json
+import logging
+import os
+import threading
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+OP_PUT = "put"
+OP_DELETE = "delete"
+
+
+class SessionJournal:
+    """Snapshot plus append-only change journal of one session's screenshot events"""
+
+    def __init__(self, session_dir: str, command_uuid: str, compact_after: int = 500):
+        """
+        Initialize the journal. No file is touched until the first write.
+
+        Args:
+            session_dir: The session directory, data/<project_uuid>/<command_uuid>.
+            command_uuid: Command identifier, part of the file names.
+            compact_after: Compact once the journal holds this many records.
+        """
+        if compact_after < 1:
+            raise ValueError("compact_after must be at least 1")
+        self.session_dir = session_dir
+        self.snapshot_path = os.path.join(session_dir, f"screenshot_events_{command_uuid}.json")
+        self.journal_path = os.path.join(session_dir, f"screenshot_events_{command_uuid}.jsonl")
+        self.compact_after = compact_after
+        self._lock = threading.Lock()
+        # Records in the journal file, counted on first use
+        self._record_count: Optional[int] = None
+        # Generation of the snapshot, read on first use
+        self._generation: Optional[int] = None
+
+    def exists(self) -> bool:
+        """Whether the session has a snapshot or a journal"""
+        return os.path.exists(self.snapshot_path) or os.path.exists(self.journal_path)
+
+    def put(self, event_dicts: Iterable[Dict[str, Any]]) -> None:
+        """
+        Add events, or replace the events with the same event_id in place.
+
+        Args:
+            event_dicts: JSON-serializable event dicts with an event_id.
+        """
+        self._append([{"op": OP_PUT, "event": event_dict} for event_dict in event_dicts])
+
+    def delete(self, event_ids: Iterable[str]) -> None:
+        """
+        Remove events.
+
+        Args:
+            event_ids: Ids of the events to remove. Unknown ids are ignored.
+        """
+        event_ids = list(event_ids)
+        if event_ids:
+            self._append([{"op": OP_DELETE, "event_ids": event_ids}])
+
+    def load(self) -> List[Dict[str, Any]]:
+        """
+        Get the current event dicts, in order.
+
+        Returns:
+            List[Dict[str, Any]]: The snapshot's events with the journal applied.
+
+        Raises:
+            json.JSONDecodeError: If the snapshot is not valid JSON.
+        """
+        with self._lock:
+            return self._load()
+
+    def compact(self, event_dicts: Optional[List[Dict[str, Any]]] = None) -> None:
+        """
+        Write a new snapshot and empty the journal.
+
+        Args:
+            event_dicts: The full event list to store. None folds the current journal into the snapshot.
+        """
+        with self._lock:
+            self._compact(self._load() if event_dicts is None else event_dicts)
+
+    def reset(self) -> None:
+        """Start over with an empty event list, e.g. when a new capture reuses the session directory"""
+        self.compact([])
+
+    def _append(self, records: List[Dict[str, Any]]) -> None:
+        if not records:
+            return
+        with self._lock:
+            generation = self._current_generation()
+            data = "".join(json.dumps(dict(record, generation=generation), ensure_ascii=False) + "\n"
+                           for record in records)
+            os.makedirs(self.session_dir, exist_ok=True)
+            record_count = self._count_records() + len(records)
+            with open(self.journal_path, "a+b") as f:
+                if f.tell() > 0:
+                    f.seek(-1, os.SEEK_END)
+                    if f.read(1) != b"\n":
+                        # Terminate a line torn by a crash so it does not swallow this record
+                        data = "\n" + data
+                f.write(data.encode("utf-8"))
+                f.flush()
+                os.fsync(f.fileno())
+            self._record_count = record_count
+            if self._record_count >= self.compact_after:
+                self._compact(self._load())
+
+    def _count_records(self) -> int:
+        if self._record_count is None:
+            self._record_count = sum(1 for _ in self._read_journal())
+        return self._record_count
+
+    def _current_generation(self) -> int:
+        if self._generation is None:
+            self._generation, _ = self._read_snapshot()
+        return self._generation
+
+    def _read_snapshot(self) -> Tuple[int, List[Dict[str, Any]]]:
+        """Read the snapshot's generation and events"""
+        generation, event_dicts = 0, []
+        if os.path.exists(self.snapshot_path):
+            with open(self.snapshot_path, "r", encoding="utf-8") as f:
+                snapshot = json.load(f)
+            if isinstance(snapshot, list):
+                # Written before snapshots had a generation
+                event_dicts = snapshot
+            else:
+                generation, event_dicts = snapshot["generation"], snapshot["events"]
+        return generation, event_dicts
+
+    def _load(self) -> List[Dict[str, Any]]:
+        events: Dict[str, Dict[str, Any]] = {}
+        self._generation, snapshot_events = self._read_snapshot()
+        for event_dict in snapshot_events:
+            events[event_dict["event_id"]] = event_dict
+        for record in self._read_journal():
+            if record.get("generation", 0) < self._generation:
+                # Already in the snapshot, left behind by a crash during compaction
+                continue
+            if record.get("op") == OP_PUT:
+                # Assigning an existing key keeps its position, edits stay in place
+                events[record["event"]["event_id"]] = record["event"]
+            elif record.get("op") == OP_DELETE:
+                for event_id in record["event_ids"]:
+                    events.pop(event_id, None)
+        return list(events.values())
+
+    def _read_journal(self) -> Iterator[Dict[str, Any]]:
+        """Stream the journal records, skipping a line torn by a crash"""
+        if not os.path.exists(self.journal_path):
+            return
+        with open(self.journal_path, "r", encoding="utf-8") as f:
+            for line_number, line in enumerate(f, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    logger.warning(f"Skipping unreadable record {line_number} of {self.journal_path}")
+
+    def _compact(self, event_dicts: List[Dict[str, Any]]) -> None:
+        os.makedirs(self.session_dir, exist_ok=True)
+        # Records of the current journal belong to an older generation once the new snapshot is in place
+        generation = self._current_generation() + 1
+        temp_path = f"{self.snapshot_path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump({"generation": generation, "events": event_dicts}, f, ensure_ascii=False)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, self.snapshot_path)
+        self._fsync_session_dir()
+        self._generation = generation
+        if os.path.exists(self.journal_path):
+            os.remove(self.journal_path)
+        self._record_count = 0
+        logger.debug(f"Compacted {len(event_dicts)} screenshot events into {self.snapshot_path}")
+
+    def _fsync_session_dir(self) -> None:
+        """Make the rename of the snapshot durable"""
+        if os.name == "nt":
+            # Directories cannot be opened for fsync on Windows, NTFS journals the rename itself
+            return
+        fd = os.open(self.session_dir, os.O_RDONLY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+
+_journals: Dict[str, SessionJournal] = {}
+_journals_lock = threading.Lock()
+
+
+def get_session_journal(project_uuid: str, command_uuid: str, data_dir: str = "data") -> SessionJournal:
+    """
+    Get the journal of a session, shared by everything in the process that reads or writes it.
+
+    Args:
+        project_uuid: Project identifier
+        command_uuid: Command identifier
+        data_dir: Root of the session directories.
+
+    Returns:
+        SessionJournal: The journal of data_dir/<project_uuid>/<command_uuid>.
+    """
+    session_dir = os.path.join(data_dir, project_uuid, command_uuid)
+    key = os.path.abspath(session_dir)
+    with _journals_lock:
+        journal = _journals.get(key)
+        if journal is None:
+            journal = SessionJournal(session_dir, command_uuid)
+            _journals[key] = journal
+        return journal
@@ -0,0 +1,345 @@
+"""
+Tile-based delta storage of a session's screenshot sequence.
+
+Consecutive screenshots mostly differ in small regions, e.g. the text box being
+typed into. A TileDeltaStore keeps a full keyframe every keyframe_interval
+frames and, in between, only the tile_size x tile_size tiles that changed since
+the previous frame:
+
+    <store_dir>/index.jsonl          one JSON record per frame, in order
+    <store_dir>/keyframes/<n>.png    full frames
+    <store_dir>/deltas/<n>.png       changed tiles of frame n, stacked vertically
+
+Any frame is rebuilt from its keyframe by pasting the tiles of the frames after
+it, so reading is random access and costs at most keyframe_interval - 1 small
+decodes. Decoded keyframes are kept in an LRU cache.
+
+Index records are appended and fsync'd like the session journal's; a record
+torn by a crash is skipped on open.
+"""
+
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from PIL import Image
+
+logger = logging.getLogger(__name__)
+
+INDEX_FILENAME = "index.jsonl"
+KEYFRAME_DIR = "keyframes"
+DELTA_DIR = "deltas"
+PNG_COMPRESS_LEVEL = 1
+
+
+@dataclass
+class TileFrameRecord:
+    """Index entry of one stored frame"""
+    index: int
+    width: int
+    height: int
+    # Index of the keyframe the frame is rebuilt from, itself for keyframes
+    keyframe: int
+    # Store-relative path of the keyframe PNG or the delta tile PNG, None if nothing changed
+    path: Optional[str] = None
+    # (column, row) of each changed tile, in the order they are stacked in the delta PNG
+    tiles: List[Tuple[int, int]] = field(default_factory=list)
+    # Caller's name of the frame, e.g. the original screenshot file name
+    name: Optional[str] = None
+
+    @property
+    def is_keyframe(self) -> bool:
+        return self.keyframe == self.index
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "TileFrameRecord":
+        return cls(index=data["index"], width=data["width"], height=data["height"], keyframe=data["keyframe"],
+                   path=data.get("path"), tiles=[tuple(tile) for tile in data.get("tiles", [])],
+                   name=data.get("name"))
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"index": self.index, "width": self.width, "height": self.height, "keyframe": self.keyframe,
+                "path": self.path, "tiles": [list(tile) for tile in self.tiles], "name": self.name}
+
+
+def changed_tiles(previous: np.ndarray, current: np.ndarray, tile_size: int) -> List[Tuple[int, int]]:
+    """
+    Find the tiles that differ between two frames of the same size.
+
+    Args:
+        previous: HxWx3 uint8 frame.
+        current: HxWx3 uint8 frame.
+        tile_size: Tile edge in pixels. Edge tiles may be smaller.
+
+    Returns:
+        List[Tuple[int, int]]: (column, row) of every changed tile, row by row.
+    """
+    changed = np.any(previous != current, axis=2)
+    height, width = changed.shape
+    rows = -(-height // tile_size)
+    columns = -(-width // tile_size)
+    padded = np.zeros((rows * tile_size, columns * tile_size), dtype=bool)
+    padded[:height, :width] = changed
+    tile_changed = padded.reshape(rows, tile_size, columns, tile_size).any(axis=(1, 3))
+    return [(int(column), int(row)) for row, column in zip(*np.nonzero(tile_changed))]
+
+
+class TileDeltaStore:
+    """Keyframes plus changed tiles of a screenshot sequence, with random-access reads"""
+
+    def __init__(self, store_dir: str, tile_size: int = 64, keyframe_interval: int = 10, cache_size: int = 4):
+        """
+        Open a store, creating it on the first append.
+
+        Args:
+            store_dir: Directory of the store.
+            tile_size: Tile edge in pixels, for new stores. Existing stores keep theirs.
+            keyframe_interval: Store a full frame every this many frames.
+            cache_size: Number of decoded keyframes kept in memory.
+        """
+        if tile_size < 1:
+            raise ValueError("tile_size must be at least 1")
+        if keyframe_interval < 1:
+            raise ValueError("keyframe_interval must be at least 1")
+        if cache_size < 1:
+            raise ValueError("cache_size must be at least 1")
+        self.store_dir = store_dir
+        self.index_path = os.path.join(store_dir, INDEX_FILENAME)
+        self.tile_size = tile_size
+        self.keyframe_interval = keyframe_interval
+        self.cache_size = cache_size
+        self.keyframe_hits = 0
+        self.keyframe_misses = 0
+        self._lock = threading.Lock()
+        self._keyframes: "OrderedDict[int, np.ndarray]" = OrderedDict()
+        # The last appended frame, to diff the next one against
+        self._previous: Optional[np.ndarray] = None
+        # Reading the index restores the tile size of an existing store
+        self._records: List[TileFrameRecord] = self._read_index()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._records)
+
+    @property
+    def records(self) -> List[TileFrameRecord]:
+        with self._lock:
+            return list(self._records)
+
+    def index_of(self, name: str) -> int:
+        """
+        Get the index of a frame by name.
+
+        Raises:
+            KeyError: If no frame has that name.
+        """
+        with self._lock:
+            for record in self._records:
+                if record.name == name:
+                    return record.index
+        raise KeyError(name)
+
+    def append(self, rgb: np.ndarray, name: Optional[str] = None) -> int:
+        """
+        Add a frame.
+
+        Args:
+            rgb: HxWx3 uint8 RGB frame.
+            name: Optional name to find the frame by, e.g. its screenshot file name.
+
+        Returns:
+            int: The frame's index.
+        """
+        if rgb.ndim != 3 or rgb.shape[2] != 3 or rgb.dtype != np.uint8:
+            raise ValueError("Frames must be HxWx3 uint8 RGB arrays")
+        with self._lock:
+            index = len(self._records)
+            height, width = rgb.shape[:2]
+            previous = self._previous
+            if previous is None and self._records:
+                previous = self._read(index - 1)
+            last = self._records[-1] if self._records else None
+
+            is_keyframe = (last is None or previous is None or previous.shape != rgb.shape
+                           or index - last.keyframe >= self.keyframe_interval)
+            if is_keyframe:
+                path = f"{KEYFRAME_DIR}/{index}.png"
+                self._save_png(rgb, path)
+                record = TileFrameRecord(index=index, width=width, height=height, keyframe=index, path=path,
+                                         name=name)
+            else:
+                tiles = changed_tiles(previous, rgb, self.tile_size)
+                path = None
+                if tiles:
+                    path = f"{DELTA_DIR}/{index}.png"
+                    self._save_png(self._pack_tiles(rgb, tiles), path)
+                record = TileFrameRecord(index=index, width=width, height=height, keyframe=last.keyframe,
+                                         path=path, tiles=tiles, name=name)
+
+            self._append_record(record)
+            self._records.append(record)
+            frame = np.array(rgb, copy=True)
+            frame.setflags(write=False)
+            self._previous = frame
+            return index
+
+    def read(self, index: int) -> np.ndarray:
+        """
+        Rebuild a frame.
+
+        Args:
+            index: Frame index, negative values count from the end.
+
+        Returns:
+            np.ndarray: Read-only HxWx3 uint8 RGB frame.
+        """
+        with self._lock:
+            if index < 0:
+                index += len(self._records)
+            if not 0 <= index < len(self._records):
+                raise IndexError(f"Frame {index} is not in the store")
+            return self._read(index)
+
+    def export_png(self, index: int, path: str) -> str:
+        """Write a frame as a plain PNG, for consumers that need a file"""
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        Image.fromarray(self.read(index)).save(path, format="PNG", compress_level=PNG_COMPRESS_LEVEL)
+        return path
+
+    def size_on_disk(self) -> int:
+        """Bytes of the index, keyframes and deltas"""
+        total = 0
+        for root, _, files in os.walk(self.store_dir):
+            total += sum(os.path.getsize(os.path.join(root, name)) for name in files)
+        return total
+
+    def _read(self, index: int) -> np.ndarray:
+        record = self._records[index]
+        keyframe = self._get_keyframe(record.keyframe)
+        if record.is_keyframe:
+            return keyframe
+
+        frame = np.array(keyframe, copy=True)
+        tile_size = self.tile_size
+        for delta in self._records[record.keyframe + 1:index + 1]:
+            if not delta.path:
+                continue
+            atlas = self._load_png(delta.path)
+            for slot, (column, row) in enumerate(delta.tiles):
+                top, left = row * tile_size, column * tile_size
+                bottom, right = min(top + tile_size, frame.shape[0]), min(left + tile_size, frame.shape[1])
+                atlas_top = slot * tile_size
+                frame[top:bottom, left:right] = atlas[atlas_top:atlas_top + bottom - top, :right - left]
+        frame.setflags(write=False)
+        return frame
+
+    def _get_keyframe(self, index: int) -> np.ndarray:
+        keyframe = self._keyframes.get(index)
+        if keyframe is not None:
+            self._keyframes.move_to_end(index)
+            self.keyframe_hits += 1
+            return keyframe
+        self.keyframe_misses += 1
+        keyframe = self._load_png(self._records[index].path)
+        keyframe.setflags(write=False)
+        self._keyframes[index] = keyframe
+        while len(self._keyframes) > self.cache_size:
+            self._keyframes.popitem(last=False)
+        return keyframe
+
+    def _pack_tiles(self, rgb: np.ndarray, tiles: Sequence[Tuple[int, int]]) -> np.ndarray:
+        """Stack the tiles vertically into one image; edge tiles are padded with black"""
+        tile_size = self.tile_size
+        atlas = np.zeros((len(tiles) * tile_size, tile_size, 3), dtype=np.uint8)
+        for slot, (column, row) in enumerate(tiles):
+            tile = rgb[row * tile_size:(row + 1) * tile_size, column * tile_size:(column + 1) * tile_size]
+            atlas[slot * tile_size:slot * tile_size + tile.shape[0], :tile.shape[1]] = tile
+        return atlas
+
+    def _save_png(self, rgb: np.ndarray, relative_path: str) -> None:
+        path = os.path.join(self.store_dir, relative_path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        Image.fromarray(rgb).save(path, format="PNG", compress_level=PNG_COMPRESS_LEVEL)
+
+    def _load_png(self, relative_path: str) -> np.ndarray:
+        with Image.open(os.path.join(self.store_dir, relative_path)) as image:
+            return np.asarray(image.convert("RGB"))
+
+    def _append_record(self, record: TileFrameRecord) -> None:
+        os.makedirs(self.store_dir, exist_ok=True)
+        data = dict(record.to_dict(), tile_size=self.tile_size)
+        line = json.dumps(data) + "\n"
+        with open(self.index_path, "a+b") as f:
+            if f.tell() > 0:
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b"\n":
+                    # Terminate a line torn by a crash so it does not swallow this record
+                    line = "\n" + line
+            f.write(line.encode("utf-8"))
+            f.flush()
+            os.fsync(f.fileno())
+
+    def _read_index(self) -> List[TileFrameRecord]:
+        records: List[TileFrameRecord] = []
+        if not os.path.exists(self.index_path):
+            return records
+        with open(self.index_path, "r", encoding="utf-8") as f:
+            for line_number, line in enumerate(f, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    data = json.loads(line)
+                except json.JSONDecodeError:
+                    logger.warning(f"Skipping unreadable record {line_number} of {self.index_path}")
+                    continue
+                if data["index"] != len(records):
+                    logger.warning(f"Ignoring out of order record {line_number} of {self.index_path}")
+                    continue
+                self.tile_size = data.get("tile_size", self.tile_size)
+                records.append(TileFrameRecord.from_dict(data))
+        return records
+
+
+def get_tile_store_dir(session_dir: str) -> str:
+    """Get where the tile delta store of a session lives, <session>/screenshots/tiles"""
+    return os.path.join(session_dir, "screenshots", "tiles")
+
+
+def convert_session(session_dir: str, tile_size: int = 64, keyframe_interval: int = 10) -> TileDeltaStore:
+    """
+    Convert a session's raw screenshots into a tile delta store.
+
+    Frames are added in file name order, which is capture order. Frames already in the
+    store are skipped, so an interrupted conversion can be resumed.
+
+    The PNGs are kept: the app still reads screenshots/raw everywhere, so the store is
+    an additional copy until there is a reader for it.
+
+    Args:
+        session_dir: The session directory, data/<project_uuid>/<command_uuid>.
+        tile_size: Tile edge in pixels.
+        keyframe_interval: Store a full frame every this many frames.
+
+    Returns:
+        TileDeltaStore: The session's store.
+    """
+    raw_dir = os.path.join(session_dir, "screenshots", "raw")
+    store = TileDeltaStore(get_tile_store_dir(session_dir), tile_size=tile_size,
+                           keyframe_interval=keyframe_interval)
+    stored_names = {record.name for record in store.records}
+    filenames = sorted(name for name in os.listdir(raw_dir) if name.lower().endswith(".png")) \
+        if os.path.isdir(raw_dir) else []
+
+    for filename in filenames:
+        if filename in stored_names:
+            continue
+        with Image.open(os.path.join(raw_dir, filename)) as image:
+            rgb = np.asarray(image.convert("RGB"))
+        store.append(rgb, name=filename)
+    logger.info(f"Converted {len(filenames)} screenshots of {session_dir} into {len(store)} stored frames")
+    return store
@@ -95,7 +95,12 @@ export class ScreenCaptureChannel extends BaseWebSocketChannel {
                 mouseEventToolTip: event.mouse_event_tool_tip || event.mouseEventToolTip,
                 keyChar: event.keyChar,
                 keyCode: event.keyCode,
-                isSpecialKey: event.isSpecialKey
+                isSpecialKey: event.isSpecialKey,
+                similarityScore: event.similarityScore,
+                duplicateOfEventId: event.duplicateOfEventId,
+                thumbnailPaths: event.thumbnailPaths,
+                captureOriginX: event.captureOriginX,
+                captureOriginY: event.captureOriginY
             };
         });
 
@@ -327,6 +327,303 @@ export namespace karna {
             public static getTypeUrl(typeUrlPrefix?: string): string;
         }
 
+        /** Properties of a CaptureDeltaSubscribeRequest. */
+        interface ICaptureDeltaSubscribeRequest {
+
+            /** CaptureDeltaSubscribeRequest enabled */
+            enabled?: (boolean|null);
+        }
+
+        /** Represents a CaptureDeltaSubscribeRequest. */
+        class CaptureDeltaSubscribeRequest implements ICaptureDeltaSubscribeRequest {
+
+            /**
+             * Constructs a new CaptureDeltaSubscribeRequest.
+             * @param [properties] Properties to set
+             */
+            constructor(properties?: karna.screen_capture.ICaptureDeltaSubscribeRequest);
+
+            /** CaptureDeltaSubscribeRequest enabled. */
+            public enabled: boolean;
+
+            /**
+             * Creates a new CaptureDeltaSubscribeRequest instance using the specified properties.
+             * @param [properties] Properties to set
+             * @returns CaptureDeltaSubscribeRequest instance
+             */
+            public static create(properties?: karna.screen_capture.ICaptureDeltaSubscribeRequest): karna.screen_capture.CaptureDeltaSubscribeRequest;
+
+            /**
+             * Encodes the specified CaptureDeltaSubscribeRequest message. Does not implicitly {@link karna.screen_capture.CaptureDeltaSubscribeRequest.verify|verify} messages.
+             * @param message CaptureDeltaSubscribeRequest message or plain object to encode
+             * @param [writer] Writer to encode to
+             * @returns Writer
+             */
+            public static encode(message: karna.screen_capture.ICaptureDeltaSubscribeRequest, writer?: $protobuf.Writer): $protobuf.Writer;
+
+            /**
+             * Encodes the specified CaptureDeltaSubscribeRequest message, length delimited. Does not implicitly {@link karna.screen_capture.CaptureDeltaSubscribeRequest.verify|verify} messages.
+             * @param message CaptureDeltaSubscribeRequest message or plain object to encode
+             * @param [writer] Writer to encode to
+             * @returns Writer
+             */
+            public static encodeDelimited(message: karna.screen_capture.ICaptureDeltaSubscribeRequest, writer?: $protobuf.Writer): $protobuf.Writer;
+
+            /**
+             * Decodes a CaptureDeltaSubscribeRequest message from the specified reader or buffer.
+             * @param reader Reader or buffer to decode from
+             * @param [length] Message length if known beforehand
+             * @returns CaptureDeltaSubscribeRequest
+             * @throws {Error} If the payload is not a reader or valid buffer
+             * @throws {$protobuf.util.ProtocolError} If required fields are missing
+             */
+            public static decode(reader: ($protobuf.Reader|Uint8Array), length?: number): karna.screen_capture.CaptureDeltaSubscribeRequest;
+
+            /**
+             * Decodes a CaptureDeltaSubscribeRequest message from the specified reader or buffer, length delimited.
+             * @param reader Reader or buffer to decode from
+             * @returns CaptureDeltaSubscribeRequest
+             * @throws {Error} If the payload is not a reader or valid buffer
+             * @throws {$protobuf.util.ProtocolError} If required fields are missing
+             */
+            public static decodeDelimited(reader: ($protobuf.Reader|Uint8Array)): karna.screen_capture.CaptureDeltaSubscribeRequest;
+
+            /**
+             * Verifies a CaptureDeltaSubscribeRequest message.
+             * @param message Plain object to verify
+             * @returns `null` if valid, otherwise the reason why it is not
+             */
+            public static verify(message: { [k: string]: any }): (string|null);
+
+            /**
+             * Creates a CaptureDeltaSubscribeRequest message from a plain object. Also converts values to their respective internal types.
+             * @param object Plain object
+             * @returns CaptureDeltaSubscribeRequest
+             */
+            public static fromObject(object: { [k: string]: any }): karna.screen_capture.CaptureDeltaSubscribeRequest;
+
+            /**
+             * Creates a plain object from a CaptureDeltaSubscribeRequest message. Also converts values to other types if specified.
+             * @param message CaptureDeltaSubscribeRequest
+             * @param [options] Conversion options
+             * @returns Plain object
+             */
+            public static toObject(message: karna.screen_capture.CaptureDeltaSubscribeRequest, options?: $protobuf.IConversionOptions): { [k: string]: any };
+
+            /**
+             * Converts this CaptureDeltaSubscribeRequest to JSON.
+             * @returns JSON object
+             */
+            public toJSON(): { [k: string]: any };
+
+            /**
+             * Gets the default type url for CaptureDeltaSubscribeRequest
+             * @param [typeUrlPrefix] your custom typeUrlPrefix(default "type.googleapis.com")
+             * @returns The default type url
+             */
+            public static getTypeUrl(typeUrlPrefix?: string): string;
+        }
+
+        /** Properties of a CaptureResyncRequest. */
+        interface ICaptureResyncRequest {
+
+            /** CaptureResyncRequest projectUuid */
+            projectUuid?: (string|null);
+
+            /** CaptureResyncRequest commandUuid */
+            commandUuid?: (string|null);
+
+            /** CaptureResyncRequest lastSequence */
+            lastSequence?: (number|Long|null);
+        }
+
+        /** Represents a CaptureResyncRequest. */
+        class CaptureResyncRequest implements ICaptureResyncRequest {
+
+            /**
+             * Constructs a new CaptureResyncRequest.
+             * @param [properties] Properties to set
+             */
+            constructor(properties?: karna.screen_capture.ICaptureResyncRequest);
+
+            /** CaptureResyncRequest projectUuid. */
+            public projectUuid: string;
+
+            /** CaptureResyncRequest commandUuid. */
+            public commandUuid: string;
+
+            /** CaptureResyncRequest lastSequence. */
+            public lastSequence: (number|Long);
+
+            /**
+             * Creates a new CaptureResyncRequest instance using the specified properties.
+             * @param [properties] Properties to set
+             * @returns CaptureResyncRequest instance
+             */
+            public static create(properties?: karna.screen_capture.ICaptureResyncRequest): karna.screen_capture.CaptureResyncRequest;
+
+            /**
+             * Encodes the specified CaptureResyncRequest message. Does not implicitly {@link karna.screen_capture.CaptureResyncRequest.verify|verify} messages.
+             * @param message CaptureResyncRequest message or plain object to encode
+             * @param [writer] Writer to encode to
+             * @returns Writer
+             */
+            public static encode(message: karna.screen_capture.ICaptureResyncRequest, writer?: $protobuf.Writer): $protobuf.Writer;
+
+            /**
+             * Encodes the specified CaptureResyncRequest message, length delimited. Does not implicitly {@link karna.screen_capture.CaptureResyncRequest.verify|verify} messages.
+             * @param message CaptureResyncRequest message or plain object to encode
+             * @param [writer] Writer to encode to
+             * @returns Writer
+             */
+            public static encodeDelimited(message: karna.screen_capture.ICaptureResyncRequest, writer?: $protobuf.Writer): $protobuf.Writer;
+
+            /**
+             * Decodes a CaptureResyncRequest message from the specified reader or buffer.
+             * @param reader Reader or buffer to decode from
+             * @param [length] Message length if known beforehand
+             * @returns CaptureResyncRequest
+             * @throws {Error} If the payload is not a reader or valid buffer
+             * @throws {$protobuf.util.ProtocolError} If required fields are missing
+             */
+            public static decode(reader: ($protobuf.Reader|Uint8Array), length?: number): karna.screen_capture.CaptureResyncRequest;
+
+            /**
+             * Decodes a CaptureResyncRequest message from the specified reader or buffer, length delimited.
+             * @param reader Reader or buffer to decode from
+             * @returns CaptureResyncRequest
+             * @throws {Error} If the payload is not a reader or valid buffer
+             * @throws {$protobuf.util.ProtocolError} If required fields are missing
+             */
+            public static decodeDelimited(reader: ($protobuf.Reader|Uint8Array)): karna.screen_capture.CaptureResyncRequest;
+
+            /**
+             * Verifies a CaptureResyncRequest message.
+             * @param message Plain object to verify
+             * @returns `null` if valid, otherwise the reason why it is not
+             */
+            public static verify(message: { [k: string]: any }): (string|null);
+
+            /**
+             * Creates a CaptureResyncRequest message from a plain object. Also converts values to their respective internal types.
+             * @param object Plain object
+             * @returns CaptureResyncRequest
+             */
+            public static fromObject(object: { [k: string]: any }): karna.screen_capture.CaptureResyncRequest;
+
+            /**
+             * Creates a plain object from a CaptureResyncRequest message. Also converts values to other types if specified.
+             * @param message CaptureResyncRequest
+             * @param [options] Conversion options
+             * @returns Plain object
+             */
+            public static toObject(message: karna.screen_capture.CaptureResyncRequest, options?: $protobuf.IConversionOptions): { [k: string]: any };
+
+            /**
+             * Converts this CaptureResyncRequest to JSON.
+             * @returns JSON object
+             */
+            public toJSON(): { [k: string]: any };
+
+            /**
+             * Gets the default type url for CaptureResyncRequest
+             * @param [typeUrlPrefix] your custom typeUrlPrefix(default "type.googleapis.com")
+             * @returns The default type url
+             */
+            public static getTypeUrl(typeUrlPrefix?: string): string;
+        }
+
+        /** Properties of a CaptureStatsRequest. */
+        interface ICaptureStatsRequest {
+        }
+
+        /** Represents a CaptureStatsRequest. */
+        class CaptureStatsRequest implements ICaptureStatsRequest {
+
+            /**
+             * Constructs a new CaptureStatsRequest.
+             * @param [properties] Properties to set
+             */
+            constructor(properties?: karna.screen_capture.ICaptureStatsRequest);
+
+            /**
+             * Creates a new CaptureStatsRequest instance using the specified properties.
+             * @param [properties] Properties to set
+             * @returns CaptureStatsRequest instance
+             */
+            public static create(properties?: karna.screen_capture.ICaptureStatsRequest): karna.screen_capture.CaptureStatsRequest;
+
+            /**
+             * Encodes the specified CaptureStatsRequest message. Does not implicitly {@link karna.screen_capture.CaptureStatsRequest.verify|verify} messages.
+             * @param message CaptureStatsRequest message or plain object to encode
+             * @param [writer] Writer to encode to
+             * @returns Writer
+             */
+            public static encode(message: karna.screen_capture.ICaptureStatsRequest, writer?: $protobuf.Writer): $protobuf.Writer;
+
+            /**
+             * Encodes the specified CaptureStatsRequest message, length delimited. Does not implicitly {@link karna.screen_capture.CaptureStatsRequest.verify|verify} messages.
+             * @param message CaptureStatsRequest message or plain object to encode
+             * @param [writer] Writer to encode to
+             * @returns Writer
+             */
+            public static encodeDelimited(message: karna.screen_capture.ICaptureStatsRequest, writer?: $protobuf.Writer): $protobuf.Writer;
+
+            /**
+             * Decodes a CaptureStatsRequest message from the specified reader or buffer.
+             * @param reader Reader or buffer to decode from
+             * @param [length] Message length if known beforehand
+             * @returns CaptureStatsRequest
+             * @throws {Error} If the payload is not a reader or valid buffer
+             * @throws {$protobuf.util.ProtocolError} If required fields are missing
+             */
+            public static decode(reader: ($protobuf.Reader|Uint8Array), length?: number): karna.screen_capture.CaptureStatsRequest;
+
+            /**
+             * Decodes a CaptureStatsRequest message from the specified reader or buffer, length delimited.
+             * @param reader Reader or buffer to decode from
+             * @returns CaptureStatsRequest
+             * @throws {Error} If the payload is not a reader or valid buffer
+             * @throws {$protobuf.util.ProtocolError} If required fields are missing
+             */
+            public static decodeDelimited(reader: ($protobuf.Reader|Uint8Array)): karna.screen_capture.CaptureStatsRequest;
+
+            /**
+             * Verifies a CaptureStatsRequest message.
+             * @param message Plain object to verify
+             * @returns `null` if valid, otherwise the reason why it is not
+             */
+            public static verify(message: { [k: string]: any }): (string|null);
+
+            /**
+             * Creates a CaptureStatsRequest message from a plain object. Also converts values to their respective internal types.
+             * @param object Plain object
+             * @returns CaptureStatsRequest
+             */
+            public static fromObject(object: { [k: string]: any }): karna.screen_capture.CaptureStatsRequest;
+
+            /**
+             * Creates a plain object from a CaptureStatsRequest message. Also converts values to other types if specified.
+             * @param message CaptureStatsRequest
+             * @param [options] Conversion options
+             * @returns Plain object
+             */
+            public static toObject(message: karna.screen_capture.CaptureStatsRequest, options?: $protobuf.IConversionOptions): { [k: string]: any };
+
+            /**
+             * Converts this CaptureStatsRequest to JSON.
+             * @returns JSON object
+             */
+            public toJSON(): { [k: string]: any };
+
+            /**
+             * Gets the default type url for CaptureStatsRequest
+             * @param [typeUrlPrefix] your custom typeUrlPrefix(default "type.googleapis.com")
+             * @returns The default type url
+             */
+            public static getTypeUrl(typeUrlPrefix?: string): string;
+        }
+
         /** Properties of a ScreenCaptureRPCRequest. */
         interface IScreenCaptureRPCRequest {
 
@@ -341,6 +638,15 @@ export namespace karna {
 
             /** ScreenCaptureRPCRequest getCache */
             getCache?: (karna.screen_capture.ICaptureCacheRequest|null);
+
+            /** ScreenCaptureRPCRequest subscribeDeltas */
+            subscribeDeltas?: (karna.screen_capture.ICaptureDeltaSubscribeRequest|null);
+
+            /** ScreenCaptureRPCRequest resync */
+            resync?: (karna.screen_capture.ICaptureResyncRequest|null);
+
+            /** ScreenCaptureRPCRequest getStats */
+            getStats?: (karna.screen_capture.ICaptureStatsRequest|null);
         }
 
         /** Represents a ScreenCaptureRPCRequest. */
@@ -364,8 +670,17 @@ export namespace karna {
             /** ScreenCaptureRPCRequest getCache. */
             public getCache?: (karna.screen_capture.ICaptureCacheRequest|null);
 
+            /** ScreenCaptureRPCRequest subscribeDeltas. */
+            public subscribeDeltas?: (karna.screen_capture.ICaptureDeltaSubscribeRequest|null);
+
+            /** ScreenCaptureRPCRequest resync. */
+            public resync?: (karna.screen_capture.ICaptureResyncRequest|null);
+
+            /** ScreenCaptureRPCRequest getStats. */
+            public getStats?: (karna.screen_capture.ICaptureStatsRequest|null);
+
             /** ScreenCaptureRPCRequest method. */
-            public method?: ("startCapture"|"stopCapture"|"updateCapture"|"getCache");
+            public method?: ("startCapture"|"stopCapture"|"updateCapture"|"getCache"|"subscribeDeltas"|"resync"|"getStats");
 
             /**
              * Creates a new ScreenCaptureRPCRequest instance using the specified properties.
@@ -486,6 +801,21 @@ export namespace karna {
 
             /** RpcScreenshotEvent mouseEventToolTip */
             mouseEventToolTip?: (string|null);
+
+            /** RpcScreenshotEvent similarityScore */
+            similarityScore?: (number|null);
+
+            /** RpcScreenshotEvent duplicateOfEventId */
+            duplicateOfEventId?: (string|null);
+
+            /** RpcScreenshotEvent thumbnailPaths */
+            thumbnailPaths?: ({ [k: string]: string }|null);
+
+            /** RpcScreenshotEvent captureOriginX */
+            captureOriginX?: (number|null);
+
+            /** RpcScreenshotEvent captureOriginY */
+            captureOriginY?: (number|null);
         }
 
         /** Represents a RpcScreenshotEvent. */
@@ -536,6 +866,21 @@ export namespace karna {
             /** RpcScreenshotEvent mouseEventToolTip. */
             public mouseEventToolTip?: (string|null);
 
+            /** RpcScreenshotEvent similarityScore. */
+            public similarityScore?: (number|null);
+
+            /** RpcScreenshotEvent duplicateOfEventId. */
+            public duplicateOfEventId?: (string|null);
+
+            /** RpcScreenshotEvent thumbnailPaths. */
+            public thumbnailPaths: { [k: string]: string };
+
+            /** RpcScreenshotEvent captureOriginX. */
+            public captureOriginX?: (number|null);
+
+            /** RpcScreenshotEvent captureOriginY. */
+            public captureOriginY?: (number|null);
+
             /**
              * Creates a new RpcScreenshotEvent instance using the specified properties.
              * @param [properties] Properties to set
@@ -735,6 +1080,304 @@ export namespace karna {
             public static getTypeUrl(typeUrlPrefix?: string): string;
         }
 
+        /** CaptureDeltaType enum. */
+        enum CaptureDeltaType {
+            CAPTURE_DELTA_APPEND = 0,
+            CAPTURE_DELTA_UPDATE = 1,
+            CAPTURE_DELTA_DELETE = 2,
+            CAPTURE_DELTA_RESET = 3
+        }
+
+        /** Properties of a CaptureDelta. */
+        interface ICaptureDelta {
+
+            /** CaptureDelta projectUuid */
+            projectUuid?: (string|null);
+
+            /** CaptureDelta commandUuid */
+            commandUuid?: (string|null);
+
+            /** CaptureDelta sequence */
+            sequence?: (number|Long|null);
+
+            /** CaptureDelta type */
+            type?: (karna.screen_capture.CaptureDeltaType|null);
+
+            /** CaptureDelta isActive */
+            isActive?: (boolean|null);
+
+            /** CaptureDelta screenshotEvents */
+            screenshotEvents?: (karna.screen_capture.IRpcScreenshotEvent[]|null);
+
+            /** CaptureDelta deletedEventIds */
+            deletedEventIds?: (string[]|null);
+        }
+
+        /** Represents a CaptureDelta. */
+        class CaptureDelta implements ICaptureDelta {
+
+            /**
+             * Constructs a new CaptureDelta.
+             * @param [properties] Properties to set
+             */
+            constructor(properties?: karna.screen_capture.ICaptureDelta);
+
+            /** CaptureDelta projectUuid. */
+            public projectUuid: string;
+
+            /** CaptureDelta commandUuid. */
+            public commandUuid: string;
+
+            /** CaptureDelta sequence. */
+            public sequence: (number|Long);
+
+            /** CaptureDelta type. */
+            public type: karna.screen_capture.CaptureDeltaType;
+
+            /** CaptureDelta isActive. */
+            public isActive: boolean;
+
+            /** CaptureDelta screenshotEvents. */
+            public screenshotEvents: karna.screen_capture.IRpcScreenshotEvent[];
+
+            /** CaptureDelta deletedEventIds. */
+            public deletedEventIds: string[];
+
+            /**
+             * Creates a new CaptureDelta instance using the specified properties.
+             * @param [properties] Properties to set
+             * @returns CaptureDelta instance
+             */
+            public static create(properties?: karna.screen_capture.ICaptureDelta): karna.screen_capture.CaptureDelta;
+
+            /**
+             * Encodes the specified CaptureDelta message. Does not implicitly {@link karna.screen_capture.CaptureDelta.verify|verify} messages.
+             * @param message CaptureDelta message or plain object to encode
+             * @param [writer] Writer to encode to
+             * @returns Writer
+             */
+            public static encode(message: karna.screen_capture.ICaptureDelta, writer?: $protobuf.Writer): $protobuf.Writer;
+
+            /**
+             * Encodes the specified CaptureDelta message, length delimited. Does not implicitly {@link karna.screen_capture.CaptureDelta.verify|verify} messages.
+             * @param message CaptureDelta message or plain object to encode
+             * @param [writer] Writer to encode to
+             * @returns Writer
+             */
+            public static encodeDelimited(message: karna.screen_capture.ICaptureDelta, writer?: $protobuf.Writer): $protobuf.Writer;
+
+            /**
+             * Decodes a CaptureDelta message from the specified reader or buffer.
+             * @param reader Reader or buffer to decode from
+             * @param [length] Message length if known beforehand
+             * @returns CaptureDelta
+             * @throws {Error} If the payload is not a reader or valid buffer
+             * @throws {$protobuf.util.ProtocolError} If required fields are missing
+             */
+            public static decode(reader: ($protobuf.Reader|Uint8Array), length?: number): karna.screen_capture.CaptureDelta;
+
+            /**
+             * Decodes a CaptureDelta message from the specified reader or buffer, length delimited.
+             * @param reader Reader or buffer to decode from
+             * @returns CaptureDelta
+             * @throws {Error} If the payload is not a reader or valid buffer
+             * @throws {$protobuf.util.ProtocolError} If required fields are missing
+             */
+            public static decodeDelimited(reader: ($protobuf.Reader|Uint8Array)): karna.screen_capture.CaptureDelta;
+
+            /**
+             * Verifies a CaptureDelta message.
+             * @param message Plain object to verify
+             * @returns `null` if valid, otherwise the reason why it is not
+             */
+            public static verify(message: { [k: string]: any }): (string|null);
+
+            /**
+             * Creates a CaptureDelta message from a plain object. Also converts values to their respective internal types.
+             * @param object Plain object
+             * @returns CaptureDelta
+             */
+            public static fromObject(object: { [k: string]: any }): karna.screen_capture.CaptureDelta;
+
+            /**
+             * Creates a plain object from a CaptureDelta message. Also converts values to other types if specified.
+             * @param message CaptureDelta
+             * @param [options] Conversion options
+             * @returns Plain object
+             */
+            public static toObject(message: karna.screen_capture.CaptureDelta, options?: $protobuf.IConversionOptions): { [k: string]: any };
+
+            /**
+             * Converts this CaptureDelta to JSON.
+             * @returns JSON object
+             */
+            public toJSON(): { [k: string]: any };
+
+            /**
+             * Gets the default type url for CaptureDelta
+             * @param [typeUrlPrefix] your custom typeUrlPrefix(default "type.googleapis.com")
+             * @returns The default type url
+             */
+            public static getTypeUrl(typeUrlPrefix?: string): string;
+        }
+
+        /** Properties of a CaptureStats. */
+        interface ICaptureStats {
+
+            /** CaptureStats projectUuid */
+            projectUuid?: (string|null);
+
+            /** CaptureStats commandUuid */
+            commandUuid?: (string|null);
+
+            /** CaptureStats isActive */
+            isActive?: (boolean|null);
+
+            /** CaptureStats totalScreenshots */
+            totalScreenshots?: (number|null);
+
+            /** CaptureStats totalAnnotations */
+            totalAnnotations?: (number|null);
+
+            /** CaptureStats totalKeyEvents */
+            totalKeyEvents?: (number|null);
+
+            /** CaptureStats totalMouseEvents */
+            totalMouseEvents?: (number|null);
+
+            /** CaptureStats durationSeconds */
+            durationSeconds?: (number|null);
+
+            /** CaptureStats rawDirectorySize */
+            rawDirectorySize?: (number|Long|null);
+
+            /** CaptureStats annotatedDirectorySize */
+            annotatedDirectorySize?: (number|Long|null);
+
+            /** CaptureStats missingFiles */
+            missingFiles?: (number|null);
+        }
+
+        /** Represents a CaptureStats. */
+        class CaptureStats implements ICaptureStats {
+
+            /**
+             * Constructs a new CaptureStats.
+             * @param [properties] Properties to set
+             */
+            constructor(properties?: karna.screen_capture.ICaptureStats);
+
+            /** CaptureStats projectUuid. */
+            public projectUuid: string;
+
+            /** CaptureStats commandUuid. */
+            public commandUuid: string;
+
+            /** CaptureStats isActive. */
+            public isActive: boolean;
+
+            /** CaptureStats totalScreenshots. */
+            public totalScreenshots: number;
+
+            /** CaptureStats totalAnnotations. */
+            public totalAnnotations: number;
+
+            /** CaptureStats totalKeyEvents. */
+            public totalKeyEvents: number;
+
+            /** CaptureStats totalMouseEvents. */
+            public totalMouseEvents: number;
+
+            /** CaptureStats durationSeconds. */
+            public durationSeconds: number;
+
+            /** CaptureStats rawDirectorySize. */
+            public rawDirectorySize: (number|Long);
+
+            /** CaptureStats annotatedDirectorySize. */
+            public annotatedDirectorySize: (number|Long);
+
+            /** CaptureStats missingFiles. */
+            public missingFiles: number;
+
+            /**
+             * Creates a new CaptureStats instance using the specified properties.
+             * @param [properties] Properties to set
+             * @returns CaptureStats instance
+             */
+            public static create(properties?: karna.screen_capture.ICaptureStats): karna.screen_capture.CaptureStats;
+
+            /**
+             * Encodes the specified CaptureStats message. Does not implicitly {@link karna.screen_capture.CaptureStats.verify|verify} messages.
+             * @param message CaptureStats message or plain object to encode
+             * @param [writer] Writer to encode to
+             * @returns Writer
+             */
+            public static encode(message: karna.screen_capture.ICaptureStats, writer?: $protobuf.Writer): $protobuf.Writer;
+
+            /**
+             * Encodes the specified CaptureStats message, length delimited. Does not implicitly {@link karna.screen_capture.CaptureStats.verify|verify} messages.
+             * @param message CaptureStats message or plain object to encode
+             * @param [writer] Writer to encode to
+             * @returns Writer
+             */
+            public static encodeDelimited(message: karna.screen_capture.ICaptureStats, writer?: $protobuf.Writer): $protobuf.Writer;
+
+            /**
+             * Decodes a CaptureStats message from the specified reader or buffer.
+             * @param reader Reader or buffer to decode from
+             * @param [length] Message length if known beforehand
+             * @returns CaptureStats
+             * @throws {Error} If the payload is not a reader or valid buffer
+             * @throws {$protobuf.util.ProtocolError} If required fields are missing
+             */
+            public static decode(reader: ($protobuf.Reader|Uint8Array), length?: number): karna.screen_capture.CaptureStats;
+
+            /**
+             * Decodes a CaptureStats message from the specified reader or buffer, length delimited.
+             * @param reader Reader or buffer to decode from
+             * @returns CaptureStats
+             * @throws {Error} If the payload is not a reader or valid buffer
+             * @throws {$protobuf.util.ProtocolError} If required fields are missing
+             */
+            public static decodeDelimited(reader: ($protobuf.Reader|Uint8Array)): karna.screen_capture.CaptureStats;
+
+            /**
+             * Verifies a CaptureStats message.
+             * @param message Plain object to verify
+             * @returns `null` if valid, otherwise the reason why it is not
+             */
+            public static verify(message: { [k: string]: any }): (string|null);
+
+            /**
+             * Creates a CaptureStats message from a plain object. Also converts values to their respective internal types.
+             * @param object Plain object
+             * @returns CaptureStats
+             */
+            public static fromObject(object: { [k: string]: any }): karna.screen_capture.CaptureStats;
+
+            /**
+             * Creates a plain object from a CaptureStats message. Also converts values to other types if specified.
+             * @param message CaptureStats
+             * @param [options] Conversion options
+             * @returns Plain object
+             */
+            public static toObject(message: karna.screen_capture.CaptureStats, options?: $protobuf.IConversionOptions): { [k: string]: any };
+
+            /**
+             * Converts this CaptureStats to JSON.
+             * @returns JSON object
+             */
+            public toJSON(): { [k: string]: any };
+
+            /**
+             * Gets the default type url for CaptureStats
+             * @param [typeUrlPrefix] your custom typeUrlPrefix(default "type.googleapis.com")
+             * @returns The default type url
+             */
+            public static getTypeUrl(typeUrlPrefix?: string): string;
+        }
+
         /** Properties of a ScreenCaptureRPCResponse. */
         interface IScreenCaptureRPCResponse {
 
@@ -743,6 +1386,12 @@ export namespace karna {
 
             /** ScreenCaptureRPCResponse error */
             error?: (string|null);
+
+            /** ScreenCaptureRPCResponse captureDelta */
+            captureDelta?: (karna.screen_capture.ICaptureDelta|null);
+
+            /** ScreenCaptureRPCResponse captureStats */
+            captureStats?: (karna.screen_capture.ICaptureStats|null);
         }
 
         /** Represents a ScreenCaptureRPCResponse. */
@@ -760,8 +1409,14 @@ export namespace karna {
             /** ScreenCaptureRPCResponse error. */
             public error?: (string|null);
 
+            /** ScreenCaptureRPCResponse captureDelta. */
+            public captureDelta?: (karna.screen_capture.ICaptureDelta|null);
+
+            /** ScreenCaptureRPCResponse captureStats. */
+            public captureStats?: (karna.screen_capture.ICaptureStats|null);
+
             /** ScreenCaptureRPCResponse type. */
-            public type?: ("captureResponse"|"error");
+            public type?: ("captureResponse"|"error"|"captureDelta"|"captureStats");
 
             /**
              * Creates a new ScreenCaptureRPCResponse instance using the specified properties.
@@ -774,27 +774,24 @@ export const karna = $root.karna = (() => {
             return CaptureUpdateRequest;
         })();
 
-        screen_capture.ScreenCaptureRPCRequest = (function() {
+        screen_capture.CaptureDeltaSubscribeRequest = (function() {
 
             /**
-             * Properties of a ScreenCaptureRPCRequest.
+             * Properties of a CaptureDeltaSubscribeRequest.
              * @memberof karna.screen_capture
-             * @interface IScreenCaptureRPCRequest
-             * @property {karna.screen_capture.ICaptureRequest|null} [startCapture] ScreenCaptureRPCRequest startCapture
-             * @property {karna.screen_capture.ICaptureRequest|null} [stopCapture] ScreenCaptureRPCRequest stopCapture
-             * @property {karna.screen_capture.ICaptureUpdateRequest|null} [updateCapture] ScreenCaptureRPCRequest updateCapture
-             * @property {karna.screen_capture.ICaptureCacheRequest|null} [getCache] ScreenCaptureRPCRequest getCache
+             * @interface ICaptureDeltaSubscribeRequest
+             * @property {boolean|null} [enabled] CaptureDeltaSubscribeRequest enabled
              */
 
             /**
-             * Constructs a new ScreenCaptureRPCRequest.
+             * Constructs a new CaptureDeltaSubscribeRequest.
              * @memberof karna.screen_capture
-             * @classdesc Represents a ScreenCaptureRPCRequest.
-             * @implements IScreenCaptureRPCRequest
+             * @classdesc Represents a CaptureDeltaSubscribeRequest.
+             * @implements ICaptureDeltaSubscribeRequest
              * @constructor
-             * @param {karna.screen_capture.IScreenCaptureRPCRequest=} [properties] Properties to set
+             * @param {karna.screen_capture.ICaptureDeltaSubscribeRequest=} [properties] Properties to set
              */
-            function ScreenCaptureRPCRequest(properties) {
+            function CaptureDeltaSubscribeRequest(properties) {
                 if (properties)
                     for (let keys = Object.keys(properties), i = 0; i < keys.length; ++i)
                         if (properties[keys[i]] != null)
@@ -802,131 +799,75 @@ export const karna = $root.karna = (() => {
             }
 
             /**
-             * ScreenCaptureRPCRequest startCapture.
-             * @member {karna.screen_capture.ICaptureRequest|null|undefined} startCapture
-             * @memberof karna.screen_capture.ScreenCaptureRPCRequest
-             * @instance
-             */
-            ScreenCaptureRPCRequest.prototype.startCapture = null;
-
-            /**
-             * ScreenCaptureRPCRequest stopCapture.
-             * @member {karna.screen_capture.ICaptureRequest|null|undefined} stopCapture
-             * @memberof karna.screen_capture.ScreenCaptureRPCRequest
-             * @instance
-             */
-            ScreenCaptureRPCRequest.prototype.stopCapture = null;
-
-            /**
-             * ScreenCaptureRPCRequest updateCapture.
-             * @member {karna.screen_capture.ICaptureUpdateRequest|null|undefined} updateCapture
-             * @memberof karna.screen_capture.ScreenCaptureRPCRequest
-             * @instance
-             */
-            ScreenCaptureRPCRequest.prototype.updateCapture = null;
-
-            /**
-             * ScreenCaptureRPCRequest getCache.
-             * @member {karna.screen_capture.ICaptureCacheRequest|null|undefined} getCache
-             * @memberof karna.screen_capture.ScreenCaptureRPCRequest
-             * @instance
-             */
-            ScreenCaptureRPCRequest.prototype.getCache = null;
-
-            // OneOf field names bound to virtual getters and setters
-            let $oneOfFields;
-
-            /**
-             * ScreenCaptureRPCRequest method.
-             * @member {"startCapture"|"stopCapture"|"updateCapture"|"getCache"|undefined} method
-             * @memberof karna.screen_capture.ScreenCaptureRPCRequest
+             * CaptureDeltaSubscribeRequest enabled.
+             * @member {boolean} enabled
+             * @memberof karna.screen_capture.CaptureDeltaSubscribeRequest
              * @instance
              */
-            Object.defineProperty(ScreenCaptureRPCRequest.prototype, "method", {
-                get: $util.oneOfGetter($oneOfFields = ["startCapture", "stopCapture", "updateCapture", "getCache"]),
-                set: $util.oneOfSetter($oneOfFields)
-            });
+            CaptureDeltaSubscribeRequest.prototype.enabled = false;
 
             /**
-             * Creates a new ScreenCaptureRPCRequest instance using the specified properties.
+             * Creates a new CaptureDeltaSubscribeRequest instance using the specified properties.
              * @function create
-             * @memberof karna.screen_capture.ScreenCaptureRPCRequest
+             * @memberof karna.screen_capture.CaptureDeltaSubscribeRequest
              * @static
-             * @param {karna.screen_capture.IScreenCaptureRPCRequest=} [properties] Properties to set
-             * @returns {karna.screen_capture.ScreenCaptureRPCRequest} ScreenCaptureRPCRequest instance
+             * @param {karna.screen_capture.ICaptureDeltaSubscribeRequest=} [properties] Properties to set
+             * @returns {karna.screen_capture.CaptureDeltaSubscribeRequest} CaptureDeltaSubscribeRequest instance
              */
-            ScreenCaptureRPCRequest.create = function create(properties) {
-                return new ScreenCaptureRPCRequest(properties);
+            CaptureDeltaSubscribeRequest.create = function create(properties) {
+                return new CaptureDeltaSubscribeRequest(properties);
             };
 
             /**
-             * Encodes the specified ScreenCaptureRPCRequest message. Does not implicitly {@link karna.screen_capture.ScreenCaptureRPCRequest.verify|verify} messages.
+             * Encodes the specified CaptureDeltaSubscribeRequest message. Does not implicitly {@link karna.screen_capture.CaptureDeltaSubscribeRequest.verify|verify} messages.
              * @function encode
-             * @memberof karna.screen_capture.ScreenCaptureRPCRequest
+             * @memberof karna.screen_capture.CaptureDeltaSubscribeRequest
              * @static
-             * @param {karna.screen_capture.IScreenCaptureRPCRequest} message ScreenCaptureRPCRequest message or plain object to encode
+             * @param {karna.screen_capture.ICaptureDeltaSubscribeRequest} message CaptureDeltaSubscribeRequest message or plain object to encode
              * @param {$protobuf.Writer} [writer] Writer to encode to
              * @returns {$protobuf.Writer} Writer
              */
-            ScreenCaptureRPCRequest.encode = function encode(message, writer) {
+            CaptureDeltaSubscribeRequest.encode = function encode(message, writer) {
                 if (!writer)
                     writer = $Writer.create();
-                if (message.startCapture != null && Object.hasOwnProperty.call(message, "startCapture"))
-                    $root.karna.screen_capture.CaptureRequest.encode(message.startCapture, writer.uint32(/* id 1, wireType 2 =*/10).fork()).ldelim();
-                if (message.stopCapture != null && Object.hasOwnProperty.call(message, "stopCapture"))
-                    $root.karna.screen_capture.CaptureRequest.encode(message.stopCapture, writer.uint32(/* id 2, wireType 2 =*/18).fork()).ldelim();
-                if (message.updateCapture != null && Object.hasOwnProperty.call(message, "updateCapture"))
-                    $root.karna.screen_capture.CaptureUpdateRequest.encode(message.updateCapture, writer.uint32(/* id 3, wireType 2 =*/26).fork()).ldelim();
-                if (message.getCache != null && Object.hasOwnProperty.call(message, "getCache"))
-                    $root.karna.screen_capture.CaptureCacheRequest.encode(message.getCache, writer.uint32(/* id 4, wireType 2 =*/34).fork()).ldelim();
+                if (message.enabled != null && Object.hasOwnProperty.call(message, "enabled"))
+                    writer.uint32(/* id 1, wireType 0 =*/8).bool(message.enabled);
                 return writer;
             };
 
             /**
-             * Encodes the specified ScreenCaptureRPCRequest message, length delimited. Does not implicitly {@link karna.screen_capture.ScreenCaptureRPCRequest.verify|verify} messages.
+             * Encodes the specified CaptureDeltaSubscribeRequest message, length delimited. Does not implicitly {@link karna.screen_capture.CaptureDeltaSubscribeRequest.verify|verify} messages.
              * @function encodeDelimited
-             * @memberof karna.screen_capture.ScreenCaptureRPCRequest
+             * @memberof karna.screen_capture.CaptureDeltaSubscribeRequest
              * @static
-             * @param {karna.screen_capture.IScreenCaptureRPCRequest} message ScreenCaptureRPCRequest message or plain object to encode
+             * @param {karna.screen_capture.ICaptureDeltaSubscribeRequest} message CaptureDeltaSubscribeRequest message or plain object to encode
              * @param {$protobuf.Writer} [writer] Writer to encode to
              * @returns {$protobuf.Writer} Writer
              */
-            ScreenCaptureRPCRequest.encodeDelimited = function encodeDelimited(message, writer) {
+            CaptureDeltaSubscribeRequest.encodeDelimited = function encodeDelimited(message, writer) {
                 return this.encode(message, writer).ldelim();
             };
 
             /**
-             * Decodes a ScreenCaptureRPCRequest message from the specified reader or buffer.
+             * Decodes a CaptureDeltaSubscribeRequest message from the specified reader or buffer.
              * @function decode
-             * @memberof karna.screen_capture.ScreenCaptureRPCRequest
+             * @memberof karna.screen_capture.CaptureDeltaSubscribeRequest
              * @static
              * @param {$protobuf.Reader|Uint8Array} reader Reader or buffer to decode from
              * @param {number} [length] Message length if known beforehand
-             * @returns {karna.screen_capture.ScreenCaptureRPCRequest} ScreenCaptureRPCRequest
+             * @returns {karna.screen_capture.CaptureDeltaSubscribeRequest} CaptureDeltaSubscribeRequest
              * @throws {Error} If the payload is not a reader or valid buffer
              * @throws {$protobuf.util.ProtocolError} If required fields are missing
              */
-            ScreenCaptureRPCRequest.decode = function decode(reader, length) {
+            CaptureDeltaSubscribeRequest.decode = function decode(reader, length) {
                 if (!(reader instanceof $Reader))
                     reader = $Reader.create(reader);
-                let end = length === undefined ? reader.len : reader.pos + length, message = new $root.karna.screen_capture.ScreenCaptureRPCRequest();
+                let end = length === undefined ? reader.len : reader.pos + length, message = new $root.karna.screen_capture.CaptureDeltaSubscribeRequest();
                 while (reader.pos < end) {
                     let tag = reader.uint32();
                     switch (tag >>> 3) {
                     case 1: {
-                            message.startCapture = $root.karna.screen_capture.CaptureRequest.decode(reader, reader.uint32());
-                            break;
-                        }
-                    case 2: {
-                            message.stopCapture = $root.karna.screen_capture.CaptureRequest.decode(reader, reader.uint32());
-                            break;
-                        }
-                    case 3: {
-                            message.updateCapture = $root.karna.screen_capture.CaptureUpdateRequest.decode(reader, reader.uint32());
-                            break;
-                        }
-                    case 4: {
-                            message.getCache = $root.karna.screen_capture.CaptureCacheRequest.decode(reader, reader.uint32());
+                            message.enabled = reader.bool();
                             break;
                         }
                     default:
@@ -938,204 +879,124 @@ export const karna = $root.karna = (() => {
             };
 
             /**
-             * Decodes a ScreenCaptureRPCRequest message from the specified reader or buffer, length delimited.
+             * Decodes a CaptureDeltaSubscribeRequest message from the specified reader or buffer, length delimited.
              * @function decodeDelimited
-             * @memberof karna.screen_capture.ScreenCaptureRPCRequest
+             * @memberof karna.screen_capture.CaptureDeltaSubscribeRequest
              * @static
              * @param {$protobuf.Reader|Uint8Array} reader Reader or buffer to decode from
-             * @returns {karna.screen_capture.ScreenCaptureRPCRequest} ScreenCaptureRPCRequest
+             * @returns {karna.screen_capture.CaptureDeltaSubscribeRequest} CaptureDeltaSubscribeRequest
              * @throws {Error} If the payload is not a reader or valid buffer
              * @throws {$protobuf.util.ProtocolError} If required fields are missing
              */
-            ScreenCaptureRPCRequest.decodeDelimited = function decodeDelimited(reader) {
+            CaptureDeltaSubscribeRequest.decodeDelimited = function decodeDelimited(reader) {
                 if (!(reader instanceof $Reader))
                     reader = new $Reader(reader);
                 return this.decode(reader, reader.uint32());
             };
 
             /**
-             * Verifies a ScreenCaptureRPCRequest message.
+             * Verifies a CaptureDeltaSubscribeRequest message.
              * @function verify
-             * @memberof karna.screen_capture.ScreenCaptureRPCRequest
+             * @memberof karna.screen_capture.CaptureDeltaSubscribeRequest
              * @static
              * @param {Object.<string,*>} message Plain object to verify
              * @returns {string|null} `null` if valid, otherwise the reason why it is not
              */
-            ScreenCaptureRPCRequest.verify = function verify(message) {
+            CaptureDeltaSubscribeRequest.verify = function verify(message) {
                 if (typeof message !== "object" || message === null)
                     return "object expected";
-                let properties = {};
-                if (message.startCapture != null && message.hasOwnProperty("startCapture")) {
-                    properties.method = 1;
-                    {
-                        let error = $root.karna.screen_capture.CaptureRequest.verify(message.startCapture);
-                        if (error)
-                            return "startCapture." + error;
-                    }
-                }
-                if (message.stopCapture != null && message.hasOwnProperty("stopCapture")) {
-                    if (properties.method === 1)
-                        return "method: multiple values";
-                    properties.method = 1;
-                    {
-                        let error = $root.karna.screen_capture.CaptureRequest.verify(message.stopCapture);
-                        if (error)
-                            return "stopCapture." + error;
-                    }
-                }
-                if (message.updateCapture != null && message.hasOwnProperty("updateCapture")) {
-                    if (properties.method === 1)
-                        return "method: multiple values";
-                    properties.method = 1;
-                    {
-                        let error = $root.karna.screen_capture.CaptureUpdateRequest.verify(message.updateCapture);
-                        if (error)
-                            return "updateCapture." + error;
-                    }
-                }
-                if (message.getCache != null && message.hasOwnProperty("getCache")) {
-                    if (properties.method === 1)
-                        return "method: multiple values";
-                    properties.method = 1;
-                    {
-                        let error = $root.karna.screen_capture.CaptureCacheRequest.verify(message.getCache);
-                        if (error)
-                            return "getCache." + error;
-                    }
-                }
+                if (message.enabled != null && message.hasOwnProperty("enabled"))
+                    if (typeof message.enabled !== "boolean")
+                        return "enabled: boolean expected";
                 return null;
             };
 
             /**
-             * Creates a ScreenCaptureRPCRequest message from a plain object. Also converts values to their respective internal types.
+             * Creates a CaptureDeltaSubscribeRequest message from a plain object. Also converts values to their respective internal types.
              * @function fromObject
-             * @memberof karna.screen_capture.ScreenCaptureRPCRequest
+             * @memberof karna.screen_capture.CaptureDeltaSubscribeRequest
              * @static
              * @param {Object.<string,*>} object Plain object
-             * @returns {karna.screen_capture.ScreenCaptureRPCRequest} ScreenCaptureRPCRequest
+             * @returns {karna.screen_capture.CaptureDeltaSubscribeRequest} CaptureDeltaSubscribeRequest
              */
-            ScreenCaptureRPCRequest.fromObject = function fromObject(object) {
-                if (object instanceof $root.karna.screen_capture.ScreenCaptureRPCRequest)
+            CaptureDeltaSubscribeRequest.fromObject = function fromObject(object) {
+                if (object instanceof $root.karna.screen_capture.CaptureDeltaSubscribeRequest)
                     return object;
-                let message = new $root.karna.screen_capture.ScreenCaptureRPCRequest();
-                if (object.startCapture != null) {
-                    if (typeof object.startCapture !== "object")
-                        throw TypeError(".karna.screen_capture.ScreenCaptureRPCRequest.startCapture: object expected");
-                    message.startCapture = $root.karna.screen_capture.CaptureRequest.fromObject(object.startCapture);
-                }
-                if (object.stopCapture != null) {
-                    if (typeof object.stopCapture !== "object")
-                        throw TypeError(".karna.screen_capture.ScreenCaptureRPCRequest.stopCapture: object expected");
-                    message.stopCapture = $root.karna.screen_capture.CaptureRequest.fromObject(object.stopCapture);
-                }
-                if (object.updateCapture != null) {
-                    if (typeof object.updateCapture !== "object")
-                        throw TypeError(".karna.screen_capture.ScreenCaptureRPCRequest.updateCapture: object expected");
-                    message.updateCapture = $root.karna.screen_capture.CaptureUpdateRequest.fromObject(object.updateCapture);
-                }
-                if (object.getCache != null) {
-                    if (typeof object.getCache !== "object")
-                        throw TypeError(".karna.screen_capture.ScreenCaptureRPCRequest.getCache: object expected");
-                    message.getCache = $root.karna.screen_capture.CaptureCacheRequest.fromObject(object.getCache);
-                }
+                let message = new $root.karna.screen_capture.CaptureDeltaSubscribeRequest();
+                if (object.enabled != null)
+                    message.enabled = Boolean(object.enabled);
                 return message;
             };
 
             /**
-             * Creates a plain object from a ScreenCaptureRPCRequest message. Also converts values to other types if specified.
+             * Creates a plain object from a CaptureDeltaSubscribeRequest message. Also converts values to other types if specified.
              * @function toObject
-             * @memberof karna.screen_capture.ScreenCaptureRPCRequest
+             * @memberof karna.screen_capture.CaptureDeltaSubscribeRequest
              * @static
-             * @param {karna.screen_capture.ScreenCaptureRPCRequest} message ScreenCaptureRPCRequest
+             * @param {karna.screen_capture.CaptureDeltaSubscribeRequest} message CaptureDeltaSubscribeRequest
              * @param {$protobuf.IConversionOptions} [options] Conversion options
              * @returns {Object.<string,*>} Plain object
              */
-            ScreenCaptureRPCRequest.toObject = function toObject(message, options) {
+            CaptureDeltaSubscribeRequest.toObject = function toObject(message, options) {
                 if (!options)
                     options = {};
                 let object = {};
-                if (message.startCapture != null && message.hasOwnProperty("startCapture")) {
-                    object.startCapture = $root.karna.screen_capture.CaptureRequest.toObject(message.startCapture, options);
-                    if (options.oneofs)
-                        object.method = "startCapture";
-                }
-                if (message.stopCapture != null && message.hasOwnProperty("stopCapture")) {
-                    object.stopCapture = $root.karna.screen_capture.CaptureRequest.toObject(message.stopCapture, options);
-                    if (options.oneofs)
-                        object.method = "stopCapture";
-                }
-                if (message.updateCapture != null && message.hasOwnProperty("updateCapture")) {
-                    object.updateCapture = $root.karna.screen_capture.CaptureUpdateRequest.toObject(message.updateCapture, options);
-                    if (options.oneofs)
-                        object.method = "updateCapture";
-                }
-                if (message.getCache != null && message.hasOwnProperty("getCache")) {
-                    object.getCache = $root.karna.screen_capture.CaptureCacheRequest.toObject(message.getCache, options);
-                    if (options.oneofs)
-                        object.method = "getCache";
-                }
+                if (options.defaults)
+                    object.enabled = false;
+                if (message.enabled != null && message.hasOwnProperty("enabled"))
+                    object.enabled = message.enabled;
                 return object;
             };
 
             /**
-             * Converts this ScreenCaptureRPCRequest to JSON.
+             * Converts this CaptureDeltaSubscribeRequest to JSON.
              * @function toJSON
-             * @memberof karna.screen_capture.ScreenCaptureRPCRequest
+             * @memberof karna.screen_capture.CaptureDeltaSubscribeRequest
              * @instance
              * @returns {Object.<string,*>} JSON object
              */
-            ScreenCaptureRPCRequest.prototype.toJSON = function toJSON() {
+            CaptureDeltaSubscribeRequest.prototype.toJSON = function toJSON() {
                 return this.constructor.toObject(this, $protobuf.util.toJSONOptions);
             };
 
             /**
-             * Gets the default type url for ScreenCaptureRPCRequest
+             * Gets the default type url for CaptureDeltaSubscribeRequest
              * @function getTypeUrl
-             * @memberof karna.screen_capture.ScreenCaptureRPCRequest
+             * @memberof karna.screen_capture.CaptureDeltaSubscribeRequest
              * @static
              * @param {string} [typeUrlPrefix] your custom typeUrlPrefix(default "type.googleapis.com")
              * @returns {string} The default type url
              */
-            ScreenCaptureRPCRequest.getTypeUrl = function getTypeUrl(typeUrlPrefix) {
+            CaptureDeltaSubscribeRequest.getTypeUrl = function getTypeUrl(typeUrlPrefix) {
                 if (typeUrlPrefix === undefined) {
                     typeUrlPrefix = "type.googleapis.com";
                 }
-                return typeUrlPrefix + "/karna.screen_capture.ScreenCaptureRPCRequest";
+                return typeUrlPrefix + "/karna.screen_capture.CaptureDeltaSubscribeRequest";
             };
 
-            return ScreenCaptureRPCRequest;
+            return CaptureDeltaSubscribeRequest;
         })();
 
-        screen_capture.RpcScreenshotEvent = (function() {
+        screen_capture.CaptureResyncRequest = (function() {
 
             /**
-             * Properties of a RpcScreenshotEvent.
+             * Properties of a CaptureResyncRequest.
              * @memberof karna.screen_capture
-             * @interface IRpcScreenshotEvent
-             * @property {string|null} [eventId] RpcScreenshotEvent eventId
-             * @property {string|null} [projectUuid] RpcScreenshotEvent projectUuid
-             * @property {string|null} [commandUuid] RpcScreenshotEvent commandUuid
-             * @property {string|null} [timestamp] RpcScreenshotEvent timestamp
-             * @property {string|null} [description] RpcScreenshotEvent description
-             * @property {string|null} [screenshotPath] RpcScreenshotEvent screenshotPath
-             * @property {string|null} [annotationPath] RpcScreenshotEvent annotationPath
-             * @property {number|null} [mouseX] RpcScreenshotEvent mouseX
-             * @property {number|null} [mouseY] RpcScreenshotEvent mouseY
-             * @property {string|null} [keyChar] RpcScreenshotEvent keyChar
-             * @property {string|null} [keyCode] RpcScreenshotEvent keyCode
-             * @property {boolean|null} [isSpecialKey] RpcScreenshotEvent isSpecialKey
-             * @property {string|null} [mouseEventToolTip] RpcScreenshotEvent mouseEventToolTip
+             * @interface ICaptureResyncRequest
+             * @property {string|null} [projectUuid] CaptureResyncRequest projectUuid
+             * @property {string|null} [commandUuid] CaptureResyncRequest commandUuid
+             * @property {number|Long|null} [lastSequence] CaptureResyncRequest lastSequence
              */
 
             /**
-             * Constructs a new RpcScreenshotEvent.
+             * Constructs a new CaptureResyncRequest.
              * @memberof karna.screen_capture
-             * @classdesc Represents a RpcScreenshotEvent.
-             * @implements IRpcScreenshotEvent
+             * @classdesc Represents a CaptureResyncRequest.
+             * @implements ICaptureResyncRequest
              * @constructor
-             * @param {karna.screen_capture.IRpcScreenshotEvent=} [properties] Properties to set
+             * @param {karna.screen_capture.ICaptureResyncRequest=} [properties] Properties to set
              */
-            function RpcScreenshotEvent(properties) {
+            function CaptureResyncRequest(properties) {
                 if (properties)
                     for (let keys = Object.keys(properties), i = 0; i < keys.length; ++i)
                         if (properties[keys[i]] != null)
@@ -1143,282 +1004,2121 @@ export const karna = $root.karna = (() => {
             }
 
             /**
-             * RpcScreenshotEvent eventId.
-             * @member {string} eventId
-             * @memberof karna.screen_capture.RpcScreenshotEvent
-             * @instance
-             */
-            RpcScreenshotEvent.prototype.eventId = "";
-
-            /**
-             * RpcScreenshotEvent projectUuid.
+             * CaptureResyncRequest projectUuid.
              * @member {string} projectUuid
-             * @memberof karna.screen_capture.RpcScreenshotEvent
+             * @memberof karna.screen_capture.CaptureResyncRequest
              * @instance
              */
-            RpcScreenshotEvent.prototype.projectUuid = "";
+            CaptureResyncRequest.prototype.projectUuid = "";
 
             /**
-             * RpcScreenshotEvent commandUuid.
+             * CaptureResyncRequest commandUuid.
              * @member {string} commandUuid
-             * @memberof karna.screen_capture.RpcScreenshotEvent
+             * @memberof karna.screen_capture.CaptureResyncRequest
              * @instance
              */
-            RpcScreenshotEvent.prototype.commandUuid = "";
+            CaptureResyncRequest.prototype.commandUuid = "";
 
             /**
-             * RpcScreenshotEvent timestamp.
-             * @member {string} timestamp
-             * @memberof karna.screen_capture.RpcScreenshotEvent
+             * CaptureResyncRequest lastSequence.
+             * @member {number|Long} lastSequence
+             * @memberof karna.screen_capture.CaptureResyncRequest
              * @instance
              */
-            RpcScreenshotEvent.prototype.timestamp = "";
+            CaptureResyncRequest.prototype.lastSequence = $util.Long ? $util.Long.fromBits(0,0,false) : 0;
 
             /**
-             * RpcScreenshotEvent description.
-             * @member {string} description
-             * @memberof karna.screen_capture.RpcScreenshotEvent
-             * @instance
+             * Creates a new CaptureResyncRequest instance using the specified properties.
+             * @function create
+             * @memberof karna.screen_capture.CaptureResyncRequest
+             * @static
+             * @param {karna.screen_capture.ICaptureResyncRequest=} [properties] Properties to set
+             * @returns {karna.screen_capture.CaptureResyncRequest} CaptureResyncRequest instance
              */
-            RpcScreenshotEvent.prototype.description = "";
+            CaptureResyncRequest.create = function create(properties) {
+                return new CaptureResyncRequest(properties);
+            };
 
             /**
-             * RpcScreenshotEvent screenshotPath.
-             * @member {string} screenshotPath
-             * @memberof karna.screen_capture.RpcScreenshotEvent
-             * @instance
+             * Encodes the specified CaptureResyncRequest message. Does not implicitly {@link karna.screen_capture.CaptureResyncRequest.verify|verify} messages.
+             * @function encode
+             * @memberof karna.screen_capture.CaptureResyncRequest
+             * @static
+             * @param {karna.screen_capture.ICaptureResyncRequest} message CaptureResyncRequest message or plain object to encode
+             * @param {$protobuf.Writer} [writer] Writer to encode to
+             * @returns {$protobuf.Writer} Writer
              */
-            RpcScreenshotEvent.prototype.screenshotPath = "";
-
-            /**
-             * RpcScreenshotEvent annotationPath.
-             * @member {string|null|undefined} annotationPath
+            CaptureResyncRequest.encode = function encode(message, writer) {
+                if (!writer)
+                    writer = $Writer.create();
+                if (message.projectUuid != null && Object.hasOwnProperty.call(message, "projectUuid"))
+                    writer.uint32(/* id 1, wireType 2 =*/10).string(message.projectUuid);
+                if (message.commandUuid != null && Object.hasOwnProperty.call(message, "commandUuid"))
+                    writer.uint32(/* id 2, wireType 2 =*/18).string(message.commandUuid);
+                if (message.lastSequence != null && Object.hasOwnProperty.call(message, "lastSequence"))
+                    writer.uint32(/* id 3, wireType 0 =*/24).int64(message.lastSequence);
+                return writer;
+            };
+
+            /**
+             * Encodes the specified CaptureResyncRequest message, length delimited. Does not implicitly {@link karna.screen_capture.CaptureResyncRequest.verify|verify} messages.
+             * @function encodeDelimited
+             * @memberof karna.screen_capture.CaptureResyncRequest
+             * @static
+             * @param {karna.screen_capture.ICaptureResyncRequest} message CaptureResyncRequest message or plain object to encode
+             * @param {$protobuf.Writer} [writer] Writer to encode to
+             * @returns {$protobuf.Writer} Writer
+             */
+            CaptureResyncRequest.encodeDelimited = function encodeDelimited(message, writer) {
+                return this.encode(message, writer).ldelim();
+            };
+
+            /**
+             * Decodes a CaptureResyncRequest message from the specified reader or buffer.
+             * @function decode
+             * @memberof karna.screen_capture.CaptureResyncRequest
+             * @static
+             * @param {$protobuf.Reader|Uint8Array} reader Reader or buffer to decode from
+             * @param {number} [length] Message length if known beforehand
+             * @returns {karna.screen_capture.CaptureResyncRequest} CaptureResyncRequest
+             * @throws {Error} If the payload is not a reader or valid buffer
+             * @throws {$protobuf.util.ProtocolError} If required fields are missing
+             */
+            CaptureResyncRequest.decode = function decode(reader, length) {
+                if (!(reader instanceof $Reader))
+                    reader = $Reader.create(reader);
+                let end = length === undefined ? reader.len : reader.pos + length, message = new $root.karna.screen_capture.CaptureResyncRequest();
+                while (reader.pos < end) {
+                    let tag = reader.uint32();
+                    switch (tag >>> 3) {
+                    case 1: {
+                            message.projectUuid = reader.string();
+                            break;
+                        }
+                    case 2: {
+                            message.commandUuid = reader.string();
+                            break;
+                        }
+                    case 3: {
+                            message.lastSequence = reader.int64();
+                            break;
+                        }
+                    default:
+                        reader.skipType(tag & 7);
+                        break;
+                    }
+                }
+                return message;
+            };
+
+            /**
+             * Decodes a CaptureResyncRequest message from the specified reader or buffer, length delimited.
+             * @function decodeDelimited
+             * @memberof karna.screen_capture.CaptureResyncRequest
+             * @static
+             * @param {$protobuf.Reader|Uint8Array} reader Reader or buffer to decode from
+             * @returns {karna.screen_capture.CaptureResyncRequest} CaptureResyncRequest
+             * @throws {Error} If the payload is not a reader or valid buffer
+             * @throws {$protobuf.util.ProtocolError} If required fields are missing
+             */
+            CaptureResyncRequest.decodeDelimited = function decodeDelimited(reader) {
+                if (!(reader instanceof $Reader))
+                    reader = new $Reader(reader);
+                return this.decode(reader, reader.uint32());
+            };
+
+            /**
+             * Verifies a CaptureResyncRequest message.
+             * @function verify
+             * @memberof karna.screen_capture.CaptureResyncRequest
+             * @static
+             * @param {Object.<string,*>} message Plain object to verify
+             * @returns {string|null} `null` if valid, otherwise the reason why it is not
+             */
+            CaptureResyncRequest.verify = function verify(message) {
+                if (typeof message !== "object" || message === null)
+                    return "object expected";
+                if (message.projectUuid != null && message.hasOwnProperty("projectUuid"))
+                    if (!$util.isString(message.projectUuid))
+                        return "projectUuid: string expected";
+                if (message.commandUuid != null && message.hasOwnProperty("commandUuid"))
+                    if (!$util.isString(message.commandUuid))
+                        return "commandUuid: string expected";
+                if (message.lastSequence != null && message.hasOwnProperty("lastSequence"))
+                    if (!$util.isInteger(message.lastSequence) && !(message.lastSequence && $util.isInteger(message.lastSequence.low) && $util.isInteger(message.lastSequence.high)))
+                        return "lastSequence: integer|Long expected";
+                return null;
+            };
+
+            /**
+             * Creates a CaptureResyncRequest message from a plain object. Also converts values to their respective internal types.
+             * @function fromObject
+             * @memberof karna.screen_capture.CaptureResyncRequest
+             * @static
+             * @param {Object.<string,*>} object Plain object
+             * @returns {karna.screen_capture.CaptureResyncRequest} CaptureResyncRequest
+             */
+            CaptureResyncRequest.fromObject = function fromObject(object) {
+                if (object instanceof $root.karna.screen_capture.CaptureResyncRequest)
+                    return object;
+                let message = new $root.karna.screen_capture.CaptureResyncRequest();
+                if (object.projectUuid != null)
+                    message.projectUuid = String(object.projectUuid);
+                if (object.commandUuid != null)
+                    message.commandUuid = String(object.commandUuid);
+                if (object.lastSequence != null)
+                    if ($util.Long)
+                        (message.lastSequence = $util.Long.fromValue(object.lastSequence)).unsigned = false;
+                    else if (typeof object.lastSequence === "string")
+                        message.lastSequence = parseInt(object.lastSequence, 10);
+                    else if (typeof object.lastSequence === "number")
+                        message.lastSequence = object.lastSequence;
+                    else if (typeof object.lastSequence === "object")
+                        message.lastSequence = new $util.LongBits(object.lastSequence.low >>> 0, object.lastSequence.high >>> 0).toNumber();
+                return message;
+            };
+
+            /**
+             * Creates a plain object from a CaptureResyncRequest message. Also converts values to other types if specified.
+             * @function toObject
+             * @memberof karna.screen_capture.CaptureResyncRequest
+             * @static
+             * @param {karna.screen_capture.CaptureResyncRequest} message CaptureResyncRequest
+             * @param {$protobuf.IConversionOptions} [options] Conversion options
+             * @returns {Object.<string,*>} Plain object
+             */
+            CaptureResyncRequest.toObject = function toObject(message, options) {
+                if (!options)
+                    options = {};
+                let object = {};
+                if (options.defaults) {
+                    object.projectUuid = "";
+                    object.commandUuid = "";
+                    if ($util.Long) {
+                        let long = new $util.Long(0, 0, false);
+                        object.lastSequence = options.longs === String ? long.toString() : options.longs === Number ? long.toNumber() : long;
+                    } else
+                        object.lastSequence = options.longs === String ? "0" : 0;
+                }
+                if (message.projectUuid != null && message.hasOwnProperty("projectUuid"))
+                    object.projectUuid = message.projectUuid;
+                if (message.commandUuid != null && message.hasOwnProperty("commandUuid"))
+                    object.commandUuid = message.commandUuid;
+                if (message.lastSequence != null && message.hasOwnProperty("lastSequence"))
+                    if (typeof message.lastSequence === "number")
+                        object.lastSequence = options.longs === String ? String(message.lastSequence) : message.lastSequence;
+                    else
+                        object.lastSequence = options.longs === String ? $util.Long.prototype.toString.call(message.lastSequence) : options.longs === Number ? new $util.LongBits(message.lastSequence.low >>> 0, message.lastSequence.high >>> 0).toNumber() : message.lastSequence;
+                return object;
+            };
+
+            /**
+             * Converts this CaptureResyncRequest to JSON.
+             * @function toJSON
+             * @memberof karna.screen_capture.CaptureResyncRequest
+             * @instance
+             * @returns {Object.<string,*>} JSON object
+             */
+            CaptureResyncRequest.prototype.toJSON = function toJSON() {
+                return this.constructor.toObject(this, $protobuf.util.toJSONOptions);
+            };
+
+            /**
+             * Gets the default type url for CaptureResyncRequest
+             * @function getTypeUrl
+             * @memberof karna.screen_capture.CaptureResyncRequest
+             * @static
+             * @param {string} [typeUrlPrefix] your custom typeUrlPrefix(default "type.googleapis.com")
+             * @returns {string} The default type url
+             */
+            CaptureResyncRequest.getTypeUrl = function getTypeUrl(typeUrlPrefix) {
+                if (typeUrlPrefix === undefined) {
+                    typeUrlPrefix = "type.googleapis.com";
+                }
+                return typeUrlPrefix + "/karna.screen_capture.CaptureResyncRequest";
+            };
+
+            return CaptureResyncRequest;
+        })();
+
+        screen_capture.CaptureStatsRequest = (function() {
+
+            /**
+             * Properties of a CaptureStatsRequest.
+             * @memberof karna.screen_capture
+             * @interface ICaptureStatsRequest
+             */
+
+            /**
+             * Constructs a new CaptureStatsRequest.
+             * @memberof karna.screen_capture
+             * @classdesc Represents a CaptureStatsRequest.
+             * @implements ICaptureStatsRequest
+             * @constructor
+             * @param {karna.screen_capture.ICaptureStatsRequest=} [properties] Properties to set
+             */
+            function CaptureStatsRequest(properties) {
+                if (properties)
+                    for (let keys = Object.keys(properties), i = 0; i < keys.length; ++i)
+                        if (properties[keys[i]] != null)
+                            this[keys[i]] = properties[keys[i]];
+            }
+
+            /**
+             * Creates a new CaptureStatsRequest instance using the specified properties.
+             * @function create
+             * @memberof karna.screen_capture.CaptureStatsRequest
+             * @static
+             * @param {karna.screen_capture.ICaptureStatsRequest=} [properties] Properties to set
+             * @returns {karna.screen_capture.CaptureStatsRequest} CaptureStatsRequest instance
+             */
+            CaptureStatsRequest.create = function create(properties) {
+                return new CaptureStatsRequest(properties);
+            };
+
+            /**
+             * Encodes the specified CaptureStatsRequest message. Does not implicitly {@link karna.screen_capture.CaptureStatsRequest.verify|verify} messages.
+             * @function encode
+             * @memberof karna.screen_capture.CaptureStatsRequest
+             * @static
+             * @param {karna.screen_capture.ICaptureStatsRequest} message CaptureStatsRequest message or plain object to encode
+             * @param {$protobuf.Writer} [writer] Writer to encode to
+             * @returns {$protobuf.Writer} Writer
+             */
+            CaptureStatsRequest.encode = function encode(message, writer) {
+                if (!writer)
+                    writer = $Writer.create();
+                return writer;
+            };
+
+            /**
+             * Encodes the specified CaptureStatsRequest message, length delimited. Does not implicitly {@link karna.screen_capture.CaptureStatsRequest.verify|verify} messages.
+             * @function encodeDelimited
+             * @memberof karna.screen_capture.CaptureStatsRequest
+             * @static
+             * @param {karna.screen_capture.ICaptureStatsRequest} message CaptureStatsRequest message or plain object to encode
+             * @param {$protobuf.Writer} [writer] Writer to encode to
+             * @returns {$protobuf.Writer} Writer
+             */
+            CaptureStatsRequest.encodeDelimited = function encodeDelimited(message, writer) {
+                return this.encode(message, writer).ldelim();
+            };
+
+            /**
+             * Decodes a CaptureStatsRequest message from the specified reader or buffer.
+             * @function decode
+             * @memberof karna.screen_capture.CaptureStatsRequest
+             * @static
+             * @param {$protobuf.Reader|Uint8Array} reader Reader or buffer to decode from
+             * @param {number} [length] Message length if known beforehand
+             * @returns {karna.screen_capture.CaptureStatsRequest} CaptureStatsRequest
+             * @throws {Error} If the payload is not a reader or valid buffer
+             * @throws {$protobuf.util.ProtocolError} If required fields are missing
+             */
+            CaptureStatsRequest.decode = function decode(reader, length) {
+                if (!(reader instanceof $Reader))
+                    reader = $Reader.create(reader);
+                let end = length === undefined ? reader.len : reader.pos + length, message = new $root.karna.screen_capture.CaptureStatsRequest();
+                while (reader.pos < end) {
+                    let tag = reader.uint32();
+                    switch (tag >>> 3) {
+                    default:
+                        reader.skipType(tag & 7);
+                        break;
+                    }
+                }
+                return message;
+            };
+
+            /**
+             * Decodes a CaptureStatsRequest message from the specified reader or buffer, length delimited.
+             * @function decodeDelimited
+             * @memberof karna.screen_capture.CaptureStatsRequest
+             * @static
+             * @param {$protobuf.Reader|Uint8Array} reader Reader or buffer to decode from
+             * @returns {karna.screen_capture.CaptureStatsRequest} CaptureStatsRequest
+             * @throws {Error} If the payload is not a reader or valid buffer
+             * @throws {$protobuf.util.ProtocolError} If required fields are missing
+             */
+            CaptureStatsRequest.decodeDelimited = function decodeDelimited(reader) {
+                if (!(reader instanceof $Reader))
+                    reader = new $Reader(reader);
+                return this.decode(reader, reader.uint32());
+            };
+
+            /**
+             * Verifies a CaptureStatsRequest message.
+             * @function verify
+             * @memberof karna.screen_capture.CaptureStatsRequest
+             * @static
+             * @param {Object.<string,*>} message Plain object to verify
+             * @returns {string|null} `null` if valid, otherwise the reason why it is not
+             */
+            CaptureStatsRequest.verify = function verify(message) {
+                if (typeof message !== "object" || message === null)
+                    return "object expected";
+                return null;
+            };
+
+            /**
+             * Creates a CaptureStatsRequest message from a plain object. Also converts values to their respective internal types.
+             * @function fromObject
+             * @memberof karna.screen_capture.CaptureStatsRequest
+             * @static
+             * @param {Object.<string,*>} object Plain object
+             * @returns {karna.screen_capture.CaptureStatsRequest} CaptureStatsRequest
+             */
+            CaptureStatsRequest.fromObject = function fromObject(object) {
+                if (object instanceof $root.karna.screen_capture.CaptureStatsRequest)
+                    return object;
+                return new $root.karna.screen_capture.CaptureStatsRequest();
+            };
+
+            /**
+             * Creates a plain object from a CaptureStatsRequest message. Also converts values to other types if specified.
+             * @function toObject
+             * @memberof karna.screen_capture.CaptureStatsRequest
+             * @static
+             * @param {karna.screen_capture.CaptureStatsRequest} message CaptureStatsRequest
+             * @param {$protobuf.IConversionOptions} [options] Conversion options
+             * @returns {Object.<string,*>} Plain object
+             */
+            CaptureStatsRequest.toObject = function toObject() {
+                return {};
+            };
+
+            /**
+             * Converts this CaptureStatsRequest to JSON.
+             * @function toJSON
+             * @memberof karna.screen_capture.CaptureStatsRequest
+             * @instance
+             * @returns {Object.<string,*>} JSON object
+             */
+            CaptureStatsRequest.prototype.toJSON = function toJSON() {
+                return this.constructor.toObject(this, $protobuf.util.toJSONOptions);
+            };
+
+            /**
+             * Gets the default type url for CaptureStatsRequest
+             * @function getTypeUrl
+             * @memberof karna.screen_capture.CaptureStatsRequest
+             * @static
+             * @param {string} [typeUrlPrefix] your custom typeUrlPrefix(default "type.googleapis.com")
+             * @returns {string} The default type url
+             */
+            CaptureStatsRequest.getTypeUrl = function getTypeUrl(typeUrlPrefix) {
+                if (typeUrlPrefix === undefined) {
+                    typeUrlPrefix = "type.googleapis.com";
+                }
+                return typeUrlPrefix + "/karna.screen_capture.CaptureStatsRequest";
+            };
+
+            return CaptureStatsRequest;
+        })();
+
+        screen_capture.ScreenCaptureRPCRequest = (function() {
+
+            /**
+             * Properties of a ScreenCaptureRPCRequest.
+             * @memberof karna.screen_capture
+             * @interface IScreenCaptureRPCRequest
+             * @property {karna.screen_capture.ICaptureRequest|null} [startCapture] ScreenCaptureRPCRequest startCapture
+             * @property {karna.screen_capture.ICaptureRequest|null} [stopCapture] ScreenCaptureRPCRequest stopCapture
+             * @property {karna.screen_capture.ICaptureUpdateRequest|null} [updateCapture] ScreenCaptureRPCRequest updateCapture
+             * @property {karna.screen_capture.ICaptureCacheRequest|null} [getCache] ScreenCaptureRPCRequest getCache
+             * @property {karna.screen_capture.ICaptureDeltaSubscribeRequest|null} [subscribeDeltas] ScreenCaptureRPCRequest subscribeDeltas
+             * @property {karna.screen_capture.ICaptureResyncRequest|null} [resync] ScreenCaptureRPCRequest resync
+             * @property {karna.screen_capture.ICaptureStatsRequest|null} [getStats] ScreenCaptureRPCRequest getStats
+             */
+
+            /**
+             * Constructs a new ScreenCaptureRPCRequest.
+             * @memberof karna.screen_capture
+             * @classdesc Represents a ScreenCaptureRPCRequest.
+             * @implements IScreenCaptureRPCRequest
+             * @constructor
+             * @param {karna.screen_capture.IScreenCaptureRPCRequest=} [properties] Properties to set
+             */
+            function ScreenCaptureRPCRequest(properties) {
+                if (properties)
+                    for (let keys = Object.keys(properties), i = 0; i < keys.length; ++i)
+                        if (properties[keys[i]] != null)
+                            this[keys[i]] = properties[keys[i]];
+            }
+
+            /**
+             * ScreenCaptureRPCRequest startCapture.
+             * @member {karna.screen_capture.ICaptureRequest|null|undefined} startCapture
+             * @memberof karna.screen_capture.ScreenCaptureRPCRequest
+             * @instance
+             */
+            ScreenCaptureRPCRequest.prototype.startCapture = null;
+
+            /**
+             * ScreenCaptureRPCRequest stopCapture.
+             * @member {karna.screen_capture.ICaptureRequest|null|undefined} stopCapture
+             * @memberof karna.screen_capture.ScreenCaptureRPCRequest
+             * @instance
+             */
+            ScreenCaptureRPCRequest.prototype.stopCapture = null;
+
+            /**
+             * ScreenCaptureRPCRequest updateCapture.
+             * @member {karna.screen_capture.ICaptureUpdateRequest|null|undefined} updateCapture
+             * @memberof karna.screen_capture.ScreenCaptureRPCRequest
+             * @instance
+             */
+            ScreenCaptureRPCRequest.prototype.updateCapture = null;
+
+            /**
+             * ScreenCaptureRPCRequest getCache.
+             * @member {karna.screen_capture.ICaptureCacheRequest|null|undefined} getCache
+             * @memberof karna.screen_capture.ScreenCaptureRPCRequest
+             * @instance
+             */
+            ScreenCaptureRPCRequest.prototype.getCache = null;
+
+            /**
+             * ScreenCaptureRPCRequest subscribeDeltas.
+             * @member {karna.screen_capture.ICaptureDeltaSubscribeRequest|null|undefined} subscribeDeltas
+             * @memberof karna.screen_capture.ScreenCaptureRPCRequest
+             * @instance
+             */
+            ScreenCaptureRPCRequest.prototype.subscribeDeltas = null;
+
+            /**
+             * ScreenCaptureRPCRequest resync.
+             * @member {karna.screen_capture.ICaptureResyncRequest|null|undefined} resync
+             * @memberof karna.screen_capture.ScreenCaptureRPCRequest
+             * @instance
+             */
+            ScreenCaptureRPCRequest.prototype.resync = null;
+
+            /**
+             * ScreenCaptureRPCRequest getStats.
+             * @member {karna.screen_capture.ICaptureStatsRequest|null|undefined} getStats
+             * @memberof karna.screen_capture.ScreenCaptureRPCRequest
+             * @instance
+             */
+            ScreenCaptureRPCRequest.prototype.getStats = null;
+
+            // OneOf field names bound to virtual getters and setters
+            let $oneOfFields;
+
+            /**
+             * ScreenCaptureRPCRequest method.
+             * @member {"startCapture"|"stopCapture"|"updateCapture"|"getCache"|"subscribeDeltas"|"resync"|"getStats"|undefined} method
+             * @memberof karna.screen_capture.ScreenCaptureRPCRequest
+             * @instance
+             */
+            Object.defineProperty(ScreenCaptureRPCRequest.prototype, "method", {
+                get: $util.oneOfGetter($oneOfFields = ["startCapture", "stopCapture", "updateCapture", "getCache", "subscribeDeltas", "resync", "getStats"]),
+                set: $util.oneOfSetter($oneOfFields)
+            });
+
+            /**
+             * Creates a new ScreenCaptureRPCRequest instance using the specified properties.
+             * @function create
+             * @memberof karna.screen_capture.ScreenCaptureRPCRequest
+             * @static
+             * @param {karna.screen_capture.IScreenCaptureRPCRequest=} [properties] Properties to set
+             * @returns {karna.screen_capture.ScreenCaptureRPCRequest} ScreenCaptureRPCRequest instance
+             */
+            ScreenCaptureRPCRequest.create = function create(properties) {
+                return new ScreenCaptureRPCRequest(properties);
+            };
+
+            /**
+             * Encodes the specified ScreenCaptureRPCRequest message. Does not implicitly {@link karna.screen_capture.ScreenCaptureRPCRequest.verify|verify} messages.
+             * @function encode
+             * @memberof karna.screen_capture.ScreenCaptureRPCRequest
+             * @static
+             * @param {karna.screen_capture.IScreenCaptureRPCRequest} message ScreenCaptureRPCRequest message or plain object to encode
+             * @param {$protobuf.Writer} [writer] Writer to encode to
+             * @returns {$protobuf.Writer} Writer
+             */
+            ScreenCaptureRPCRequest.encode = function encode(message, writer) {
+                if (!writer)
+                    writer = $Writer.create();
+                if (message.startCapture != null && Object.hasOwnProperty.call(message, "startCapture"))
+                    $root.karna.screen_capture.CaptureRequest.encode(message.startCapture, writer.uint32(/* id 1, wireType 2 =*/10).fork()).ldelim();
+                if (message.stopCapture != null && Object.hasOwnProperty.call(message, "stopCapture"))
+                    $root.karna.screen_capture.CaptureRequest.encode(message.stopCapture, writer.uint32(/* id 2, wireType 2 =*/18).fork()).ldelim();
+                if (message.updateCapture != null && Object.hasOwnProperty.call(message, "updateCapture"))
+                    $root.karna.screen_capture.CaptureUpdateRequest.encode(message.updateCapture, writer.uint32(/* id 3, wireType 2 =*/26).fork()).ldelim();
+                if (message.getCache != null && Object.hasOwnProperty.call(message, "getCache"))
+                    $root.karna.screen_capture.CaptureCacheRequest.encode(message.getCache, writer.uint32(/* id 4, wireType 2 =*/34).fork()).ldelim();
+                if (message.subscribeDeltas != null && Object.hasOwnProperty.call(message, "subscribeDeltas"))
+                    $root.karna.screen_capture.CaptureDeltaSubscribeRequest.encode(message.subscribeDeltas, writer.uint32(/* id 5, wireType 2 =*/42).fork()).ldelim();
+                if (message.resync != null && Object.hasOwnProperty.call(message, "resync"))
+                    $root.karna.screen_capture.CaptureResyncRequest.encode(message.resync, writer.uint32(/* id 6, wireType 2 =*/50).fork()).ldelim();
+                if (message.getStats != null && Object.hasOwnProperty.call(message, "getStats"))
+                    $root.karna.screen_capture.CaptureStatsRequest.encode(message.getStats, writer.uint32(/* id 7, wireType 2 =*/58).fork()).ldelim();
+                return writer;
+            };
+
+            /**
+             * Encodes the specified ScreenCaptureRPCRequest message, length delimited. Does not implicitly {@link karna.screen_capture.ScreenCaptureRPCRequest.verify|verify} messages.
+             * @function encodeDelimited
+             * @memberof karna.screen_capture.ScreenCaptureRPCRequest
+             * @static
+             * @param {karna.screen_capture.IScreenCaptureRPCRequest} message ScreenCaptureRPCRequest message or plain object to encode
+             * @param {$protobuf.Writer} [writer] Writer to encode to
+             * @returns {$protobuf.Writer} Writer
+             */
+            ScreenCaptureRPCRequest.encodeDelimited = function encodeDelimited(message, writer) {
+                return this.encode(message, writer).ldelim();
+            };
+
+            /**
+             * Decodes a ScreenCaptureRPCRequest message from the specified reader or buffer.
+             * @function decode
+             * @memberof karna.screen_capture.ScreenCaptureRPCRequest
+             * @static
+             * @param {$protobuf.Reader|Uint8Array} reader Reader or buffer to decode from
+             * @param {number} [length] Message length if known beforehand
+             * @returns {karna.screen_capture.ScreenCaptureRPCRequest} ScreenCaptureRPCRequest
+             * @throws {Error} If the payload is not a reader or valid buffer
+             * @throws {$protobuf.util.ProtocolError} If required fields are missing
+             */
+            ScreenCaptureRPCRequest.decode = function decode(reader, length) {
+                if (!(reader instanceof $Reader))
+                    reader = $Reader.create(reader);
+                let end = length === undefined ? reader.len : reader.pos + length, message = new $root.karna.screen_capture.ScreenCaptureRPCRequest();
+                while (reader.pos < end) {
+                    let tag = reader.uint32();
+                    switch (tag >>> 3) {
+                    case 1: {
+                            message.startCapture = $root.karna.screen_capture.CaptureRequest.decode(reader, reader.uint32());
+                            break;
+                        }
+                    case 2: {
+                            message.stopCapture = $root.karna.screen_capture.CaptureRequest.decode(reader, reader.uint32());
+                            break;
+                        }
+                    case 3: {
+                            message.updateCapture = $root.karna.screen_capture.CaptureUpdateRequest.decode(reader, reader.uint32());
+                            break;
+                        }
+                    case 4: {
+                            message.getCache = $root.karna.screen_capture.CaptureCacheRequest.decode(reader, reader.uint32());
+                            break;
+                        }
+                    case 5: {
+                            message.subscribeDeltas = $root.karna.screen_capture.CaptureDeltaSubscribeRequest.decode(reader, reader.uint32());
+                            break;
+                        }
+                    case 6: {
+                            message.resync = $root.karna.screen_capture.CaptureResyncRequest.decode(reader, reader.uint32());
+                            break;
+                        }
+                    case 7: {
+                            message.getStats = $root.karna.screen_capture.CaptureStatsRequest.decode(reader, reader.uint32());
+                            break;
+                        }
+                    default:
+                        reader.skipType(tag & 7);
+                        break;
+                    }
+                }
+                return message;
+            };
+
+            /**
+             * Decodes a ScreenCaptureRPCRequest message from the specified reader or buffer, length delimited.
+             * @function decodeDelimited
+             * @memberof karna.screen_capture.ScreenCaptureRPCRequest
+             * @static
+             * @param {$protobuf.Reader|Uint8Array} reader Reader or buffer to decode from
+             * @returns {karna.screen_capture.ScreenCaptureRPCRequest} ScreenCaptureRPCRequest
+             * @throws {Error} If the payload is not a reader or valid buffer
+             * @throws {$protobuf.util.ProtocolError} If required fields are missing
+             */
+            ScreenCaptureRPCRequest.decodeDelimited = function decodeDelimited(reader) {
+                if (!(reader instanceof $Reader))
+                    reader = new $Reader(reader);
+                return this.decode(reader, reader.uint32());
+            };
+
+            /**
+             * Verifies a ScreenCaptureRPCRequest message.
+             * @function verify
+             * @memberof karna.screen_capture.ScreenCaptureRPCRequest
+             * @static
+             * @param {Object.<string,*>} message Plain object to verify
+             * @returns {string|null} `null` if valid, otherwise the reason why it is not
+             */
+            ScreenCaptureRPCRequest.verify = function verify(message) {
+                if (typeof message !== "object" || message === null)
+                    return "object expected";
+                let properties = {};
+                if (message.startCapture != null && message.hasOwnProperty("startCapture")) {
+                    properties.method = 1;
+                    {
+                        let error = $root.karna.screen_capture.CaptureRequest.verify(message.startCapture);
+                        if (error)
+                            return "startCapture." + error;
+                    }
+                }
+                if (message.stopCapture != null && message.hasOwnProperty("stopCapture")) {
+                    if (properties.method === 1)
+                        return "method: multiple values";
+                    properties.method = 1;
+                    {
+                        let error = $root.karna.screen_capture.CaptureRequest.verify(message.stopCapture);
+                        if (error)
+                            return "stopCapture." + error;
+                    }
+                }
+                if (message.updateCapture != null && message.hasOwnProperty("updateCapture")) {
+                    if (properties.method === 1)
+                        return "method: multiple values";
+                    properties.method = 1;
+                    {
+                        let error = $root.karna.screen_capture.CaptureUpdateRequest.verify(message.updateCapture);
+                        if (error)
+                            return "updateCapture." + error;
+                    }
+                }
+                if (message.getCache != null && message.hasOwnProperty("getCache")) {
+                    if (properties.method === 1)
+                        return "method: multiple values";
+                    properties.method = 1;
+                    {
+                        let error = $root.karna.screen_capture.CaptureCacheRequest.verify(message.getCache);
+                        if (error)
+                            return "getCache." + error;
+                    }
+                }
+                if (message.subscribeDeltas != null && message.hasOwnProperty("subscribeDeltas")) {
+                    if (properties.method === 1)
+                        return "method: multiple values";
+                    properties.method = 1;
+                    {
+                        let error = $root.karna.screen_capture.CaptureDeltaSubscribeRequest.verify(message.subscribeDeltas);
+                        if (error)
+                            return "subscribeDeltas." + error;
+                    }
+                }
+                if (message.resync != null && message.hasOwnProperty("resync")) {
+                    if (properties.method === 1)
+                        return "method: multiple values";
+                    properties.method = 1;
+                    {
+                        let error = $root.karna.screen_capture.CaptureResyncRequest.verify(message.resync);
+                        if (error)
+                            return "resync." + error;
+                    }
+                }
+                if (message.getStats != null && message.hasOwnProperty("getStats")) {
+                    if (properties.method === 1)
+                        return "method: multiple values";
+                    properties.method = 1;
+                    {
+                        let error = $root.karna.screen_capture.CaptureStatsRequest.verify(message.getStats);
+                        if (error)
+                            return "getStats." + error;
+                    }
+                }
+                return null;
+            };
+
+            /**
+             * Creates a ScreenCaptureRPCRequest message from a plain object. Also converts values to their respective internal types.
+             * @function fromObject
+             * @memberof karna.screen_capture.ScreenCaptureRPCRequest
+             * @static
+             * @param {Object.<string,*>} object Plain object
+             * @returns {karna.screen_capture.ScreenCaptureRPCRequest} ScreenCaptureRPCRequest
+             */
+            ScreenCaptureRPCRequest.fromObject = function fromObject(object) {
+                if (object instanceof $root.karna.screen_capture.ScreenCaptureRPCRequest)
+                    return object;
+                let message = new $root.karna.screen_capture.ScreenCaptureRPCRequest();
+                if (object.startCapture != null) {
+                    if (typeof object.startCapture !== "object")
+                        throw TypeError(".karna.screen_capture.ScreenCaptureRPCRequest.startCapture: object expected");
+                    message.startCapture = $root.karna.screen_capture.CaptureRequest.fromObject(object.startCapture);
+                }
+                if (object.stopCapture != null) {
+                    if (typeof object.stopCapture !== "object")
+                        throw TypeError(".karna.screen_capture.ScreenCaptureRPCRequest.stopCapture: object expected");
+                    message.stopCapture = $root.karna.screen_capture.CaptureRequest.fromObject(object.stopCapture);
+                }
+                if (object.updateCapture != null) {
+                    if (typeof object.updateCapture !== "object")
+                        throw TypeError(".karna.screen_capture.ScreenCaptureRPCRequest.updateCapture: object expected");
+                    message.updateCapture = $root.karna.screen_capture.CaptureUpdateRequest.fromObject(object.updateCapture);
+                }
+                if (object.getCache != null) {
+                    if (typeof object.getCache !== "object")
+                        throw TypeError(".karna.screen_capture.ScreenCaptureRPCRequest.getCache: object expected");
+                    message.getCache = $root.karna.screen_capture.CaptureCacheRequest.fromObject(object.getCache);
+                }
+                if (object.subscribeDeltas != null) {
+                    if (typeof object.subscribeDeltas !== "object")
+                        throw TypeError(".karna.screen_capture.ScreenCaptureRPCRequest.subscribeDeltas: object expected");
+                    message.subscribeDeltas = $root.karna.screen_capture.CaptureDeltaSubscribeRequest.fromObject(object.subscribeDeltas);
+                }
+                if (object.resync != null) {
+                    if (typeof object.resync !== "object")
+                        throw TypeError(".karna.screen_capture.ScreenCaptureRPCRequest.resync: object expected");
+                    message.resync = $root.karna.screen_capture.CaptureResyncRequest.fromObject(object.resync);
+                }
+                if (object.getStats != null) {
+                    if (typeof object.getStats !== "object")
+                        throw TypeError(".karna.screen_capture.ScreenCaptureRPCRequest.getStats: object expected");
+                    message.getStats = $root.karna.screen_capture.CaptureStatsRequest.fromObject(object.getStats);
+                }
+                return message;
+            };
+
+            /**
+             * Creates a plain object from a ScreenCaptureRPCRequest message. Also converts values to other types if specified.
+             * @function toObject
+             * @memberof karna.screen_capture.ScreenCaptureRPCRequest
+             * @static
+             * @param {karna.screen_capture.ScreenCaptureRPCRequest} message ScreenCaptureRPCRequest
+             * @param {$protobuf.IConversionOptions} [options] Conversion options
+             * @returns {Object.<string,*>} Plain object
+             */
+            ScreenCaptureRPCRequest.toObject = function toObject(message, options) {
+                if (!options)
+                    options = {};
+                let object = {};
+                if (message.startCapture != null && message.hasOwnProperty("startCapture")) {
+                    object.startCapture = $root.karna.screen_capture.CaptureRequest.toObject(message.startCapture, options);
+                    if (options.oneofs)
+                        object.method = "startCapture";
+                }
+                if (message.stopCapture != null && message.hasOwnProperty("stopCapture")) {
+                    object.stopCapture = $root.karna.screen_capture.CaptureRequest.toObject(message.stopCapture, options);
+                    if (options.oneofs)
+                        object.method = "stopCapture";
+                }
+                if (message.updateCapture != null && message.hasOwnProperty("updateCapture")) {
+                    object.updateCapture = $root.karna.screen_capture.CaptureUpdateRequest.toObject(message.updateCapture, options);
+                    if (options.oneofs)
+                        object.method = "updateCapture";
+                }
+                if (message.getCache != null && message.hasOwnProperty("getCache")) {
+                    object.getCache = $root.karna.screen_capture.CaptureCacheRequest.toObject(message.getCache, options);
+                    if (options.oneofs)
+                        object.method = "getCache";
+                }
+                if (message.subscribeDeltas != null && message.hasOwnProperty("subscribeDeltas")) {
+                    object.subscribeDeltas = $root.karna.screen_capture.CaptureDeltaSubscribeRequest.toObject(message.subscribeDeltas, options);
+                    if (options.oneofs)
+                        object.method = "subscribeDeltas";
+                }
+                if (message.resync != null && message.hasOwnProperty("resync")) {
+                    object.resync = $root.karna.screen_capture.CaptureResyncRequest.toObject(message.resync, options);
+                    if (options.oneofs)
+                        object.method = "resync";
+                }
+                if (message.getStats != null && message.hasOwnProperty("getStats")) {
+                    object.getStats = $root.karna.screen_capture.CaptureStatsRequest.toObject(message.getStats, options);
+                    if (options.oneofs)
+                        object.method = "getStats";
+                }
+                return object;
+            };
+
+            /**
+             * Converts this ScreenCaptureRPCRequest to JSON.
+             * @function toJSON
+             * @memberof karna.screen_capture.ScreenCaptureRPCRequest
+             * @instance
+             * @returns {Object.<string,*>} JSON object
+             */
+            ScreenCaptureRPCRequest.prototype.toJSON = function toJSON() {
+                return this.constructor.toObject(this, $protobuf.util.toJSONOptions);
+            };
+
+            /**
+             * Gets the default type url for ScreenCaptureRPCRequest
+             * @function getTypeUrl
+             * @memberof karna.screen_capture.ScreenCaptureRPCRequest
+             * @static
+             * @param {string} [typeUrlPrefix] your custom typeUrlPrefix(default "type.googleapis.com")
+             * @returns {string} The default type url
+             */
+            ScreenCaptureRPCRequest.getTypeUrl = function getTypeUrl(typeUrlPrefix) {
+                if (typeUrlPrefix === undefined) {
+                    typeUrlPrefix = "type.googleapis.com";
+                }
+                return typeUrlPrefix + "/karna.screen_capture.ScreenCaptureRPCRequest";
+            };
+
+            return ScreenCaptureRPCRequest;
+        })();
+
+        screen_capture.RpcScreenshotEvent = (function() {
+
+            /**
+             * Properties of a RpcScreenshotEvent.
+             * @memberof karna.screen_capture
+             * @interface IRpcScreenshotEvent
+             * @property {string|null} [eventId] RpcScreenshotEvent eventId
+             * @property {string|null} [projectUuid] RpcScreenshotEvent projectUuid
+             * @property {string|null} [commandUuid] RpcScreenshotEvent commandUuid
+             * @property {string|null} [timestamp] RpcScreenshotEvent timestamp
+             * @property {string|null} [description] RpcScreenshotEvent description
+             * @property {string|null} [screenshotPath] RpcScreenshotEvent screenshotPath
+             * @property {string|null} [annotationPath] RpcScreenshotEvent annotationPath
+             * @property {number|null} [mouseX] RpcScreenshotEvent mouseX
+             * @property {number|null} [mouseY] RpcScreenshotEvent mouseY
+             * @property {string|null} [keyChar] RpcScreenshotEvent keyChar
+             * @property {string|null} [keyCode] RpcScreenshotEvent keyCode
+             * @property {boolean|null} [isSpecialKey] RpcScreenshotEvent isSpecialKey
+             * @property {string|null} [mouseEventToolTip] RpcScreenshotEvent mouseEventToolTip
+             * @property {number|null} [similarityScore] RpcScreenshotEvent similarityScore
+             * @property {string|null} [duplicateOfEventId] RpcScreenshotEvent duplicateOfEventId
+             * @property {Object.<string,string>|null} [thumbnailPaths] RpcScreenshotEvent thumbnailPaths
+             * @property {number|null} [captureOriginX] RpcScreenshotEvent captureOriginX
+             * @property {number|null} [captureOriginY] RpcScreenshotEvent captureOriginY
+             */
+
+            /**
+             * Constructs a new RpcScreenshotEvent.
+             * @memberof karna.screen_capture
+             * @classdesc Represents a RpcScreenshotEvent.
+             * @implements IRpcScreenshotEvent
+             * @constructor
+             * @param {karna.screen_capture.IRpcScreenshotEvent=} [properties] Properties to set
+             */
+            function RpcScreenshotEvent(properties) {
+                this.thumbnailPaths = {};
+                if (properties)
+                    for (let keys = Object.keys(properties), i = 0; i < keys.length; ++i)
+                        if (properties[keys[i]] != null)
+                            this[keys[i]] = properties[keys[i]];
+            }
+
+            /**
+             * RpcScreenshotEvent eventId.
+             * @member {string} eventId
+             * @memberof karna.screen_capture.RpcScreenshotEvent
+             * @instance
+             */
+            RpcScreenshotEvent.prototype.eventId = "";
+
+            /**
+             * RpcScreenshotEvent projectUuid.
+             * @member {string} projectUuid
+             * @memberof karna.screen_capture.RpcScreenshotEvent
+             * @instance
+             */
+            RpcScreenshotEvent.prototype.projectUuid = "";
+
+            /**
+             * RpcScreenshotEvent commandUuid.
+             * @member {string} commandUuid
+             * @memberof karna.screen_capture.RpcScreenshotEvent
+             * @instance
+             */
+            RpcScreenshotEvent.prototype.commandUuid = "";
+
+            /**
+             * RpcScreenshotEvent timestamp.
+             * @member {string} timestamp
+             * @memberof karna.screen_capture.RpcScreenshotEvent
+             * @instance
+             */
+            RpcScreenshotEvent.prototype.timestamp = "";
+
+            /**
+             * RpcScreenshotEvent description.
+             * @member {string} description
+             * @memberof karna.screen_capture.RpcScreenshotEvent
+             * @instance
+             */
+            RpcScreenshotEvent.prototype.description = "";
+
+            /**
+             * RpcScreenshotEvent screenshotPath.
+             * @member {string} screenshotPath
+             * @memberof karna.screen_capture.RpcScreenshotEvent
+             * @instance
+             */
+            RpcScreenshotEvent.prototype.screenshotPath = "";
+
+            /**
+             * RpcScreenshotEvent annotationPath.
+             * @member {string|null|undefined} annotationPath
+             * @memberof karna.screen_capture.RpcScreenshotEvent
+             * @instance
+             */
+            RpcScreenshotEvent.prototype.annotationPath = null;
+
+            /**
+             * RpcScreenshotEvent mouseX.
+             * @member {number|null|undefined} mouseX
+             * @memberof karna.screen_capture.RpcScreenshotEvent
+             * @instance
+             */
+            RpcScreenshotEvent.prototype.mouseX = null;
+
+            /**
+             * RpcScreenshotEvent mouseY.
+             * @member {number|null|undefined} mouseY
+             * @memberof karna.screen_capture.RpcScreenshotEvent
+             * @instance
+             */
+            RpcScreenshotEvent.prototype.mouseY = null;
+
+            /**
+             * RpcScreenshotEvent keyChar.
+             * @member {string|null|undefined} keyChar
+             * @memberof karna.screen_capture.RpcScreenshotEvent
+             * @instance
+             */
+            RpcScreenshotEvent.prototype.keyChar = null;
+
+            /**
+             * RpcScreenshotEvent keyCode.
+             * @member {string|null|undefined} keyCode
+             * @memberof karna.screen_capture.RpcScreenshotEvent
+             * @instance
+             */
+            RpcScreenshotEvent.prototype.keyCode = null;
+
+            /**
+             * RpcScreenshotEvent isSpecialKey.
+             * @member {boolean} isSpecialKey
+             * @memberof karna.screen_capture.RpcScreenshotEvent
+             * @instance
+             */
+            RpcScreenshotEvent.prototype.isSpecialKey = false;
+
+            /**
+             * RpcScreenshotEvent mouseEventToolTip.
+             * @member {string|null|undefined} mouseEventToolTip
+             * @memberof karna.screen_capture.RpcScreenshotEvent
+             * @instance
+             */
+            RpcScreenshotEvent.prototype.mouseEventToolTip = null;
+
+            /**
+             * RpcScreenshotEvent similarityScore.
+             * @member {number|null|undefined} similarityScore
+             * @memberof karna.screen_capture.RpcScreenshotEvent
+             * @instance
+             */
+            RpcScreenshotEvent.prototype.similarityScore = null;
+
+            /**
+             * RpcScreenshotEvent duplicateOfEventId.
+             * @member {string|null|undefined} duplicateOfEventId
+             * @memberof karna.screen_capture.RpcScreenshotEvent
+             * @instance
+             */
+            RpcScreenshotEvent.prototype.duplicateOfEventId = null;
+
+            /**
+             * RpcScreenshotEvent thumbnailPaths.
+             * @member {Object.<string,string>} thumbnailPaths
+             * @memberof karna.screen_capture.RpcScreenshotEvent
+             * @instance
+             */
+            RpcScreenshotEvent.prototype.thumbnailPaths = $util.emptyObject;
+
+            /**
+             * RpcScreenshotEvent captureOriginX.
+             * @member {number|null|undefined} captureOriginX
+             * @memberof karna.screen_capture.RpcScreenshotEvent
+             * @instance
+             */
+            RpcScreenshotEvent.prototype.captureOriginX = null;
+
+            /**
+             * RpcScreenshotEvent captureOriginY.
+             * @member {number|null|undefined} captureOriginY
+             * @memberof karna.screen_capture.RpcScreenshotEvent
+             * @instance
+             */
+            RpcScreenshotEvent.prototype.captureOriginY = null;
+
+            // OneOf field names bound to virtual getters and setters
+            let $oneOfFields;
+
+            // Virtual OneOf for proto3 optional field
+            Object.defineProperty(RpcScreenshotEvent.prototype, "_annotationPath", {
+                get: $util.oneOfGetter($oneOfFields = ["annotationPath"]),
+                set: $util.oneOfSetter($oneOfFields)
+            });
+
+            // Virtual OneOf for proto3 optional field
+            Object.defineProperty(RpcScreenshotEvent.prototype, "_mouseX", {
+                get: $util.oneOfGetter($oneOfFields = ["mouseX"]),
+                set: $util.oneOfSetter($oneOfFields)
+            });
+
+            // Virtual OneOf for proto3 optional field
+            Object.defineProperty(RpcScreenshotEvent.prototype, "_mouseY", {
+                get: $util.oneOfGetter($oneOfFields = ["mouseY"]),
+                set: $util.oneOfSetter($oneOfFields)
+            });
+
+            // Virtual OneOf for proto3 optional field
+            Object.defineProperty(RpcScreenshotEvent.prototype, "_keyChar", {
+                get: $util.oneOfGetter($oneOfFields = ["keyChar"]),
+                set: $util.oneOfSetter($oneOfFields)
+            });
+
+            // Virtual OneOf for proto3 optional field
+            Object.defineProperty(RpcScreenshotEvent.prototype, "_keyCode", {
+                get: $util.oneOfGetter($oneOfFields = ["keyCode"]),
+                set: $util.oneOfSetter($oneOfFields)
+            });
+
+            // Virtual OneOf for proto3 optional field
+            Object.defineProperty(RpcScreenshotEvent.prototype, "_mouseEventToolTip", {
+                get: $util.oneOfGetter($oneOfFields = ["mouseEventToolTip"]),
+                set: $util.oneOfSetter($oneOfFields)
+            });
+
+            // Virtual OneOf for proto3 optional field
+            Object.defineProperty(RpcScreenshotEvent.prototype, "_similarityScore", {
+                get: $util.oneOfGetter($oneOfFields = ["similarityScore"]),
+                set: $util.oneOfSetter($oneOfFields)
+            });
+
+            // Virtual OneOf for proto3 optional field
+            Object.defineProperty(RpcScreenshotEvent.prototype, "_duplicateOfEventId", {
+                get: $util.oneOfGetter($oneOfFields = ["duplicateOfEventId"]),
+                set: $util.oneOfSetter($oneOfFields)
+            });
+
+            // Virtual OneOf for proto3 optional field
+            Object.defineProperty(RpcScreenshotEvent.prototype, "_captureOriginX", {
+                get: $util.oneOfGetter($oneOfFields = ["captureOriginX"]),
+                set: $util.oneOfSetter($oneOfFields)
+            });
+
+            // Virtual OneOf for proto3 optional field
+            Object.defineProperty(RpcScreenshotEvent.prototype, "_captureOriginY", {
+                get: $util.oneOfGetter($oneOfFields = ["captureOriginY"]),
+                set: $util.oneOfSetter($oneOfFields)
+            });
+
+            /**
+             * Creates a new RpcScreenshotEvent instance using the specified properties.
+             * @function create
+             * @memberof karna.screen_capture.RpcScreenshotEvent
+             * @static
+             * @param {karna.screen_capture.IRpcScreenshotEvent=} [properties] Properties to set
+             * @returns {karna.screen_capture.RpcScreenshotEvent} RpcScreenshotEvent instance
+             */
+            RpcScreenshotEvent.create = function create(properties) {
+                return new RpcScreenshotEvent(properties);
+            };
+
+            /**
+             * Encodes the specified RpcScreenshotEvent message. Does not implicitly {@link karna.screen_capture.RpcScreenshotEvent.verify|verify} messages.
+             * @function encode
+             * @memberof karna.screen_capture.RpcScreenshotEvent
+             * @static
+             * @param {karna.screen_capture.IRpcScreenshotEvent} message RpcScreenshotEvent message or plain object to encode
+             * @param {$protobuf.Writer} [writer] Writer to encode to
+             * @returns {$protobuf.Writer} Writer
+             */
+            RpcScreenshotEvent.encode = function encode(message, writer) {
+                if (!writer)
+                    writer = $Writer.create();
+                if (message.eventId != null && Object.hasOwnProperty.call(message, "eventId"))
+                    writer.uint32(/* id 1, wireType 2 =*/10).string(message.eventId);
+                if (message.projectUuid != null && Object.hasOwnProperty.call(message, "projectUuid"))
+                    writer.uint32(/* id 2, wireType 2 =*/18).string(message.projectUuid);
+                if (message.commandUuid != null && Object.hasOwnProperty.call(message, "commandUuid"))
+                    writer.uint32(/* id 3, wireType 2 =*/26).string(message.commandUuid);
+                if (message.timestamp != null && Object.hasOwnProperty.call(message, "timestamp"))
+                    writer.uint32(/* id 4, wireType 2 =*/34).string(message.timestamp);
+                if (message.description != null && Object.hasOwnProperty.call(message, "description"))
+                    writer.uint32(/* id 5, wireType 2 =*/42).string(message.description);
+                if (message.screenshotPath != null && Object.hasOwnProperty.call(message, "screenshotPath"))
+                    writer.uint32(/* id 6, wireType 2 =*/50).string(message.screenshotPath);
+                if (message.annotationPath != null && Object.hasOwnProperty.call(message, "annotationPath"))
+                    writer.uint32(/* id 7, wireType 2 =*/58).string(message.annotationPath);
+                if (message.mouseX != null && Object.hasOwnProperty.call(message, "mouseX"))
+                    writer.uint32(/* id 8, wireType 0 =*/64).int32(message.mouseX);
+                if (message.mouseY != null && Object.hasOwnProperty.call(message, "mouseY"))
+                    writer.uint32(/* id 9, wireType 0 =*/72).int32(message.mouseY);
+                if (message.keyChar != null && Object.hasOwnProperty.call(message, "keyChar"))
+                    writer.uint32(/* id 10, wireType 2 =*/82).string(message.keyChar);
+                if (message.keyCode != null && Object.hasOwnProperty.call(message, "keyCode"))
+                    writer.uint32(/* id 11, wireType 2 =*/90).string(message.keyCode);
+                if (message.isSpecialKey != null && Object.hasOwnProperty.call(message, "isSpecialKey"))
+                    writer.uint32(/* id 12, wireType 0 =*/96).bool(message.isSpecialKey);
+                if (message.mouseEventToolTip != null && Object.hasOwnProperty.call(message, "mouseEventToolTip"))
+                    writer.uint32(/* id 13, wireType 2 =*/106).string(message.mouseEventToolTip);
+                if (message.similarityScore != null && Object.hasOwnProperty.call(message, "similarityScore"))
+                    writer.uint32(/* id 14, wireType 1 =*/113).double(message.similarityScore);
+                if (message.duplicateOfEventId != null && Object.hasOwnProperty.call(message, "duplicateOfEventId"))
+                    writer.uint32(/* id 15, wireType 2 =*/122).string(message.duplicateOfEventId);
+                if (message.thumbnailPaths != null && Object.hasOwnProperty.call(message, "thumbnailPaths"))
+                    for (let keys = Object.keys(message.thumbnailPaths), i = 0; i < keys.length; ++i)
+                        writer.uint32(/* id 16, wireType 2 =*/130).fork().uint32(/* id 1, wireType 0 =*/8).int32(keys[i]).uint32(/* id 2, wireType 2 =*/18).string(message.thumbnailPaths[keys[i]]).ldelim();
+                if (message.captureOriginX != null && Object.hasOwnProperty.call(message, "captureOriginX"))
+                    writer.uint32(/* id 17, wireType 0 =*/136).int32(message.captureOriginX);
+                if (message.captureOriginY != null && Object.hasOwnProperty.call(message, "captureOriginY"))
+                    writer.uint32(/* id 18, wireType 0 =*/144).int32(message.captureOriginY);
+                return writer;
+            };
+
+            /**
+             * Encodes the specified RpcScreenshotEvent message, length delimited. Does not implicitly {@link karna.screen_capture.RpcScreenshotEvent.verify|verify} messages.
+             * @function encodeDelimited
+             * @memberof karna.screen_capture.RpcScreenshotEvent
+             * @static
+             * @param {karna.screen_capture.IRpcScreenshotEvent} message RpcScreenshotEvent message or plain object to encode
+             * @param {$protobuf.Writer} [writer] Writer to encode to
+             * @returns {$protobuf.Writer} Writer
+             */
+            RpcScreenshotEvent.encodeDelimited = function encodeDelimited(message, writer) {
+                return this.encode(message, writer).ldelim();
+            };
+
+            /**
+             * Decodes a RpcScreenshotEvent message from the specified reader or buffer.
+             * @function decode
+             * @memberof karna.screen_capture.RpcScreenshotEvent
+             * @static
+             * @param {$protobuf.Reader|Uint8Array} reader Reader or buffer to decode from
+             * @param {number} [length] Message length if known beforehand
+             * @returns {karna.screen_capture.RpcScreenshotEvent} RpcScreenshotEvent
+             * @throws {Error} If the payload is not a reader or valid buffer
+             * @throws {$protobuf.util.ProtocolError} If required fields are missing
+             */
+            RpcScreenshotEvent.decode = function decode(reader, length) {
+                if (!(reader instanceof $Reader))
+                    reader = $Reader.create(reader);
+                let end = length === undefined ? reader.len : reader.pos + length, message = new $root.karna.screen_capture.RpcScreenshotEvent(), key, value;
+                while (reader.pos < end) {
+                    let tag = reader.uint32();
+                    switch (tag >>> 3) {
+                    case 1: {
+                            message.eventId = reader.string();
+                            break;
+                        }
+                    case 2: {
+                            message.projectUuid = reader.string();
+                            break;
+                        }
+                    case 3: {
+                            message.commandUuid = reader.string();
+                            break;
+                        }
+                    case 4: {
+                            message.timestamp = reader.string();
+                            break;
+                        }
+                    case 5: {
+                            message.description = reader.string();
+                            break;
+                        }
+                    case 6: {
+                            message.screenshotPath = reader.string();
+                            break;
+                        }
+                    case 7: {
+                            message.annotationPath = reader.string();
+                            break;
+                        }
+                    case 8: {
+                            message.mouseX = reader.int32();
+                            break;
+                        }
+                    case 9: {
+                            message.mouseY = reader.int32();
+                            break;
+                        }
+                    case 10: {
+                            message.keyChar = reader.string();
+                            break;
+                        }
+                    case 11: {
+                            message.keyCode = reader.string();
+                            break;
+                        }
+                    case 12: {
+                            message.isSpecialKey = reader.bool();
+                            break;
+                        }
+                    case 13: {
+                            message.mouseEventToolTip = reader.string();
+                            break;
+                        }
+                    case 14: {
+                            message.similarityScore = reader.double();
+                            break;
+                        }
+                    case 15: {
+                            message.duplicateOfEventId = reader.string();
+                            break;
+                        }
+                    case 16: {
+                            if (message.thumbnailPaths === $util.emptyObject)
+                                message.thumbnailPaths = {};
+                            let end2 = reader.uint32() + reader.pos;
+                            key = 0;
+                            value = "";
+                            while (reader.pos < end2) {
+                                let tag2 = reader.uint32();
+                                switch (tag2 >>> 3) {
+                                case 1:
+                                    key = reader.int32();
+                                    break;
+                                case 2:
+                                    value = reader.string();
+                                    break;
+                                default:
+                                    reader.skipType(tag2 & 7);
+                                    break;
+                                }
+                            }
+                            message.thumbnailPaths[key] = value;
+                            break;
+                        }
+                    case 17: {
+                            message.captureOriginX = reader.int32();
+                            break;
+                        }
+                    case 18: {
+                            message.captureOriginY = reader.int32();
+                            break;
+                        }
+                    default:
+                        reader.skipType(tag & 7);
+                        break;
+                    }
+                }
+                return message;
+            };
+
+            /**
+             * Decodes a RpcScreenshotEvent message from the specified reader or buffer, length delimited.
+             * @function decodeDelimited
+             * @memberof karna.screen_capture.RpcScreenshotEvent
+             * @static
+             * @param {$protobuf.Reader|Uint8Array} reader Reader or buffer to decode from
+             * @returns {karna.screen_capture.RpcScreenshotEvent} RpcScreenshotEvent
+             * @throws {Error} If the payload is not a reader or valid buffer
+             * @throws {$protobuf.util.ProtocolError} If required fields are missing
+             */
+            RpcScreenshotEvent.decodeDelimited = function decodeDelimited(reader) {
+                if (!(reader instanceof $Reader))
+                    reader = new $Reader(reader);
+                return this.decode(reader, reader.uint32());
+            };
+
+            /**
+             * Verifies a RpcScreenshotEvent message.
+             * @function verify
+             * @memberof karna.screen_capture.RpcScreenshotEvent
+             * @static
+             * @param {Object.<string,*>} message Plain object to verify
+             * @returns {string|null} `null` if valid, otherwise the reason why it is not
+             */
+            RpcScreenshotEvent.verify = function verify(message) {
+                if (typeof message !== "object" || message === null)
+                    return "object expected";
+                let properties = {};
+                if (message.eventId != null && message.hasOwnProperty("eventId"))
+                    if (!$util.isString(message.eventId))
+                        return "eventId: string expected";
+                if (message.projectUuid != null && message.hasOwnProperty("projectUuid"))
+                    if (!$util.isString(message.projectUuid))
+                        return "projectUuid: string expected";
+                if (message.commandUuid != null && message.hasOwnProperty("commandUuid"))
+                    if (!$util.isString(message.commandUuid))
+                        return "commandUuid: string expected";
+                if (message.timestamp != null && message.hasOwnProperty("timestamp"))
+                    if (!$util.isString(message.timestamp))
+                        return "timestamp: string expected";
+                if (message.description != null && message.hasOwnProperty("description"))
+                    if (!$util.isString(message.description))
+                        return "description: string expected";
+                if (message.screenshotPath != null && message.hasOwnProperty("screenshotPath"))
+                    if (!$util.isString(message.screenshotPath))
+                        return "screenshotPath: string expected";
+                if (message.annotationPath != null && message.hasOwnProperty("annotationPath")) {
+                    properties._annotationPath = 1;
+                    if (!$util.isString(message.annotationPath))
+                        return "annotationPath: string expected";
+                }
+                if (message.mouseX != null && message.hasOwnProperty("mouseX")) {
+                    properties._mouseX = 1;
+                    if (!$util.isInteger(message.mouseX))
+                        return "mouseX: integer expected";
+                }
+                if (message.mouseY != null && message.hasOwnProperty("mouseY")) {
+                    properties._mouseY = 1;
+                    if (!$util.isInteger(message.mouseY))
+                        return "mouseY: integer expected";
+                }
+                if (message.keyChar != null && message.hasOwnProperty("keyChar")) {
+                    properties._keyChar = 1;
+                    if (!$util.isString(message.keyChar))
+                        return "keyChar: string expected";
+                }
+                if (message.keyCode != null && message.hasOwnProperty("keyCode")) {
+                    properties._keyCode = 1;
+                    if (!$util.isString(message.keyCode))
+                        return "keyCode: string expected";
+                }
+                if (message.isSpecialKey != null && message.hasOwnProperty("isSpecialKey"))
+                    if (typeof message.isSpecialKey !== "boolean")
+                        return "isSpecialKey: boolean expected";
+                if (message.mouseEventToolTip != null && message.hasOwnProperty("mouseEventToolTip")) {
+                    properties._mouseEventToolTip = 1;
+                    if (!$util.isString(message.mouseEventToolTip))
+                        return "mouseEventToolTip: string expected";
+                }
+                if (message.similarityScore != null && message.hasOwnProperty("similarityScore")) {
+                    properties._similarityScore = 1;
+                    if (typeof message.similarityScore !== "number")
+                        return "similarityScore: number expected";
+                }
+                if (message.duplicateOfEventId != null && message.hasOwnProperty("duplicateOfEventId")) {
+                    properties._duplicateOfEventId = 1;
+                    if (!$util.isString(message.duplicateOfEventId))
+                        return "duplicateOfEventId: string expected";
+                }
+                if (message.thumbnailPaths != null && message.hasOwnProperty("thumbnailPaths")) {
+                    if (!$util.isObject(message.thumbnailPaths))
+                        return "thumbnailPaths: object expected";
+                    let key = Object.keys(message.thumbnailPaths);
+                    for (let i = 0; i < key.length; ++i) {
+                        if (!$util.key32Re.test(key[i]))
+                            return "thumbnailPaths: integer key{k:int32} expected";
+                        if (!$util.isString(message.thumbnailPaths[key[i]]))
+                            return "thumbnailPaths: string{k:int32} expected";
+                    }
+                }
+                if (message.captureOriginX != null && message.hasOwnProperty("captureOriginX")) {
+                    properties._captureOriginX = 1;
+                    if (!$util.isInteger(message.captureOriginX))
+                        return "captureOriginX: integer expected";
+                }
+                if (message.captureOriginY != null && message.hasOwnProperty("captureOriginY")) {
+                    properties._captureOriginY = 1;
+                    if (!$util.isInteger(message.captureOriginY))
+                        return "captureOriginY: integer expected";
+                }
+                return null;
+            };
+
+            /**
+             * Creates a RpcScreenshotEvent message from a plain object. Also converts values to their respective internal types.
+             * @function fromObject
+             * @memberof karna.screen_capture.RpcScreenshotEvent
+             * @static
+             * @param {Object.<string,*>} object Plain object
+             * @returns {karna.screen_capture.RpcScreenshotEvent} RpcScreenshotEvent
+             */
+            RpcScreenshotEvent.fromObject = function fromObject(object) {
+                if (object instanceof $root.karna.screen_capture.RpcScreenshotEvent)
+                    return object;
+                let message = new $root.karna.screen_capture.RpcScreenshotEvent();
+                if (object.eventId != null)
+                    message.eventId = String(object.eventId);
+                if (object.projectUuid != null)
+                    message.projectUuid = String(object.projectUuid);
+                if (object.commandUuid != null)
+                    message.commandUuid = String(object.commandUuid);
+                if (object.timestamp != null)
+                    message.timestamp = String(object.timestamp);
+                if (object.description != null)
+                    message.description = String(object.description);
+                if (object.screenshotPath != null)
+                    message.screenshotPath = String(object.screenshotPath);
+                if (object.annotationPath != null)
+                    message.annotationPath = String(object.annotationPath);
+                if (object.mouseX != null)
+                    message.mouseX = object.mouseX | 0;
+                if (object.mouseY != null)
+                    message.mouseY = object.mouseY | 0;
+                if (object.keyChar != null)
+                    message.keyChar = String(object.keyChar);
+                if (object.keyCode != null)
+                    message.keyCode = String(object.keyCode);
+                if (object.isSpecialKey != null)
+                    message.isSpecialKey = Boolean(object.isSpecialKey);
+                if (object.mouseEventToolTip != null)
+                    message.mouseEventToolTip = String(object.mouseEventToolTip);
+                if (object.similarityScore != null)
+                    message.similarityScore = Number(object.similarityScore);
+                if (object.duplicateOfEventId != null)
+                    message.duplicateOfEventId = String(object.duplicateOfEventId);
+                if (object.thumbnailPaths) {
+                    if (typeof object.thumbnailPaths !== "object")
+                        throw TypeError(".karna.screen_capture.RpcScreenshotEvent.thumbnailPaths: object expected");
+                    message.thumbnailPaths = {};
+                    for (let keys = Object.keys(object.thumbnailPaths), i = 0; i < keys.length; ++i)
+                        message.thumbnailPaths[keys[i]] = String(object.thumbnailPaths[keys[i]]);
+                }
+                if (object.captureOriginX != null)
+                    message.captureOriginX = object.captureOriginX | 0;
+                if (object.captureOriginY != null)
+                    message.captureOriginY = object.captureOriginY | 0;
+                return message;
+            };
+
+            /**
+             * Creates a plain object from a RpcScreenshotEvent message. Also converts values to other types if specified.
+             * @function toObject
+             * @memberof karna.screen_capture.RpcScreenshotEvent
+             * @static
+             * @param {karna.screen_capture.RpcScreenshotEvent} message RpcScreenshotEvent
+             * @param {$protobuf.IConversionOptions} [options] Conversion options
+             * @returns {Object.<string,*>} Plain object
+             */
+            RpcScreenshotEvent.toObject = function toObject(message, options) {
+                if (!options)
+                    options = {};
+                let object = {};
+                if (options.objects || options.defaults)
+                    object.thumbnailPaths = {};
+                if (options.defaults) {
+                    object.eventId = "";
+                    object.projectUuid = "";
+                    object.commandUuid = "";
+                    object.timestamp = "";
+                    object.description = "";
+                    object.screenshotPath = "";
+                    object.isSpecialKey = false;
+                }
+                if (message.eventId != null && message.hasOwnProperty("eventId"))
+                    object.eventId = message.eventId;
+                if (message.projectUuid != null && message.hasOwnProperty("projectUuid"))
+                    object.projectUuid = message.projectUuid;
+                if (message.commandUuid != null && message.hasOwnProperty("commandUuid"))
+                    object.commandUuid = message.commandUuid;
+                if (message.timestamp != null && message.hasOwnProperty("timestamp"))
+                    object.timestamp = message.timestamp;
+                if (message.description != null && message.hasOwnProperty("description"))
+                    object.description = message.description;
+                if (message.screenshotPath != null && message.hasOwnProperty("screenshotPath"))
+                    object.screenshotPath = message.screenshotPath;
+                if (message.annotationPath != null && message.hasOwnProperty("annotationPath")) {
+                    object.annotationPath = message.annotationPath;
+                    if (options.oneofs)
+                        object._annotationPath = "annotationPath";
+                }
+                if (message.mouseX != null && message.hasOwnProperty("mouseX")) {
+                    object.mouseX = message.mouseX;
+                    if (options.oneofs)
+                        object._mouseX = "mouseX";
+                }
+                if (message.mouseY != null && message.hasOwnProperty("mouseY")) {
+                    object.mouseY = message.mouseY;
+                    if (options.oneofs)
+                        object._mouseY = "mouseY";
+                }
+                if (message.keyChar != null && message.hasOwnProperty("keyChar")) {
+                    object.keyChar = message.keyChar;
+                    if (options.oneofs)
+                        object._keyChar = "keyChar";
+                }
+                if (message.keyCode != null && message.hasOwnProperty("keyCode")) {
+                    object.keyCode = message.keyCode;
+                    if (options.oneofs)
+                        object._keyCode = "keyCode";
+                }
+                if (message.isSpecialKey != null && message.hasOwnProperty("isSpecialKey"))
+                    object.isSpecialKey = message.isSpecialKey;
+                if (message.mouseEventToolTip != null && message.hasOwnProperty("mouseEventToolTip")) {
+                    object.mouseEventToolTip = message.mouseEventToolTip;
+                    if (options.oneofs)
+                        object._mouseEventToolTip = "mouseEventToolTip";
+                }
+                if (message.similarityScore != null && message.hasOwnProperty("similarityScore")) {
+                    object.similarityScore = options.json && !isFinite(message.similarityScore) ? String(message.similarityScore) : message.similarityScore;
+                    if (options.oneofs)
+                        object._similarityScore = "similarityScore";
+                }
+                if (message.duplicateOfEventId != null && message.hasOwnProperty("duplicateOfEventId")) {
+                    object.duplicateOfEventId = message.duplicateOfEventId;
+                    if (options.oneofs)
+                        object._duplicateOfEventId = "duplicateOfEventId";
+                }
+                let keys2;
+                if (message.thumbnailPaths && (keys2 = Object.keys(message.thumbnailPaths)).length) {
+                    object.thumbnailPaths = {};
+                    for (let j = 0; j < keys2.length; ++j)
+                        object.thumbnailPaths[keys2[j]] = message.thumbnailPaths[keys2[j]];
+                }
+                if (message.captureOriginX != null && message.hasOwnProperty("captureOriginX")) {
+                    object.captureOriginX = message.captureOriginX;
+                    if (options.oneofs)
+                        object._captureOriginX = "captureOriginX";
+                }
+                if (message.captureOriginY != null && message.hasOwnProperty("captureOriginY")) {
+                    object.captureOriginY = message.captureOriginY;
+                    if (options.oneofs)
+                        object._captureOriginY = "captureOriginY";
+                }
+                return object;
+            };
+
+            /**
+             * Converts this RpcScreenshotEvent to JSON.
+             * @function toJSON
+             * @memberof karna.screen_capture.RpcScreenshotEvent
+             * @instance
+             * @returns {Object.<string,*>} JSON object
+             */
+            RpcScreenshotEvent.prototype.toJSON = function toJSON() {
+                return this.constructor.toObject(this, $protobuf.util.toJSONOptions);
+            };
+
+            /**
+             * Gets the default type url for RpcScreenshotEvent
+             * @function getTypeUrl
              * @memberof karna.screen_capture.RpcScreenshotEvent
+             * @static
+             * @param {string} [typeUrlPrefix] your custom typeUrlPrefix(default "type.googleapis.com")
+             * @returns {string} The default type url
+             */
+            RpcScreenshotEvent.getTypeUrl = function getTypeUrl(typeUrlPrefix) {
+                if (typeUrlPrefix === undefined) {
+                    typeUrlPrefix = "type.googleapis.com";
+                }
+                return typeUrlPrefix + "/karna.screen_capture.RpcScreenshotEvent";
+            };
+
+            return RpcScreenshotEvent;
+        })();
+
+        screen_capture.CaptureResult = (function() {
+
+            /**
+             * Properties of a CaptureResult.
+             * @memberof karna.screen_capture
+             * @interface ICaptureResult
+             * @property {string|null} [projectUuid] CaptureResult projectUuid
+             * @property {string|null} [commandUuid] CaptureResult commandUuid
+             * @property {boolean|null} [isActive] CaptureResult isActive
+             * @property {string|null} [message] CaptureResult message
+             * @property {Array.<karna.screen_capture.IRpcScreenshotEvent>|null} [screenshotEvents] CaptureResult screenshotEvents
+             */
+
+            /**
+             * Constructs a new CaptureResult.
+             * @memberof karna.screen_capture
+             * @classdesc Represents a CaptureResult.
+             * @implements ICaptureResult
+             * @constructor
+             * @param {karna.screen_capture.ICaptureResult=} [properties] Properties to set
+             */
+            function CaptureResult(properties) {
+                this.screenshotEvents = [];
+                if (properties)
+                    for (let keys = Object.keys(properties), i = 0; i < keys.length; ++i)
+                        if (properties[keys[i]] != null)
+                            this[keys[i]] = properties[keys[i]];
+            }
+
+            /**
+             * CaptureResult projectUuid.
+             * @member {string} projectUuid
+             * @memberof karna.screen_capture.CaptureResult
+             * @instance
+             */
+            CaptureResult.prototype.projectUuid = "";
+
+            /**
+             * CaptureResult commandUuid.
+             * @member {string} commandUuid
+             * @memberof karna.screen_capture.CaptureResult
+             * @instance
+             */
+            CaptureResult.prototype.commandUuid = "";
+
+            /**
+             * CaptureResult isActive.
+             * @member {boolean} isActive
+             * @memberof karna.screen_capture.CaptureResult
+             * @instance
+             */
+            CaptureResult.prototype.isActive = false;
+
+            /**
+             * CaptureResult message.
+             * @member {string} message
+             * @memberof karna.screen_capture.CaptureResult
+             * @instance
+             */
+            CaptureResult.prototype.message = "";
+
+            /**
+             * CaptureResult screenshotEvents.
+             * @member {Array.<karna.screen_capture.IRpcScreenshotEvent>} screenshotEvents
+             * @memberof karna.screen_capture.CaptureResult
+             * @instance
+             */
+            CaptureResult.prototype.screenshotEvents = $util.emptyArray;
+
+            /**
+             * Creates a new CaptureResult instance using the specified properties.
+             * @function create
+             * @memberof karna.screen_capture.CaptureResult
+             * @static
+             * @param {karna.screen_capture.ICaptureResult=} [properties] Properties to set
+             * @returns {karna.screen_capture.CaptureResult} CaptureResult instance
+             */
+            CaptureResult.create = function create(properties) {
+                return new CaptureResult(properties);
+            };
+
+            /**
+             * Encodes the specified CaptureResult message. Does not implicitly {@link karna.screen_capture.CaptureResult.verify|verify} messages.
+             * @function encode
+             * @memberof karna.screen_capture.CaptureResult
+             * @static
+             * @param {karna.screen_capture.ICaptureResult} message CaptureResult message or plain object to encode
+             * @param {$protobuf.Writer} [writer] Writer to encode to
+             * @returns {$protobuf.Writer} Writer
+             */
+            CaptureResult.encode = function encode(message, writer) {
+                if (!writer)
+                    writer = $Writer.create();
+                if (message.projectUuid != null && Object.hasOwnProperty.call(message, "projectUuid"))
+                    writer.uint32(/* id 1, wireType 2 =*/10).string(message.projectUuid);
+                if (message.commandUuid != null && Object.hasOwnProperty.call(message, "commandUuid"))
+                    writer.uint32(/* id 2, wireType 2 =*/18).string(message.commandUuid);
+                if (message.isActive != null && Object.hasOwnProperty.call(message, "isActive"))
+                    writer.uint32(/* id 3, wireType 0 =*/24).bool(message.isActive);
+                if (message.message != null && Object.hasOwnProperty.call(message, "message"))
+                    writer.uint32(/* id 4, wireType 2 =*/34).string(message.message);
+                if (message.screenshotEvents != null && message.screenshotEvents.length)
+                    for (let i = 0; i < message.screenshotEvents.length; ++i)
+                        $root.karna.screen_capture.RpcScreenshotEvent.encode(message.screenshotEvents[i], writer.uint32(/* id 5, wireType 2 =*/42).fork()).ldelim();
+                return writer;
+            };
+
+            /**
+             * Encodes the specified CaptureResult message, length delimited. Does not implicitly {@link karna.screen_capture.CaptureResult.verify|verify} messages.
+             * @function encodeDelimited
+             * @memberof karna.screen_capture.CaptureResult
+             * @static
+             * @param {karna.screen_capture.ICaptureResult} message CaptureResult message or plain object to encode
+             * @param {$protobuf.Writer} [writer] Writer to encode to
+             * @returns {$protobuf.Writer} Writer
+             */
+            CaptureResult.encodeDelimited = function encodeDelimited(message, writer) {
+                return this.encode(message, writer).ldelim();
+            };
+
+            /**
+             * Decodes a CaptureResult message from the specified reader or buffer.
+             * @function decode
+             * @memberof karna.screen_capture.CaptureResult
+             * @static
+             * @param {$protobuf.Reader|Uint8Array} reader Reader or buffer to decode from
+             * @param {number} [length] Message length if known beforehand
+             * @returns {karna.screen_capture.CaptureResult} CaptureResult
+             * @throws {Error} If the payload is not a reader or valid buffer
+             * @throws {$protobuf.util.ProtocolError} If required fields are missing
+             */
+            CaptureResult.decode = function decode(reader, length) {
+                if (!(reader instanceof $Reader))
+                    reader = $Reader.create(reader);
+                let end = length === undefined ? reader.len : reader.pos + length, message = new $root.karna.screen_capture.CaptureResult();
+                while (reader.pos < end) {
+                    let tag = reader.uint32();
+                    switch (tag >>> 3) {
+                    case 1: {
+                            message.projectUuid = reader.string();
+                            break;
+                        }
+                    case 2: {
+                            message.commandUuid = reader.string();
+                            break;
+                        }
+                    case 3: {
+                            message.isActive = reader.bool();
+                            break;
+                        }
+                    case 4: {
+                            message.message = reader.string();
+                            break;
+                        }
+                    case 5: {
+                            if (!(message.screenshotEvents && message.screenshotEvents.length))
+                                message.screenshotEvents = [];
+                            message.screenshotEvents.push($root.karna.screen_capture.RpcScreenshotEvent.decode(reader, reader.uint32()));
+                            break;
+                        }
+                    default:
+                        reader.skipType(tag & 7);
+                        break;
+                    }
+                }
+                return message;
+            };
+
+            /**
+             * Decodes a CaptureResult message from the specified reader or buffer, length delimited.
+             * @function decodeDelimited
+             * @memberof karna.screen_capture.CaptureResult
+             * @static
+             * @param {$protobuf.Reader|Uint8Array} reader Reader or buffer to decode from
+             * @returns {karna.screen_capture.CaptureResult} CaptureResult
+             * @throws {Error} If the payload is not a reader or valid buffer
+             * @throws {$protobuf.util.ProtocolError} If required fields are missing
+             */
+            CaptureResult.decodeDelimited = function decodeDelimited(reader) {
+                if (!(reader instanceof $Reader))
+                    reader = new $Reader(reader);
+                return this.decode(reader, reader.uint32());
+            };
+
+            /**
+             * Verifies a CaptureResult message.
+             * @function verify
+             * @memberof karna.screen_capture.CaptureResult
+             * @static
+             * @param {Object.<string,*>} message Plain object to verify
+             * @returns {string|null} `null` if valid, otherwise the reason why it is not
+             */
+            CaptureResult.verify = function verify(message) {
+                if (typeof message !== "object" || message === null)
+                    return "object expected";
+                if (message.projectUuid != null && message.hasOwnProperty("projectUuid"))
+                    if (!$util.isString(message.projectUuid))
+                        return "projectUuid: string expected";
+                if (message.commandUuid != null && message.hasOwnProperty("commandUuid"))
+                    if (!$util.isString(message.commandUuid))
+                        return "commandUuid: string expected";
+                if (message.isActive != null && message.hasOwnProperty("isActive"))
+                    if (typeof message.isActive !== "boolean")
+                        return "isActive: boolean expected";
+                if (message.message != null && message.hasOwnProperty("message"))
+                    if (!$util.isString(message.message))
+                        return "message: string expected";
+                if (message.screenshotEvents != null && message.hasOwnProperty("screenshotEvents")) {
+                    if (!Array.isArray(message.screenshotEvents))
+                        return "screenshotEvents: array expected";
+                    for (let i = 0; i < message.screenshotEvents.length; ++i) {
+                        let error = $root.karna.screen_capture.RpcScreenshotEvent.verify(message.screenshotEvents[i]);
+                        if (error)
+                            return "screenshotEvents." + error;
+                    }
+                }
+                return null;
+            };
+
+            /**
+             * Creates a CaptureResult message from a plain object. Also converts values to their respective internal types.
+             * @function fromObject
+             * @memberof karna.screen_capture.CaptureResult
+             * @static
+             * @param {Object.<string,*>} object Plain object
+             * @returns {karna.screen_capture.CaptureResult} CaptureResult
+             */
+            CaptureResult.fromObject = function fromObject(object) {
+                if (object instanceof $root.karna.screen_capture.CaptureResult)
+                    return object;
+                let message = new $root.karna.screen_capture.CaptureResult();
+                if (object.projectUuid != null)
+                    message.projectUuid = String(object.projectUuid);
+                if (object.commandUuid != null)
+                    message.commandUuid = String(object.commandUuid);
+                if (object.isActive != null)
+                    message.isActive = Boolean(object.isActive);
+                if (object.message != null)
+                    message.message = String(object.message);
+                if (object.screenshotEvents) {
+                    if (!Array.isArray(object.screenshotEvents))
+                        throw TypeError(".karna.screen_capture.CaptureResult.screenshotEvents: array expected");
+                    message.screenshotEvents = [];
+                    for (let i = 0; i < object.screenshotEvents.length; ++i) {
+                        if (typeof object.screenshotEvents[i] !== "object")
+                            throw TypeError(".karna.screen_capture.CaptureResult.screenshotEvents: object expected");
+                        message.screenshotEvents[i] = $root.karna.screen_capture.RpcScreenshotEvent.fromObject(object.screenshotEvents[i]);
+                    }
+                }
+                return message;
+            };
+
+            /**
+             * Creates a plain object from a CaptureResult message. Also converts values to other types if specified.
+             * @function toObject
+             * @memberof karna.screen_capture.CaptureResult
+             * @static
+             * @param {karna.screen_capture.CaptureResult} message CaptureResult
+             * @param {$protobuf.IConversionOptions} [options] Conversion options
+             * @returns {Object.<string,*>} Plain object
+             */
+            CaptureResult.toObject = function toObject(message, options) {
+                if (!options)
+                    options = {};
+                let object = {};
+                if (options.arrays || options.defaults)
+                    object.screenshotEvents = [];
+                if (options.defaults) {
+                    object.projectUuid = "";
+                    object.commandUuid = "";
+                    object.isActive = false;
+                    object.message = "";
+                }
+                if (message.projectUuid != null && message.hasOwnProperty("projectUuid"))
+                    object.projectUuid = message.projectUuid;
+                if (message.commandUuid != null && message.hasOwnProperty("commandUuid"))
+                    object.commandUuid = message.commandUuid;
+                if (message.isActive != null && message.hasOwnProperty("isActive"))
+                    object.isActive = message.isActive;
+                if (message.message != null && message.hasOwnProperty("message"))
+                    object.message = message.message;
+                if (message.screenshotEvents && message.screenshotEvents.length) {
+                    object.screenshotEvents = [];
+                    for (let j = 0; j < message.screenshotEvents.length; ++j)
+                        object.screenshotEvents[j] = $root.karna.screen_capture.RpcScreenshotEvent.toObject(message.screenshotEvents[j], options);
+                }
+                return object;
+            };
+
+            /**
+             * Converts this CaptureResult to JSON.
+             * @function toJSON
+             * @memberof karna.screen_capture.CaptureResult
              * @instance
+             * @returns {Object.<string,*>} JSON object
              */
-            RpcScreenshotEvent.prototype.annotationPath = null;
+            CaptureResult.prototype.toJSON = function toJSON() {
+                return this.constructor.toObject(this, $protobuf.util.toJSONOptions);
+            };
 
             /**
-             * RpcScreenshotEvent mouseX.
-             * @member {number|null|undefined} mouseX
-             * @memberof karna.screen_capture.RpcScreenshotEvent
+             * Gets the default type url for CaptureResult
+             * @function getTypeUrl
+             * @memberof karna.screen_capture.CaptureResult
+             * @static
+             * @param {string} [typeUrlPrefix] your custom typeUrlPrefix(default "type.googleapis.com")
+             * @returns {string} The default type url
+             */
+            CaptureResult.getTypeUrl = function getTypeUrl(typeUrlPrefix) {
+                if (typeUrlPrefix === undefined) {
+                    typeUrlPrefix = "type.googleapis.com";
+                }
+                return typeUrlPrefix + "/karna.screen_capture.CaptureResult";
+            };
+
+            return CaptureResult;
+        })();
+
+        /**
+         * CaptureDeltaType enum.
+         * @name karna.screen_capture.CaptureDeltaType
+         * @enum {number}
+         * @property {number} CAPTURE_DELTA_APPEND=0 CAPTURE_DELTA_APPEND value
+         * @property {number} CAPTURE_DELTA_UPDATE=1 CAPTURE_DELTA_UPDATE value
+         * @property {number} CAPTURE_DELTA_DELETE=2 CAPTURE_DELTA_DELETE value
+         * @property {number} CAPTURE_DELTA_RESET=3 CAPTURE_DELTA_RESET value
+         */
+        screen_capture.CaptureDeltaType = (function() {
+            const valuesById = {}, values = Object.create(valuesById);
+            values[valuesById[0] = "CAPTURE_DELTA_APPEND"] = 0;
+            values[valuesById[1] = "CAPTURE_DELTA_UPDATE"] = 1;
+            values[valuesById[2] = "CAPTURE_DELTA_DELETE"] = 2;
+            values[valuesById[3] = "CAPTURE_DELTA_RESET"] = 3;
+            return values;
+        })();
+
+        screen_capture.CaptureDelta = (function() {
+
+            /**
+             * Properties of a CaptureDelta.
+             * @memberof karna.screen_capture
+             * @interface ICaptureDelta
+             * @property {string|null} [projectUuid] CaptureDelta projectUuid
+             * @property {string|null} [commandUuid] CaptureDelta commandUuid
+             * @property {number|Long|null} [sequence] CaptureDelta sequence
+             * @property {karna.screen_capture.CaptureDeltaType|null} [type] CaptureDelta type
+             * @property {boolean|null} [isActive] CaptureDelta isActive
+             * @property {Array.<karna.screen_capture.IRpcScreenshotEvent>|null} [screenshotEvents] CaptureDelta screenshotEvents
+             * @property {Array.<string>|null} [deletedEventIds] CaptureDelta deletedEventIds
+             */
+
+            /**
+             * Constructs a new CaptureDelta.
+             * @memberof karna.screen_capture
+             * @classdesc Represents a CaptureDelta.
+             * @implements ICaptureDelta
+             * @constructor
+             * @param {karna.screen_capture.ICaptureDelta=} [properties] Properties to set
+             */
+            function CaptureDelta(properties) {
+                this.screenshotEvents = [];
+                this.deletedEventIds = [];
+                if (properties)
+                    for (let keys = Object.keys(properties), i = 0; i < keys.length; ++i)
+                        if (properties[keys[i]] != null)
+                            this[keys[i]] = properties[keys[i]];
+            }
+
+            /**
+             * CaptureDelta projectUuid.
+             * @member {string} projectUuid
+             * @memberof karna.screen_capture.CaptureDelta
              * @instance
              */
-            RpcScreenshotEvent.prototype.mouseX = null;
+            CaptureDelta.prototype.projectUuid = "";
+
+            /**
+             * CaptureDelta commandUuid.
+             * @member {string} commandUuid
+             * @memberof karna.screen_capture.CaptureDelta
+             * @instance
+             */
+            CaptureDelta.prototype.commandUuid = "";
 
             /**
-             * RpcScreenshotEvent mouseY.
-             * @member {number|null|undefined} mouseY
-             * @memberof karna.screen_capture.RpcScreenshotEvent
+             * CaptureDelta sequence.
+             * @member {number|Long} sequence
+             * @memberof karna.screen_capture.CaptureDelta
              * @instance
              */
-            RpcScreenshotEvent.prototype.mouseY = null;
+            CaptureDelta.prototype.sequence = $util.Long ? $util.Long.fromBits(0,0,false) : 0;
 
             /**
-             * RpcScreenshotEvent keyChar.
-             * @member {string|null|undefined} keyChar
-             * @memberof karna.screen_capture.RpcScreenshotEvent
+             * CaptureDelta type.
+             * @member {karna.screen_capture.CaptureDeltaType} type
+             * @memberof karna.screen_capture.CaptureDelta
              * @instance
              */
-            RpcScreenshotEvent.prototype.keyChar = null;
+            CaptureDelta.prototype.type = 0;
 
             /**
-             * RpcScreenshotEvent keyCode.
-             * @member {string|null|undefined} keyCode
-             * @memberof karna.screen_capture.RpcScreenshotEvent
+             * CaptureDelta isActive.
+             * @member {boolean} isActive
+             * @memberof karna.screen_capture.CaptureDelta
              * @instance
              */
-            RpcScreenshotEvent.prototype.keyCode = null;
+            CaptureDelta.prototype.isActive = false;
 
             /**
-             * RpcScreenshotEvent isSpecialKey.
-             * @member {boolean} isSpecialKey
-             * @memberof karna.screen_capture.RpcScreenshotEvent
+             * CaptureDelta screenshotEvents.
+             * @member {Array.<karna.screen_capture.IRpcScreenshotEvent>} screenshotEvents
+             * @memberof karna.screen_capture.CaptureDelta
              * @instance
              */
-            RpcScreenshotEvent.prototype.isSpecialKey = false;
+            CaptureDelta.prototype.screenshotEvents = $util.emptyArray;
 
             /**
-             * RpcScreenshotEvent mouseEventToolTip.
-             * @member {string|null|undefined} mouseEventToolTip
-             * @memberof karna.screen_capture.RpcScreenshotEvent
+             * CaptureDelta deletedEventIds.
+             * @member {Array.<string>} deletedEventIds
+             * @memberof karna.screen_capture.CaptureDelta
              * @instance
              */
-            RpcScreenshotEvent.prototype.mouseEventToolTip = null;
-
-            // OneOf field names bound to virtual getters and setters
-            let $oneOfFields;
-
-            // Virtual OneOf for proto3 optional field
-            Object.defineProperty(RpcScreenshotEvent.prototype, "_annotationPath", {
-                get: $util.oneOfGetter($oneOfFields = ["annotationPath"]),
-                set: $util.oneOfSetter($oneOfFields)
-            });
-
-            // Virtual OneOf for proto3 optional field
-            Object.defineProperty(RpcScreenshotEvent.prototype, "_mouseX", {
-                get: $util.oneOfGetter($oneOfFields = ["mouseX"]),
-                set: $util.oneOfSetter($oneOfFields)
-            });
-
-            // Virtual OneOf for proto3 optional field
-            Object.defineProperty(RpcScreenshotEvent.prototype, "_mouseY", {
-                get: $util.oneOfGetter($oneOfFields = ["mouseY"]),
-                set: $util.oneOfSetter($oneOfFields)
-            });
-
-            // Virtual OneOf for proto3 optional field
-            Object.defineProperty(RpcScreenshotEvent.prototype, "_keyChar", {
-                get: $util.oneOfGetter($oneOfFields = ["keyChar"]),
-                set: $util.oneOfSetter($oneOfFields)
-            });
-
-            // Virtual OneOf for proto3 optional field
-            Object.defineProperty(RpcScreenshotEvent.prototype, "_keyCode", {
-                get: $util.oneOfGetter($oneOfFields = ["keyCode"]),
-                set: $util.oneOfSetter($oneOfFields)
-            });
-
-            // Virtual OneOf for proto3 optional field
-            Object.defineProperty(RpcScreenshotEvent.prototype, "_mouseEventToolTip", {
-                get: $util.oneOfGetter($oneOfFields = ["mouseEventToolTip"]),
-                set: $util.oneOfSetter($oneOfFields)
-            });
+            CaptureDelta.prototype.deletedEventIds = $util.emptyArray;
 
             /**
-             * Creates a new RpcScreenshotEvent instance using the specified properties.
+             * Creates a new CaptureDelta instance using the specified properties.
              * @function create
-             * @memberof karna.screen_capture.RpcScreenshotEvent
+             * @memberof karna.screen_capture.CaptureDelta
              * @static
-             * @param {karna.screen_capture.IRpcScreenshotEvent=} [properties] Properties to set
-             * @returns {karna.screen_capture.RpcScreenshotEvent} RpcScreenshotEvent instance
+             * @param {karna.screen_capture.ICaptureDelta=} [properties] Properties to set
+             * @returns {karna.screen_capture.CaptureDelta} CaptureDelta instance
              */
-            RpcScreenshotEvent.create = function create(properties) {
-                return new RpcScreenshotEvent(properties);
+            CaptureDelta.create = function create(properties) {
+                return new CaptureDelta(properties);
             };
 
             /**
-             * Encodes the specified RpcScreenshotEvent message. Does not implicitly {@link karna.screen_capture.RpcScreenshotEvent.verify|verify} messages.
+             * Encodes the specified CaptureDelta message. Does not implicitly {@link karna.screen_capture.CaptureDelta.verify|verify} messages.
              * @function encode
-             * @memberof karna.screen_capture.RpcScreenshotEvent
+             * @memberof karna.screen_capture.CaptureDelta
              * @static
-             * @param {karna.screen_capture.IRpcScreenshotEvent} message RpcScreenshotEvent message or plain object to encode
+             * @param {karna.screen_capture.ICaptureDelta} message CaptureDelta message or plain object to encode
              * @param {$protobuf.Writer} [writer] Writer to encode to
              * @returns {$protobuf.Writer} Writer
              */
-            RpcScreenshotEvent.encode = function encode(message, writer) {
+            CaptureDelta.encode = function encode(message, writer) {
                 if (!writer)
                     writer = $Writer.create();
-                if (message.eventId != null && Object.hasOwnProperty.call(message, "eventId"))
-                    writer.uint32(/* id 1, wireType 2 =*/10).string(message.eventId);
                 if (message.projectUuid != null && Object.hasOwnProperty.call(message, "projectUuid"))
-                    writer.uint32(/* id 2, wireType 2 =*/18).string(message.projectUuid);
+                    writer.uint32(/* id 1, wireType 2 =*/10).string(message.projectUuid);
                 if (message.commandUuid != null && Object.hasOwnProperty.call(message, "commandUuid"))
-                    writer.uint32(/* id 3, wireType 2 =*/26).string(message.commandUuid);
-                if (message.timestamp != null && Object.hasOwnProperty.call(message, "timestamp"))
-                    writer.uint32(/* id 4, wireType 2 =*/34).string(message.timestamp);
-                if (message.description != null && Object.hasOwnProperty.call(message, "description"))
-                    writer.uint32(/* id 5, wireType 2 =*/42).string(message.description);
-                if (message.screenshotPath != null && Object.hasOwnProperty.call(message, "screenshotPath"))
-                    writer.uint32(/* id 6, wireType 2 =*/50).string(message.screenshotPath);
-                if (message.annotationPath != null && Object.hasOwnProperty.call(message, "annotationPath"))
-                    writer.uint32(/* id 7, wireType 2 =*/58).string(message.annotationPath);
-                if (message.mouseX != null && Object.hasOwnProperty.call(message, "mouseX"))
-                    writer.uint32(/* id 8, wireType 0 =*/64).int32(message.mouseX);
-                if (message.mouseY != null && Object.hasOwnProperty.call(message, "mouseY"))
-                    writer.uint32(/* id 9, wireType 0 =*/72).int32(message.mouseY);
-                if (message.keyChar != null && Object.hasOwnProperty.call(message, "keyChar"))
-                    writer.uint32(/* id 10, wireType 2 =*/82).string(message.keyChar);
-                if (message.keyCode != null && Object.hasOwnProperty.call(message, "keyCode"))
-                    writer.uint32(/* id 11, wireType 2 =*/90).string(message.keyCode);
-                if (message.isSpecialKey != null && Object.hasOwnProperty.call(message, "isSpecialKey"))
-                    writer.uint32(/* id 12, wireType 0 =*/96).bool(message.isSpecialKey);
-                if (message.mouseEventToolTip != null && Object.hasOwnProperty.call(message, "mouseEventToolTip"))
-                    writer.uint32(/* id 13, wireType 2 =*/106).string(message.mouseEventToolTip);
+                    writer.uint32(/* id 2, wireType 2 =*/18).string(message.commandUuid);
+                if (message.sequence != null && Object.hasOwnProperty.call(message, "sequence"))
+                    writer.uint32(/* id 3, wireType 0 =*/24).int64(message.sequence);
+                if (message.type != null && Object.hasOwnProperty.call(message, "type"))
+                    writer.uint32(/* id 4, wireType 0 =*/32).int32(message.type);
+                if (message.isActive != null && Object.hasOwnProperty.call(message, "isActive"))
+                    writer.uint32(/* id 5, wireType 0 =*/40).bool(message.isActive);
+                if (message.screenshotEvents != null && message.screenshotEvents.length)
+                    for (let i = 0; i < message.screenshotEvents.length; ++i)
+                        $root.karna.screen_capture.RpcScreenshotEvent.encode(message.screenshotEvents[i], writer.uint32(/* id 6, wireType 2 =*/50).fork()).ldelim();
+                if (message.deletedEventIds != null && message.deletedEventIds.length)
+                    for (let i = 0; i < message.deletedEventIds.length; ++i)
+                        writer.uint32(/* id 7, wireType 2 =*/58).string(message.deletedEventIds[i]);
                 return writer;
             };
 
             /**
-             * Encodes the specified RpcScreenshotEvent message, length delimited. Does not implicitly {@link karna.screen_capture.RpcScreenshotEvent.verify|verify} messages.
+             * Encodes the specified CaptureDelta message, length delimited. Does not implicitly {@link karna.screen_capture.CaptureDelta.verify|verify} messages.
              * @function encodeDelimited
-             * @memberof karna.screen_capture.RpcScreenshotEvent
+             * @memberof karna.screen_capture.CaptureDelta
              * @static
-             * @param {karna.screen_capture.IRpcScreenshotEvent} message RpcScreenshotEvent message or plain object to encode
+             * @param {karna.screen_capture.ICaptureDelta} message CaptureDelta message or plain object to encode
              * @param {$protobuf.Writer} [writer] Writer to encode to
              * @returns {$protobuf.Writer} Writer
              */
-            RpcScreenshotEvent.encodeDelimited = function encodeDelimited(message, writer) {
+            CaptureDelta.encodeDelimited = function encodeDelimited(message, writer) {
                 return this.encode(message, writer).ldelim();
             };
 
             /**
-             * Decodes a RpcScreenshotEvent message from the specified reader or buffer.
+             * Decodes a CaptureDelta message from the specified reader or buffer.
              * @function decode
-             * @memberof karna.screen_capture.RpcScreenshotEvent
+             * @memberof karna.screen_capture.CaptureDelta
              * @static
              * @param {$protobuf.Reader|Uint8Array} reader Reader or buffer to decode from
              * @param {number} [length] Message length if known beforehand
-             * @returns {karna.screen_capture.RpcScreenshotEvent} RpcScreenshotEvent
+             * @returns {karna.screen_capture.CaptureDelta} CaptureDelta
              * @throws {Error} If the payload is not a reader or valid buffer
              * @throws {$protobuf.util.ProtocolError} If required fields are missing
              */
-            RpcScreenshotEvent.decode = function decode(reader, length) {
+            CaptureDelta.decode = function decode(reader, length) {
                 if (!(reader instanceof $Reader))
                     reader = $Reader.create(reader);
-                let end = length === undefined ? reader.len : reader.pos + length, message = new $root.karna.screen_capture.RpcScreenshotEvent();
+                let end = length === undefined ? reader.len : reader.pos + length, message = new $root.karna.screen_capture.CaptureDelta();
                 while (reader.pos < end) {
                     let tag = reader.uint32();
                     switch (tag >>> 3) {
                     case 1: {
-                            message.eventId = reader.string();
+                            message.projectUuid = reader.string();
                             break;
                         }
                     case 2: {
-                            message.projectUuid = reader.string();
+                            message.commandUuid = reader.string();
                             break;
                         }
                     case 3: {
-                            message.commandUuid = reader.string();
+                            message.sequence = reader.int64();
                             break;
                         }
                     case 4: {
-                            message.timestamp = reader.string();
+                            message.type = reader.int32();
                             break;
                         }
                     case 5: {
-                            message.description = reader.string();
+                            message.isActive = reader.bool();
                             break;
                         }
                     case 6: {
-                            message.screenshotPath = reader.string();
+                            if (!(message.screenshotEvents && message.screenshotEvents.length))
+                                message.screenshotEvents = [];
+                            message.screenshotEvents.push($root.karna.screen_capture.RpcScreenshotEvent.decode(reader, reader.uint32()));
                             break;
                         }
                     case 7: {
-                            message.annotationPath = reader.string();
-                            break;
-                        }
-                    case 8: {
-                            message.mouseX = reader.int32();
-                            break;
-                        }
-                    case 9: {
-                            message.mouseY = reader.int32();
-                            break;
-                        }
-                    case 10: {
-                            message.keyChar = reader.string();
-                            break;
-                        }
-                    case 11: {
-                            message.keyCode = reader.string();
-                            break;
-                        }
-                    case 12: {
-                            message.isSpecialKey = reader.bool();
-                            break;
-                        }
-                    case 13: {
-                            message.mouseEventToolTip = reader.string();
+                            if (!(message.deletedEventIds && message.deletedEventIds.length))
+                                message.deletedEventIds = [];
+                            message.deletedEventIds.push(reader.string());
                             break;
                         }
                     default:
@@ -1430,249 +3130,255 @@ export const karna = $root.karna = (() => {
             };
 
             /**
-             * Decodes a RpcScreenshotEvent message from the specified reader or buffer, length delimited.
+             * Decodes a CaptureDelta message from the specified reader or buffer, length delimited.
              * @function decodeDelimited
-             * @memberof karna.screen_capture.RpcScreenshotEvent
+             * @memberof karna.screen_capture.CaptureDelta
              * @static
              * @param {$protobuf.Reader|Uint8Array} reader Reader or buffer to decode from
-             * @returns {karna.screen_capture.RpcScreenshotEvent} RpcScreenshotEvent
+             * @returns {karna.screen_capture.CaptureDelta} CaptureDelta
              * @throws {Error} If the payload is not a reader or valid buffer
              * @throws {$protobuf.util.ProtocolError} If required fields are missing
              */
-            RpcScreenshotEvent.decodeDelimited = function decodeDelimited(reader) {
+            CaptureDelta.decodeDelimited = function decodeDelimited(reader) {
                 if (!(reader instanceof $Reader))
                     reader = new $Reader(reader);
                 return this.decode(reader, reader.uint32());
             };
 
             /**
-             * Verifies a RpcScreenshotEvent message.
+             * Verifies a CaptureDelta message.
              * @function verify
-             * @memberof karna.screen_capture.RpcScreenshotEvent
+             * @memberof karna.screen_capture.CaptureDelta
              * @static
              * @param {Object.<string,*>} message Plain object to verify
              * @returns {string|null} `null` if valid, otherwise the reason why it is not
              */
-            RpcScreenshotEvent.verify = function verify(message) {
+            CaptureDelta.verify = function verify(message) {
                 if (typeof message !== "object" || message === null)
                     return "object expected";
-                let properties = {};
-                if (message.eventId != null && message.hasOwnProperty("eventId"))
-                    if (!$util.isString(message.eventId))
-                        return "eventId: string expected";
                 if (message.projectUuid != null && message.hasOwnProperty("projectUuid"))
                     if (!$util.isString(message.projectUuid))
                         return "projectUuid: string expected";
                 if (message.commandUuid != null && message.hasOwnProperty("commandUuid"))
                     if (!$util.isString(message.commandUuid))
                         return "commandUuid: string expected";
-                if (message.timestamp != null && message.hasOwnProperty("timestamp"))
-                    if (!$util.isString(message.timestamp))
-                        return "timestamp: string expected";
-                if (message.description != null && message.hasOwnProperty("description"))
-                    if (!$util.isString(message.description))
-                        return "description: string expected";
-                if (message.screenshotPath != null && message.hasOwnProperty("screenshotPath"))
-                    if (!$util.isString(message.screenshotPath))
-                        return "screenshotPath: string expected";
-                if (message.annotationPath != null && message.hasOwnProperty("annotationPath")) {
-                    properties._annotationPath = 1;
-                    if (!$util.isString(message.annotationPath))
-                        return "annotationPath: string expected";
-                }
-                if (message.mouseX != null && message.hasOwnProperty("mouseX")) {
-                    properties._mouseX = 1;
-                    if (!$util.isInteger(message.mouseX))
-                        return "mouseX: integer expected";
-                }
-                if (message.mouseY != null && message.hasOwnProperty("mouseY")) {
-                    properties._mouseY = 1;
-                    if (!$util.isInteger(message.mouseY))
-                        return "mouseY: integer expected";
-                }
-                if (message.keyChar != null && message.hasOwnProperty("keyChar")) {
-                    properties._keyChar = 1;
-                    if (!$util.isString(message.keyChar))
-                        return "keyChar: string expected";
-                }
-                if (message.keyCode != null && message.hasOwnProperty("keyCode")) {
-                    properties._keyCode = 1;
-                    if (!$util.isString(message.keyCode))
-                        return "keyCode: string expected";
+                if (message.sequence != null && message.hasOwnProperty("sequence"))
+                    if (!$util.isInteger(message.sequence) && !(message.sequence && $util.isInteger(message.sequence.low) && $util.isInteger(message.sequence.high)))
+                        return "sequence: integer|Long expected";
+                if (message.type != null && message.hasOwnProperty("type"))
+                    switch (message.type) {
+                    default:
+                        return "type: enum value expected";
+                    case 0:
+                    case 1:
+                    case 2:
+                    case 3:
+                        break;
+                    }
+                if (message.isActive != null && message.hasOwnProperty("isActive"))
+                    if (typeof message.isActive !== "boolean")
+                        return "isActive: boolean expected";
+                if (message.screenshotEvents != null && message.hasOwnProperty("screenshotEvents")) {
+                    if (!Array.isArray(message.screenshotEvents))
+                        return "screenshotEvents: array expected";
+                    for (let i = 0; i < message.screenshotEvents.length; ++i) {
+                        let error = $root.karna.screen_capture.RpcScreenshotEvent.verify(message.screenshotEvents[i]);
+                        if (error)
+                            return "screenshotEvents." + error;
+                    }
                 }
-                if (message.isSpecialKey != null && message.hasOwnProperty("isSpecialKey"))
-                    if (typeof message.isSpecialKey !== "boolean")
-                        return "isSpecialKey: boolean expected";
-                if (message.mouseEventToolTip != null && message.hasOwnProperty("mouseEventToolTip")) {
-                    properties._mouseEventToolTip = 1;
-                    if (!$util.isString(message.mouseEventToolTip))
-                        return "mouseEventToolTip: string expected";
+                if (message.deletedEventIds != null && message.hasOwnProperty("deletedEventIds")) {
+                    if (!Array.isArray(message.deletedEventIds))
+                        return "deletedEventIds: array expected";
+                    for (let i = 0; i < message.deletedEventIds.length; ++i)
+                        if (!$util.isString(message.deletedEventIds[i]))
+                            return "deletedEventIds: string[] expected";
                 }
                 return null;
             };
 
             /**
-             * Creates a RpcScreenshotEvent message from a plain object. Also converts values to their respective internal types.
+             * Creates a CaptureDelta message from a plain object. Also converts values to their respective internal types.
              * @function fromObject
-             * @memberof karna.screen_capture.RpcScreenshotEvent
+             * @memberof karna.screen_capture.CaptureDelta
              * @static
              * @param {Object.<string,*>} object Plain object
-             * @returns {karna.screen_capture.RpcScreenshotEvent} RpcScreenshotEvent
+             * @returns {karna.screen_capture.CaptureDelta} CaptureDelta
              */
-            RpcScreenshotEvent.fromObject = function fromObject(object) {
-                if (object instanceof $root.karna.screen_capture.RpcScreenshotEvent)
+            CaptureDelta.fromObject = function fromObject(object) {
+                if (object instanceof $root.karna.screen_capture.CaptureDelta)
                     return object;
-                let message = new $root.karna.screen_capture.RpcScreenshotEvent();
-                if (object.eventId != null)
-                    message.eventId = String(object.eventId);
+                let message = new $root.karna.screen_capture.CaptureDelta();
                 if (object.projectUuid != null)
                     message.projectUuid = String(object.projectUuid);
                 if (object.commandUuid != null)
                     message.commandUuid = String(object.commandUuid);
-                if (object.timestamp != null)
-                    message.timestamp = String(object.timestamp);
-                if (object.description != null)
-                    message.description = String(object.description);
-                if (object.screenshotPath != null)
-                    message.screenshotPath = String(object.screenshotPath);
-                if (object.annotationPath != null)
-                    message.annotationPath = String(object.annotationPath);
-                if (object.mouseX != null)
-                    message.mouseX = object.mouseX | 0;
-                if (object.mouseY != null)
-                    message.mouseY = object.mouseY | 0;
-                if (object.keyChar != null)
-                    message.keyChar = String(object.keyChar);
-                if (object.keyCode != null)
-                    message.keyCode = String(object.keyCode);
-                if (object.isSpecialKey != null)
-                    message.isSpecialKey = Boolean(object.isSpecialKey);
-                if (object.mouseEventToolTip != null)
-                    message.mouseEventToolTip = String(object.mouseEventToolTip);
+                if (object.sequence != null)
+                    if ($util.Long)
+                        (message.sequence = $util.Long.fromValue(object.sequence)).unsigned = false;
+                    else if (typeof object.sequence === "string")
+                        message.sequence = parseInt(object.sequence, 10);
+                    else if (typeof object.sequence === "number")
+                        message.sequence = object.sequence;
+                    else if (typeof object.sequence === "object")
+                        message.sequence = new $util.LongBits(object.sequence.low >>> 0, object.sequence.high >>> 0).toNumber();
+                switch (object.type) {
+                default:
+                    if (typeof object.type === "number") {
+                        message.type = object.type;
+                        break;
+                    }
+                    break;
+                case "CAPTURE_DELTA_APPEND":
+                case 0:
+                    message.type = 0;
+                    break;
+                case "CAPTURE_DELTA_UPDATE":
+                case 1:
+                    message.type = 1;
+                    break;
+                case "CAPTURE_DELTA_DELETE":
+                case 2:
+                    message.type = 2;
+                    break;
+                case "CAPTURE_DELTA_RESET":
+                case 3:
+                    message.type = 3;
+                    break;
+                }
+                if (object.isActive != null)
+                    message.isActive = Boolean(object.isActive);
+                if (object.screenshotEvents) {
+                    if (!Array.isArray(object.screenshotEvents))
+                        throw TypeError(".karna.screen_capture.CaptureDelta.screenshotEvents: array expected");
+                    message.screenshotEvents = [];
+                    for (let i = 0; i < object.screenshotEvents.length; ++i) {
+                        if (typeof object.screenshotEvents[i] !== "object")
+                            throw TypeError(".karna.screen_capture.CaptureDelta.screenshotEvents: object expected");
+                        message.screenshotEvents[i] = $root.karna.screen_capture.RpcScreenshotEvent.fromObject(object.screenshotEvents[i]);
+                    }
+                }
+                if (object.deletedEventIds) {
+                    if (!Array.isArray(object.deletedEventIds))
+                        throw TypeError(".karna.screen_capture.CaptureDelta.deletedEventIds: array expected");
+                    message.deletedEventIds = [];
+                    for (let i = 0; i < object.deletedEventIds.length; ++i)
+                        message.deletedEventIds[i] = String(object.deletedEventIds[i]);
+                }
                 return message;
             };
 
             /**
-             * Creates a plain object from a RpcScreenshotEvent message. Also converts values to other types if specified.
+             * Creates a plain object from a CaptureDelta message. Also converts values to other types if specified.
              * @function toObject
-             * @memberof karna.screen_capture.RpcScreenshotEvent
+             * @memberof karna.screen_capture.CaptureDelta
              * @static
-             * @param {karna.screen_capture.RpcScreenshotEvent} message RpcScreenshotEvent
+             * @param {karna.screen_capture.CaptureDelta} message CaptureDelta
              * @param {$protobuf.IConversionOptions} [options] Conversion options
              * @returns {Object.<string,*>} Plain object
              */
-            RpcScreenshotEvent.toObject = function toObject(message, options) {
+            CaptureDelta.toObject = function toObject(message, options) {
                 if (!options)
                     options = {};
                 let object = {};
+                if (options.arrays || options.defaults) {
+                    object.screenshotEvents = [];
+                    object.deletedEventIds = [];
+                }
                 if (options.defaults) {
-                    object.eventId = "";
                     object.projectUuid = "";
                     object.commandUuid = "";
-                    object.timestamp = "";
-                    object.description = "";
-                    object.screenshotPath = "";
-                    object.isSpecialKey = false;
+                    if ($util.Long) {
+                        let long = new $util.Long(0, 0, false);
+                        object.sequence = options.longs === String ? long.toString() : options.longs === Number ? long.toNumber() : long;
+                    } else
+                        object.sequence = options.longs === String ? "0" : 0;
+                    object.type = options.enums === String ? "CAPTURE_DELTA_APPEND" : 0;
+                    object.isActive = false;
                 }
-                if (message.eventId != null && message.hasOwnProperty("eventId"))
-                    object.eventId = message.eventId;
                 if (message.projectUuid != null && message.hasOwnProperty("projectUuid"))
                     object.projectUuid = message.projectUuid;
                 if (message.commandUuid != null && message.hasOwnProperty("commandUuid"))
                     object.commandUuid = message.commandUuid;
-                if (message.timestamp != null && message.hasOwnProperty("timestamp"))
-                    object.timestamp = message.timestamp;
-                if (message.description != null && message.hasOwnProperty("description"))
-                    object.description = message.description;
-                if (message.screenshotPath != null && message.hasOwnProperty("screenshotPath"))
-                    object.screenshotPath = message.screenshotPath;
-                if (message.annotationPath != null && message.hasOwnProperty("annotationPath")) {
-                    object.annotationPath = message.annotationPath;
-                    if (options.oneofs)
-                        object._annotationPath = "annotationPath";
-                }
-                if (message.mouseX != null && message.hasOwnProperty("mouseX")) {
-                    object.mouseX = message.mouseX;
-                    if (options.oneofs)
-                        object._mouseX = "mouseX";
-                }
-                if (message.mouseY != null && message.hasOwnProperty("mouseY")) {
-                    object.mouseY = message.mouseY;
-                    if (options.oneofs)
-                        object._mouseY = "mouseY";
-                }
-                if (message.keyChar != null && message.hasOwnProperty("keyChar")) {
-                    object.keyChar = message.keyChar;
-                    if (options.oneofs)
-                        object._keyChar = "keyChar";
-                }
-                if (message.keyCode != null && message.hasOwnProperty("keyCode")) {
-                    object.keyCode = message.keyCode;
-                    if (options.oneofs)
-                        object._keyCode = "keyCode";
+                if (message.sequence != null && message.hasOwnProperty("sequence"))
+                    if (typeof message.sequence === "number")
+                        object.sequence = options.longs === String ? String(message.sequence) : message.sequence;
+                    else
+                        object.sequence = options.longs === String ? $util.Long.prototype.toString.call(message.sequence) : options.longs === Number ? new $util.LongBits(message.sequence.low >>> 0, message.sequence.high >>> 0).toNumber() : message.sequence;
+                if (message.type != null && message.hasOwnProperty("type"))
+                    object.type = options.enums === String ? $root.karna.screen_capture.CaptureDeltaType[message.type] === undefined ? message.type : $root.karna.screen_capture.CaptureDeltaType[message.type] : message.type;
+                if (message.isActive != null && message.hasOwnProperty("isActive"))
+                    object.isActive = message.isActive;
+                if (message.screenshotEvents && message.screenshotEvents.length) {
+                    object.screenshotEvents = [];
+                    for (let j = 0; j < message.screenshotEvents.length; ++j)
+                        object.screenshotEvents[j] = $root.karna.screen_capture.RpcScreenshotEvent.toObject(message.screenshotEvents[j], options);
                 }
-                if (message.isSpecialKey != null && message.hasOwnProperty("isSpecialKey"))
-                    object.isSpecialKey = message.isSpecialKey;
-                if (message.mouseEventToolTip != null && message.hasOwnProperty("mouseEventToolTip")) {
-                    object.mouseEventToolTip = message.mouseEventToolTip;
-                    if (options.oneofs)
-                        object._mouseEventToolTip = "mouseEventToolTip";
+                if (message.deletedEventIds && message.deletedEventIds.length) {
+                    object.deletedEventIds = [];
+                    for (let j = 0; j < message.deletedEventIds.length; ++j)
+                        object.deletedEventIds[j] = message.deletedEventIds[j];
                 }
                 return object;
             };
 
             /**
-             * Converts this RpcScreenshotEvent to JSON.
+             * Converts this CaptureDelta to JSON.
              * @function toJSON
-             * @memberof karna.screen_capture.RpcScreenshotEvent
+             * @memberof karna.screen_capture.CaptureDelta
              * @instance
              * @returns {Object.<string,*>} JSON object
              */
-            RpcScreenshotEvent.prototype.toJSON = function toJSON() {
+            CaptureDelta.prototype.toJSON = function toJSON() {
                 return this.constructor.toObject(this, $protobuf.util.toJSONOptions);
             };
 
             /**
-             * Gets the default type url for RpcScreenshotEvent
+             * Gets the default type url for CaptureDelta
              * @function getTypeUrl
-             * @memberof karna.screen_capture.RpcScreenshotEvent
+             * @memberof karna.screen_capture.CaptureDelta
              * @static
              * @param {string} [typeUrlPrefix] your custom typeUrlPrefix(default "type.googleapis.com")
              * @returns {string} The default type url
              */
-            RpcScreenshotEvent.getTypeUrl = function getTypeUrl(typeUrlPrefix) {
+            CaptureDelta.getTypeUrl = function getTypeUrl(typeUrlPrefix) {
                 if (typeUrlPrefix === undefined) {
                     typeUrlPrefix = "type.googleapis.com";
                 }
-                return typeUrlPrefix + "/karna.screen_capture.RpcScreenshotEvent";
+                return typeUrlPrefix + "/karna.screen_capture.CaptureDelta";
             };
 
-            return RpcScreenshotEvent;
+            return CaptureDelta;
         })();
 
-        screen_capture.CaptureResult = (function() {
+        screen_capture.CaptureStats = (function() {
 
             /**
-             * Properties of a CaptureResult.
+             * Properties of a CaptureStats.
              * @memberof karna.screen_capture
-             * @interface ICaptureResult
-             * @property {string|null} [projectUuid] CaptureResult projectUuid
-             * @property {string|null} [commandUuid] CaptureResult commandUuid
-             * @property {boolean|null} [isActive] CaptureResult isActive
-             * @property {string|null} [message] CaptureResult message
-             * @property {Array.<karna.screen_capture.IRpcScreenshotEvent>|null} [screenshotEvents] CaptureResult screenshotEvents
+             * @interface ICaptureStats
+             * @property {string|null} [projectUuid] CaptureStats projectUuid
+             * @property {string|null} [commandUuid] CaptureStats commandUuid
+             * @property {boolean|null} [isActive] CaptureStats isActive
+             * @property {number|null} [totalScreenshots] CaptureStats totalScreenshots
+             * @property {number|null} [totalAnnotations] CaptureStats totalAnnotations
+             * @property {number|null} [totalKeyEvents] CaptureStats totalKeyEvents
+             * @property {number|null} [totalMouseEvents] CaptureStats totalMouseEvents
+             * @property {number|null} [durationSeconds] CaptureStats durationSeconds
+             * @property {number|Long|null} [rawDirectorySize] CaptureStats rawDirectorySize
+             * @property {number|Long|null} [annotatedDirectorySize] CaptureStats annotatedDirectorySize
+             * @property {number|null} [missingFiles] CaptureStats missingFiles
              */
 
             /**
-             * Constructs a new CaptureResult.
+             * Constructs a new CaptureStats.
              * @memberof karna.screen_capture
-             * @classdesc Represents a CaptureResult.
-             * @implements ICaptureResult
+             * @classdesc Represents a CaptureStats.
+             * @implements ICaptureStats
              * @constructor
-             * @param {karna.screen_capture.ICaptureResult=} [properties] Properties to set
+             * @param {karna.screen_capture.ICaptureStats=} [properties] Properties to set
              */
-            function CaptureResult(properties) {
-                this.screenshotEvents = [];
+            function CaptureStats(properties) {
                 if (properties)
                     for (let keys = Object.keys(properties), i = 0; i < keys.length; ++i)
                         if (properties[keys[i]] != null)
@@ -1680,67 +3386,115 @@ export const karna = $root.karna = (() => {
             }
 
             /**
-             * CaptureResult projectUuid.
+             * CaptureStats projectUuid.
              * @member {string} projectUuid
-             * @memberof karna.screen_capture.CaptureResult
+             * @memberof karna.screen_capture.CaptureStats
              * @instance
              */
-            CaptureResult.prototype.projectUuid = "";
+            CaptureStats.prototype.projectUuid = "";
 
             /**
-             * CaptureResult commandUuid.
+             * CaptureStats commandUuid.
              * @member {string} commandUuid
-             * @memberof karna.screen_capture.CaptureResult
+             * @memberof karna.screen_capture.CaptureStats
              * @instance
              */
-            CaptureResult.prototype.commandUuid = "";
+            CaptureStats.prototype.commandUuid = "";
 
             /**
-             * CaptureResult isActive.
+             * CaptureStats isActive.
              * @member {boolean} isActive
-             * @memberof karna.screen_capture.CaptureResult
+             * @memberof karna.screen_capture.CaptureStats
              * @instance
              */
-            CaptureResult.prototype.isActive = false;
+            CaptureStats.prototype.isActive = false;
 
             /**
-             * CaptureResult message.
-             * @member {string} message
-             * @memberof karna.screen_capture.CaptureResult
+             * CaptureStats totalScreenshots.
+             * @member {number} totalScreenshots
+             * @memberof karna.screen_capture.CaptureStats
              * @instance
              */
-            CaptureResult.prototype.message = "";
+            CaptureStats.prototype.totalScreenshots = 0;
 
             /**
-             * CaptureResult screenshotEvents.
-             * @member {Array.<karna.screen_capture.IRpcScreenshotEvent>} screenshotEvents
-             * @memberof karna.screen_capture.CaptureResult
+             * CaptureStats totalAnnotations.
+             * @member {number} totalAnnotations
+             * @memberof karna.screen_capture.CaptureStats
              * @instance
              */
-            CaptureResult.prototype.screenshotEvents = $util.emptyArray;
+            CaptureStats.prototype.totalAnnotations = 0;
 
             /**
-             * Creates a new CaptureResult instance using the specified properties.
+             * CaptureStats totalKeyEvents.
+             * @member {number} totalKeyEvents
+             * @memberof karna.screen_capture.CaptureStats
+             * @instance
+             */
+            CaptureStats.prototype.totalKeyEvents = 0;
+
+            /**
+             * CaptureStats totalMouseEvents.
+             * @member {number} totalMouseEvents
+             * @memberof karna.screen_capture.CaptureStats
+             * @instance
+             */
+            CaptureStats.prototype.totalMouseEvents = 0;
+
+            /**
+             * CaptureStats durationSeconds.
+             * @member {number} durationSeconds
+             * @memberof karna.screen_capture.CaptureStats
+             * @instance
+             */
+            CaptureStats.prototype.durationSeconds = 0;
+
+            /**
+             * CaptureStats rawDirectorySize.
+             * @member {number|Long} rawDirectorySize
+             * @memberof karna.screen_capture.CaptureStats
+             * @instance
+             */
+            CaptureStats.prototype.rawDirectorySize = $util.Long ? $util.Long.fromBits(0,0,false) : 0;
+
+            /**
+             * CaptureStats annotatedDirectorySize.
+             * @member {number|Long} annotatedDirectorySize
+             * @memberof karna.screen_capture.CaptureStats
+             * @instance
+             */
+            CaptureStats.prototype.annotatedDirectorySize = $util.Long ? $util.Long.fromBits(0,0,false) : 0;
+
+            /**
+             * CaptureStats missingFiles.
+             * @member {number} missingFiles
+             * @memberof karna.screen_capture.CaptureStats
+             * @instance
+             */
+            CaptureStats.prototype.missingFiles = 0;
+
+            /**
+             * Creates a new CaptureStats instance using the specified properties.
              * @function create
-             * @memberof karna.screen_capture.CaptureResult
+             * @memberof karna.screen_capture.CaptureStats
              * @static
-             * @param {karna.screen_capture.ICaptureResult=} [properties] Properties to set
-             * @returns {karna.screen_capture.CaptureResult} CaptureResult instance
+             * @param {karna.screen_capture.ICaptureStats=} [properties] Properties to set
+             * @returns {karna.screen_capture.CaptureStats} CaptureStats instance
              */
-            CaptureResult.create = function create(properties) {
-                return new CaptureResult(properties);
+            CaptureStats.create = function create(properties) {
+                return new CaptureStats(properties);
             };
 
             /**
-             * Encodes the specified CaptureResult message. Does not implicitly {@link karna.screen_capture.CaptureResult.verify|verify} messages.
+             * Encodes the specified CaptureStats message. Does not implicitly {@link karna.screen_capture.CaptureStats.verify|verify} messages.
              * @function encode
-             * @memberof karna.screen_capture.CaptureResult
+             * @memberof karna.screen_capture.CaptureStats
              * @static
-             * @param {karna.screen_capture.ICaptureResult} message CaptureResult message or plain object to encode
+             * @param {karna.screen_capture.ICaptureStats} message CaptureStats message or plain object to encode
              * @param {$protobuf.Writer} [writer] Writer to encode to
              * @returns {$protobuf.Writer} Writer
              */
-            CaptureResult.encode = function encode(message, writer) {
+            CaptureStats.encode = function encode(message, writer) {
                 if (!writer)
                     writer = $Writer.create();
                 if (message.projectUuid != null && Object.hasOwnProperty.call(message, "projectUuid"))
@@ -1749,42 +3503,53 @@ export const karna = $root.karna = (() => {
                     writer.uint32(/* id 2, wireType 2 =*/18).string(message.commandUuid);
                 if (message.isActive != null && Object.hasOwnProperty.call(message, "isActive"))
                     writer.uint32(/* id 3, wireType 0 =*/24).bool(message.isActive);
-                if (message.message != null && Object.hasOwnProperty.call(message, "message"))
-                    writer.uint32(/* id 4, wireType 2 =*/34).string(message.message);
-                if (message.screenshotEvents != null && message.screenshotEvents.length)
-                    for (let i = 0; i < message.screenshotEvents.length; ++i)
-                        $root.karna.screen_capture.RpcScreenshotEvent.encode(message.screenshotEvents[i], writer.uint32(/* id 5, wireType 2 =*/42).fork()).ldelim();
+                if (message.totalScreenshots != null && Object.hasOwnProperty.call(message, "totalScreenshots"))
+                    writer.uint32(/* id 4, wireType 0 =*/32).int32(message.totalScreenshots);
+                if (message.totalAnnotations != null && Object.hasOwnProperty.call(message, "totalAnnotations"))
+                    writer.uint32(/* id 5, wireType 0 =*/40).int32(message.totalAnnotations);
+                if (message.totalKeyEvents != null && Object.hasOwnProperty.call(message, "totalKeyEvents"))
+                    writer.uint32(/* id 6, wireType 0 =*/48).int32(message.totalKeyEvents);
+                if (message.totalMouseEvents != null && Object.hasOwnProperty.call(message, "totalMouseEvents"))
+                    writer.uint32(/* id 7, wireType 0 =*/56).int32(message.totalMouseEvents);
+                if (message.durationSeconds != null && Object.hasOwnProperty.call(message, "durationSeconds"))
+                    writer.uint32(/* id 8, wireType 1 =*/65).double(message.durationSeconds);
+                if (message.rawDirectorySize != null && Object.hasOwnProperty.call(message, "rawDirectorySize"))
+                    writer.uint32(/* id 9, wireType 0 =*/72).int64(message.rawDirectorySize);
+                if (message.annotatedDirectorySize != null && Object.hasOwnProperty.call(message, "annotatedDirectorySize"))
+                    writer.uint32(/* id 10, wireType 0 =*/80).int64(message.annotatedDirectorySize);
+                if (message.missingFiles != null && Object.hasOwnProperty.call(message, "missingFiles"))
+                    writer.uint32(/* id 11, wireType 0 =*/88).int32(message.missingFiles);
                 return writer;
             };
 
             /**
-             * Encodes the specified CaptureResult message, length delimited. Does not implicitly {@link karna.screen_capture.CaptureResult.verify|verify} messages.
+             * Encodes the specified CaptureStats message, length delimited. Does not implicitly {@link karna.screen_capture.CaptureStats.verify|verify} messages.
              * @function encodeDelimited
-             * @memberof karna.screen_capture.CaptureResult
+             * @memberof karna.screen_capture.CaptureStats
              * @static
-             * @param {karna.screen_capture.ICaptureResult} message CaptureResult message or plain object to encode
+             * @param {karna.screen_capture.ICaptureStats} message CaptureStats message or plain object to encode
              * @param {$protobuf.Writer} [writer] Writer to encode to
              * @returns {$protobuf.Writer} Writer
              */
-            CaptureResult.encodeDelimited = function encodeDelimited(message, writer) {
+            CaptureStats.encodeDelimited = function encodeDelimited(message, writer) {
                 return this.encode(message, writer).ldelim();
             };
 
             /**
-             * Decodes a CaptureResult message from the specified reader or buffer.
+             * Decodes a CaptureStats message from the specified reader or buffer.
              * @function decode
-             * @memberof karna.screen_capture.CaptureResult
+             * @memberof karna.screen_capture.CaptureStats
              * @static
              * @param {$protobuf.Reader|Uint8Array} reader Reader or buffer to decode from
              * @param {number} [length] Message length if known beforehand
-             * @returns {karna.screen_capture.CaptureResult} CaptureResult
+             * @returns {karna.screen_capture.CaptureStats} CaptureStats
              * @throws {Error} If the payload is not a reader or valid buffer
              * @throws {$protobuf.util.ProtocolError} If required fields are missing
              */
-            CaptureResult.decode = function decode(reader, length) {
+            CaptureStats.decode = function decode(reader, length) {
                 if (!(reader instanceof $Reader))
                     reader = $Reader.create(reader);
-                let end = length === undefined ? reader.len : reader.pos + length, message = new $root.karna.screen_capture.CaptureResult();
+                let end = length === undefined ? reader.len : reader.pos + length, message = new $root.karna.screen_capture.CaptureStats();
                 while (reader.pos < end) {
                     let tag = reader.uint32();
                     switch (tag >>> 3) {
@@ -1801,13 +3566,35 @@ export const karna = $root.karna = (() => {
                             break;
                         }
                     case 4: {
-                            message.message = reader.string();
+                            message.totalScreenshots = reader.int32();
                             break;
                         }
                     case 5: {
-                            if (!(message.screenshotEvents && message.screenshotEvents.length))
-                                message.screenshotEvents = [];
-                            message.screenshotEvents.push($root.karna.screen_capture.RpcScreenshotEvent.decode(reader, reader.uint32()));
+                            message.totalAnnotations = reader.int32();
+                            break;
+                        }
+                    case 6: {
+                            message.totalKeyEvents = reader.int32();
+                            break;
+                        }
+                    case 7: {
+                            message.totalMouseEvents = reader.int32();
+                            break;
+                        }
+                    case 8: {
+                            message.durationSeconds = reader.double();
+                            break;
+                        }
+                    case 9: {
+                            message.rawDirectorySize = reader.int64();
+                            break;
+                        }
+                    case 10: {
+                            message.annotatedDirectorySize = reader.int64();
+                            break;
+                        }
+                    case 11: {
+                            message.missingFiles = reader.int32();
                             break;
                         }
                     default:
@@ -1819,30 +3606,30 @@ export const karna = $root.karna = (() => {
             };
 
             /**
-             * Decodes a CaptureResult message from the specified reader or buffer, length delimited.
+             * Decodes a CaptureStats message from the specified reader or buffer, length delimited.
              * @function decodeDelimited
-             * @memberof karna.screen_capture.CaptureResult
+             * @memberof karna.screen_capture.CaptureStats
              * @static
              * @param {$protobuf.Reader|Uint8Array} reader Reader or buffer to decode from
-             * @returns {karna.screen_capture.CaptureResult} CaptureResult
+             * @returns {karna.screen_capture.CaptureStats} CaptureStats
              * @throws {Error} If the payload is not a reader or valid buffer
              * @throws {$protobuf.util.ProtocolError} If required fields are missing
              */
-            CaptureResult.decodeDelimited = function decodeDelimited(reader) {
+            CaptureStats.decodeDelimited = function decodeDelimited(reader) {
                 if (!(reader instanceof $Reader))
                     reader = new $Reader(reader);
                 return this.decode(reader, reader.uint32());
             };
 
             /**
-             * Verifies a CaptureResult message.
+             * Verifies a CaptureStats message.
              * @function verify
-             * @memberof karna.screen_capture.CaptureResult
+             * @memberof karna.screen_capture.CaptureStats
              * @static
              * @param {Object.<string,*>} message Plain object to verify
              * @returns {string|null} `null` if valid, otherwise the reason why it is not
              */
-            CaptureResult.verify = function verify(message) {
+            CaptureStats.verify = function verify(message) {
                 if (typeof message !== "object" || message === null)
                     return "object expected";
                 if (message.projectUuid != null && message.hasOwnProperty("projectUuid"))
@@ -1854,74 +3641,117 @@ export const karna = $root.karna = (() => {
                 if (message.isActive != null && message.hasOwnProperty("isActive"))
                     if (typeof message.isActive !== "boolean")
                         return "isActive: boolean expected";
-                if (message.message != null && message.hasOwnProperty("message"))
-                    if (!$util.isString(message.message))
-                        return "message: string expected";
-                if (message.screenshotEvents != null && message.hasOwnProperty("screenshotEvents")) {
-                    if (!Array.isArray(message.screenshotEvents))
-                        return "screenshotEvents: array expected";
-                    for (let i = 0; i < message.screenshotEvents.length; ++i) {
-                        let error = $root.karna.screen_capture.RpcScreenshotEvent.verify(message.screenshotEvents[i]);
-                        if (error)
-                            return "screenshotEvents." + error;
-                    }
-                }
+                if (message.totalScreenshots != null && message.hasOwnProperty("totalScreenshots"))
+                    if (!$util.isInteger(message.totalScreenshots))
+                        return "totalScreenshots: integer expected";
+                if (message.totalAnnotations != null && message.hasOwnProperty("totalAnnotations"))
+                    if (!$util.isInteger(message.totalAnnotations))
+                        return "totalAnnotations: integer expected";
+                if (message.totalKeyEvents != null && message.hasOwnProperty("totalKeyEvents"))
+                    if (!$util.isInteger(message.totalKeyEvents))
+                        return "totalKeyEvents: integer expected";
+                if (message.totalMouseEvents != null && message.hasOwnProperty("totalMouseEvents"))
+                    if (!$util.isInteger(message.totalMouseEvents))
+                        return "totalMouseEvents: integer expected";
+                if (message.durationSeconds != null && message.hasOwnProperty("durationSeconds"))
+                    if (typeof message.durationSeconds !== "number")
+                        return "durationSeconds: number expected";
+                if (message.rawDirectorySize != null && message.hasOwnProperty("rawDirectorySize"))
+                    if (!$util.isInteger(message.rawDirectorySize) && !(message.rawDirectorySize && $util.isInteger(message.rawDirectorySize.low) && $util.isInteger(message.rawDirectorySize.high)))
+                        return "rawDirectorySize: integer|Long expected";
+                if (message.annotatedDirectorySize != null && message.hasOwnProperty("annotatedDirectorySize"))
+                    if (!$util.isInteger(message.annotatedDirectorySize) && !(message.annotatedDirectorySize && $util.isInteger(message.annotatedDirectorySize.low) && $util.isInteger(message.annotatedDirectorySize.high)))
+                        return "annotatedDirectorySize: integer|Long expected";
+                if (message.missingFiles != null && message.hasOwnProperty("missingFiles"))
+                    if (!$util.isInteger(message.missingFiles))
+                        return "missingFiles: integer expected";
                 return null;
             };
 
             /**
-             * Creates a CaptureResult message from a plain object. Also converts values to their respective internal types.
+             * Creates a CaptureStats message from a plain object. Also converts values to their respective internal types.
              * @function fromObject
-             * @memberof karna.screen_capture.CaptureResult
+             * @memberof karna.screen_capture.CaptureStats
              * @static
              * @param {Object.<string,*>} object Plain object
-             * @returns {karna.screen_capture.CaptureResult} CaptureResult
+             * @returns {karna.screen_capture.CaptureStats} CaptureStats
              */
-            CaptureResult.fromObject = function fromObject(object) {
-                if (object instanceof $root.karna.screen_capture.CaptureResult)
+            CaptureStats.fromObject = function fromObject(object) {
+                if (object instanceof $root.karna.screen_capture.CaptureStats)
                     return object;
-                let message = new $root.karna.screen_capture.CaptureResult();
+                let message = new $root.karna.screen_capture.CaptureStats();
                 if (object.projectUuid != null)
                     message.projectUuid = String(object.projectUuid);
                 if (object.commandUuid != null)
                     message.commandUuid = String(object.commandUuid);
                 if (object.isActive != null)
                     message.isActive = Boolean(object.isActive);
-                if (object.message != null)
-                    message.message = String(object.message);
-                if (object.screenshotEvents) {
-                    if (!Array.isArray(object.screenshotEvents))
-                        throw TypeError(".karna.screen_capture.CaptureResult.screenshotEvents: array expected");
-                    message.screenshotEvents = [];
-                    for (let i = 0; i < object.screenshotEvents.length; ++i) {
-                        if (typeof object.screenshotEvents[i] !== "object")
-                            throw TypeError(".karna.screen_capture.CaptureResult.screenshotEvents: object expected");
-                        message.screenshotEvents[i] = $root.karna.screen_capture.RpcScreenshotEvent.fromObject(object.screenshotEvents[i]);
-                    }
-                }
+                if (object.totalScreenshots != null)
+                    message.totalScreenshots = object.totalScreenshots | 0;
+                if (object.totalAnnotations != null)
+                    message.totalAnnotations = object.totalAnnotations | 0;
+                if (object.totalKeyEvents != null)
+                    message.totalKeyEvents = object.totalKeyEvents | 0;
+                if (object.totalMouseEvents != null)
+                    message.totalMouseEvents = object.totalMouseEvents | 0;
+                if (object.durationSeconds != null)
+                    message.durationSeconds = Number(object.durationSeconds);
+                if (object.rawDirectorySize != null)
+                    if ($util.Long)
+                        (message.rawDirectorySize = $util.Long.fromValue(object.rawDirectorySize)).unsigned = false;
+                    else if (typeof object.rawDirectorySize === "string")
+                        message.rawDirectorySize = parseInt(object.rawDirectorySize, 10);
+                    else if (typeof object.rawDirectorySize === "number")
+                        message.rawDirectorySize = object.rawDirectorySize;
+                    else if (typeof object.rawDirectorySize === "object")
+                        message.rawDirectorySize = new $util.LongBits(object.rawDirectorySize.low >>> 0, object.rawDirectorySize.high >>> 0).toNumber();
+                if (object.annotatedDirectorySize != null)
+                    if ($util.Long)
+                        (message.annotatedDirectorySize = $util.Long.fromValue(object.annotatedDirectorySize)).unsigned = false;
+                    else if (typeof object.annotatedDirectorySize === "string")
+                        message.annotatedDirectorySize = parseInt(object.annotatedDirectorySize, 10);
+                    else if (typeof object.annotatedDirectorySize === "number")
+                        message.annotatedDirectorySize = object.annotatedDirectorySize;
+                    else if (typeof object.annotatedDirectorySize === "object")
+                        message.annotatedDirectorySize = new $util.LongBits(object.annotatedDirectorySize.low >>> 0, object.annotatedDirectorySize.high >>> 0).toNumber();
+                if (object.missingFiles != null)
+                    message.missingFiles = object.missingFiles | 0;
                 return message;
             };
 
             /**
-             * Creates a plain object from a CaptureResult message. Also converts values to other types if specified.
+             * Creates a plain object from a CaptureStats message. Also converts values to other types if specified.
              * @function toObject
-             * @memberof karna.screen_capture.CaptureResult
+             * @memberof karna.screen_capture.CaptureStats
              * @static
-             * @param {karna.screen_capture.CaptureResult} message CaptureResult
+             * @param {karna.screen_capture.CaptureStats} message CaptureStats
              * @param {$protobuf.IConversionOptions} [options] Conversion options
              * @returns {Object.<string,*>} Plain object
              */
-            CaptureResult.toObject = function toObject(message, options) {
+            CaptureStats.toObject = function toObject(message, options) {
                 if (!options)
                     options = {};
                 let object = {};
-                if (options.arrays || options.defaults)
-                    object.screenshotEvents = [];
                 if (options.defaults) {
                     object.projectUuid = "";
                     object.commandUuid = "";
                     object.isActive = false;
-                    object.message = "";
+                    object.totalScreenshots = 0;
+                    object.totalAnnotations = 0;
+                    object.totalKeyEvents = 0;
+                    object.totalMouseEvents = 0;
+                    object.durationSeconds = 0;
+                    if ($util.Long) {
+                        let long = new $util.Long(0, 0, false);
+                        object.rawDirectorySize = options.longs === String ? long.toString() : options.longs === Number ? long.toNumber() : long;
+                    } else
+                        object.rawDirectorySize = options.longs === String ? "0" : 0;
+                    if ($util.Long) {
+                        let long = new $util.Long(0, 0, false);
+                        object.annotatedDirectorySize = options.longs === String ? long.toString() : options.longs === Number ? long.toNumber() : long;
+                    } else
+                        object.annotatedDirectorySize = options.longs === String ? "0" : 0;
+                    object.missingFiles = 0;
                 }
                 if (message.projectUuid != null && message.hasOwnProperty("projectUuid"))
                     object.projectUuid = message.projectUuid;
@@ -1929,43 +3759,58 @@ export const karna = $root.karna = (() => {
                     object.commandUuid = message.commandUuid;
                 if (message.isActive != null && message.hasOwnProperty("isActive"))
                     object.isActive = message.isActive;
-                if (message.message != null && message.hasOwnProperty("message"))
-                    object.message = message.message;
-                if (message.screenshotEvents && message.screenshotEvents.length) {
-                    object.screenshotEvents = [];
-                    for (let j = 0; j < message.screenshotEvents.length; ++j)
-                        object.screenshotEvents[j] = $root.karna.screen_capture.RpcScreenshotEvent.toObject(message.screenshotEvents[j], options);
-                }
+                if (message.totalScreenshots != null && message.hasOwnProperty("totalScreenshots"))
+                    object.totalScreenshots = message.totalScreenshots;
+                if (message.totalAnnotations != null && message.hasOwnProperty("totalAnnotations"))
+                    object.totalAnnotations = message.totalAnnotations;
+                if (message.totalKeyEvents != null && message.hasOwnProperty("totalKeyEvents"))
+                    object.totalKeyEvents = message.totalKeyEvents;
+                if (message.totalMouseEvents != null && message.hasOwnProperty("totalMouseEvents"))
+                    object.totalMouseEvents = message.totalMouseEvents;
+                if (message.durationSeconds != null && message.hasOwnProperty("durationSeconds"))
+                    object.durationSeconds = options.json && !isFinite(message.durationSeconds) ? String(message.durationSeconds) : message.durationSeconds;
+                if (message.rawDirectorySize != null && message.hasOwnProperty("rawDirectorySize"))
+                    if (typeof message.rawDirectorySize === "number")
+                        object.rawDirectorySize = options.longs === String ? String(message.rawDirectorySize) : message.rawDirectorySize;
+                    else
+                        object.rawDirectorySize = options.longs === String ? $util.Long.prototype.toString.call(message.rawDirectorySize) : options.longs === Number ? new $util.LongBits(message.rawDirectorySize.low >>> 0, message.rawDirectorySize.high >>> 0).toNumber() : message.rawDirectorySize;
+                if (message.annotatedDirectorySize != null && message.hasOwnProperty("annotatedDirectorySize"))
+                    if (typeof message.annotatedDirectorySize === "number")
+                        object.annotatedDirectorySize = options.longs === String ? String(message.annotatedDirectorySize) : message.annotatedDirectorySize;
+                    else
+                        object.annotatedDirectorySize = options.longs === String ? $util.Long.prototype.toString.call(message.annotatedDirectorySize) : options.longs === Number ? new $util.LongBits(message.annotatedDirectorySize.low >>> 0, message.annotatedDirectorySize.high >>> 0).toNumber() : message.annotatedDirectorySize;
+                if (message.missingFiles != null && message.hasOwnProperty("missingFiles"))
+                    object.missingFiles = message.missingFiles;
                 return object;
             };
 
             /**
-             * Converts this CaptureResult to JSON.
+             * Converts this CaptureStats to JSON.
              * @function toJSON
-             * @memberof karna.screen_capture.CaptureResult
+             * @memberof karna.screen_capture.CaptureStats
              * @instance
              * @returns {Object.<string,*>} JSON object
              */
-            CaptureResult.prototype.toJSON = function toJSON() {
+            CaptureStats.prototype.toJSON = function toJSON() {
                 return this.constructor.toObject(this, $protobuf.util.toJSONOptions);
             };
 
             /**
-             * Gets the default type url for CaptureResult
+             * Gets the default type url for CaptureStats
              * @function getTypeUrl
-             * @memberof karna.screen_capture.CaptureResult
+             * @memberof karna.screen_capture.CaptureStats
              * @static
              * @param {string} [typeUrlPrefix] your custom typeUrlPrefix(default "type.googleapis.com")
              * @returns {string} The default type url
              */
-            CaptureResult.getTypeUrl = function getTypeUrl(typeUrlPrefix) {
+            CaptureStats.getTypeUrl = function getTypeUrl(typeUrlPrefix) {
                 if (typeUrlPrefix === undefined) {
                     typeUrlPrefix = "type.googleapis.com";
                 }
-                return typeUrlPrefix + "/karna.screen_capture.CaptureResult";
+                return typeUrlPrefix + "/karna.screen_capture.CaptureStats";
             };
 
-            return CaptureResult;
+            return CaptureStats;
         })();
 
         screen_capture.ScreenCaptureRPCResponse = (function() {
@@ -1976,6 +3821,8 @@ export const karna = $root.karna = (() => {
              * @interface IScreenCaptureRPCResponse
              * @property {karna.screen_capture.ICaptureResult|null} [captureResponse] ScreenCaptureRPCResponse captureResponse
              * @property {string|null} [error] ScreenCaptureRPCResponse error
+             * @property {karna.screen_capture.ICaptureDelta|null} [captureDelta] ScreenCaptureRPCResponse captureDelta
+             * @property {karna.screen_capture.ICaptureStats|null} [captureStats] ScreenCaptureRPCResponse captureStats
              */
 
             /**
@@ -2009,17 +3856,33 @@ export const karna = $root.karna = (() => {
              */
             ScreenCaptureRPCResponse.prototype.error = null;
 
+            /**
+             * ScreenCaptureRPCResponse captureDelta.
+             * @member {karna.screen_capture.ICaptureDelta|null|undefined} captureDelta
+             * @memberof karna.screen_capture.ScreenCaptureRPCResponse
+             * @instance
+             */
+            ScreenCaptureRPCResponse.prototype.captureDelta = null;
+
+            /**
+             * ScreenCaptureRPCResponse captureStats.
+             * @member {karna.screen_capture.ICaptureStats|null|undefined} captureStats
+             * @memberof karna.screen_capture.ScreenCaptureRPCResponse
+             * @instance
+             */
+            ScreenCaptureRPCResponse.prototype.captureStats = null;
+
             // OneOf field names bound to virtual getters and setters
             let $oneOfFields;
 
             /**
              * ScreenCaptureRPCResponse type.
-             * @member {"captureResponse"|"error"|undefined} type
+             * @member {"captureResponse"|"error"|"captureDelta"|"captureStats"|undefined} type
              * @memberof karna.screen_capture.ScreenCaptureRPCResponse
              * @instance
              */
             Object.defineProperty(ScreenCaptureRPCResponse.prototype, "type", {
-                get: $util.oneOfGetter($oneOfFields = ["captureResponse", "error"]),
+                get: $util.oneOfGetter($oneOfFields = ["captureResponse", "error", "captureDelta", "captureStats"]),
                 set: $util.oneOfSetter($oneOfFields)
             });
 
@@ -2051,6 +3914,10 @@ export const karna = $root.karna = (() => {
                     $root.karna.screen_capture.CaptureResult.encode(message.captureResponse, writer.uint32(/* id 1, wireType 2 =*/10).fork()).ldelim();
                 if (message.error != null && Object.hasOwnProperty.call(message, "error"))
                     writer.uint32(/* id 2, wireType 2 =*/18).string(message.error);
+                if (message.captureDelta != null && Object.hasOwnProperty.call(message, "captureDelta"))
+                    $root.karna.screen_capture.CaptureDelta.encode(message.captureDelta, writer.uint32(/* id 3, wireType 2 =*/26).fork()).ldelim();
+                if (message.captureStats != null && Object.hasOwnProperty.call(message, "captureStats"))
+                    $root.karna.screen_capture.CaptureStats.encode(message.captureStats, writer.uint32(/* id 4, wireType 2 =*/34).fork()).ldelim();
                 return writer;
             };
 
@@ -2093,6 +3960,14 @@ export const karna = $root.karna = (() => {
                             message.error = reader.string();
                             break;
                         }
+                    case 3: {
+                            message.captureDelta = $root.karna.screen_capture.CaptureDelta.decode(reader, reader.uint32());
+                            break;
+                        }
+                    case 4: {
+                            message.captureStats = $root.karna.screen_capture.CaptureStats.decode(reader, reader.uint32());
+                            break;
+                        }
                     default:
                         reader.skipType(tag & 7);
                         break;
@@ -2144,6 +4019,26 @@ export const karna = $root.karna = (() => {
                     if (!$util.isString(message.error))
                         return "error: string expected";
                 }
+                if (message.captureDelta != null && message.hasOwnProperty("captureDelta")) {
+                    if (properties.type === 1)
+                        return "type: multiple values";
+                    properties.type = 1;
+                    {
+                        let error = $root.karna.screen_capture.CaptureDelta.verify(message.captureDelta);
+                        if (error)
+                            return "captureDelta." + error;
+                    }
+                }
+                if (message.captureStats != null && message.hasOwnProperty("captureStats")) {
+                    if (properties.type === 1)
+                        return "type: multiple values";
+                    properties.type = 1;
+                    {
+                        let error = $root.karna.screen_capture.CaptureStats.verify(message.captureStats);
+                        if (error)
+                            return "captureStats." + error;
+                    }
+                }
                 return null;
             };
 
@@ -2166,6 +4061,16 @@ export const karna = $root.karna = (() => {
                 }
                 if (object.error != null)
                     message.error = String(object.error);
+                if (object.captureDelta != null) {
+                    if (typeof object.captureDelta !== "object")
+                        throw TypeError(".karna.screen_capture.ScreenCaptureRPCResponse.captureDelta: object expected");
+                    message.captureDelta = $root.karna.screen_capture.CaptureDelta.fromObject(object.captureDelta);
+                }
+                if (object.captureStats != null) {
+                    if (typeof object.captureStats !== "object")
+                        throw TypeError(".karna.screen_capture.ScreenCaptureRPCResponse.captureStats: object expected");
+                    message.captureStats = $root.karna.screen_capture.CaptureStats.fromObject(object.captureStats);
+                }
                 return message;
             };
 
@@ -2192,6 +4097,16 @@ export const karna = $root.karna = (() => {
                     if (options.oneofs)
                         object.type = "error";
                 }
+                if (message.captureDelta != null && message.hasOwnProperty("captureDelta")) {
+                    object.captureDelta = $root.karna.screen_capture.CaptureDelta.toObject(message.captureDelta, options);
+                    if (options.oneofs)
+                        object.type = "captureDelta";
+                }
+                if (message.captureStats != null && message.hasOwnProperty("captureStats")) {
+                    object.captureStats = $root.karna.screen_capture.CaptureStats.toObject(message.captureStats, options);
+                    if (options.oneofs)
+                        object.type = "captureStats";
+                }
                 return object;
             };
 
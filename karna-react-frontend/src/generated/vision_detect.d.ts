@@ -345,6 +345,145 @@ export namespace karna {
             public static getTypeUrl(typeUrlPrefix?: string): string;
         }
 
+        /** Properties of a PackedBoundingBoxes. */
+        interface IPackedBoundingBoxes {
+
+            /** PackedBoundingBoxes x */
+            x?: (number[]|null);
+
+            /** PackedBoundingBoxes y */
+            y?: (number[]|null);
+
+            /** PackedBoundingBoxes width */
+            width?: (number[]|null);
+
+            /** PackedBoundingBoxes height */
+            height?: (number[]|null);
+
+            /** PackedBoundingBoxes confidence */
+            confidence?: (number[]|null);
+
+            /** PackedBoundingBoxes classIndex */
+            classIndex?: (number[]|null);
+
+            /** PackedBoundingBoxes classNames */
+            classNames?: (string[]|null);
+
+            /** PackedBoundingBoxes ids */
+            ids?: (string[]|null);
+        }
+
+        /** Represents a PackedBoundingBoxes. */
+        class PackedBoundingBoxes implements IPackedBoundingBoxes {
+
+            /**
+             * Constructs a new PackedBoundingBoxes.
+             * @param [properties] Properties to set
+             */
+            constructor(properties?: karna.vision.IPackedBoundingBoxes);
+
+            /** PackedBoundingBoxes x. */
+            public x: number[];
+
+            /** PackedBoundingBoxes y. */
+            public y: number[];
+
+            /** PackedBoundingBoxes width. */
+            public width: number[];
+
+            /** PackedBoundingBoxes height. */
+            public height: number[];
+
+            /** PackedBoundingBoxes confidence. */
+            public confidence: number[];
+
+            /** PackedBoundingBoxes classIndex. */
+            public classIndex: number[];
+
+            /** PackedBoundingBoxes classNames. */
+            public classNames: string[];
+
+            /** PackedBoundingBoxes ids. */
+            public ids: string[];
+
+            /**
+             * Creates a new PackedBoundingBoxes instance using the specified properties.
+             * @param [properties] Properties to set
+             * @returns PackedBoundingBoxes instance
+             */
+            public static create(properties?: karna.vision.IPackedBoundingBoxes): karna.vision.PackedBoundingBoxes;
+
+            /**
+             * Encodes the specified PackedBoundingBoxes message. Does not implicitly {@link karna.vision.PackedBoundingBoxes.verify|verify} messages.
+             * @param message PackedBoundingBoxes message or plain object to encode
+             * @param [writer] Writer to encode to
+             * @returns Writer
+             */
+            public static encode(message: karna.vision.IPackedBoundingBoxes, writer?: $protobuf.Writer): $protobuf.Writer;
+
+            /**
+             * Encodes the specified PackedBoundingBoxes message, length delimited. Does not implicitly {@link karna.vision.PackedBoundingBoxes.verify|verify} messages.
+             * @param message PackedBoundingBoxes message or plain object to encode
+             * @param [writer] Writer to encode to
+             * @returns Writer
+             */
+            public static encodeDelimited(message: karna.vision.IPackedBoundingBoxes, writer?: $protobuf.Writer): $protobuf.Writer;
+
+            /**
+             * Decodes a PackedBoundingBoxes message from the specified reader or buffer.
+             * @param reader Reader or buffer to decode from
+             * @param [length] Message length if known beforehand
+             * @returns PackedBoundingBoxes
+             * @throws {Error} If the payload is not a reader or valid buffer
+             * @throws {$protobuf.util.ProtocolError} If required fields are missing
+             */
+            public static decode(reader: ($protobuf.Reader|Uint8Array), length?: number): karna.vision.PackedBoundingBoxes;
+
+            /**
+             * Decodes a PackedBoundingBoxes message from the specified reader or buffer, length delimited.
+             * @param reader Reader or buffer to decode from
+             * @returns PackedBoundingBoxes
+             * @throws {Error} If the payload is not a reader or valid buffer
+             * @throws {$protobuf.util.ProtocolError} If required fields are missing
+             */
+            public static decodeDelimited(reader: ($protobuf.Reader|Uint8Array)): karna.vision.PackedBoundingBoxes;
+
+            /**
+             * Verifies a PackedBoundingBoxes message.
+             * @param message Plain object to verify
+             * @returns `null` if valid, otherwise the reason why it is not
+             */
+            public static verify(message: { [k: string]: any }): (string|null);
+
+            /**
+             * Creates a PackedBoundingBoxes message from a plain object. Also converts values to their respective internal types.
+             * @param object Plain object
+             * @returns PackedBoundingBoxes
+             */
+            public static fromObject(object: { [k: string]: any }): karna.vision.PackedBoundingBoxes;
+
+            /**
+             * Creates a plain object from a PackedBoundingBoxes message. Also converts values to other types if specified.
+             * @param message PackedBoundingBoxes
+             * @param [options] Conversion options
+             * @returns Plain object
+             */
+            public static toObject(message: karna.vision.PackedBoundingBoxes, options?: $protobuf.IConversionOptions): { [k: string]: any };
+
+            /**
+             * Converts this PackedBoundingBoxes to JSON.
+             * @returns JSON object
+             */
+            public toJSON(): { [k: string]: any };
+
+            /**
+             * Gets the default type url for PackedBoundingBoxes
+             * @param [typeUrlPrefix] your custom typeUrlPrefix(default "type.googleapis.com")
+             * @returns The default type url
+             */
+            public static getTypeUrl(typeUrlPrefix?: string): string;
+        }
+
         /** Properties of a VisionDetectResultModel. */
         interface IVisionDetectResultModel {
 
@@ -386,6 +525,9 @@ export namespace karna {
 
             /** VisionDetectResultModel croppedHeight */
             croppedHeight?: (number|null);
+
+            /** VisionDetectResultModel packedBboxes */
+            packedBboxes?: (karna.vision.IPackedBoundingBoxes|null);
         }
 
         /** Represents a VisionDetectResultModel. */
@@ -436,6 +578,9 @@ export namespace karna {
             /** VisionDetectResultModel croppedHeight. */
             public croppedHeight: number;
 
+            /** VisionDetectResultModel packedBboxes. */
+            public packedBboxes?: (karna.vision.IPackedBoundingBoxes|null);
+
             /**
              * Creates a new VisionDetectResultModel instance using the specified properties.
              * @param [properties] Properties to set
@@ -623,6 +768,127 @@ export namespace karna {
             public static getTypeUrl(typeUrlPrefix?: string): string;
         }
 
+        /** Properties of a VisionDetectResultDelta. */
+        interface IVisionDetectResultDelta {
+
+            /** VisionDetectResultDelta projectUuid */
+            projectUuid?: (string|null);
+
+            /** VisionDetectResultDelta commandUuid */
+            commandUuid?: (string|null);
+
+            /** VisionDetectResultDelta result */
+            result?: (karna.vision.IVisionDetectResultModel|null);
+
+            /** VisionDetectResultDelta processedCount */
+            processedCount?: (number|null);
+
+            /** VisionDetectResultDelta pendingCount */
+            pendingCount?: (number|null);
+        }
+
+        /** Represents a VisionDetectResultDelta. */
+        class VisionDetectResultDelta implements IVisionDetectResultDelta {
+
+            /**
+             * Constructs a new VisionDetectResultDelta.
+             * @param [properties] Properties to set
+             */
+            constructor(properties?: karna.vision.IVisionDetectResultDelta);
+
+            /** VisionDetectResultDelta projectUuid. */
+            public projectUuid: string;
+
+            /** VisionDetectResultDelta commandUuid. */
+            public commandUuid: string;
+
+            /** VisionDetectResultDelta result. */
+            public result?: (karna.vision.IVisionDetectResultModel|null);
+
+            /** VisionDetectResultDelta processedCount. */
+            public processedCount: number;
+
+            /** VisionDetectResultDelta pendingCount. */
+            public pendingCount: number;
+
+            /**
+             * Creates a new VisionDetectResultDelta instance using the specified properties.
+             * @param [properties] Properties to set
+             * @returns VisionDetectResultDelta instance
+             */
+            public static create(properties?: karna.vision.IVisionDetectResultDelta): karna.vision.VisionDetectResultDelta;
+
+            /**
+             * Encodes the specified VisionDetectResultDelta message. Does not implicitly {@link karna.vision.VisionDetectResultDelta.verify|verify} messages.
+             * @param message VisionDetectResultDelta message or plain object to encode
+             * @param [writer] Writer to encode to
+             * @returns Writer
+             */
+            public static encode(message: karna.vision.IVisionDetectResultDelta, writer?: $protobuf.Writer): $protobuf.Writer;
+
+            /**
+             * Encodes the specified VisionDetectResultDelta message, length delimited. Does not implicitly {@link karna.vision.VisionDetectResultDelta.verify|verify} messages.
+             * @param message VisionDetectResultDelta message or plain object to encode
+             * @param [writer] Writer to encode to
+             * @returns Writer
+             */
+            public static encodeDelimited(message: karna.vision.IVisionDetectResultDelta, writer?: $protobuf.Writer): $protobuf.Writer;
+
+            /**
+             * Decodes a VisionDetectResultDelta message from the specified reader or buffer.
+             * @param reader Reader or buffer to decode from
+             * @param [length] Message length if known beforehand
+             * @returns VisionDetectResultDelta
+             * @throws {Error} If the payload is not a reader or valid buffer
+             * @throws {$protobuf.util.ProtocolError} If required fields are missing
+             */
+            public static decode(reader: ($protobuf.Reader|Uint8Array), length?: number): karna.vision.VisionDetectResultDelta;
+
+            /**
+             * Decodes a VisionDetectResultDelta message from the specified reader or buffer, length delimited.
+             * @param reader Reader or buffer to decode from
+             * @returns VisionDetectResultDelta
+             * @throws {Error} If the payload is not a reader or valid buffer
+             * @throws {$protobuf.util.ProtocolError} If required fields are missing
+             */
+            public static decodeDelimited(reader: ($protobuf.Reader|Uint8Array)): karna.vision.VisionDetectResultDelta;
+
+            /**
+             * Verifies a VisionDetectResultDelta message.
+             * @param message Plain object to verify
+             * @returns `null` if valid, otherwise the reason why it is not
+             */
+            public static verify(message: { [k: string]: any }): (string|null);
+
+            /**
+             * Creates a VisionDetectResultDelta message from a plain object. Also converts values to their respective internal types.
+             * @param object Plain object
+             * @returns VisionDetectResultDelta
+             */
+            public static fromObject(object: { [k: string]: any }): karna.vision.VisionDetectResultDelta;
+
+            /**
+             * Creates a plain object from a VisionDetectResultDelta message. Also converts values to other types if specified.
+             * @param message VisionDetectResultDelta
+             * @param [options] Conversion options
+             * @returns Plain object
+             */
+            public static toObject(message: karna.vision.VisionDetectResultDelta, options?: $protobuf.IConversionOptions): { [k: string]: any };
+
+            /**
+             * Converts this VisionDetectResultDelta to JSON.
+             * @returns JSON object
+             */
+            public toJSON(): { [k: string]: any };
+
+            /**
+             * Gets the default type url for VisionDetectResultDelta
+             * @param [typeUrlPrefix] your custom typeUrlPrefix(default "type.googleapis.com")
+             * @returns The default type url
+             */
+            public static getTypeUrl(typeUrlPrefix?: string): string;
+        }
+
         /** Properties of a VisionDetectStatus. */
         interface IVisionDetectStatus {
 
@@ -871,6 +1137,9 @@ export namespace karna {
             /** VisionDetectRPCResponse status */
             status?: (karna.vision.IVisionDetectStatus|null);
 
+            /** VisionDetectRPCResponse resultDelta */
+            resultDelta?: (karna.vision.IVisionDetectResultDelta|null);
+
             /** VisionDetectRPCResponse error */
             error?: (string|null);
         }
@@ -890,11 +1159,14 @@ export namespace karna {
             /** VisionDetectRPCResponse status. */
             public status?: (karna.vision.IVisionDetectStatus|null);
 
+            /** VisionDetectRPCResponse resultDelta. */
+            public resultDelta?: (karna.vision.IVisionDetectResultDelta|null);
+
             /** VisionDetectRPCResponse error. */
             public error: string;
 
             /** VisionDetectRPCResponse response. */
-            public response?: ("results"|"status");
+            public response?: ("results"|"status"|"resultDelta");
 
             /**
              * Creates a new VisionDetectRPCResponse instance using the specified properties.
@@ -1299,186 +1571,516 @@ export namespace karna {
             public static getTypeUrl(typeUrlPrefix?: string): string;
         }
 
-        /** Properties of a ScreenCaptureRPCRequest. */
-        interface IScreenCaptureRPCRequest {
-
-            /** ScreenCaptureRPCRequest startCapture */
-            startCapture?: (karna.screen_capture.ICaptureRequest|null);
-
-            /** ScreenCaptureRPCRequest stopCapture */
-            stopCapture?: (karna.screen_capture.ICaptureRequest|null);
-
-            /** ScreenCaptureRPCRequest updateCapture */
-            updateCapture?: (karna.screen_capture.ICaptureUpdateRequest|null);
+        /** Properties of a CaptureDeltaSubscribeRequest. */
+        interface ICaptureDeltaSubscribeRequest {
 
-            /** ScreenCaptureRPCRequest getCache */
-            getCache?: (karna.screen_capture.ICaptureCacheRequest|null);
+            /** CaptureDeltaSubscribeRequest enabled */
+            enabled?: (boolean|null);
         }
 
-        /** Represents a ScreenCaptureRPCRequest. */
-        class ScreenCaptureRPCRequest implements IScreenCaptureRPCRequest {
+        /** Represents a CaptureDeltaSubscribeRequest. */
+        class CaptureDeltaSubscribeRequest implements ICaptureDeltaSubscribeRequest {
 
             /**
-             * Constructs a new ScreenCaptureRPCRequest.
+             * Constructs a new CaptureDeltaSubscribeRequest.
              * @param [properties] Properties to set
              */
-            constructor(properties?: karna.screen_capture.IScreenCaptureRPCRequest);
-
-            /** ScreenCaptureRPCRequest startCapture. */
-            public startCapture?: (karna.screen_capture.ICaptureRequest|null);
+            constructor(properties?: karna.screen_capture.ICaptureDeltaSubscribeRequest);
 
-            /** ScreenCaptureRPCRequest stopCapture. */
-            public stopCapture?: (karna.screen_capture.ICaptureRequest|null);
-
-            /** ScreenCaptureRPCRequest updateCapture. */
-            public updateCapture?: (karna.screen_capture.ICaptureUpdateRequest|null);
-
-            /** ScreenCaptureRPCRequest getCache. */
-            public getCache?: (karna.screen_capture.ICaptureCacheRequest|null);
-
-            /** ScreenCaptureRPCRequest method. */
-            public method?: ("startCapture"|"stopCapture"|"updateCapture"|"getCache");
+            /** CaptureDeltaSubscribeRequest enabled. */
+            public enabled: boolean;
 
             /**
-             * Creates a new ScreenCaptureRPCRequest instance using the specified properties.
+             * Creates a new CaptureDeltaSubscribeRequest instance using the specified properties.
              * @param [properties] Properties to set
-             * @returns ScreenCaptureRPCRequest instance
+             * @returns CaptureDeltaSubscribeRequest instance
              */
-            public static create(properties?: karna.screen_capture.IScreenCaptureRPCRequest): karna.screen_capture.ScreenCaptureRPCRequest;
+            public static create(properties?: karna.screen_capture.ICaptureDeltaSubscribeRequest): karna.screen_capture.CaptureDeltaSubscribeRequest;
 
             /**
-             * Encodes the specified ScreenCaptureRPCRequest message. Does not implicitly {@link karna.screen_capture.ScreenCaptureRPCRequest.verify|verify} messages.
-             * @param message ScreenCaptureRPCRequest message or plain object to encode
+             * Encodes the specified CaptureDeltaSubscribeRequest message. Does not implicitly {@link karna.screen_capture.CaptureDeltaSubscribeRequest.verify|verify} messages.
+             * @param message CaptureDeltaSubscribeRequest message or plain object to encode
              * @param [writer] Writer to encode to
              * @returns Writer
              */
-            public static encode(message: karna.screen_capture.IScreenCaptureRPCRequest, writer?: $protobuf.Writer): $protobuf.Writer;
+            public static encode(message: karna.screen_capture.ICaptureDeltaSubscribeRequest, writer?: $protobuf.Writer): $protobuf.Writer;
 
             /**
-             * Encodes the specified ScreenCaptureRPCRequest message, length delimited. Does not implicitly {@link karna.screen_capture.ScreenCaptureRPCRequest.verify|verify} messages.
-             * @param message ScreenCaptureRPCRequest message or plain object to encode
+             * Encodes the specified CaptureDeltaSubscribeRequest message, length delimited. Does not implicitly {@link karna.screen_capture.CaptureDeltaSubscribeRequest.verify|verify} messages.
+             * @param message CaptureDeltaSubscribeRequest message or plain object to encode
              * @param [writer] Writer to encode to
              * @returns Writer
              */
-            public static encodeDelimited(message: karna.screen_capture.IScreenCaptureRPCRequest, writer?: $protobuf.Writer): $protobuf.Writer;
+            public static encodeDelimited(message: karna.screen_capture.ICaptureDeltaSubscribeRequest, writer?: $protobuf.Writer): $protobuf.Writer;
 
             /**
-             * Decodes a ScreenCaptureRPCRequest message from the specified reader or buffer.
+             * Decodes a CaptureDeltaSubscribeRequest message from the specified reader or buffer.
              * @param reader Reader or buffer to decode from
              * @param [length] Message length if known beforehand
-             * @returns ScreenCaptureRPCRequest
+             * @returns CaptureDeltaSubscribeRequest
              * @throws {Error} If the payload is not a reader or valid buffer
              * @throws {$protobuf.util.ProtocolError} If required fields are missing
              */
-            public static decode(reader: ($protobuf.Reader|Uint8Array), length?: number): karna.screen_capture.ScreenCaptureRPCRequest;
+            public static decode(reader: ($protobuf.Reader|Uint8Array), length?: number): karna.screen_capture.CaptureDeltaSubscribeRequest;
 
             /**
-             * Decodes a ScreenCaptureRPCRequest message from the specified reader or buffer, length delimited.
+             * Decodes a CaptureDeltaSubscribeRequest message from the specified reader or buffer, length delimited.
              * @param reader Reader or buffer to decode from
-             * @returns ScreenCaptureRPCRequest
+             * @returns CaptureDeltaSubscribeRequest
              * @throws {Error} If the payload is not a reader or valid buffer
              * @throws {$protobuf.util.ProtocolError} If required fields are missing
              */
-            public static decodeDelimited(reader: ($protobuf.Reader|Uint8Array)): karna.screen_capture.ScreenCaptureRPCRequest;
+            public static decodeDelimited(reader: ($protobuf.Reader|Uint8Array)): karna.screen_capture.CaptureDeltaSubscribeRequest;
 
             /**
-             * Verifies a ScreenCaptureRPCRequest message.
+             * Verifies a CaptureDeltaSubscribeRequest message.
              * @param message Plain object to verify
              * @returns `null` if valid, otherwise the reason why it is not
              */
             public static verify(message: { [k: string]: any }): (string|null);
 
             /**
-             * Creates a ScreenCaptureRPCRequest message from a plain object. Also converts values to their respective internal types.
+             * Creates a CaptureDeltaSubscribeRequest message from a plain object. Also converts values to their respective internal types.
              * @param object Plain object
-             * @returns ScreenCaptureRPCRequest
+             * @returns CaptureDeltaSubscribeRequest
              */
-            public static fromObject(object: { [k: string]: any }): karna.screen_capture.ScreenCaptureRPCRequest;
+            public static fromObject(object: { [k: string]: any }): karna.screen_capture.CaptureDeltaSubscribeRequest;
 
             /**
-             * Creates a plain object from a ScreenCaptureRPCRequest message. Also converts values to other types if specified.
-             * @param message ScreenCaptureRPCRequest
+             * Creates a plain object from a CaptureDeltaSubscribeRequest message. Also converts values to other types if specified.
+             * @param message CaptureDeltaSubscribeRequest
              * @param [options] Conversion options
              * @returns Plain object
              */
-            public static toObject(message: karna.screen_capture.ScreenCaptureRPCRequest, options?: $protobuf.IConversionOptions): { [k: string]: any };
+            public static toObject(message: karna.screen_capture.CaptureDeltaSubscribeRequest, options?: $protobuf.IConversionOptions): { [k: string]: any };
 
             /**
-             * Converts this ScreenCaptureRPCRequest to JSON.
+             * Converts this CaptureDeltaSubscribeRequest to JSON.
              * @returns JSON object
              */
             public toJSON(): { [k: string]: any };
 
             /**
-             * Gets the default type url for ScreenCaptureRPCRequest
+             * Gets the default type url for CaptureDeltaSubscribeRequest
              * @param [typeUrlPrefix] your custom typeUrlPrefix(default "type.googleapis.com")
              * @returns The default type url
              */
             public static getTypeUrl(typeUrlPrefix?: string): string;
         }
 
-        /** Properties of a RpcScreenshotEvent. */
-        interface IRpcScreenshotEvent {
-
-            /** RpcScreenshotEvent eventId */
-            eventId?: (string|null);
+        /** Properties of a CaptureResyncRequest. */
+        interface ICaptureResyncRequest {
 
-            /** RpcScreenshotEvent projectUuid */
+            /** CaptureResyncRequest projectUuid */
             projectUuid?: (string|null);
 
-            /** RpcScreenshotEvent commandUuid */
+            /** CaptureResyncRequest commandUuid */
             commandUuid?: (string|null);
 
-            /** RpcScreenshotEvent timestamp */
-            timestamp?: (string|null);
-
-            /** RpcScreenshotEvent description */
-            description?: (string|null);
-
-            /** RpcScreenshotEvent screenshotPath */
-            screenshotPath?: (string|null);
-
-            /** RpcScreenshotEvent annotationPath */
-            annotationPath?: (string|null);
-
-            /** RpcScreenshotEvent mouseX */
-            mouseX?: (number|null);
-
-            /** RpcScreenshotEvent mouseY */
-            mouseY?: (number|null);
-
-            /** RpcScreenshotEvent keyChar */
-            keyChar?: (string|null);
-
-            /** RpcScreenshotEvent keyCode */
-            keyCode?: (string|null);
-
-            /** RpcScreenshotEvent isSpecialKey */
-            isSpecialKey?: (boolean|null);
-
-            /** RpcScreenshotEvent mouseEventToolTip */
-            mouseEventToolTip?: (string|null);
+            /** CaptureResyncRequest lastSequence */
+            lastSequence?: (number|Long|null);
         }
 
-        /** Represents a RpcScreenshotEvent. */
-        class RpcScreenshotEvent implements IRpcScreenshotEvent {
+        /** Represents a CaptureResyncRequest. */
+        class CaptureResyncRequest implements ICaptureResyncRequest {
 
             /**
-             * Constructs a new RpcScreenshotEvent.
+             * Constructs a new CaptureResyncRequest.
              * @param [properties] Properties to set
              */
-            constructor(properties?: karna.screen_capture.IRpcScreenshotEvent);
-
-            /** RpcScreenshotEvent eventId. */
-            public eventId: string;
+            constructor(properties?: karna.screen_capture.ICaptureResyncRequest);
 
-            /** RpcScreenshotEvent projectUuid. */
+            /** CaptureResyncRequest projectUuid. */
             public projectUuid: string;
 
-            /** RpcScreenshotEvent commandUuid. */
+            /** CaptureResyncRequest commandUuid. */
             public commandUuid: string;
 
-            /** RpcScreenshotEvent timestamp. */
+            /** CaptureResyncRequest lastSequence. */
+            public lastSequence: (number|Long);
+
+            /**
+             * Creates a new CaptureResyncRequest instance using the specified properties.
+             * @param [properties] Properties to set
+             * @returns CaptureResyncRequest instance
+             */
+            public static create(properties?: karna.screen_capture.ICaptureResyncRequest): karna.screen_capture.CaptureResyncRequest;
+
+            /**
+             * Encodes the specified CaptureResyncRequest message. Does not implicitly {@link karna.screen_capture.CaptureResyncRequest.verify|verify} messages.
+             * @param message CaptureResyncRequest message or plain object to encode
+             * @param [writer] Writer to encode to
+             * @returns Writer
+             */
+            public static encode(message: karna.screen_capture.ICaptureResyncRequest, writer?: $protobuf.Writer): $protobuf.Writer;
+
+            /**
+             * Encodes the specified CaptureResyncRequest message, length delimited. Does not implicitly {@link karna.screen_capture.CaptureResyncRequest.verify|verify} messages.
+             * @param message CaptureResyncRequest message or plain object to encode
+             * @param [writer] Writer to encode to
+             * @returns Writer
+             */
+            public static encodeDelimited(message: karna.screen_capture.ICaptureResyncRequest, writer?: $protobuf.Writer): $protobuf.Writer;
+
+            /**
+             * Decodes a CaptureResyncRequest message from the specified reader or buffer.
+             * @param reader Reader or buffer to decode from
+             * @param [length] Message length if known beforehand
+             * @returns CaptureResyncRequest
+             * @throws {Error} If the payload is not a reader or valid buffer
+             * @throws {$protobuf.util.ProtocolError} If required fields are missing
+             */
+            public static decode(reader: ($protobuf.Reader|Uint8Array), length?: number): karna.screen_capture.CaptureResyncRequest;
+
+            /**
+             * Decodes a CaptureResyncRequest message from the specified reader or buffer, length delimited.
+             * @param reader Reader or buffer to decode from
+             * @returns CaptureResyncRequest
+             * @throws {Error} If the payload is not a reader or valid buffer
+             * @throws {$protobuf.util.ProtocolError} If required fields are missing
+             */
+            public static decodeDelimited(reader: ($protobuf.Reader|Uint8Array)): karna.screen_capture.CaptureResyncRequest;
+
+            /**
+             * Verifies a CaptureResyncRequest message.
+             * @param message Plain object to verify
+             * @returns `null` if valid, otherwise the reason why it is not
+             */
+            public static verify(message: { [k: string]: any }): (string|null);
+
+            /**
+             * Creates a CaptureResyncRequest message from a plain object. Also converts values to their respective internal types.
+             * @param object Plain object
+             * @returns CaptureResyncRequest
+             */
+            public static fromObject(object: { [k: string]: any }): karna.screen_capture.CaptureResyncRequest;
+
+            /**
+             * Creates a plain object from a CaptureResyncRequest message. Also converts values to other types if specified.
+             * @param message CaptureResyncRequest
+             * @param [options] Conversion options
+             * @returns Plain object
+             */
+            public static toObject(message: karna.screen_capture.CaptureResyncRequest, options?: $protobuf.IConversionOptions): { [k: string]: any };
+
+            /**
+             * Converts this CaptureResyncRequest to JSON.
+             * @returns JSON object
+             */
+            public toJSON(): { [k: string]: any };
+
+            /**
+             * Gets the default type url for CaptureResyncRequest
+             * @param [typeUrlPrefix] your custom typeUrlPrefix(default "type.googleapis.com")
+             * @returns The default type url
+             */
+            public static getTypeUrl(typeUrlPrefix?: string): string;
+        }
+
+        /** Properties of a CaptureStatsRequest. */
+        interface ICaptureStatsRequest {
+        }
+
+        /** Represents a CaptureStatsRequest. */
+        class CaptureStatsRequest implements ICaptureStatsRequest {
+
+            /**
+             * Constructs a new CaptureStatsRequest.
+             * @param [properties] Properties to set
+             */
+            constructor(properties?: karna.screen_capture.ICaptureStatsRequest);
+
+            /**
+             * Creates a new CaptureStatsRequest instance using the specified properties.
+             * @param [properties] Properties to set
+             * @returns CaptureStatsRequest instance
+             */
+            public static create(properties?: karna.screen_capture.ICaptureStatsRequest): karna.screen_capture.CaptureStatsRequest;
+
+            /**
+             * Encodes the specified CaptureStatsRequest message. Does not implicitly {@link karna.screen_capture.CaptureStatsRequest.verify|verify} messages.
+             * @param message CaptureStatsRequest message or plain object to encode
+             * @param [writer] Writer to encode to
+             * @returns Writer
+             */
+            public static encode(message: karna.screen_capture.ICaptureStatsRequest, writer?: $protobuf.Writer): $protobuf.Writer;
+
+            /**
+             * Encodes the specified CaptureStatsRequest message, length delimited. Does not implicitly {@link karna.screen_capture.CaptureStatsRequest.verify|verify} messages.
+             * @param message CaptureStatsRequest message or plain object to encode
+             * @param [writer] Writer to encode to
+             * @returns Writer
+             */
+            public static encodeDelimited(message: karna.screen_capture.ICaptureStatsRequest, writer?: $protobuf.Writer): $protobuf.Writer;
+
+            /**
+             * Decodes a CaptureStatsRequest message from the specified reader or buffer.
+             * @param reader Reader or buffer to decode from
+             * @param [length] Message length if known beforehand
+             * @returns CaptureStatsRequest
+             * @throws {Error} If the payload is not a reader or valid buffer
+             * @throws {$protobuf.util.ProtocolError} If required fields are missing
+             */
+            public static decode(reader: ($protobuf.Reader|Uint8Array), length?: number): karna.screen_capture.CaptureStatsRequest;
+
+            /**
+             * Decodes a CaptureStatsRequest message from the specified reader or buffer, length delimited.
+             * @param reader Reader or buffer to decode from
+             * @returns CaptureStatsRequest
+             * @throws {Error} If the payload is not a reader or valid buffer
+             * @throws {$protobuf.util.ProtocolError} If required fields are missing
+             */
+            public static decodeDelimited(reader: ($protobuf.Reader|Uint8Array)): karna.screen_capture.CaptureStatsRequest;
+
+            /**
+             * Verifies a CaptureStatsRequest message.
+             * @param message Plain object to verify
+             * @returns `null` if valid, otherwise the reason why it is not
+             */
+            public static verify(message: { [k: string]: any }): (string|null);
+
+            /**
+             * Creates a CaptureStatsRequest message from a plain object. Also converts values to their respective internal types.
+             * @param object Plain object
+             * @returns CaptureStatsRequest
+             */
+            public static fromObject(object: { [k: string]: any }): karna.screen_capture.CaptureStatsRequest;
+
+            /**
+             * Creates a plain object from a CaptureStatsRequest message. Also converts values to other types if specified.
+             * @param message CaptureStatsRequest
+             * @param [options] Conversion options
+             * @returns Plain object
+             */
+            public static toObject(message: karna.screen_capture.CaptureStatsRequest, options?: $protobuf.IConversionOptions): { [k: string]: any };
+
+            /**
+             * Converts this CaptureStatsRequest to JSON.
+             * @returns JSON object
+             */
+            public toJSON(): { [k: string]: any };
+
+            /**
+             * Gets the default type url for CaptureStatsRequest
+             * @param [typeUrlPrefix] your custom typeUrlPrefix(default "type.googleapis.com")
+             * @returns The default type url
+             */
+            public static getTypeUrl(typeUrlPrefix?: string): string;
+        }
+
+        /** Properties of a ScreenCaptureRPCRequest. */
+        interface IScreenCaptureRPCRequest {
+
+            /** ScreenCaptureRPCRequest startCapture */
+            startCapture?: (karna.screen_capture.ICaptureRequest|null);
+
+            /** ScreenCaptureRPCRequest stopCapture */
+            stopCapture?: (karna.screen_capture.ICaptureRequest|null);
+
+            /** ScreenCaptureRPCRequest updateCapture */
+            updateCapture?: (karna.screen_capture.ICaptureUpdateRequest|null);
+
+            /** ScreenCaptureRPCRequest getCache */
+            getCache?: (karna.screen_capture.ICaptureCacheRequest|null);
+
+            /** ScreenCaptureRPCRequest subscribeDeltas */
+            subscribeDeltas?: (karna.screen_capture.ICaptureDeltaSubscribeRequest|null);
+
+            /** ScreenCaptureRPCRequest resync */
+            resync?: (karna.screen_capture.ICaptureResyncRequest|null);
+
+            /** ScreenCaptureRPCRequest getStats */
+            getStats?: (karna.screen_capture.ICaptureStatsRequest|null);
+        }
+
+        /** Represents a ScreenCaptureRPCRequest. */
+        class ScreenCaptureRPCRequest implements IScreenCaptureRPCRequest {
+
+            /**
+             * Constructs a new ScreenCaptureRPCRequest.
+             * @param [properties] Properties to set
+             */
+            constructor(properties?: karna.screen_capture.IScreenCaptureRPCRequest);
+
+            /** ScreenCaptureRPCRequest startCapture. */
+            public startCapture?: (karna.screen_capture.ICaptureRequest|null);
+
+            /** ScreenCaptureRPCRequest stopCapture. */
+            public stopCapture?: (karna.screen_capture.ICaptureRequest|null);
+
+            /** ScreenCaptureRPCRequest updateCapture. */
+            public updateCapture?: (karna.screen_capture.ICaptureUpdateRequest|null);
+
+            /** ScreenCaptureRPCRequest getCache. */
+            public getCache?: (karna.screen_capture.ICaptureCacheRequest|null);
+
+            /** ScreenCaptureRPCRequest subscribeDeltas. */
+            public subscribeDeltas?: (karna.screen_capture.ICaptureDeltaSubscribeRequest|null);
+
+            /** ScreenCaptureRPCRequest resync. */
+            public resync?: (karna.screen_capture.ICaptureResyncRequest|null);
+
+            /** ScreenCaptureRPCRequest getStats. */
+            public getStats?: (karna.screen_capture.ICaptureStatsRequest|null);
+
+            /** ScreenCaptureRPCRequest method. */
+            public method?: ("startCapture"|"stopCapture"|"updateCapture"|"getCache"|"subscribeDeltas"|"resync"|"getStats");
+
+            /**
+             * Creates a new ScreenCaptureRPCRequest instance using the specified properties.
+             * @param [properties] Properties to set
+             * @returns ScreenCaptureRPCRequest instance
+             */
+            public static create(properties?: karna.screen_capture.IScreenCaptureRPCRequest): karna.screen_capture.ScreenCaptureRPCRequest;
+
+            /**
+             * Encodes the specified ScreenCaptureRPCRequest message. Does not implicitly {@link karna.screen_capture.ScreenCaptureRPCRequest.verify|verify} messages.
+             * @param message ScreenCaptureRPCRequest message or plain object to encode
+             * @param [writer] Writer to encode to
+             * @returns Writer
+             */
+            public static encode(message: karna.screen_capture.IScreenCaptureRPCRequest, writer?: $protobuf.Writer): $protobuf.Writer;
+
+            /**
+             * Encodes the specified ScreenCaptureRPCRequest message, length delimited. Does not implicitly {@link karna.screen_capture.ScreenCaptureRPCRequest.verify|verify} messages.
+             * @param message ScreenCaptureRPCRequest message or plain object to encode
+             * @param [writer] Writer to encode to
+             * @returns Writer
+             */
+            public static encodeDelimited(message: karna.screen_capture.IScreenCaptureRPCRequest, writer?: $protobuf.Writer): $protobuf.Writer;
+
+            /**
+             * Decodes a ScreenCaptureRPCRequest message from the specified reader or buffer.
+             * @param reader Reader or buffer to decode from
+             * @param [length] Message length if known beforehand
+             * @returns ScreenCaptureRPCRequest
+             * @throws {Error} If the payload is not a reader or valid buffer
+             * @throws {$protobuf.util.ProtocolError} If required fields are missing
+             */
+            public static decode(reader: ($protobuf.Reader|Uint8Array), length?: number): karna.screen_capture.ScreenCaptureRPCRequest;
+
+            /**
+             * Decodes a ScreenCaptureRPCRequest message from the specified reader or buffer, length delimited.
+             * @param reader Reader or buffer to decode from
+             * @returns ScreenCaptureRPCRequest
+             * @throws {Error} If the payload is not a reader or valid buffer
+             * @throws {$protobuf.util.ProtocolError} If required fields are missing
+             */
+            public static decodeDelimited(reader: ($protobuf.Reader|Uint8Array)): karna.screen_capture.ScreenCaptureRPCRequest;
+
+            /**
+             * Verifies a ScreenCaptureRPCRequest message.
+             * @param message Plain object to verify
+             * @returns `null` if valid, otherwise the reason why it is not
+             */
+            public static verify(message: { [k: string]: any }): (string|null);
+
+            /**
+             * Creates a ScreenCaptureRPCRequest message from a plain object. Also converts values to their respective internal types.
+             * @param object Plain object
+             * @returns ScreenCaptureRPCRequest
+             */
+            public static fromObject(object: { [k: string]: any }): karna.screen_capture.ScreenCaptureRPCRequest;
+
+            /**
+             * Creates a plain object from a ScreenCaptureRPCRequest message. Also converts values to other types if specified.
+             * @param message ScreenCaptureRPCRequest
+             * @param [options] Conversion options
+             * @returns Plain object
+             */
+            public static toObject(message: karna.screen_capture.ScreenCaptureRPCRequest, options?: $protobuf.IConversionOptions): { [k: string]: any };
+
+            /**
+             * Converts this ScreenCaptureRPCRequest to JSON.
+             * @returns JSON object
+             */
+            public toJSON(): { [k: string]: any };
+
+            /**
+             * Gets the default type url for ScreenCaptureRPCRequest
+             * @param [typeUrlPrefix] your custom typeUrlPrefix(default "type.googleapis.com")
+             * @returns The default type url
+             */
+            public static getTypeUrl(typeUrlPrefix?: string): string;
+        }
+
+        /** Properties of a RpcScreenshotEvent. */
+        interface IRpcScreenshotEvent {
+
+            /** RpcScreenshotEvent eventId */
+            eventId?: (string|null);
+
+            /** RpcScreenshotEvent projectUuid */
+            projectUuid?: (string|null);
+
+            /** RpcScreenshotEvent commandUuid */
+            commandUuid?: (string|null);
+
+            /** RpcScreenshotEvent timestamp */
+            timestamp?: (string|null);
+
+            /** RpcScreenshotEvent description */
+            description?: (string|null);
+
+            /** RpcScreenshotEvent screenshotPath */
+            screenshotPath?: (string|null);
+
+            /** RpcScreenshotEvent annotationPath */
+            annotationPath?: (string|null);
+
+            /** RpcScreenshotEvent mouseX */
+            mouseX?: (number|null);
+
+            /** RpcScreenshotEvent mouseY */
+            mouseY?: (number|null);
+
+            /** RpcScreenshotEvent keyChar */
+            keyChar?: (string|null);
+
+            /** RpcScreenshotEvent keyCode */
+            keyCode?: (string|null);
+
+            /** RpcScreenshotEvent isSpecialKey */
+            isSpecialKey?: (boolean|null);
+
+            /** RpcScreenshotEvent mouseEventToolTip */
+            mouseEventToolTip?: (string|null);
+
+            /** RpcScreenshotEvent similarityScore */
+            similarityScore?: (number|null);
+
+            /** RpcScreenshotEvent duplicateOfEventId */
+            duplicateOfEventId?: (string|null);
+
+            /** RpcScreenshotEvent thumbnailPaths */
+            thumbnailPaths?: ({ [k: string]: string }|null);
+
+            /** RpcScreenshotEvent captureOriginX */
+            captureOriginX?: (number|null);
+
+            /** RpcScreenshotEvent captureOriginY */
+            captureOriginY?: (number|null);
+        }
+
+        /** Represents a RpcScreenshotEvent. */
+        class RpcScreenshotEvent implements IRpcScreenshotEvent {
+
+            /**
+             * Constructs a new RpcScreenshotEvent.
+             * @param [properties] Properties to set
+             */
+            constructor(properties?: karna.screen_capture.IRpcScreenshotEvent);
+
+            /** RpcScreenshotEvent eventId. */
+            public eventId: string;
+
+            /** RpcScreenshotEvent projectUuid. */
+            public projectUuid: string;
+
+            /** RpcScreenshotEvent commandUuid. */
+            public commandUuid: string;
+
+            /** RpcScreenshotEvent timestamp. */
             public timestamp: string;
 
             /** RpcScreenshotEvent description. */
@@ -1508,6 +2110,21 @@ export namespace karna {
             /** RpcScreenshotEvent mouseEventToolTip. */
             public mouseEventToolTip?: (string|null);
 
+            /** RpcScreenshotEvent similarityScore. */
+            public similarityScore?: (number|null);
+
+            /** RpcScreenshotEvent duplicateOfEventId. */
+            public duplicateOfEventId?: (string|null);
+
+            /** RpcScreenshotEvent thumbnailPaths. */
+            public thumbnailPaths: { [k: string]: string };
+
+            /** RpcScreenshotEvent captureOriginX. */
+            public captureOriginX?: (number|null);
+
+            /** RpcScreenshotEvent captureOriginY. */
+            public captureOriginY?: (number|null);
+
             /**
              * Creates a new RpcScreenshotEvent instance using the specified properties.
              * @param [properties] Properties to set
@@ -1707,6 +2324,304 @@ export namespace karna {
             public static getTypeUrl(typeUrlPrefix?: string): string;
         }
 
+        /** CaptureDeltaType enum. */
+        enum CaptureDeltaType {
+            CAPTURE_DELTA_APPEND = 0,
+            CAPTURE_DELTA_UPDATE = 1,
+            CAPTURE_DELTA_DELETE = 2,
+            CAPTURE_DELTA_RESET = 3
+        }
+
+        /** Properties of a CaptureDelta. */
+        interface ICaptureDelta {
+
+            /** CaptureDelta projectUuid */
+            projectUuid?: (string|null);
+
+            /** CaptureDelta commandUuid */
+            commandUuid?: (string|null);
+
+            /** CaptureDelta sequence */
+            sequence?: (number|Long|null);
+
+            /** CaptureDelta type */
+            type?: (karna.screen_capture.CaptureDeltaType|null);
+
+            /** CaptureDelta isActive */
+            isActive?: (boolean|null);
+
+            /** CaptureDelta screenshotEvents */
+            screenshotEvents?: (karna.screen_capture.IRpcScreenshotEvent[]|null);
+
+            /** CaptureDelta deletedEventIds */
+            deletedEventIds?: (string[]|null);
+        }
+
+        /** Represents a CaptureDelta. */
+        class CaptureDelta implements ICaptureDelta {
+
+            /**
+             * Constructs a new CaptureDelta.
+             * @param [properties] Properties to set
+             */
+            constructor(properties?: karna.screen_capture.ICaptureDelta);
+
+            /** CaptureDelta projectUuid. */
+            public projectUuid: string;
+
+            /** CaptureDelta commandUuid. */
+            public commandUuid: string;
+
+            /** CaptureDelta sequence. */
+            public sequence: (number|Long);
+
+            /** CaptureDelta type. */
+            public type: karna.screen_capture.CaptureDeltaType;
+
+            /** CaptureDelta isActive. */
+            public isActive: boolean;
+
+            /** CaptureDelta screenshotEvents. */
+            public screenshotEvents: karna.screen_capture.IRpcScreenshotEvent[];
+
+            /** CaptureDelta deletedEventIds. */
+            public deletedEventIds: string[];
+
+            /**
+             * Creates a new CaptureDelta instance using the specified properties.
+             * @param [properties] Properties to set
+             * @returns CaptureDelta instance
+             */
+            public static create(properties?: karna.screen_capture.ICaptureDelta): karna.screen_capture.CaptureDelta;
+
+            /**
+             * Encodes the specified CaptureDelta message. Does not implicitly {@link karna.screen_capture.CaptureDelta.verify|verify} messages.
+             * @param message CaptureDelta message or plain object to encode
+             * @param [writer] Writer to encode to
+             * @returns Writer
+             */
+            public static encode(message: karna.screen_capture.ICaptureDelta, writer?: $protobuf.Writer): $protobuf.Writer;
+
+            /**
+             * Encodes the specified CaptureDelta message, length delimited. Does not implicitly {@link karna.screen_capture.CaptureDelta.verify|verify} messages.
+             * @param message CaptureDelta message or plain object to encode
+             * @param [writer] Writer to encode to
+             * @returns Writer
+             */
+            public static encodeDelimited(message: karna.screen_capture.ICaptureDelta, writer?: $protobuf.Writer): $protobuf.Writer;
+
+            /**
+             * Decodes a CaptureDelta message from the specified reader or buffer.
+             * @param reader Reader or buffer to decode from
+             * @param [length] Message length if known beforehand
+             * @returns CaptureDelta
+             * @throws {Error} If the payload is not a reader or valid buffer
+             * @throws {$protobuf.util.ProtocolError} If required fields are missing
+             */
+            public static decode(reader: ($protobuf.Reader|Uint8Array), length?: number): karna.screen_capture.CaptureDelta;
+
+            /**
+             * Decodes a CaptureDelta message from the specified reader or buffer, length delimited.
+             * @param reader Reader or buffer to decode from
+             * @returns CaptureDelta
+             * @throws {Error} If the payload is not a reader or valid buffer
+             * @throws {$protobuf.util.ProtocolError} If required fields are missing
+             */
+            public static decodeDelimited(reader: ($protobuf.Reader|Uint8Array)): karna.screen_capture.CaptureDelta;
+
+            /**
+             * Verifies a CaptureDelta message.
+             * @param message Plain object to verify
+             * @returns `null` if valid, otherwise the reason why it is not
+             */
+            public static verify(message: { [k: string]: any }): (string|null);
+
+            /**
+             * Creates a CaptureDelta message from a plain object. Also converts values to their respective internal types.
+             * @param object Plain object
+             * @returns CaptureDelta
+             */
+            public static fromObject(object: { [k: string]: any }): karna.screen_capture.CaptureDelta;
+
+            /**
+             * Creates a plain object from a CaptureDelta message. Also converts values to other types if specified.
+             * @param message CaptureDelta
+             * @param [options] Conversion options
+             * @returns Plain object
+             */
+            public static toObject(message: karna.screen_capture.CaptureDelta, options?: $protobuf.IConversionOptions): { [k: string]: any };
+
+            /**
+             * Converts this CaptureDelta to JSON.
+             * @returns JSON object
+             */
+            public toJSON(): { [k: string]: any };
+
+            /**
+             * Gets the default type url for CaptureDelta
+             * @param [typeUrlPrefix] your custom typeUrlPrefix(default "type.googleapis.com")
+             * @returns The default type url
+             */
+            public static getTypeUrl(typeUrlPrefix?: string): string;
+        }
+
+        /** Properties of a CaptureStats. */
+        interface ICaptureStats {
+
+            /** CaptureStats projectUuid */
+            projectUuid?: (string|null);
+
+            /** CaptureStats commandUuid */
+            commandUuid?: (string|null);
+
+            /** CaptureStats isActive */
+            isActive?: (boolean|null);
+
+            /** CaptureStats totalScreenshots */
+            totalScreenshots?: (number|null);
+
+            /** CaptureStats totalAnnotations */
+            totalAnnotations?: (number|null);
+
+            /** CaptureStats totalKeyEvents */
+            totalKeyEvents?: (number|null);
+
+            /** CaptureStats totalMouseEvents */
+            totalMouseEvents?: (number|null);
+
+            /** CaptureStats durationSeconds */
+            durationSeconds?: (number|null);
+
+            /** CaptureStats rawDirectorySize */
+            rawDirectorySize?: (number|Long|null);
+
+            /** CaptureStats annotatedDirectorySize */
+            annotatedDirectorySize?: (number|Long|null);
+
+            /** CaptureStats missingFiles */
+            missingFiles?: (number|null);
+        }
+
+        /** Represents a CaptureStats. */
+        class CaptureStats implements ICaptureStats {
+
+            /**
+             * Constructs a new CaptureStats.
+             * @param [properties] Properties to set
+             */
+            constructor(properties?: karna.screen_capture.ICaptureStats);
+
+            /** CaptureStats projectUuid. */
+            public projectUuid: string;
+
+            /** CaptureStats commandUuid. */
+            public commandUuid: string;
+
+            /** CaptureStats isActive. */
+            public isActive: boolean;
+
+            /** CaptureStats totalScreenshots. */
+            public totalScreenshots: number;
+
+            /** CaptureStats totalAnnotations. */
+            public totalAnnotations: number;
+
+            /** CaptureStats totalKeyEvents. */
+            public totalKeyEvents: number;
+
+            /** CaptureStats totalMouseEvents. */
+            public totalMouseEvents: number;
+
+            /** CaptureStats durationSeconds. */
+            public durationSeconds: number;
+
+            /** CaptureStats rawDirectorySize. */
+            public rawDirectorySize: (number|Long);
+
+            /** CaptureStats annotatedDirectorySize. */
+            public annotatedDirectorySize: (number|Long);
+
+            /** CaptureStats missingFiles. */
+            public missingFiles: number;
+
+            /**
+             * Creates a new CaptureStats instance using the specified properties.
+             * @param [properties] Properties to set
+             * @returns CaptureStats instance
+             */
+            public static create(properties?: karna.screen_capture.ICaptureStats): karna.screen_capture.CaptureStats;
+
+            /**
+             * Encodes the specified CaptureStats message. Does not implicitly {@link karna.screen_capture.CaptureStats.verify|verify} messages.
+             * @param message CaptureStats message or plain object to encode
+             * @param [writer] Writer to encode to
+             * @returns Writer
+             */
+            public static encode(message: karna.screen_capture.ICaptureStats, writer?: $protobuf.Writer): $protobuf.Writer;
+
+            /**
+             * Encodes the specified CaptureStats message, length delimited. Does not implicitly {@link karna.screen_capture.CaptureStats.verify|verify} messages.
+             * @param message CaptureStats message or plain object to encode
+             * @param [writer] Writer to encode to
+             * @returns Writer
+             */
+            public static encodeDelimited(message: karna.screen_capture.ICaptureStats, writer?: $protobuf.Writer): $protobuf.Writer;
+
+            /**
+             * Decodes a CaptureStats message from the specified reader or buffer.
+             * @param reader Reader or buffer to decode from
+             * @param [length] Message length if known beforehand
+             * @returns CaptureStats
+             * @throws {Error} If the payload is not a reader or valid buffer
+             * @throws {$protobuf.util.ProtocolError} If required fields are missing
+             */
+            public static decode(reader: ($protobuf.Reader|Uint8Array), length?: number): karna.screen_capture.CaptureStats;
+
+            /**
+             * Decodes a CaptureStats message from the specified reader or buffer, length delimited.
+             * @param reader Reader or buffer to decode from
+             * @returns CaptureStats
+             * @throws {Error} If the payload is not a reader or valid buffer
+             * @throws {$protobuf.util.ProtocolError} If required fields are missing
+             */
+            public static decodeDelimited(reader: ($protobuf.Reader|Uint8Array)): karna.screen_capture.CaptureStats;
+
+            /**
+             * Verifies a CaptureStats message.
+             * @param message Plain object to verify
+             * @returns `null` if valid, otherwise the reason why it is not
+             */
+            public static verify(message: { [k: string]: any }): (string|null);
+
+            /**
+             * Creates a CaptureStats message from a plain object. Also converts values to their respective internal types.
+             * @param object Plain object
+             * @returns CaptureStats
+             */
+            public static fromObject(object: { [k: string]: any }): karna.screen_capture.CaptureStats;
+
+            /**
+             * Creates a plain object from a CaptureStats message. Also converts values to other types if specified.
+             * @param message CaptureStats
+             * @param [options] Conversion options
+             * @returns Plain object
+             */
+            public static toObject(message: karna.screen_capture.CaptureStats, options?: $protobuf.IConversionOptions): { [k: string]: any };
+
+            /**
+             * Converts this CaptureStats to JSON.
+             * @returns JSON object
+             */
+            public toJSON(): { [k: string]: any };
+
+            /**
+             * Gets the default type url for CaptureStats
+             * @param [typeUrlPrefix] your custom typeUrlPrefix(default "type.googleapis.com")
+             * @returns The default type url
+             */
+            public static getTypeUrl(typeUrlPrefix?: string): string;
+        }
+
         /** Properties of a ScreenCaptureRPCResponse. */
         interface IScreenCaptureRPCResponse {
 
@@ -1715,6 +2630,12 @@ export namespace karna {
 
             /** ScreenCaptureRPCResponse error */
             error?: (string|null);
+
+            /** ScreenCaptureRPCResponse captureDelta */
+            captureDelta?: (karna.screen_capture.ICaptureDelta|null);
+
+            /** ScreenCaptureRPCResponse captureStats */
+            captureStats?: (karna.screen_capture.ICaptureStats|null);
         }
 
         /** Represents a ScreenCaptureRPCResponse. */
@@ -1732,8 +2653,14 @@ export namespace karna {
             /** ScreenCaptureRPCResponse error. */
             public error?: (string|null);
 
+            /** ScreenCaptureRPCResponse captureDelta. */
+            public captureDelta?: (karna.screen_capture.ICaptureDelta|null);
+
+            /** ScreenCaptureRPCResponse captureStats. */
+            public captureStats?: (karna.screen_capture.ICaptureStats|null);
+
             /** ScreenCaptureRPCResponse type. */
-            public type?: ("captureResponse"|"error");
+            public type?: ("captureResponse"|"error"|"captureDelta"|"captureStats");
 
             /**
              * Creates a new ScreenCaptureRPCResponse instance using the specified properties.